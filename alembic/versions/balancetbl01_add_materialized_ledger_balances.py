@@ -0,0 +1,69 @@
+"""add wallet_balance and debt_pair_balance: materialized ledger sums
+
+Every wallet and debt balance was SUM(amount) over the append-only wallet_tx
+and debt_ledger logs, and get_owed_maps ran two full grouped debt_ledger scans
+on every staked-queue embed render -- render cost grew with ledger age. These
+tables hold the sums, maintained by an after_insert hook in the same
+transaction as each ledger row (models/ledger_balance.py). debt_pair_balance
+is tix-only (card_name IS NULL), like every tix balance read.
+
+The aged-cutoff query becomes "current balance minus entries since the
+cutoff", which ix_debt_ledger_guild_created serves.
+
+Backfill is one grouped INSERT ... SELECT per table; the sums are the ledger's
+own, so the tables start exactly consistent.
+
+Revision ID: balancetbl01
+Revises: chanindex01
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'balancetbl01'
+down_revision: Union[str, Sequence[str], None] = 'chanindex01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def backfill_balances(conn) -> None:
+    """(Re)derive both tables from their ledgers. Safe to re-run."""
+    conn.execute(sa.text("DELETE FROM wallet_balance"))
+    conn.execute(sa.text(
+        "INSERT INTO wallet_balance (guild_id, player_id, balance) "
+        "SELECT guild_id, player_id, SUM(amount) FROM wallet_tx "
+        "GROUP BY guild_id, player_id"
+    ))
+    conn.execute(sa.text("DELETE FROM debt_pair_balance"))
+    conn.execute(sa.text(
+        "INSERT INTO debt_pair_balance (guild_id, player_id, counterparty_id, balance) "
+        "SELECT guild_id, player_id, counterparty_id, SUM(amount) FROM debt_ledger "
+        "WHERE card_name IS NULL "
+        "GROUP BY guild_id, player_id, counterparty_id"
+    ))
+
+
+def upgrade() -> None:
+    op.create_table(
+        'wallet_balance',
+        sa.Column('guild_id', sa.String(64), primary_key=True),
+        sa.Column('player_id', sa.String(64), primary_key=True),
+        sa.Column('balance', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'debt_pair_balance',
+        sa.Column('guild_id', sa.String(64), primary_key=True),
+        sa.Column('player_id', sa.String(64), primary_key=True),
+        sa.Column('counterparty_id', sa.String(64), primary_key=True),
+        sa.Column('balance', sa.Integer(), nullable=False),
+    )
+    op.create_index('ix_debt_ledger_guild_created', 'debt_ledger', ['guild_id', 'created_at'])
+    backfill_balances(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('ix_debt_ledger_guild_created', table_name='debt_ledger')
+    op.drop_table('debt_pair_balance')
+    op.drop_table('wallet_balance')
@@ -0,0 +1,69 @@
+"""add draft_session_channels: indexed channel -> session lookup
+
+DraftSession.get_by_any_channel_id used to run
+``channel_ids LIKE '%<id>%'`` over every session that ever created channels,
+newest first, then confirm each hit in Python -- on every button press in a
+team channel, with cost growing with history. This table normalizes
+channel_ids + draft_chat_channel into one row per channel so the lookup is a
+primary-key hit.
+
+Backfill walks sessions oldest-first and upserts, so a channel id that
+appears on several sessions (test drafts reuse the queue channel as their
+chat) ends up owned by the newest one -- the row the old newest-first scan
+returned. The role logic is frozen here rather than imported from the model.
+
+Revision ID: chanindex01
+Revises: draftlogblob01
+"""
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'chanindex01'
+down_revision: Union[str, Sequence[str], None] = 'draftlogblob01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def backfill_channels(conn) -> int:
+    """Upsert a row per channel for every session with channels. Returns the
+    number of (channel, session) pairs written; safe to re-run."""
+    rows = conn.execute(sa.text(
+        "SELECT session_id, channel_ids, draft_chat_channel FROM draft_sessions "
+        "WHERE channel_ids IS NOT NULL OR draft_chat_channel IS NOT NULL "
+        "ORDER BY draft_start_time, id"
+    )).fetchall()
+    written = 0
+    for session_id, raw_ids, chat in rows:
+        ids = json.loads(raw_ids) if isinstance(raw_ids, (str, bytes)) else raw_ids
+        roles = {str(cid): 'created' for cid in ids or ()}
+        if chat:
+            roles[str(chat)] = 'draft_chat'
+        for channel_id, role in roles.items():
+            conn.execute(
+                sa.text("INSERT OR REPLACE INTO draft_session_channels (channel_id, session_id, role) "
+                        "VALUES (:c, :s, :r)"),
+                {"c": channel_id, "s": session_id, "r": role},
+            )
+            written += 1
+    return written
+
+
+def upgrade() -> None:
+    op.create_table(
+        'draft_session_channels',
+        sa.Column('channel_id', sa.String(64), primary_key=True),
+        sa.Column('session_id', sa.String(64),
+                  sa.ForeignKey('draft_sessions.session_id', ondelete='CASCADE'), nullable=False),
+        sa.Column('role', sa.String(16), nullable=False),
+    )
+    op.create_index('ix_draft_session_channels_session_id', 'draft_session_channels', ['session_id'])
+    backfill_channels(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('ix_draft_session_channels_session_id', table_name='draft_session_channels')
+    op.drop_table('draft_session_channels')
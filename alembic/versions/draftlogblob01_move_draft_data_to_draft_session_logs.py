@@ -0,0 +1,80 @@
+"""move draft_sessions.draft_data into draft_session_logs
+
+The raw Draftmancer log (several hundred KB of JSON per draft) sat on the
+draft_sessions row, so every select(DraftSession) -- queue and channel
+lookups, view re-registration, the cleanup/reconciler sweeps, quiz
+eligibility -- loaded and JSON-decoded it although only publish, team-log
+posting and the analysis paths ever read it. It moves to its own table as
+zlib-compressed JSON, keyed by session_id, and the column is dropped so a
+stray ``DraftSession.draft_data`` is an AttributeError rather than a silently
+empty read.
+
+The encoding is frozen here (not imported from models/draft_session_log.py)
+so the migration keeps working if the model's format ever changes.
+
+Revision ID: draftlogblob01
+Revises: 748aae6ae438
+"""
+import json
+import zlib
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'draftlogblob01'
+down_revision: Union[str, Sequence[str], None] = '748aae6ae438'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _encode(draft_data) -> bytes:
+    return zlib.compress(json.dumps(draft_data, separators=(',', ':')).encode('utf-8'))
+
+
+def copy_logs_out(conn) -> int:
+    """Copy every non-null draft_sessions.draft_data into draft_session_logs.
+    Rows already present are left alone, so a re-run is a no-op."""
+    rows = conn.execute(sa.text(
+        "SELECT ds.session_id, ds.draft_data FROM draft_sessions ds "
+        "WHERE ds.draft_data IS NOT NULL AND ds.draft_data != 'null' "
+        "AND NOT EXISTS (SELECT 1 FROM draft_session_logs l WHERE l.session_id = ds.session_id)"
+    )).fetchall()
+    now = datetime.now()
+    for session_id, raw in rows:
+        data = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+        conn.execute(
+            sa.text("INSERT INTO draft_session_logs (session_id, payload, stored_at) VALUES (:s, :p, :t)"),
+            {"s": session_id, "p": _encode(data), "t": now},
+        )
+    return len(rows)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'draft_session_logs',
+        sa.Column('session_id', sa.String(64),
+                  sa.ForeignKey('draft_sessions.session_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('stored_at', sa.DateTime(), nullable=False),
+    )
+    copy_logs_out(op.get_bind())
+    # batch mode for SQLite portability: native DROP COLUMN needs 3.35+.
+    with op.batch_alter_table('draft_sessions', schema=None) as batch_op:
+        batch_op.drop_column('draft_data')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('draft_sessions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('draft_data', sa.JSON(), nullable=True))
+    conn = op.get_bind()
+    for session_id, payload in conn.execute(sa.text(
+        "SELECT session_id, payload FROM draft_session_logs"
+    )).fetchall():
+        conn.execute(
+            sa.text("UPDATE draft_sessions SET draft_data = :d WHERE session_id = :s"),
+            {"d": zlib.decompress(payload).decode('utf-8'), "s": session_id},
+        )
+    op.drop_table('draft_session_logs')
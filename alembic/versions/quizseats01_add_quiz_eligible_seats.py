@@ -0,0 +1,42 @@
+"""add quiz_eligible_seats: precomputed quiz starting seats per draft
+
+Quiz selection used to load every DraftSession from the last year, shuffle,
+and for each one download the full log from Spaces and build a DraftAnalysis
+just to learn its valid starting seats -- stopping only at a draft with an
+unused seat, which degrades toward downloading everything as quizzes pile up.
+The valid seats are now computed when the log is captured and stored here,
+so selection is a single anti-join against quiz_sessions.
+
+Existing drafts need their logs downloaded to be indexed, which a migration
+shouldn't do: run scripts/backfill_quiz_eligible_seats.py after upgrading.
+
+Revision ID: quizseats01
+Revises: balancetbl01
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'quizseats01'
+down_revision: Union[str, Sequence[str], None] = 'balancetbl01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'quiz_eligible_seats',
+        sa.Column('session_id', sa.String(64),
+                  sa.ForeignKey('draft_sessions.session_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('pack_num', sa.Integer(), primary_key=True),
+        sa.Column('num_picks', sa.Integer(), primary_key=True),
+        sa.Column('starting_seat', sa.Integer(), primary_key=True),
+    )
+    op.create_index('ix_quiz_sessions_draft_seat', 'quiz_sessions', ['draft_session_id', 'starting_seat'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quiz_sessions_draft_seat', table_name='quiz_sessions')
+    op.drop_table('quiz_eligible_seats')
@@ -0,0 +1,36 @@
+"""add skill_checkpoints: per-guild TrueSkill replay snapshots
+
+A reported-winner correction used to replay every guild's full match
+history. Guild replays now save their state every SKILL_CHECKPOINT_INTERVAL
+rated rows and a correction resumes from the last checkpoint whose row
+prefix is unchanged. An empty table just means the next correction replays
+its guild from the start (and writes the checkpoints).
+
+Revision ID: skillckpt01
+Revises: viewlayout01
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'skillckpt01'
+down_revision: Union[str, Sequence[str], None] = 'viewlayout01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'skill_checkpoints',
+        sa.Column('guild_id', sa.String(64), primary_key=True),
+        sa.Column('position', sa.Integer(), primary_key=True),
+        sa.Column('prefix_hash', sa.String(64), nullable=False),
+        sa.Column('state', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('skill_checkpoints')
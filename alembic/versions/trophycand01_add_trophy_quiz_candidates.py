@@ -0,0 +1,40 @@
+"""add trophy_quiz_candidates: precomputed trophy-quiz drafters per draft
+
+Trophy quiz selection used to shuffle every eligible draft and, for each one,
+download its log from Spaces, load its match results and run
+select_two_decks until a draft yielded a pair -- dozens of sequential
+downloads for guilds that have used most of their history. The log-derived
+inputs (which drafters map cleanly and have a pool) are now stored here at
+capture, so selection is one query aggregating match_results over these rows
+plus a single download of the chosen draft.
+
+Existing drafts need their logs downloaded to be indexed, which a migration
+shouldn't do: run scripts/backfill_trophy_quiz_candidates.py after upgrading.
+
+Revision ID: trophycand01
+Revises: skillckpt01
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'trophycand01'
+down_revision: Union[str, Sequence[str], None] = 'skillckpt01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'trophy_quiz_candidates',
+        sa.Column('session_id', sa.String(64),
+                  sa.ForeignKey('draft_sessions.session_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('drafter_id', sa.String(64), primary_key=True),
+        sa.Column('dm_user_id', sa.String(64), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('trophy_quiz_candidates')
@@ -0,0 +1,33 @@
+"""add registered_view_layouts: last restored component layout per message
+
+Startup used to fetch every live queue, team, pairing, quiz and settle
+message and re-edit its view, one at a time. Views are now rebuilt from DB
+state and registered with bot.add_view; this table remembers the layout each
+message was last given, so only messages whose layout changed are edited.
+An empty table just means the first restart edits everything once.
+
+Revision ID: viewlayout01
+Revises: quizseats01
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'viewlayout01'
+down_revision: Union[str, Sequence[str], None] = 'quizseats01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'registered_view_layouts',
+        sa.Column('message_id', sa.String(64), primary_key=True),
+        sa.Column('signature', sa.String(64), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('registered_view_layouts')
@@ -63,8 +63,11 @@ async def main():
         from helpers.view_dispatch_guard import install_dispatch_collision_guard
         install_dispatch_collision_guard()
 
+        from helpers.view_restore import StartupTimer
+        timer = StartupTimer()
         try:
-            await bot.sync_commands()
+            with timer.phase("sync commands"):
+                await bot.sync_commands()
             logger.info("Successfully synced commands")
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
@@ -76,7 +79,8 @@ async def main():
         try:
             # Reconnect to sessions needing setup
             logger.info("Starting draft setup reconnection...")
-            setup_managers = await reconnect_draft_setup_sessions(bot)
+            with timer.phase("draft setup reconnection"):
+                setup_managers = await reconnect_draft_setup_sessions(bot)
             if setup_managers:
                 logger.info(f"Created {len(setup_managers)} draft setup reconnection managers")
                 bot.loop.create_task(monitor_reconnection_tasks(setup_managers, "setup"))
@@ -90,16 +94,21 @@ async def main():
         migrate_configs()
         print(f'Logged in as {bot.user}!')
         from utils import re_register_views
-        await re_register_views(bot)
+        with timer.phase("persistent views"):
+            await re_register_views(bot)
         # Register persistent debt settlement view
         from debt_views.settle_views import PublicSettleDebtsView
         bot.add_view(PublicSettleDebtsView())
         from livedrafts import re_register_live_drafts
-        await re_register_live_drafts(bot)
+        with timer.phase("live drafts"):
+            await re_register_live_drafts(bot)
         from cogs.tournament_commands import re_register_tournament_views
-        await re_register_tournament_views(bot)
+        with timer.phase("tournament views"):
+            await re_register_tournament_views(bot)
         from tournament_nudge import re_register_premade_nudges
-        await re_register_premade_nudges(bot)
+        with timer.phase("premade nudges"):
+            await re_register_premade_nudges(bot)
+        logger.info(timer.report())
         # Watchdog for MTGO serve jobs (deposits/withdraws): re-polls anything still
         # pending — at startup and every 10 min — so a trade that completes after a
         # poll timeout or across a restart always gets booked eventually.
@@ -127,24 +136,12 @@ async def main():
         await handle_application_command_error(ctx, error)
 
     async def monitor_reconnection_tasks(managers, task_type=""):
-        """Process managers sequentially with a 1-second delay between each"""
+        """Reconnect managers concurrently through the shared reconnection
+        scheduler (concurrency cap + token bucket, in-progress drafts first)."""
+        from services.reconnect_scheduler import reconnect_managers
         try:
-            logger.info(f"Starting to run {len(managers)} draft {task_type} reconnection tasks sequentially")
-            for i, manager in enumerate(managers):
-                try:
-
-                    # Start this specific connection and create a task to monitor it
-                    task = asyncio.create_task(manager.keep_connection_alive())
-                    logger.info(f"Started task {i+1}/{len(managers)} for draft ID: {manager.draft_id}")
-                    
-                    # Add a 1-second delay before the next task
-                    if i < len(managers) - 1:  # Don't delay after the last manager
-                        await asyncio.sleep(3)
-                        
-                except Exception as e:
-                    logger.error(f"Error starting task {i+1}/{len(managers)}: {e}")
-            
-            logger.info(f"All draft {task_type} reconnection managers have been started sequentially")
+            logger.info(f"Reconnecting {len(managers)} draft {task_type} managers")
+            await reconnect_managers(managers)
         except Exception as e:
             logger.error(f"Error during draft {task_type} reconnection sequence: {e}")
 
@@ -153,6 +150,10 @@ async def main():
     await load_extensions(bot)
     await init_db()
     await ensure_guild_id_in_tables()
+    # The wallet/debt balance tables are caches of their ledgers; rebuild any drift
+    # (e.g. from manual DB edits) before the first balance read.
+    from services.ledger_balances import check_consistency
+    await check_consistency(repair=True)
     await setup_sticky_handler(bot)
     logger.info("Database initialized")
     # Create a delayed task for leaderboard refresh
@@ -173,8 +174,18 @@ async def main():
     bot.loop.create_task(delayed_refresh())
 
     
+    from helpers.digital_ocean_helper import open_spaces_clients, close_spaces_clients
+    from helpers.card_image_cache import close_card_image_session
+    from database.message_management import flush_sticky_activity
+    await open_spaces_clients()
+
     # Run the bot
-    await bot.start(TOKEN)
+    try:
+        await bot.start(TOKEN)
+    finally:
+        await flush_sticky_activity()
+        await close_spaces_clients()
+        await close_card_image_session()
 
 if __name__ == "__main__":
     import asyncio
@@ -8,6 +8,7 @@ from discord.ui import View, Button
 from datetime import datetime, timedelta
 from sqlalchemy import select, and_, desc, update
 from database.db_session import db_session
+from services.ledger_stats import invalidate_session as invalidate_ledger_session
 from services.draft_setup_manager import (
     DraftSetupManager,
     PAUSED_DRAFT_OPTIONS,
@@ -51,6 +52,7 @@ async def abandon_draft_session(session_id, session_factory=None):
                     deletion_time=datetime.now() + timedelta(hours=ABANDON_CLEANUP_HOURS),
                 )
             )
+    invalidate_ledger_session(session_id)
 
 
 def _disable_all(view):
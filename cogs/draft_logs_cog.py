@@ -9,6 +9,7 @@ from typing import Optional, List
 from database.db_session import db_session
 from models.draft_logs import LogChannel, BackupLog, UserSubmission, PostSchedule
 from helpers.permissions import has_bot_manager_role
+from cogs.unified_scheduler_cog import schedules_changed
 
 class DraftLogsCog(commands.Cog):
     """
@@ -66,6 +67,7 @@ class DraftLogsCog(commands.Cog):
             
             session.add(new_channel)
             await session.commit()
+            schedules_changed(self.bot)
         
         await ctx.followup.send(
             f"✅ Successfully set up {channel.mention} for draft logs with time zone {time_zone}. "
@@ -140,6 +142,7 @@ class DraftLogsCog(commands.Cog):
             
             session.add(new_schedule)
             await session.commit()
+            schedules_changed(self.bot)
         
         # Get current schedules to show in response
         schedules = await self.get_channel_schedules(channel.id)
@@ -237,6 +240,7 @@ class DraftLogsCog(commands.Cog):
             # Delete schedule
             await session.delete(schedule)
             await session.commit()
+            schedules_changed(self.bot)
         
         # Get channel mention for response
         channel = self.bot.get_channel(int(channel_id))
@@ -601,6 +605,7 @@ class DraftLogsCog(commands.Cog):
             log_channel.enabled = True
             session.add(log_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"✅ Draft log posting enabled for {channel.mention}",
@@ -647,6 +652,7 @@ class DraftLogsCog(commands.Cog):
             log_channel.enabled = False
             session.add(log_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"🔴 Draft log posting disabled for {channel.mention}. "
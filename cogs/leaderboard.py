@@ -9,6 +9,8 @@ from services.leaderboard_service import get_timeframe_date
 from services.leaderboard_formatter import create_leaderboard_embed
 from loguru import logger
 from helpers.permissions import has_bot_manager_role
+from helpers.message_edits import edit_message, PRIORITY_BACKGROUND
+from services.leaderboard_refresh import embed_digest, remember_posted
 from leaderboard_config import (
     ALL_CATEGORIES as LEADERBOARD_CATEGORIES,
     LEADERBOARD_GROUPS,
@@ -55,6 +57,10 @@ class TimeframeView(View):
         
         # Update the message with the new embed and view
         await interaction.response.edit_message(embed=embed, view=view)
+        # Keep the auto-refresh's "unchanged, skip the edit" check in step
+        # with what the message now shows.
+        remember_posted(interaction.message.id,
+                        embed_digest(embed, timeframe, bool(pinned_timeframe(category, self.guild_id))))
         
         # Update the database to reflect the new timeframe
         async with db_session() as session:
@@ -312,8 +318,7 @@ class LeaderboardCog(commands.Cog):
 
         if message_id:
             try:
-                existing = await channel.fetch_message(int(message_id))
-                await existing.edit(content=content)
+                await edit_message(channel, message_id, priority=PRIORITY_BACKGROUND, content=content)
                 return
             except discord.NotFound:
                 logger.warning(f"Header message for {group['key']} missing, reposting")
@@ -354,10 +359,11 @@ class LeaderboardCog(commands.Cog):
         if hasattr(leaderboard_record, msg_id_field) and getattr(leaderboard_record, msg_id_field):
             try:
                 message_id = getattr(leaderboard_record, msg_id_field)
-                existing_msg = await channel.fetch_message(int(message_id))
                 # Always pass the view, even when it is None: that is what
                 # clears the buttons off a board that used to offer them.
-                await existing_msg.edit(embed=embed, view=view)
+                await edit_message(channel, message_id, priority=PRIORITY_BACKGROUND,
+                                   embed=embed, view=view)
+                remember_posted(message_id, embed_digest(embed, timeframe, view is None))
                 message_updated = True
                 logger.info(f"Updated existing {category} message {message_id}")
             except discord.NotFound:
@@ -472,12 +478,13 @@ async def refresh_all_leaderboards(bot):
                             if hasattr(leaderboard, msg_id_field) and getattr(leaderboard, msg_id_field):
                                 try:
                                     message_id = getattr(leaderboard, msg_id_field)
-                                    existing_msg = await channel.fetch_message(int(message_id))
                                     
                                     view = None
                                     if not pinned_timeframe(category, guild_id):
                                         view = TimeframeView(bot, guild_id, category, current_timeframe=timeframes[category])
-                                    await existing_msg.edit(embed=embed, view=view)
+                                    await edit_message(channel, message_id, priority=PRIORITY_BACKGROUND,
+                                                       embed=embed, view=view)
+                                    remember_posted(message_id, embed_digest(embed, timeframes[category], view is None))
 
                                     message_updated = True
                                     logger.info(f"Updated {category} leaderboard for guild {guild.name}")
@@ -1,18 +1,18 @@
 import discord
-import random
 import asyncio
 from utils import safe_pin
 from io import BytesIO
-from typing import Optional, Tuple, List, Set
+from typing import Optional, Tuple, List
 from discord.ext import commands
 from datetime import datetime, timedelta
 from loguru import logger
-from sqlalchemy import select, update, and_, func
+from sqlalchemy import select, update, func
 from database.db_session import db_session
 from models import DraftSession, QuizSession
 from models.draft_domain import PackTrace
 from services.draft_analysis import DraftAnalysis
-from services.draft_data_loader import load_from_spaces
+from services.quiz_eligibility import QUIZ_PACK_NUMBER, QUIZ_NUM_PICKS, pick_unused_seat
+from services.quiz_trace_record import trace_record
 from quiz_views_module.quiz_views import QuizPublicView
 from helpers.magicprotools_helper import MagicProtoolsHelper
 from helpers.pack_compositor import PackCompositor
@@ -20,9 +20,7 @@ from helpers.permissions import has_bot_manager_role
 from helpers.quiz_threads import DISCUSSION_THREAD_STARTER, spawn_discussion_thread
 from config import get_config
 
-# Quiz configuration constants
-QUIZ_PACK_NUMBER = 0  # First pack
-QUIZ_NUM_PICKS = 4  # Number of picks to quiz on
+# Quiz configuration constants (pack/length live with the eligibility index they key)
 ELIGIBLE_DRAFT_DAYS = 365  # Look back 1 year for eligible drafts
 
 
@@ -88,8 +86,8 @@ class QuizCommands(commands.Cog):
         """
         Select a random eligible draft and seat combination that hasn't been used for a quiz yet.
 
-        Uses lazy evaluation: randomly picks drafts one at a time and checks for unused seats,
-        stopping as soon as a valid combination is found.
+        Reads the quiz eligibility index (services/quiz_eligibility.py): valid seats were
+        computed when each log was captured, so no draft is downloaded here.
 
         Args:
             guild_id: Guild ID to search drafts for
@@ -98,63 +96,7 @@ class QuizCommands(commands.Cog):
             Tuple of (DraftSession, starting_seat) or (None, None) if no eligible combinations found
         """
         one_year_ago = datetime.now() - timedelta(days=ELIGIBLE_DRAFT_DAYS)
-
-        async with db_session() as session:
-            # Get used (draft_session_id, starting_seat) combinations for this guild
-            used_combos_stmt = select(QuizSession.draft_session_id, QuizSession.starting_seat).where(
-                QuizSession.guild_id == str(guild_id)
-            )
-            used_result = await session.execute(used_combos_stmt)
-            used_combos: Set[Tuple[str, Optional[int]]] = {(row[0], row[1]) for row in used_result.fetchall()}
-
-            # Get all eligible drafts (last year, has spaces_object_key)
-            stmt = select(DraftSession).where(
-                and_(
-                    DraftSession.guild_id == str(guild_id),
-                    DraftSession.spaces_object_key.isnot(None),
-                    DraftSession.draft_start_time >= one_year_ago
-                )
-            )
-            result = await session.execute(stmt)
-            eligible_drafts = list(result.scalars().all())
-
-        if not eligible_drafts:
-            logger.warning(f"No eligible drafts found for guild {guild_id}")
-            return None, None
-
-        # Shuffle drafts for random selection
-        random.shuffle(eligible_drafts)
-
-        # Lazily check drafts until we find one with unused seats
-        drafts_checked = 0
-        for draft in eligible_drafts:
-            drafts_checked += 1
-            try:
-                analysis = await DraftAnalysis.from_session(draft)
-                if analysis is None:
-                    continue
-
-                # Get valid seats for this draft
-                valid_seats = analysis.get_valid_starting_seats(QUIZ_PACK_NUMBER, QUIZ_NUM_PICKS)
-                if not valid_seats:
-                    continue
-
-                # Filter to unused seats
-                unused_seats = [seat for seat in valid_seats if (draft.session_id, seat) not in used_combos]
-                if not unused_seats:
-                    continue
-
-                # Found a draft with unused seats - pick one randomly
-                selected_seat = random.choice(unused_seats)
-                logger.info(f"Selected draft {draft.session_id} (cube: {draft.cube}) seat {selected_seat} after checking {drafts_checked} drafts ({len(unused_seats)} unused seats available)")
-                return draft, selected_seat
-
-            except Exception as e:
-                logger.warning(f"Error loading analysis for draft {draft.session_id}: {e}")
-                continue
-
-        logger.warning(f"No unused draft+seat combinations found for guild {guild_id} (checked {drafts_checked} drafts, {len(used_combos)} combinations already used)")
-        return None, None
+        return await pick_unused_seat(str(guild_id), one_year_ago)
 
     async def _prepare_quiz_data(self, draft_session: DraftSession, starting_seat: int):
         """
@@ -188,14 +130,12 @@ class QuizCommands(commands.Cog):
             logger.warning(f"Pack trace incomplete: {len(pack_trace.picks) if pack_trace else 0} picks")
             return None
 
-        # Create MagicProTools visualization and load draft data
+        # Create MagicProTools visualization from the log the analysis already holds
         mpt_url = None
-        draft_data = None
-        if draft_session.spaces_object_key:
-            draft_data = await load_from_spaces(draft_session.spaces_object_key)
-            if draft_data:
-                mpt_url = await self.create_pack_visualization_url(pack_trace, draft_data)
-                logger.info(f"Generated MagicProTools URL: {mpt_url}")
+        draft_data = analysis.draft_data
+        if draft_data:
+            mpt_url = await self.create_pack_visualization_url(pack_trace, draft_data)
+            logger.info(f"Generated MagicProTools URL: {mpt_url}")
 
         return (analysis, pack_trace, mpt_url, draft_data)
 
@@ -240,17 +180,9 @@ class QuizCommands(commands.Cog):
             logger.error(f"Failed to generate display_id: {e}")
             return None  # Abort quiz creation
 
-        # Serialize pack trace and correct answers
-        pack_trace_data = {
-            "picks": [
-                {
-                    "user_name": pick.user_name,
-                    "booster_ids": pick.booster_ids,
-                    "picked_id": pick.picked_id
-                }
-                for pick in pack_trace.picks
-            ]
-        }
+        # Serialize pack trace (with its card names, so the views never need
+        # the full analysis again) and correct answers
+        pack_trace_data = trace_record(pack_trace, analysis)
         correct_answers = [pick.picked_id for pick in pack_trace.picks]
 
         # Generate pack composite image if enabled and draft data available.
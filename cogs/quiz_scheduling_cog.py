@@ -8,6 +8,7 @@ import pytz
 from typing import Optional, List
 from database.db_session import db_session
 from helpers.permissions import has_bot_manager_role
+from cogs.unified_scheduler_cog import schedules_changed
 from models.quiz_scheduling import QuizChannel, QuizSchedule
 
 class QuizSchedulingCog(commands.Cog):
@@ -68,6 +69,7 @@ class QuizSchedulingCog(commands.Cog):
 
             session.add(new_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"✅ Successfully set up {channel.mention} for scheduled quizzes with time zone {time_zone}. "
@@ -152,6 +154,7 @@ class QuizSchedulingCog(commands.Cog):
 
             session.add(new_schedule)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"✅ Successfully added a **{quiz_type}** quiz posting schedule at {post_time} "
@@ -246,6 +249,7 @@ class QuizSchedulingCog(commands.Cog):
             # Delete the schedule
             await session.delete(schedule)
             await session.commit()
+            schedules_changed(self.bot)
 
         # Get channel mention for response
         channel = self.bot.get_channel(int(channel_id))
@@ -308,6 +312,7 @@ class QuizSchedulingCog(commands.Cog):
             quiz_channel.time_zone = time_zone
             session.add(quiz_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"✅ Updated timezone for {channel.mention} from {old_timezone} to {time_zone}",
@@ -354,6 +359,7 @@ class QuizSchedulingCog(commands.Cog):
             quiz_channel.enabled = True
             session.add(quiz_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"✅ Quiz posting enabled for {channel.mention}",
@@ -400,6 +406,7 @@ class QuizSchedulingCog(commands.Cog):
             quiz_channel.enabled = False
             session.add(quiz_channel)
             await session.commit()
+            schedules_changed(self.bot)
 
         await ctx.followup.send(
             f"🔴 Quiz posting disabled for {channel.mention}. "
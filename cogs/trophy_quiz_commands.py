@@ -6,16 +6,17 @@ from typing import List, Optional, Tuple
 import discord
 from discord.ext import commands
 from loguru import logger
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import func, select, update
 
 from database.db_session import db_session
 from helpers.permissions import has_bot_manager_role
 from helpers.magicprotools_helper import MagicProtoolsHelper
 from helpers.pile_compositor import PileImageBuilder
-from models import DraftSession, MatchResult, TrophyQuizSession
-from services.draft_data_loader import load_from_spaces
-from services.draft_log_store import map_discord_to_draftmancer, split_decklist, build_mtgo_deck_text
-from services.trophy_quiz_service import select_two_decks
+from models import DraftSession, TrophyQuizSession
+from services.draft_analysis import DraftAnalysis
+from services.draft_log_store import map_discord_to_draftmancer, render_pool, split_decklist, build_mtgo_deck_text
+from services.trophy_quiz_candidates import qualifying_by_draft
+from services.trophy_quiz_service import is_eligible_pod, pick_deck_pair
 from quiz_views_module.trophy_quiz_views import TrophyQuizView
 from helpers.quiz_threads import DISCUSSION_THREAD_STARTER, spawn_discussion_thread
 from utils import safe_pin
@@ -45,63 +46,51 @@ async def _select_eligible_draft(
     Select an eligible draft and its 2-deck trophy quiz pair.
 
     Eligible = spaces_object_key set, session_type != "swiss", within
-    ELIGIBLE_DRAFT_DAYS, and draft_session_id not already used for a trophy
-    quiz in this guild. Lazily checks drafts (in random order), loading each
-    draft's log + match results and running select_two_decks, stopping at the
-    first draft that yields a non-None deck pair (select_two_decks already
-    enforces the fully-reported / extreme / bucket rules).
+    ELIGIBLE_DRAFT_DAYS, draft_session_id not already used for a trophy quiz
+    in this guild, and a pod select_two_decks would accept (fully-reported /
+    extreme / bucket rules). The candidates and their records come from one
+    query over the capture-time index (services.trophy_quiz_candidates); the
+    pair is drawn from them, and only the chosen draft's log is loaded, to
+    render the two pools.
 
     Returns (DraftSession, deck_pair, draft_data) or (None, None, None) if no
     eligible draft yields a valid pair. draft_data is returned alongside so
     callers can build MPT deck links without reloading it from Spaces.
     """
     cutoff = datetime.now() - timedelta(days=ELIGIBLE_DRAFT_DAYS)
-    exclude_draft_ids = exclude_draft_ids or set()
+    by_draft = await qualifying_by_draft(guild_id, cutoff, exclude_draft_ids or ())
+    # Sorted first so a seeded rng picks reproducibly.
+    eligible = sorted(sid for sid, qualifying in by_draft.items() if is_eligible_pod(qualifying))
 
-    async with db_session() as session:
-        used_stmt = select(TrophyQuizSession.draft_session_id).where(
-            TrophyQuizSession.guild_id == str(guild_id)
-        )
-        used_result = await session.execute(used_stmt)
-        used_draft_ids = {row[0] for row in used_result.fetchall()} | set(exclude_draft_ids)
-
-        stmt = select(DraftSession).where(
-            and_(
-                DraftSession.guild_id == str(guild_id),
-                DraftSession.spaces_object_key.isnot(None),
-                DraftSession.session_type != "swiss",
-                DraftSession.draft_start_time >= cutoff,
-            )
-        )
-        result = await session.execute(stmt)
-        eligible_drafts = [
-            draft for draft in result.scalars().all()
-            if draft.session_id not in used_draft_ids
-        ]
-
-    if not eligible_drafts:
+    if not eligible:
         logger.warning(f"No eligible drafts found for trophy quiz in guild {guild_id}")
         return None, None, None
 
-    rng.shuffle(eligible_drafts)
+    rng.shuffle(eligible)
 
     drafts_checked = 0
-    for draft in eligible_drafts:
+    for session_id in eligible:
         drafts_checked += 1
         try:
-            draft_data = await load_from_spaces(draft.spaces_object_key)
-            if not draft_data:
-                continue
-
             async with db_session() as session:
-                matches_result = await session.execute(
-                    select(MatchResult).where(MatchResult.session_id == draft.session_id)
-                )
-                match_results = list(matches_result.scalars().all())
-
-            sign_ups = draft.sign_ups or {}
-            deck_pair = select_two_decks(draft_data, sign_ups, match_results, rng)
-            if deck_pair is None:
+                draft = (await session.execute(
+                    select(DraftSession).where(DraftSession.session_id == session_id)
+                )).scalar_one_or_none()
+            if draft is None:
+                continue
+            # Through the analysis memo: a draft posted here (or later opened
+            # by a pick quiz) is downloaded and indexed once.
+            analysis = await DraftAnalysis.from_session(draft)
+            if analysis is None:
+                continue
+            draft_data = analysis.draft_data
+
+            deck_pair = [
+                {"drafter_id": d["drafter_id"], "wins": d["wins"],
+                 "pool": render_pool(draft_data, d["dm_id"])}
+                for d in pick_deck_pair(by_draft[session_id], rng)
+            ]
+            if not all(deck["pool"] for deck in deck_pair):
                 continue
 
             logger.info(
@@ -111,7 +100,7 @@ async def _select_eligible_draft(
             return draft, deck_pair, draft_data
 
         except Exception as e:
-            logger.warning(f"Error preparing trophy quiz decks for draft {draft.session_id}: {e}")
+            logger.warning(f"Error preparing trophy quiz decks for draft {session_id}: {e}")
             continue
 
     logger.warning(
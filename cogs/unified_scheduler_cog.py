@@ -1,6 +1,12 @@
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import List, Optional
+
 import discord
 from discord.ext import commands, tasks
-from datetime import datetime
 from loguru import logger
 from sqlalchemy import select
 import pytz
@@ -8,6 +14,10 @@ from database.db_session import db_session
 from models.draft_logs import LogChannel, PostSchedule
 from models.quiz_scheduling import QuizChannel, QuizSchedule
 
+# A slot missed while the bot was down is still posted at startup if it is at
+# most this old and the channel's last_post predates it.
+CATCH_UP_GRACE = timedelta(hours=2)
+
 
 def select_scheduled_poster(quiz_type, pick_cog, trophy_cog):
     """Return the cog that posts this schedule's quiz_type, or None if that cog
@@ -19,131 +29,251 @@ def select_scheduled_poster(quiz_type, pick_cog, trophy_cog):
     return None
 
 
+@dataclass(frozen=True)
+class ScheduledPost:
+    """One PostSchedule/QuizSchedule row joined with its channel's settings."""
+    kind: str  # 'draft_log' | 'quiz'
+    channel_id: str
+    post_time: str  # "HH:MM" in time_zone
+    time_zone: str
+    quiz_type: Optional[str] = None
+
+
+def _local_slot(post_time: str, tz, day) -> datetime:
+    hour, minute = map(int, post_time.split(":"))
+    # normalize() moves a wall time that falls in a spring-forward gap past it.
+    return tz.normalize(tz.localize(datetime.combine(day, dt_time(hour, minute))))
+
+
+def next_fire(post_time: str, time_zone: str, after: datetime) -> datetime:
+    """First instant strictly after `after` (aware) whose wall clock in
+    `time_zone` reads `post_time`, as an aware UTC datetime."""
+    tz = pytz.timezone(time_zone)
+    today = after.astimezone(tz).date()
+    for offset in range(3):
+        slot = _local_slot(post_time, tz, today + timedelta(days=offset))
+        if slot > after:
+            return slot.astimezone(timezone.utc)
+    raise ValueError(f"no slot for {post_time} {time_zone} after {after}")
+
+
+def previous_fire(post_time: str, time_zone: str, at: datetime) -> datetime:
+    """Latest slot at or before `at` (aware), as an aware UTC datetime."""
+    tz = pytz.timezone(time_zone)
+    today = at.astimezone(tz).date()
+    for offset in range(0, -3, -1):
+        slot = _local_slot(post_time, tz, today + timedelta(days=offset))
+        if slot <= at:
+            return slot.astimezone(timezone.utc)
+    raise ValueError(f"no slot for {post_time} {time_zone} before {at}")
+
+
+def missed_slot(post: ScheduledPost, last_post: Optional[datetime], now: datetime) -> Optional[datetime]:
+    """The slot to catch up on at startup, or None.
+
+    last_post is the channel's naive server-local timestamp (datetime.now()
+    at posting). A channel that never posted is not caught up -- there is no
+    evidence a slot was ever owed.
+    """
+    if last_post is None:
+        return None
+    slot = previous_fire(post.post_time, post.time_zone, now)
+    if now - slot > CATCH_UP_GRACE:
+        return None
+    if last_post.astimezone(timezone.utc) >= slot:
+        return None
+    return slot
+
+
+class ScheduleQueue:
+    """Min-heap of (next fire instant, post). Popping a due post re-pushes its
+    next occurrence, so a slow post delays later slots but never skips them."""
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, when: datetime, post: ScheduledPost) -> None:
+        heapq.heappush(self._heap, (when, next(self._seq), post))
+
+    def next_due(self) -> Optional[datetime]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[ScheduledPost]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, post = heapq.heappop(self._heap)
+            due.append(post)
+            self.push(next_fire(post.post_time, post.time_zone, when), post)
+        return due
+
+
+def schedules_changed(bot) -> None:
+    """Have the scheduler reload its queue. Call after committing any change
+    to a log/quiz channel's schedules, time zone or enabled flag."""
+    cog = bot.get_cog("UnifiedSchedulerCog")
+    if cog is not None:
+        cog.reload_schedules()
+
+
 class UnifiedSchedulerCog(commands.Cog):
     """
-    Unified scheduler that checks both draft log and quiz schedules.
+    Unified scheduler for draft log and quiz posts.
     Scheduling logic moved here from draft_logs_cog.py for centralized management.
+
+    Every enabled schedule sits in a ScheduleQueue keyed by its next fire
+    instant (computed in the channel's time zone). The loop sleeps until the
+    earliest one or until schedules_changed() asks for a reload, so schedules
+    are only read from the database at startup and after schedule commands.
+    At startup, a slot missed within CATCH_UP_GRACE whose channel's last_post
+    predates it is posted immediately.
     """
 
     def __init__(self, bot):
         self.bot = bot
+        self.queue = ScheduleQueue()
+        self._reload = asyncio.Event()
+        self._reload.set()
+        self._loaded_once = False
         logger.info("Unified Scheduler cog initialized")
-        self.check_all_schedules.start()
+        self.run_schedules.start()
 
     def cog_unload(self):
-        self.check_all_schedules.cancel()
+        self.run_schedules.cancel()
 
-    @tasks.loop(minutes=1)
-    async def check_all_schedules(self):
-        """Check schedules for both draft logs and quizzes every minute"""
+    def reload_schedules(self):
+        self._reload.set()
+
+    @tasks.loop()
+    async def run_schedules(self):
+        """One scheduler step: reload if asked, sleep to the next slot (or a
+        reload request), then post everything that is due."""
         try:
             await self.bot.wait_until_ready()
 
-            # Check draft log schedules
-            await self.check_draft_log_schedules()
+            if self._reload.is_set():
+                self._reload.clear()
+                await self.load_schedules(catch_up=not self._loaded_once)
+                self._loaded_once = True
 
-            # Check quiz schedules
-            await self.check_quiz_schedules()
+            when = self.queue.next_due()
+            if when is None:
+                await self._reload.wait()
+                return
+            delay = (when - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._reload.wait(), delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
 
-        except Exception as e:
-            logger.error(f"Error in check_all_schedules task: {e}", exc_info=True)
+            for post in self.queue.pop_due(datetime.now(timezone.utc)):
+                await self.fire(post)
 
-    async def check_draft_log_schedules(self):
-        """Check if it's time to post a draft log in any channels"""
-        try:
-            async with db_session() as session:
-                # Get all log channels and their schedules
-                stmt = select(LogChannel, PostSchedule).join(
-                    PostSchedule, LogChannel.channel_id == PostSchedule.channel_id
-                )
-                result = await session.execute(stmt)
-                channel_schedules = result.all()
+        except Exception as e:
+            logger.error(f"Error in run_schedules task: {e}", exc_info=True)
+            await asyncio.sleep(60)
 
-                for log_channel, schedule in channel_schedules:
-                    try:
-                        # Skip disabled channels
-                        if not log_channel.enabled:
-                            continue
+    async def load_schedules(self, catch_up: bool = False):
+        """Rebuild the queue from every enabled schedule. With catch_up, slots
+        missed while the bot was down are queued as due now."""
+        now = datetime.now(timezone.utc)
+        queue = ScheduleQueue()
+        async with db_session() as session:
+            log_rows = (await session.execute(
+                select(LogChannel, PostSchedule).join(
+                    PostSchedule, LogChannel.channel_id == PostSchedule.channel_id)
+            )).all()
+            quiz_rows = (await session.execute(
+                select(QuizChannel, QuizSchedule).join(
+                    QuizSchedule, QuizChannel.channel_id == QuizSchedule.channel_id)
+            )).all()
 
-                        # Get current time in the channel's time zone
-                        tz = pytz.timezone(log_channel.time_zone)
-                        current_time = datetime.now(tz).strftime("%H:%M")
+        rows = [("draft_log", channel, schedule, None) for channel, schedule in log_rows]
+        rows += [("quiz", channel, schedule, schedule.quiz_type) for channel, schedule in quiz_rows]
+        caught_up = set()
+        for kind, channel, schedule, quiz_type in rows:
+            if not channel.enabled:
+                continue
+            post = ScheduledPost(kind, channel.channel_id, schedule.post_time,
+                                 channel.time_zone or "UTC", quiz_type)
+            try:
+                missed = missed_slot(post, channel.last_post, now) if catch_up else None
+                # One catch-up post per channel, however many of its slots were missed.
+                if missed is not None and (kind, post.channel_id) not in caught_up:
+                    caught_up.add((kind, post.channel_id))
+                    logger.info(f"Catching up {kind} slot {schedule.post_time} {post.time_zone} "
+                                f"missed in channel {channel.channel_id}")
+                    queue.push(missed, post)
+                else:
+                    queue.push(next_fire(post.post_time, post.time_zone, now), post)
+            except Exception as e:
+                logger.error(f"Skipping bad schedule {schedule.id} in channel {channel.channel_id}: {e}")
+        self.queue = queue
+        logger.info(f"Scheduler loaded {len(queue)} schedules; next slot {queue.next_due()}")
 
-                        # Check if it's time to post
-                        if current_time == schedule.post_time:
-                            logger.info(f"Posting draft log in channel {log_channel.channel_id} at {current_time} {log_channel.time_zone}")
+    async def fire(self, post: ScheduledPost):
+        if post.kind == "draft_log":
+            await self.post_scheduled_draft_log(post)
+        else:
+            await self.post_scheduled_quiz(post)
 
-                            # Get the draft logs cog and call its post method
-                            draft_logs_cog = self.bot.get_cog("DraftLogsCog")
-                            if draft_logs_cog:
-                                await draft_logs_cog.post_draft_log(log_channel.channel_id)
-                            else:
-                                logger.error("DraftLogsCog not found")
+    async def post_scheduled_draft_log(self, post: ScheduledPost):
+        """Post a draft log for a due schedule slot"""
+        try:
+            logger.info(f"Posting draft log in channel {post.channel_id} at {post.post_time} {post.time_zone}")
 
-                    except Exception as e:
-                        logger.error(f"Error posting scheduled draft log to channel {log_channel.channel_id}: {e}", exc_info=True)
+            # Get the draft logs cog and call its post method
+            draft_logs_cog = self.bot.get_cog("DraftLogsCog")
+            if draft_logs_cog:
+                await draft_logs_cog.post_draft_log(post.channel_id)
+            else:
+                logger.error("DraftLogsCog not found")
 
         except Exception as e:
-            logger.error(f"Error in check_draft_log_schedules: {e}", exc_info=True)
+            logger.error(f"Error posting scheduled draft log to channel {post.channel_id}: {e}", exc_info=True)
 
-    async def check_quiz_schedules(self):
-        """Check if it's time to post a quiz in any channels"""
+    async def post_scheduled_quiz(self, post: ScheduledPost):
+        """Post a quiz for a due schedule slot"""
         try:
-            async with db_session() as session:
-                # Get all quiz channels and their schedules
-                stmt = select(QuizChannel, QuizSchedule).join(
-                    QuizSchedule, QuizChannel.channel_id == QuizSchedule.channel_id
+            logger.info(f"Posting quiz in channel {post.channel_id} at {post.post_time} {post.time_zone}")
+
+            # Get the quiz commands cogs and route by this schedule's quiz_type
+            pick_cog = self.bot.get_cog("QuizCommands")
+            trophy_cog = self.bot.get_cog("TrophyQuizCommands")
+            cog = select_scheduled_poster(post.quiz_type, pick_cog, trophy_cog)
+
+            if cog is None:
+                if post.quiz_type not in ("pick", "trophy"):
+                    reason = f"unknown quiz_type '{post.quiz_type}'"
+                else:
+                    reason = f"no cog loaded for '{post.quiz_type}' quizzes"
+                logger.warning(
+                    f"Skipping scheduled quiz in channel {post.channel_id}: {reason}"
                 )
-                result = await session.execute(stmt)
-                channel_schedules = result.all()
-
-                for quiz_channel, schedule in channel_schedules:
-                    try:
-                        # Skip disabled channels
-                        if not quiz_channel.enabled:
-                            continue
-
-                        # Get current time in the channel's time zone
-                        tz = pytz.timezone(quiz_channel.time_zone)
-                        current_time = datetime.now(tz).strftime("%H:%M")
-
-                        # Check if it's time to post
-                        if current_time == schedule.post_time:
-                            logger.info(f"Posting quiz in channel {quiz_channel.channel_id} at {current_time} {quiz_channel.time_zone}")
-
-                            # Get the quiz commands cogs and route by this schedule's quiz_type
-                            pick_cog = self.bot.get_cog("QuizCommands")
-                            trophy_cog = self.bot.get_cog("TrophyQuizCommands")
-                            cog = select_scheduled_poster(schedule.quiz_type, pick_cog, trophy_cog)
-
-                            if cog is None:
-                                if schedule.quiz_type not in ("pick", "trophy"):
-                                    reason = f"unknown quiz_type '{schedule.quiz_type}'"
-                                else:
-                                    reason = f"no cog loaded for '{schedule.quiz_type}' quizzes"
-                                logger.warning(
-                                    f"Skipping scheduled quiz in channel {quiz_channel.channel_id}: {reason}"
-                                )
-                                continue
-
-                            if schedule.quiz_type == "pick":
-                                posted = await cog.post_scheduled_quiz(quiz_channel.channel_id)
-                            else:  # trophy
-                                posted = await cog.post_scheduled_trophy_quiz(quiz_channel.channel_id)
-
-                            if posted:
-                                # Update last_post timestamp
-                                quiz_channel.last_post = datetime.now()
-                                session.add(quiz_channel)
-                                await session.commit()
-                            else:
-                                logger.warning(f"Failed to post quiz to channel {quiz_channel.channel_id}")
-
-                    except Exception as e:
-                        logger.error(f"Error posting scheduled quiz to channel {quiz_channel.channel_id}: {e}", exc_info=True)
+                return
+
+            if post.quiz_type == "pick":
+                posted = await cog.post_scheduled_quiz(post.channel_id)
+            else:  # trophy
+                posted = await cog.post_scheduled_trophy_quiz(post.channel_id)
+
+            if posted:
+                # Update last_post timestamp
+                async with db_session() as session:
+                    quiz_channel = await session.get(QuizChannel, post.channel_id)
+                    if quiz_channel:
+                        quiz_channel.last_post = datetime.now()
+                        await session.commit()
+            else:
+                logger.warning(f"Failed to post quiz to channel {post.channel_id}")
 
         except Exception as e:
-            logger.error(f"Error in check_quiz_schedules: {e}", exc_info=True)
+            logger.error(f"Error posting scheduled quiz to channel {post.channel_id}: {e}", exc_info=True)
 
 
 def setup(bot):
@@ -1,8 +1,10 @@
 from enum import Enum
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, Tuple
 import discord
 from helpers.pin_helpers import safe_pin
-from sqlalchemy import JSON, Column, Integer, String, Boolean, Float, select, text, REAL
+from helpers.message_edits import edit_message
+from sqlalchemy import JSON, Column, Integer, String, Boolean, Float, bindparam, select, text, update, REAL
 from sqlalchemy.ext.asyncio import AsyncSession
 from views import PersistentView
 from database.models_base import Base
@@ -28,6 +30,7 @@ INACTIVITY_CHECK_INTERVAL = 60  # Check for inactive channels every 60 seconds
 DRAFT_NOTIFICATION_CHANNEL = "wheres-the-draft"  # Name of the channel to post draft links
 MESSAGES_BEFORE_VOLUME_UPDATE = 20  # Higher threshold for the message-only trigger
 ANTI_SPAM_COOLDOWN_SECONDS = 180  # Minimum seconds between updates to prevent spam (3 minutes)
+ACTIVITY_FLUSH_INTERVAL = 5  # Seconds between batched writes of in-memory activity counters
 
 class Message(Base):
     """Represents a message stored in the database, potentially a sticky message."""
@@ -68,6 +71,113 @@ async def fetch_all_sticky_messages(session: AsyncSession) -> list[Message]:
     return result.scalars().all()
 
 
+# --- In-memory sticky activity registry ---
+#
+# Chat traffic in sticky channels only bumps counters here; the DB copy of
+# message_count / last_activity is written by flush_sticky_activity in one
+# batched transaction (every ACTIVITY_FLUSH_INTERVAL seconds and on shutdown).
+# The registry is authoritative for those columns while the bot runs and is
+# reloaded from the DB at startup. Every sticky create/update/delete in this
+# module keeps it in step.
+
+@dataclass
+class StickyActivity:
+    """Live activity counters for one sticky channel."""
+    row_id: int
+    message_count: int = 0
+    last_activity: float = 0.0
+    last_update_time: float = 0.0
+    dirty: bool = False
+
+
+_STICKY_ACTIVITY: Dict[str, StickyActivity] = {}
+
+
+def reset_sticky_registry() -> None:
+    """Forget every registered sticky channel (tests)."""
+    _STICKY_ACTIVITY.clear()
+
+
+def get_sticky_activity(channel_id: str) -> Optional[StickyActivity]:
+    return _STICKY_ACTIVITY.get(str(channel_id))
+
+
+def _register_sticky(sticky_message: "Message", dirty: bool = False) -> None:
+    """Track (or re-sync) a sticky row's counters from the row itself."""
+    _STICKY_ACTIVITY[str(sticky_message.channel_id)] = StickyActivity(
+        row_id=sticky_message.id,
+        message_count=sticky_message.message_count or 0,
+        last_activity=sticky_message.last_activity or 0.0,
+        last_update_time=sticky_message.last_update_time or 0.0,
+        dirty=dirty,
+    )
+
+
+def _unregister_sticky(channel_id: str) -> None:
+    _STICKY_ACTIVITY.pop(str(channel_id), None)
+
+
+def record_sticky_activity(channel_id: str, at: float) -> bool:
+    """Count one chat message in a sticky channel. No DB access; returns
+    False when the channel has no sticky message."""
+    activity = _STICKY_ACTIVITY.get(str(channel_id))
+    if activity is None:
+        return False
+    activity.message_count += 1
+    activity.last_activity = at
+    activity.dirty = True
+    return True
+
+
+async def load_sticky_registry() -> int:
+    """Populate the registry from every sticky row. Called once at startup."""
+    async with AsyncSessionLocal() as session:
+        sticky_messages = await fetch_all_sticky_messages(session)
+    reset_sticky_registry()
+    for sticky_message in sticky_messages:
+        _register_sticky(sticky_message)
+    logger.info(f"Loaded {len(_STICKY_ACTIVITY)} sticky channels into the activity registry")
+    return len(_STICKY_ACTIVITY)
+
+
+async def flush_sticky_activity() -> int:
+    """Write every dirty channel's counters in one transaction. Entries are
+    marked clean before the write, so activity arriving mid-flush is picked
+    up by the next one; a failed write re-marks them dirty."""
+    pending = [a for a in _STICKY_ACTIVITY.values() if a.dirty]
+    if not pending:
+        return 0
+    params = [
+        {"b_id": a.row_id, "b_count": a.message_count, "b_activity": a.last_activity}
+        for a in pending
+    ]
+    for activity in pending:
+        activity.dirty = False
+    table = Message.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(message_count=bindparam("b_count"), last_activity=bindparam("b_activity"))
+    )
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+    except Exception as e:
+        for activity in pending:
+            activity.dirty = True
+        logger.error(f"Error flushing sticky activity counters: {e}")
+        return 0
+    return len(pending)
+
+
+async def flush_sticky_activity_periodically(bot: discord.Client) -> None:
+    """Background task: batched counter writes every ACTIVITY_FLUSH_INTERVAL seconds."""
+    while not bot.is_closed():
+        await asyncio.sleep(ACTIVITY_FLUSH_INTERVAL)
+        await flush_sticky_activity()
+
+
 async def _get_guild(bot: discord.Client, guild_id: str) -> Optional[discord.Guild]:
     """Get guild by ID, with fallback to fetch if not cached."""
     guild = bot.get_guild(int(guild_id))
@@ -244,8 +354,7 @@ class DraftStickyStrategy(StickyStrategy):
 
             if sticky_message.notification_message_id:
                 try:
-                    notification_message = await notification_channel.fetch_message(int(sticky_message.notification_message_id))
-                    await notification_message.edit(content=content)
+                    await edit_message(notification_channel, sticky_message.notification_message_id, content=content)
                     return sticky_message.notification_message_id
                 except discord.NotFound:
                     sticky_message.notification_message_id = None # Logic to fall through to send new
@@ -310,6 +419,7 @@ async def delete_sticky_message_record(sticky_message: Message, session: AsyncSe
     """Safely deletes a sticky message record and its associated notification."""
     try:        
         await session.delete(sticky_message)
+        _unregister_sticky(sticky_message.channel_id)
         logger.info(f"Deleted sticky message record for channel {sticky_message.channel_id}")
     except Exception as e:
         logger.error(f"Error deleting sticky message record: {e}")
@@ -385,6 +495,7 @@ async def handle_sticky_message_update(
 
     # Commit all changes
     await session.commit()
+    _register_sticky(sticky_message)
 
     # Delete old message
     try:
@@ -409,30 +520,36 @@ async def check_channels_for_inactivity(bot: discord.Client) -> None:
 
     while not bot.is_closed():
         current_time = time.time()
-        async with AsyncSessionLocal() as session:
-            sticky_messages = await fetch_all_sticky_messages(session)
-
-            for sticky_message in sticky_messages:
-                sticky_key = f"{sticky_message.channel_id}-{sticky_message.id}"
-
-                if failure_tracker.get(sticky_key, 0) >= MAX_CONSECUTIVE_FAILURES:
-                    continue
-
-                elapsed_time = current_time - sticky_message.last_activity
-                time_since_last_update = current_time - (sticky_message.last_update_time or 0)
-
-                should_update = False
-
-                # Inactivity check: channel quiet for a while with pending messages
-                if elapsed_time >= INACTIVITY_THRESHOLD and sticky_message.message_count >= MESSAGES_BEFORE_REGULAR_UPDATE:
-                    should_update = True
-                # Volume check: many messages, respecting anti-spam cooldown
-                elif (sticky_message.message_count >= MESSAGES_BEFORE_VOLUME_UPDATE and
-                      time_since_last_update >= ANTI_SPAM_COOLDOWN_SECONDS):
-                    should_update = True
-
-                if should_update:
+        due = []
+        for channel_id, activity in list(_STICKY_ACTIVITY.items()):
+            sticky_key = f"{channel_id}-{activity.row_id}"
+
+            if failure_tracker.get(sticky_key, 0) >= MAX_CONSECUTIVE_FAILURES:
+                continue
+
+            elapsed_time = current_time - activity.last_activity
+            time_since_last_update = current_time - activity.last_update_time
+
+            # Inactivity check: channel quiet for a while with pending messages
+            if elapsed_time >= INACTIVITY_THRESHOLD and activity.message_count >= MESSAGES_BEFORE_REGULAR_UPDATE:
+                due.append((channel_id, sticky_key))
+            # Volume check: many messages, respecting anti-spam cooldown
+            elif (activity.message_count >= MESSAGES_BEFORE_VOLUME_UPDATE and
+                  time_since_last_update >= ANTI_SPAM_COOLDOWN_SECONDS):
+                due.append((channel_id, sticky_key))
+
+        if due:
+            async with AsyncSessionLocal() as session:
+                for channel_id, sticky_key in due:
                     try:
+                        sticky_message = await fetch_sticky_message(channel_id, session)
+                        activity = _STICKY_ACTIVITY.get(channel_id)
+                        if sticky_message is None or activity is None:
+                            _unregister_sticky(channel_id)
+                            continue
+                        # The row's counters lag the registry by up to one flush.
+                        sticky_message.message_count = activity.message_count
+                        sticky_message.last_activity = activity.last_activity
                         result = await handle_sticky_message_update(sticky_message, bot, session)
                         if result == StickyUpdateResult.SUCCESS or result == StickyUpdateResult.CLEANED_UP:
                             failure_tracker[sticky_key] = 0
@@ -449,22 +566,15 @@ async def check_channels_for_inactivity(bot: discord.Client) -> None:
 async def setup_sticky_handler(bot: discord.Client) -> None:
     """Sets up event handlers for managing sticky messages in Discord."""
     logger.info("Setting up sticky message handler")
+    await load_sticky_registry()
     bot.loop.create_task(check_channels_for_inactivity(bot))
+    bot.loop.create_task(flush_sticky_activity_periodically(bot))
 
     @bot.event
     async def on_message(message: discord.Message) -> None:
         if message.author.bot:
             return
-
-        current_time = time.time()
-        async with AsyncSessionLocal() as session:
-            sticky_message = await fetch_sticky_message(str(message.channel.id), session)
-            if not sticky_message:
-                return
-
-            sticky_message.last_activity = current_time
-            sticky_message.message_count += 1
-            await session.commit()
+        record_sticky_activity(str(message.channel.id), time.time())
 
     @bot.event
     async def on_message_unpin(message: discord.Message) -> None:
@@ -527,6 +637,7 @@ async def make_message_sticky(
         await strategy.on_update_success(sticky_message, message, bot, session)
 
         await session.commit()
+        _register_sticky(sticky_message)
         logger.info(f"Sticky message ID {message.id} committed for channel {channel_id}")
 
 
@@ -549,4 +660,5 @@ async def remove_sticky_message(message: discord.Message) -> None:
                 logger.error(f"Error deleting notification: {e}")
 
         await session.delete(sticky_message)
-        await session.commit()
\ No newline at end of file
+        await session.commit()
+        _unregister_sticky(sticky_message.channel_id)
\ No newline at end of file
@@ -1,12 +1,17 @@
 """Pure team-based Swiss pairing functions.
 
-Adapted from the player-based algorithm in draft_organization/tournament.py,
-generalized to any team count with global backtracking (so down-pairing across
-points groups works) and an injectable RNG for deterministic tests.
+A round is paired as one maximum-weight perfect matching over all teams
+(draft_organization/matching.py): every pair costs the squared points
+difference, plus a rematch penalty larger than any possible total of points
+differences. So the optimum has the fewest rematches the field allows and,
+among those, pairs teams as close in points as possible -- down-pairing
+across points groups included -- in polynomial time. The RNG is injectable
+for deterministic tests.
 
 Teams are plain dicts: {"id": <participant id>, "points": int, "byes": int}.
 ``previous_matchups`` is a set of frozenset({id_a, id_b}).
 """
+from draft_organization.matching import max_weight_matching
 
 
 def round_robin_schedule(team_ids, rng=None):
@@ -98,10 +103,11 @@ def assign_bye(teams, rng):
 def pair_round(teams, previous_matchups, rng):
     """Pair a round of Swiss. Returns (pairs, bye_id).
 
-    pairs is a list of (id_a, id_b); bye_id is None for even team counts.
-    Teams are ordered by points (shuffled within equal-points groups), then
-    paired top-down with backtracking to avoid rematches. If no rematch-free
-    configuration exists, rematches are allowed rather than failing the round.
+    pairs is a list of (id_a, id_b), top of the standings first; bye_id is
+    None for even team counts. Teams are ordered by points (shuffled within
+    equal-points groups, which breaks ties between equally good pairings),
+    then paired by maximum-weight matching: fewest rematches first, then the
+    smallest points differences. Rematches happen only when unavoidable.
     """
     teams = list(teams)
     bye_id = None
@@ -118,25 +124,25 @@ def pair_round(teams, previous_matchups, rng):
         rng.shuffle(group)
         ordered.extend(group)
 
-    pairs = []
-    if _pair_backtracking(ordered, previous_matchups, pairs):
-        return pairs, bye_id
-
-    # No rematch-free configuration exists: pair in standings order anyway.
-    pairs = [(ordered[i], ordered[i + 1]) for i in range(0, len(ordered), 2)]
-    return pairs, bye_id
-
-
-def _pair_backtracking(ordered, previous_matchups, pairs):
-    if not ordered:
-        return True
-    first = ordered[0]
-    for i in range(1, len(ordered)):
-        opponent = ordered[i]
-        if frozenset((first, opponent)) in previous_matchups:
-            continue
-        pairs.append((first, opponent))
-        if _pair_backtracking(ordered[1:i] + ordered[i + 1:], previous_matchups, pairs):
-            return True
-        pairs.pop()
-    return False
+    points = {t["id"]: t["points"] for t in teams}
+    return _pair_by_matching(ordered, points, previous_matchups), bye_id
+
+
+def _pair_by_matching(ordered, points, previous_matchups):
+    n = len(ordered)
+    if n == 0:
+        return []
+    values = [points[tid] for tid in ordered]
+    max_diff_cost = (max(values) - min(values)) ** 2
+    # One rematch outweighs every points difference the round could contain.
+    rematch_penalty = (n // 2) * max_diff_cost + 1
+    base = rematch_penalty + max_diff_cost + 1   # keeps every weight positive
+    edges = []
+    for i in range(n):
+        for j in range(i + 1, n):
+            cost = (values[i] - values[j]) ** 2
+            if frozenset((ordered[i], ordered[j])) in previous_matchups:
+                cost += rematch_penalty
+            edges.append((i, j, base - cost))
+    mate = max_weight_matching(edges, maxcardinality=True)
+    return [(ordered[i], ordered[mate[i]]) for i in range(n) if i < mate[i]]
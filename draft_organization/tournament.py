@@ -1,5 +1,7 @@
 import random
 
+from draft_organization.swiss import pair_round
+
 class Tournament:
     def __init__(self, sign_ups=None, from_state=None):
         if from_state:
@@ -54,48 +56,15 @@ class Tournament:
             return self.pairings  # Initial pairings
 
         self.round_number += 1
-        points_groups = {}
-        for player_id, details in self.players.items():
-            points = details['win_points']
-            if points not in points_groups:
-                points_groups[points] = []
-            points_groups[points].append(player_id)
-
-        pairings = []
         print(f"Pairings for Round {self.round_number}")
-        for points, group in sorted(points_groups.items(), key=lambda item: item[0], reverse=True):
-            random.shuffle(group)
-            group_pairings = []
-            if not self.find_pairings(group, group_pairings, set()):
-                print(f"Failed to find pairings for group with {points} points: {group}")
-            pairings.extend(group_pairings)
-
+        teams = [
+            {"id": player_id, "points": details['win_points'], "byes": 0}
+            for player_id, details in self.players.items()
+        ]
+        previous_matchups = {
+            frozenset((player_id, opponent))
+            for player_id, details in self.players.items()
+            for opponent in details['opponents']
+        }
+        pairings, _ = pair_round(teams, previous_matchups, random)
         return pairings
-
-    def find_pairings(self, group, group_pairings, used):
-        if not group:
-            print("All players paired successfully.")
-            return True  # All players are paired, valid configuration found
-
-        player1 = group[0]
-        print(f"Trying to find pair for {self.players[player1]['display_name']} ({player1})")
-        
-        for i in range(1, len(group)):
-            player2 = group[i]
-            if player2 not in self.players[player1]['opponents'] and player2 not in used:
-                print(f"Pairing {self.players[player1]['display_name']} ({player1}) with {self.players[player2]['display_name']} ({player2})")
-                # Tentatively pair them
-                group_pairings.append((player1, player2))
-                used.add(player1)
-                used.add(player2)
-                # Recursively try to pair the rest
-                if self.find_pairings([p for p in group if p not in used], group_pairings, used):
-                    return True  # Successful pairing configuration
-                # Backtrack if not successful
-                print(f"Backtracking from pairing {self.players[player1]['display_name']} ({player1}) and {self.players[player2]['display_name']} ({player2})")
-                group_pairings.pop()
-                used.remove(player1)
-                used.remove(player2)
-
-        print(f"No valid pairings found for {self.players[player1]['display_name']} ({player1}) at this path.")
-        return False  # No valid pairing configuration found for this entry point
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""Persistent, pre-resized card-image cache for the pack, pile and quiz
+compositors.
+
+Images are stored on local disk already resized to the size a compositor
+pastes them at (PACK_CARD_SIZE / PILE_CARD_SIZE) and encoded as WebP, keyed by
+card id, printing (the captured image URL) and size. A hit is a small file read
+and decode -- no network, no Scryfall throttle, no LANCZOS. Misses go through
+fetch_card_image on one shared aiohttp session for the process. The directory
+is size-bounded LRU (file mtime, touched on every hit).
+
+CARD_IMAGE_CACHE_DIR (default .cache/card_images) and CARD_IMAGE_CACHE_MB
+(default 512; 0 disables the disk layer) configure it.
+"""
+
+import asyncio
+import hashlib
+import os
+from io import BytesIO
+from typing import Iterable, Optional, Tuple
+
+import aiohttp
+from loguru import logger
+from PIL import Image
+
+from helpers.card_image_fetcher import build_image_url_ladder, fetch_card_image
+
+PACK_CARD_SIZE = (244, 340)
+PILE_CARD_SIZE = (160, 223)
+
+_WEBP_QUALITY = 85
+
+
+class CardImageCache:
+    """Size-bounded LRU directory of resized card images, one WebP file each."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, card_id: str, printing: str, size: Tuple[int, int]) -> str:
+        key = f"{card_id}|{printing}|{size[0]}x{size[1]}"
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".webp")
+
+    def get(self, card_id: str, printing: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        path = self._path(card_id, printing, size)
+        try:
+            with open(path, "rb") as f:
+                img = Image.open(BytesIO(f.read()))
+                img.load()
+            os.utime(path)
+        except Exception:
+            return None
+        return img
+
+    def put(self, card_id: str, printing: str, size: Tuple[int, int], img: Image.Image) -> None:
+        buf = BytesIO()
+        img.save(buf, format="WEBP", quality=_WEBP_QUALITY)
+        body = buf.getvalue()
+        if len(body) > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(card_id, printing, size)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def _disk_cache() -> Optional[CardImageCache]:
+    cache_mb = int(os.getenv("CARD_IMAGE_CACHE_MB", "512"))
+    if cache_mb <= 0:
+        return None
+    return CardImageCache(
+        os.getenv("CARD_IMAGE_CACHE_DIR", os.path.join(".cache", "card_images")),
+        cache_mb * 1024 * 1024,
+    )
+
+
+class _SharedSession:
+    """One aiohttp session for every card-image fetch in the process, rebound
+    if the running event loop changes (only tests do that)."""
+
+    def __init__(self):
+        self._loop = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def get(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop or self._session is None or self._session.closed:
+            self._loop = loop
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._loop = None
+        self._session = None
+
+
+_SESSION = _SharedSession()
+
+
+async def close_card_image_session() -> None:
+    """Close the shared card-image HTTP session. Called once on shutdown (bot.py)."""
+    await _SESSION.close()
+
+
+def _printing(card_id: str, carddata: dict) -> str:
+    ladder = build_image_url_ladder(card_id, carddata)
+    return ladder[0] if ladder else ""
+
+
+def _resize(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    if img.size != size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def _resize_and_store(cache: Optional[CardImageCache], card_id: str, printing: str,
+                      size: Tuple[int, int], img: Image.Image) -> Image.Image:
+    img = _resize(img, size)
+    if cache is not None:
+        try:
+            cache.put(card_id, printing, size, img)
+        except Exception as e:
+            logger.warning(f"[card-image] could not cache {card_id}: {e}")
+    return img
+
+
+async def get_card_image(
+    card_id: str,
+    carddata: dict,
+    size: Tuple[int, int],
+    *,
+    timeout: int = 10,
+    deadline: Optional[float] = None,
+) -> Optional[Image.Image]:
+    """One card image at `size`, from the disk cache or fetched, resized and
+    stored. None when the fetch ladder is exhausted (see fetch_card_image)."""
+    cache = _disk_cache()
+    printing = _printing(card_id, carddata)
+    if cache is not None:
+        img = await asyncio.to_thread(cache.get, card_id, printing, size)
+        if img is not None:
+            return img
+    img = await fetch_card_image(_SESSION.get(), card_id, carddata, timeout=timeout, deadline=deadline)
+    if img is None:
+        return None
+    return await asyncio.to_thread(_resize_and_store, cache, card_id, printing, size, img)
+
+
+async def warm_card_images(
+    card_ids: Iterable[str],
+    carddata: dict,
+    sizes: Iterable[Tuple[int, int]] = (PACK_CARD_SIZE, PILE_CARD_SIZE),
+    concurrency: int = 10,
+) -> Tuple[int, int]:
+    """Pre-fetch every card at every size into the disk cache, one download
+    per card. Returns (cached, failed) card counts."""
+    cache = _disk_cache()
+    if cache is None:
+        logger.warning("[card-image] cache disabled (CARD_IMAGE_CACHE_MB=0); nothing to warm")
+        return 0, 0
+    sizes = list(sizes)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(card_id: str) -> bool:
+        printing = _printing(card_id, carddata)
+        missing = [size for size in sizes
+                   if await asyncio.to_thread(cache.get, card_id, printing, size) is None]
+        if not missing:
+            return True
+        async with semaphore:
+            img = await fetch_card_image(_SESSION.get(), card_id, carddata)
+        if img is None:
+            return False
+        for size in missing:
+            await asyncio.to_thread(_resize_and_store, cache, card_id, printing, size, img)
+        return True
+
+    results = await asyncio.gather(*(_one(cid) for cid in dict.fromkeys(card_ids)))
+    cached = sum(1 for ok in results if ok)
+    return cached, len(results) - cached
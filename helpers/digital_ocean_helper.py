@@ -1,9 +1,14 @@
 import os
 import json
+import asyncio
+import hashlib
 import logging
+from contextlib import AsyncExitStack
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 import aiobotocore.session
+from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
 
 
 @dataclass
@@ -13,6 +18,143 @@ class UploadResult:
     object_path: Optional[str] = None
 
 
+# Connections kept open per pooled client. Quiz rounds and /history fan out a
+# handful of concurrent downloads; botocore's default of 10 is about right.
+MAX_POOL_CONNECTIONS = 10
+
+
+class _ClientPool:
+    """One long-lived S3 client per (endpoint, credentials), shared by every
+    DigitalOceanHelper in the process, so TLS and connection setup are paid
+    once instead of on every call.
+
+    A client is bound to the event loop it was opened on (aiohttp). If the
+    running loop changes -- only tests do that -- the old clients are dropped
+    (their loop is gone, so they can't be closed on it) and fresh ones opened.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._stack: Optional[AsyncExitStack] = None
+        self._clients: Dict[tuple, Any] = {}
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._stack = AsyncExitStack()
+            self._clients = {}
+            self._lock = asyncio.Lock()
+
+    async def get(self, endpoint: str, region: str, key: str, secret: str):
+        self._bind_loop()
+        pool_key = (endpoint, region, key)
+        client = self._clients.get(pool_key)
+        if client is not None:
+            return client
+        async with self._lock:
+            if pool_key not in self._clients:
+                session = aiobotocore.session.AioSession()
+                self._clients[pool_key] = await self._stack.enter_async_context(
+                    session.create_client(
+                        's3',
+                        region_name=region,
+                        endpoint_url=endpoint,
+                        aws_access_key_id=key,
+                        aws_secret_access_key=secret,
+                        config=AioConfig(max_pool_connections=MAX_POOL_CONNECTIONS),
+                    ))
+            return self._clients[pool_key]
+
+    async def close(self) -> None:
+        if self._stack is not None and self._loop is asyncio.get_running_loop():
+            await self._stack.aclose()
+        self._loop = None
+        self._stack = None
+        self._clients = {}
+
+
+_POOL = _ClientPool()
+
+
+class _PooledClient:
+    """What create_client() hands out: ``async with`` yields the shared client
+    and leaves it open on exit, so call sites keep their usual shape."""
+
+    def __init__(self, endpoint: str, region: str, key: str, secret: str):
+        self._args = (endpoint, region, key, secret)
+
+    async def __aenter__(self):
+        return await _POOL.get(*self._args)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+async def close_spaces_clients() -> None:
+    """Close the pooled S3 clients. Called once on shutdown (bot.py)."""
+    await _POOL.close()
+
+
+class _DiskCache:
+    """Size-bounded LRU cache of downloaded objects on local disk.
+
+    One file per object key (named by its SHA-256), holding the object's ETag
+    on the first line and the raw body after it. download_json revalidates
+    with a conditional GET (If-None-Match), so a hit costs a round trip on the
+    pooled connection but no body transfer -- and an overwritten key is
+    refetched, never served stale. Recency is the file's mtime, touched on
+    every hit; put() evicts least-recently-used files past max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, object_key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(object_key.encode('utf-8')).hexdigest())
+
+    def get(self, object_key: str) -> Optional[Tuple[str, bytes]]:
+        """(etag, body) for a cached object, or None."""
+        path = self._path(object_key)
+        try:
+            with open(path, 'rb') as f:
+                etag, _, body = f.read().partition(b'\n')
+            os.utime(path)
+        except OSError:
+            return None
+        return etag.decode('utf-8'), body
+
+    def put(self, object_key: str, etag: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(object_key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(etag.encode('utf-8') + b'\n' + body)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
 class DigitalOceanHelper:
     """Helper class for interacting with Digital Ocean Spaces"""
     
@@ -39,35 +181,39 @@ class DigitalOceanHelper:
 
         if not self.config_valid:
             self.logger.warning("Missing DigitalOcean Spaces configuration")
+
+        # Local read-through cache for download_json; DO_SPACES_CACHE_MB=0 disables it.
+        cache_mb = int(os.getenv("DO_SPACES_CACHE_MB", "256"))
+        self.cache = _DiskCache(
+            os.getenv("DO_SPACES_CACHE_DIR", os.path.join(".cache", "spaces")),
+            cache_mb * 1024 * 1024,
+        ) if cache_mb > 0 else None
     
     async def create_client(self):
-        """Create and return an S3 client for Digital Ocean Spaces (bucket-specific endpoint)"""
+        """The pooled S3 client for Digital Ocean Spaces (bucket-specific endpoint),
+        as an async context manager that leaves the shared client open."""
         if not self.config_valid:
             return None
 
-        session = aiobotocore.session.AioSession()
-        return session.create_client(
-            's3',
-            region_name=self.region,
-            endpoint_url=self.endpoint,  # Bucket-specific endpoint
-            aws_access_key_id=self.key,
-            aws_secret_access_key=self.secret
-        )
+        return _PooledClient(self.endpoint, self.region, self.key, self.secret)
 
     async def create_raw_client(self):
-        """Create and return an S3 client for listing operations (raw endpoint)"""
+        """The pooled S3 client for listing operations (raw endpoint)"""
         if not self.config_valid or not self.raw_endpoint:
             return None
 
-        session = aiobotocore.session.AioSession()
-        return session.create_client(
-            's3',
-            region_name=self.region,
-            endpoint_url=self.raw_endpoint,  # Region-only endpoint for listing
-            aws_access_key_id=self.key,
-            aws_secret_access_key=self.secret
-        )
+        return _PooledClient(self.raw_endpoint, self.region, self.key, self.secret)
     
+    async def _cache_store(self, object_path: str, etag: Optional[str], body: bytes) -> None:
+        """Best-effort write to the disk cache; a full or read-only disk only
+        costs the next download, never this call."""
+        if not self.cache or not etag:
+            return
+        try:
+            await asyncio.to_thread(self.cache.put, object_path, etag, body)
+        except OSError as e:
+            self.logger.warning(f"Could not cache {object_path}: {e}")
+
     async def upload_json(
         self,
         data: Dict[str, Any],
@@ -95,15 +241,18 @@ class DigitalOceanHelper:
                 return UploadResult(success=False)
 
             object_path = f'{folder}/{filename}'
+            body = json.dumps(data).encode('utf-8')
 
             async with client as s3:
-                await s3.put_object(
+                response = await s3.put_object(
                     Bucket=self.bucket,
                     Key=object_path,
-                    Body=json.dumps(data),
+                    Body=body,
                     ContentType='application/json',
                     ACL='public-read'
                 )
+            # Seed the read cache: the freshly captured log is usually read back soon.
+            await self._cache_store(object_path, response.get('ETag'), body)
 
             self.logger.info(f"Data uploaded to DigitalOcean Space: {object_path}")
             return UploadResult(success=True, object_path=object_path)
@@ -166,6 +315,9 @@ class DigitalOceanHelper:
 
         Returns:
             Parsed JSON data or None if download failed
+
+        Served from the local disk cache when the object's ETag still matches
+        (a conditional GET, no body transfer).
         """
         if not self.config_valid:
             self.logger.warning("Cannot download: Missing Digital Ocean Spaces configuration")
@@ -176,14 +328,23 @@ class DigitalOceanHelper:
             if not client:
                 return None
 
+            cached = await asyncio.to_thread(self.cache.get, object_path) if self.cache else None
+            kwargs = {"Bucket": self.bucket, "Key": object_path}
+            if cached:
+                kwargs["IfNoneMatch"] = cached[0]
+
             async with client as s3:
-                response = await s3.get_object(
-                    Bucket=self.bucket,
-                    Key=object_path
-                )
+                try:
+                    response = await s3.get_object(**kwargs)
+                except ClientError as e:
+                    if not cached or e.response.get('Error', {}).get('Code') not in ('304', 'NotModified'):
+                        raise
+                    self.logger.debug(f"Cache hit for DigitalOcean Space object: {object_path}")
+                    return json.loads(cached[1].decode('utf-8'))
                 body = await response['Body'].read()
                 data = json.loads(body.decode('utf-8'))
 
+            await self._cache_store(object_path, response.get('ETag'), body)
             self.logger.info(f"Data downloaded from DigitalOcean Space: {object_path}")
             return data
 
@@ -245,4 +406,13 @@ class DigitalOceanHelper:
         Returns:
             The public URL
         """
-        return f"https://{self.bucket}.{self.region}.digitaloceanspaces.com/{object_path}"
\ No newline at end of file
+        return f"https://{self.bucket}.{self.region}.digitaloceanspaces.com/{object_path}"
+
+async def open_spaces_clients() -> None:
+    """Open the pooled clients up front (bot startup) so the first draft log
+    fetch doesn't pay for it. A no-op without Spaces configuration."""
+    helper = DigitalOceanHelper()
+    for client in (await helper.create_client(), await helper.create_raw_client()):
+        if client:
+            async with client:
+                pass
@@ -1,13 +1,31 @@
 from datetime import datetime
+import asyncio
 import os
 import urllib.parse
 import logging
 import aiohttp
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from .digital_ocean_helper import DigitalOceanHelper
 from services.draft_log_store import split_decklist, build_mtgo_deck_text
 
+MPT_API_URL = "https://magicprotools.com/api/draft/add"
+MPT_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Referer": "https://draftmancer.com",
+}
+# Publishing a finished draft submits one request per seat; these bound how
+# many are in flight at once and how hard a flaky request is retried.
+MPT_CONCURRENCY = 4
+MPT_MAX_ATTEMPTS = 3
+MPT_RETRY_BASE_DELAY = 0.5  # seconds, doubled per retry
+MPT_REQUEST_TIMEOUT = 30  # seconds
+
+
+class _RetryableMPTError(Exception):
+    """A transient failure (connection error, timeout, 429/5xx) worth another attempt."""
+
 
 class MagicProtoolsHelper:
     """Helper class for interacting with MagicProTools"""
@@ -25,8 +43,19 @@ class MagicProtoolsHelper:
         tokens = params.get("deck")
         return tokens[0] if tokens else None
 
-    def convert_to_magicprotools_format(self, draft_log: Dict[str, Any], user_id: str, anonymize: bool = False) -> str:
-        """Convert a draft log JSON to MagicProTools format for a specific user."""
+    def _booster_header(self, draft_log: Dict[str, Any]) -> str:
+        """The per-pack header line: the set code for single-set drafts, else Cube."""
+        if (draft_log.get('setRestriction') and 
+            len(draft_log['setRestriction']) == 1 and
+            len([card for card in draft_log['carddata'].values() if card['set'] == draft_log['setRestriction'][0]]) >= 
+            0.5 * len(draft_log['carddata'])):
+            return f"------ {draft_log['setRestriction'][0].upper()} ------"
+        return "------ Cube ------"
+
+    def convert_to_magicprotools_format(self, draft_log: Dict[str, Any], user_id: str, anonymize: bool = False,
+                                        booster_header: Optional[str] = None) -> str:
+        """Convert a draft log JSON to MagicProTools format for a specific user.
+        `booster_header` may be passed in when rendering many seats of one log."""
         output = []
 
         # Basic draft info
@@ -47,15 +76,9 @@ class MagicProtoolsHelper:
         
         output.append("")
         
-        # Determine booster header
-        if (draft_log.get('setRestriction') and 
-            len(draft_log['setRestriction']) == 1 and
-            len([card for card in draft_log['carddata'].values() if card['set'] == draft_log['setRestriction'][0]]) >= 
-            0.5 * len(draft_log['carddata'])):
-            booster_header = f"------ {draft_log['setRestriction'][0].upper()} ------"
-        else:
-            booster_header = "------ Cube ------"
-        
+        if booster_header is None:
+            booster_header = self._booster_header(draft_log)
+
         # Group picks by pack
         picks = draft_log['users'][user_id]['picks']
         picks_by_pack = {}
@@ -105,6 +128,78 @@ class MagicProtoolsHelper:
         
         return "\n".join(output)
     
+    def _deck_text(self, draft_data: Dict[str, Any], user_id: str) -> Optional[str]:
+        """The player's built deck as MTGO text, or None (best-effort)."""
+        try:
+            split = split_decklist(draft_data, user_id)
+            return build_mtgo_deck_text(split, draft_data.get("carddata", {})) or None
+        except Exception as e:
+            self.logger.warning(f"[MPT] deck build failed for user {user_id}, submitting draft-only: {e}")
+            return None
+
+    def _build_payloads(self, draft_data: Dict[str, Any], user_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        """Render the POST body for each seat of one log. CPU-bound; callers run
+        it off the event loop."""
+        booster_header = self._booster_header(draft_data)
+        payloads = {}
+        for user_id in user_ids:
+            try:
+                data = {
+                    "draft": self.convert_to_magicprotools_format(
+                        draft_data, user_id, booster_header=booster_header),
+                    "apiKey": self.api_key,
+                    "platform": "mtgadraft",
+                }
+            except Exception as e:
+                self.logger.error(f"[MPT] conversion failed for user {user_id}: {e}")
+                continue
+            deck_text = self._deck_text(draft_data, user_id)
+            if deck_text:
+                data["deck"] = deck_text
+            payloads[user_id] = data
+        return payloads
+
+    async def _post_once(self, session: aiohttp.ClientSession, data: Dict[str, str], label: str) -> Optional[str]:
+        """One POST to /api/draft/add. Returns the url, None on a definitive
+        failure, or raises _RetryableMPTError on a transient one."""
+        try:
+            async with session.post(MPT_API_URL, headers=MPT_HEADERS, data=data) as resp:
+                if resp.status == 429 or resp.status >= 500:
+                    raise _RetryableMPTError(f"status {resp.status}")
+                if resp.status != 200:
+                    self.logger.warning(f"[MPT] non-200 status {resp.status} for {label}")
+                    try:
+                        self.logger.debug(f"[MPT] Response body: {(await resp.text())[:200]}")
+                    except Exception as text_err:
+                        self.logger.debug(f"[MPT] Could not read response body: {text_err}")
+                    return None
+                body = await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise _RetryableMPTError(repr(e)) from e
+        if body.get("error") or "url" not in body:
+            self.logger.warning(
+                f"[MPT] bad body for {label}: error={body.get('error')!r} "
+                f"url_present={'url' in body}"
+            )
+            return None
+        result_url = body["url"]
+        self.logger.info(f"[MPT] SUCCESS: got url for {label}: {result_url}")
+        return result_url
+
+    async def _post_with_retry(self, session: aiohttp.ClientSession, data: Dict[str, str], label: str) -> Optional[str]:
+        """_post_once, retried with exponential backoff on transient failures."""
+        for attempt in range(1, MPT_MAX_ATTEMPTS + 1):
+            try:
+                return await self._post_once(session, data, label)
+            except _RetryableMPTError as e:
+                if attempt == MPT_MAX_ATTEMPTS:
+                    self.logger.error(f"[MPT] giving up on {label} after {attempt} attempts: {e}")
+                    return None
+                delay = MPT_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                self.logger.warning(f"[MPT] attempt {attempt} for {label} failed ({e}); retrying in {delay}s")
+                await asyncio.sleep(delay)
+        return None
+
     async def _submit_draft(
         self,
         user_id: str,
@@ -126,37 +221,12 @@ class MagicProtoolsHelper:
             data = {"draft": draft, "apiKey": self.api_key, "platform": "mtgadraft"}
             if deck_text:
                 data["deck"] = deck_text
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Referer": "https://draftmancer.com",
-            }
             self.logger.info(
                 f"[MPT] Submitting draft for user {user_name} (session {session_id}, "
                 f"deck={'yes' if deck_text else 'no'}, anonymize={anonymize})"
             )
             async with aiohttp.ClientSession() as session:
-                async with session.post("https://magicprotools.com/api/draft/add",
-                                        headers=headers, data=data) as resp:
-                    if resp.status != 200:
-                        self.logger.warning(
-                            f"[MPT] non-200 status {resp.status} for user {user_name} (session {session_id})"
-                        )
-                        try:
-                            self.logger.debug(f"[MPT] Response body: {(await resp.text())[:200]}")
-                        except Exception as text_err:
-                            self.logger.debug(f"[MPT] Could not read response body: {text_err}")
-                        return None
-                    body = await resp.json()
-            if body.get("error") or "url" not in body:
-                self.logger.warning(
-                    f"[MPT] bad body for user {user_name}: error={body.get('error')!r} "
-                    f"url_present={'url' in body}"
-                )
-                return None
-            result_url = body["url"]
-            self.logger.info(f"[MPT] SUCCESS: got url for user {user_name}: {result_url}")
-            return result_url
+                return await self._post_with_retry(session, data, f"user {user_name} (session {session_id})")
         except Exception as e:
             self.logger.error(f"[MPT] submit failed for user {user_name}: {e}")
             return None
@@ -165,14 +235,46 @@ class MagicProtoolsHelper:
         """Submit draft data to the MagicProTools API with the player's built deck
         attached (best-effort), so the returned URL opens the draft with that deck.
         Returns the MPT URL if successful, None otherwise."""
-        deck_text = None
-        try:
-            split = split_decklist(draft_data, user_id)
-            deck_text = build_mtgo_deck_text(split, draft_data.get("carddata", {})) or None
-        except Exception as e:
-            self.logger.warning(f"[MPT] deck build failed for user {user_id}, submitting draft-only: {e}")
-            deck_text = None
+        deck_text = self._deck_text(draft_data, user_id)
         return await self._submit_draft(user_id, draft_data, deck_text=deck_text, anonymize=False)
+
+    async def submit_all(
+        self,
+        user_ids: List[str],
+        draft_data: Dict[str, Any],
+        concurrency: int = MPT_CONCURRENCY,
+    ) -> Dict[str, Optional[str]]:
+        """submit_to_api for every seat of one log at once: the bodies are
+        rendered in a worker thread, then posted over one shared session with
+        at most `concurrency` requests in flight. Returns {user_id: url or None}."""
+        results: Dict[str, Optional[str]] = {user_id: None for user_id in user_ids}
+        session_id = draft_data.get("sessionID", "unknown")
+        if not self.api_key:
+            self.logger.warning(f"[MPT] Missing API key, cannot submit session {session_id}")
+            return results
+        payloads = await asyncio.to_thread(self._build_payloads, draft_data, list(user_ids))
+        self.logger.info(
+            f"[MPT] Submitting {len(payloads)} drafts for session {session_id} (concurrency={concurrency})"
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        users = draft_data.get("users", {})
+
+        async def submit(session: aiohttp.ClientSession, user_id: str, data: Dict[str, str]) -> Tuple[str, Optional[str]]:
+            label = f"user {users.get(user_id, {}).get('userName', 'unknown')} (session {session_id})"
+            async with semaphore:
+                try:
+                    return user_id, await self._post_with_retry(session, data, label)
+                except Exception as e:
+                    self.logger.error(f"[MPT] submit failed for {label}: {e}")
+                    return user_id, None
+
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        timeout = aiohttp.ClientTimeout(total=MPT_REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            for user_id, url in await asyncio.gather(
+                    *(submit(session, user_id, data) for user_id, data in payloads.items())):
+                results[user_id] = url
+        return results
     
     async def submit_deck_view(self, user_id: str, draft_data: Dict[str, Any], deck_text: str) -> Optional[str]:
         """Upload the anonymized draft + deck to MPT; return the /deck/show URL or None."""
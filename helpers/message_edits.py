@@ -0,0 +1,174 @@
+"""Central, coalescing scheduler for Discord message edits.
+
+Edits are keyed by (channel_id, message_id). While an edit for a message is
+waiting, later edits for the same message merge into it (later fields win),
+so a sign-up burst that re-renders the same embed ten times costs one REST
+call. Edits go out through partial messages -- no fetch_message round trip --
+under a per-channel and a global sliding-window budget kept below Discord's
+limits, highest priority first: interaction follow-ups ahead of ordinary
+refreshes ahead of background boards (leaderboards).
+
+Callers await the edit and get the edited Message back, or the same
+discord exceptions (NotFound, Forbidden, HTTPException) a direct
+``message.edit`` raises; every caller coalesced into one edit shares its
+outcome.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import discord
+from loguru import logger
+
+PRIORITY_INTERACTION = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+# Discord allows roughly 5 message edits per 5s per channel and 50 requests/s
+# globally; stay under both so edits never reach the 429 path.
+CHANNEL_EDIT_BUDGET = (4, 5.0)   # (edits, per seconds) per channel
+GLOBAL_EDIT_BUDGET = (30, 1.0)   # (edits, per seconds) across all channels
+
+_Key = Tuple[int, int]
+
+
+class _PendingEdit:
+    __slots__ = ("channel", "message_id", "fields", "priority", "seq", "waiters")
+
+    def __init__(self, channel, message_id: int, fields: dict, priority: int, seq: int):
+        self.channel = channel
+        self.message_id = message_id
+        self.fields = fields
+        self.priority = priority
+        self.seq = seq
+        self.waiters: List[asyncio.Future] = []
+
+
+class _Window:
+    """Sliding-window request budget: at most `limit` starts per `period`."""
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self.starts: Deque[float] = deque()
+
+    def next_slot(self, now: float) -> float:
+        while self.starts and now - self.starts[0] >= self.period:
+            self.starts.popleft()
+        if len(self.starts) < self.limit:
+            return now
+        return self.starts[0] + self.period
+
+    def take(self, now: float) -> None:
+        self.starts.append(now)
+
+
+class MessageEditScheduler:
+    """One dispatcher per event loop; see the module docstring."""
+
+    def __init__(self, channel_budget=CHANNEL_EDIT_BUDGET, global_budget=GLOBAL_EDIT_BUDGET):
+        self.channel_budget = channel_budget
+        self._global = _Window(*global_budget)
+        self._channels: Dict[int, _Window] = {}
+        self._pending: Dict[_Key, _PendingEdit] = {}
+        self._in_flight: set = set()
+        self._seq = itertools.count()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Only tests run more than one loop per process.
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._dispatcher = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._run())
+        self._wake.set()
+
+    async def edit(self, channel, message_id, *, priority: int = PRIORITY_NORMAL, **fields) -> discord.Message:
+        """Queue an edit of `message_id` in `channel` (anything with
+        get_partial_message: a text channel, thread or PartialMessageable)
+        and wait for it to be sent."""
+        key = (int(channel.id), int(message_id))
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingEdit(channel, int(message_id), dict(fields), priority, next(self._seq))
+            self._pending[key] = pending
+        else:
+            pending.fields.update(fields)
+            pending.priority = min(pending.priority, priority)
+            pending.channel = channel
+        pending.waiters.append(future)
+        self._ensure_dispatcher()
+        return await future
+
+    def _channel_window(self, channel_id: int) -> _Window:
+        window = self._channels.get(channel_id)
+        if window is None:
+            window = self._channels[channel_id] = _Window(*self.channel_budget)
+        return window
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            if not self._pending:
+                await self._wake.wait()
+                continue
+            now = time.monotonic()
+            ready, retry_at = [], None
+            for key, pending in self._pending.items():
+                if key in self._in_flight:
+                    continue   # keep edits to one message in order
+                slot = self._channel_window(key[0]).next_slot(now)
+                if slot <= now:
+                    ready.append((pending.priority, pending.seq, key))
+                elif retry_at is None or slot < retry_at:
+                    retry_at = slot
+            global_slot = self._global.next_slot(now)
+            if not ready or global_slot > now:
+                wait_until = global_slot if ready else retry_at
+                timeout = None if wait_until is None else max(0.0, wait_until - now)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, key = min(ready)
+            pending = self._pending.pop(key)
+            self._channel_window(key[0]).take(now)
+            self._global.take(now)
+            self._in_flight.add(key)
+            asyncio.get_running_loop().create_task(self._send(key, pending))
+
+    async def _send(self, key: _Key, pending: _PendingEdit) -> None:
+        try:
+            message = await pending.channel.get_partial_message(pending.message_id).edit(**pending.fields)
+        except Exception as e:
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+        else:
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.set_result(message)
+        finally:
+            self._in_flight.discard(key)
+            if len(pending.waiters) > 1:
+                logger.debug(f"[edits] coalesced {len(pending.waiters)} edits of message {pending.message_id}")
+            if self._wake is not None:
+                self._wake.set()
+
+
+_SCHEDULER = MessageEditScheduler()
+
+
+async def edit_message(channel, message_id, *, priority: int = PRIORITY_NORMAL, **fields) -> discord.Message:
+    """Edit a message through the process-wide scheduler, without fetching it."""
+    return await _SCHEDULER.edit(channel, message_id, priority=priority, **fields)
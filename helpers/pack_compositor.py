@@ -1,18 +1,18 @@
 """
 Pack Compositor - Generate visual composite images of MTG card packs for quiz display.
 
-This module downloads Scryfall card images and composites them into a grid layout.
+This module loads card images (through the shared on-disk card-image cache) and
+composites them into a grid layout.
 """
 
 import asyncio
 import time
-import aiohttp
 from io import BytesIO
 from PIL import Image
 from typing import Optional, List
 from loguru import logger
 
-from helpers.card_image_fetcher import fetch_card_image
+from helpers.card_image_cache import get_card_image
 
 PACK_COMPOSITE_DEADLINE_SECONDS = 45
 
@@ -35,15 +35,16 @@ class PackCompositor:
 
     async def download_card_image(
         self,
-        session: aiohttp.ClientSession,
         card_id: str,
         carddata: dict,
         timeout: int = 10,
         deadline: Optional[float] = None,
     ) -> Optional[Image.Image]:
-        """Download one card image via the shared retry-aware fetcher."""
-        return await fetch_card_image(
-            session, card_id, carddata, timeout=timeout, deadline=deadline
+        """One card image at this compositor's card size, from the card-image
+        cache or fetched via the shared retry-aware fetcher."""
+        return await get_card_image(
+            card_id, carddata, (self.card_width, self.card_height),
+            timeout=timeout, deadline=deadline,
         )
 
     async def create_pack_composite(
@@ -72,17 +73,16 @@ class PackCompositor:
             deadline = time.monotonic() + PACK_COMPOSITE_DEADLINE_SECONDS
             semaphore = asyncio.Semaphore(10)
 
-            async def _one(session, card_id):
+            async def _one(card_id):
                 async with semaphore:
                     return await self.download_card_image(
-                        session, card_id, carddata, timeout, deadline
+                        card_id, carddata, timeout, deadline
                     )
 
-            async with aiohttp.ClientSession() as session:
-                results = await asyncio.gather(
-                    *(_one(session, cid) for cid in pack_card_ids),
-                    return_exceptions=True,
-                )
+            results = await asyncio.gather(
+                *(_one(cid) for cid in pack_card_ids),
+                return_exceptions=True,
+            )
 
             valid_images = []
             for i, img in enumerate(results):
@@ -4,8 +4,8 @@ Buckets a pool by mana value (with a dedicated Lands column) and renders each
 bucket as an overlapping vertical stack: every card but the bottom one is
 offset down by a name-bar height so its name/mana cost shows, and the bottom
 card shows full art. The composed image stacks the main deck block, a
-labeled SIDEBOARD divider, and the sideboard block vertically. Fetches art
-via the shared retry-aware fetcher and is all-or-nothing (any unfetchable
+labeled SIDEBOARD divider, and the sideboard block vertically. Loads art
+through the shared card-image cache and is all-or-nothing (any unfetchable
 card -> None)."""
 
 import asyncio
@@ -13,11 +13,10 @@ import time
 from io import BytesIO
 from typing import List, Optional, Tuple
 
-import aiohttp
 from loguru import logger
 from PIL import Image, ImageDraw, ImageFont
 
-from helpers.card_image_fetcher import fetch_card_image
+from helpers.card_image_cache import get_card_image
 
 PILE_COMPOSITE_DEADLINE_SECONDS = 45
 _MV_COLUMNS = ["0", "1", "2", "3", "4", "5", "6", "7+"]
@@ -75,19 +74,18 @@ class PileImageBuilder:
         deadline = time.monotonic() + PILE_COMPOSITE_DEADLINE_SECONDS
         semaphore = asyncio.Semaphore(10)
 
-        async def _one(session, cid):
+        async def _one(cid):
             async with semaphore:
-                return await fetch_card_image(
-                    session, cid, carddata, deadline=deadline
+                return await get_card_image(
+                    cid, carddata, (self.card_width, self.card_height), deadline=deadline
                 )
 
         # Fetch every unique card once (a pool can repeat a card_id).
         unique_ids = list({cid for cols in (main_cols, side_cols) for _, cids in cols for cid in cids})
-        async with aiohttp.ClientSession() as session:
-            results = await asyncio.gather(
-                *(_one(session, cid) for cid in unique_ids),
-                return_exceptions=True,
-            )
+        results = await asyncio.gather(
+            *(_one(cid) for cid in unique_ids),
+            return_exceptions=True,
+        )
 
         images = {}
         for cid, img in zip(unique_ids, results):
@@ -11,11 +11,19 @@ a divergence here once silently dropped thousands of real games).
 
 Only depends on ``trueskill`` and ``sqlalchemy`` so it is safe to import from an
 Alembic migration (no app-model imports).
+
+A winner correction replays only the corrected match's guild
+(replay_guild_skill_ratings), resuming from the newest skill_checkpoints row
+whose chained row hash still matches; the result is identical to the full
+backfill for that guild.
 """
+import hashlib
+import json
 from collections import defaultdict
+from math import sqrt
 
 from sqlalchemy import text
-from trueskill import TrueSkill
+from trueskill import TrueSkill, calc_draw_margin
 
 from helpers.test_users import TEST_USER_ID_BASE, TEST_USER_ID_CEILING
 
@@ -197,13 +205,51 @@ def apply_upset_decoration(title, description, winner_prob):
     return title, description
 
 
+# Closed-form 1v1 update. With two single-player teams the library's factor
+# graph converges in one pass, so rate_1vs1 reduces to these few lines over
+# floats (agrees with SKILL_ENV.rate_1vs1 to ~1e-12). Same environment, same
+# v/w functions; no Rating objects or factor graph per match.
+_TAU2 = SKILL_ENV.tau ** 2
+_TWO_BETA2 = 2 * SKILL_ENV.beta ** 2
+_DRAW_MARGIN = calc_draw_margin(SKILL_ENV.draw_probability, 2, env=SKILL_ENV)
+_v_win = SKILL_ENV.v_win
+_w_win = SKILL_ENV.w_win
+
+
 def new_ratings(winner_mu, winner_sigma, loser_mu, loser_sigma):
     """One 1v1 update through the shared environment. Returns
     (new_winner_mu, new_winner_sigma, new_loser_mu, new_loser_sigma)."""
-    winner = SKILL_ENV.create_rating(mu=winner_mu, sigma=winner_sigma)
-    loser = SKILL_ENV.create_rating(mu=loser_mu, sigma=loser_sigma)
-    new_winner, new_loser = SKILL_ENV.rate_1vs1(winner, loser)
-    return new_winner.mu, new_winner.sigma, new_loser.mu, new_loser.sigma
+    winner_var = winner_sigma * winner_sigma + _TAU2
+    loser_var = loser_sigma * loser_sigma + _TAU2
+    c2 = winner_var + loser_var + _TWO_BETA2
+    c = sqrt(c2)
+    t, margin = (winner_mu - loser_mu) / c, _DRAW_MARGIN / c
+    v, w = _v_win(t, margin), _w_win(t, margin)
+    return (
+        winner_mu + winner_var / c * v,
+        sqrt(winner_var * (1 - winner_var / c2 * w)),
+        loser_mu - loser_var / c * v,
+        sqrt(loser_var * (1 - loser_var / c2 * w)),
+    )
+
+
+def replay_1vs1(mu, sigma, matches):
+    """Bulk form of new_ratings for history replays.
+
+    `mu` and `sigma` are per-player float lists (index = player slot), updated
+    in place; `matches` yields (winner_idx, loser_idx) in chronological order.
+    Returns the number of matches rated.
+    """
+    count = 0
+    for winner, loser in matches:
+        mu[winner], sigma[winner], mu[loser], sigma[loser] = new_ratings(
+            mu[winner], sigma[winner], mu[loser], sigma[loser]
+        )
+        count += 1
+    return count
+
+
+_TYPE_LIST = ", ".join(f"'{t}'" for t in RATING_SESSION_TYPES)
 
 
 def backfill_skill_ratings(connection):
@@ -222,17 +268,16 @@ def backfill_skill_ratings(connection):
         {"mu": PRIOR_MU, "sig": PRIOR_SIGMA},
     )
 
-    type_list = ", ".join(f"'{t}'" for t in RATING_SESSION_TYPES)
     rows = connection.execute(text(
         "SELECT m.player1_id, m.player2_id, m.winner_id, d.guild_id "
         "FROM match_results m JOIN draft_sessions d ON m.session_id = d.session_id "
-        f"WHERE d.session_type IN ({type_list}) "
+        f"WHERE d.session_type IN ({_TYPE_LIST}) "
         "AND m.winner_id IS NOT NULL "
         "ORDER BY COALESCE(m.result_submitted_at, d.draft_start_time), m.id"
     )).fetchall()
 
-    mu = defaultdict(lambda: PRIOR_MU)
-    sigma = defaultdict(lambda: PRIOR_SIGMA)
+    slots = {}
+    matches = []
     games_won = defaultdict(int)
     games_lost = defaultdict(int)
 
@@ -242,17 +287,17 @@ def backfill_skill_ratings(connection):
         loser_id = player2_id if winner_id == player1_id else player1_id
         kw = (guild_id, winner_id)
         kl = (guild_id, loser_id)
-        new_w_mu, new_w_sig, new_l_mu, new_l_sig = new_ratings(
-            mu[kw], sigma[kw], mu[kl], sigma[kl]
-        )
-        mu[kw], sigma[kw] = new_w_mu, new_w_sig
-        mu[kl], sigma[kl] = new_l_mu, new_l_sig
+        matches.append((slots.setdefault(kw, len(slots)), slots.setdefault(kl, len(slots))))
         games_won[kw] += 1
         games_lost[kl] += 1
 
-    # Every games_won/games_lost key is also a mu key (both players in each
-    # rated match get a mu entry), so iterating mu covers every touched player.
-    for key in mu:
+    mu = [PRIOR_MU] * len(slots)
+    sigma = [PRIOR_SIGMA] * len(slots)
+    replay_1vs1(mu, sigma, matches)
+
+    # Both players of every rated match get a slot, so iterating slots covers
+    # every touched player.
+    for key, slot in slots.items():
         guild_id, player_id = key
         # ON CONFLICT upsert assumes SQLite/Postgres syntax (the repo's SQLite).
         connection.execute(
@@ -266,6 +311,112 @@ def backfill_skill_ratings(connection):
                 "games_won = excluded.games_won, "
                 "games_lost = excluded.games_lost"
             ),
-            {"mu": mu[key], "sig": sigma[key], "gw": games_won[key],
+            {"mu": mu[slot], "sig": sigma[slot], "gw": games_won[key],
              "gl": games_lost[key], "g": guild_id, "p": player_id},
         )
+
+
+# Rated rows between a guild's replay checkpoints.
+SKILL_CHECKPOINT_INTERVAL = 500
+
+
+def _chain_hash(previous, row):
+    return hashlib.sha256(f"{previous}|{'|'.join(map(str, row))}".encode()).hexdigest()
+
+
+def replay_guild_skill_ratings(connection, guild_id, interval=SKILL_CHECKPOINT_INTERVAL):
+    """Recompute one guild's μ/σ and games-won/lost, resuming from a checkpoint.
+
+    Same rows, order, validity rule and write-back as backfill_skill_ratings,
+    restricted to `guild_id` (guilds never share ratings, so the result is
+    exactly what a full backfill would give this guild). Every row is still
+    read and hashed -- cheap -- but TrueSkill updates start at the newest
+    skill_checkpoints row whose prefix hash matches; stale checkpoints after
+    it are replaced as the replay passes their position. Returns the number
+    of rows replayed.
+    """
+    rows = connection.execute(text(
+        "SELECT m.id, m.player1_id, m.player2_id, m.winner_id, "
+        "COALESCE(m.result_submitted_at, d.draft_start_time) AS ordered_at "
+        "FROM match_results m JOIN draft_sessions d ON m.session_id = d.session_id "
+        f"WHERE d.session_type IN ({_TYPE_LIST}) "
+        "AND m.winner_id IS NOT NULL AND d.guild_id = :g "
+        "ORDER BY ordered_at, m.id"
+    ), {"g": guild_id}).fetchall()
+
+    prefix = [""]
+    for row in rows:
+        prefix.append(_chain_hash(prefix[-1], row))
+
+    start, state = 0, {}
+    checkpoints = connection.execute(text(
+        "SELECT position, prefix_hash, state FROM skill_checkpoints "
+        "WHERE guild_id = :g ORDER BY position DESC"
+    ), {"g": guild_id}).fetchall()
+    for position, prefix_hash, blob in checkpoints:
+        if position < len(prefix) and prefix[position] == prefix_hash:
+            start, state = position, json.loads(blob)
+            break
+    connection.execute(
+        text("DELETE FROM skill_checkpoints WHERE guild_id = :g AND position > :p"),
+        {"g": guild_id, "p": start},
+    )
+
+    players = list(state)
+    slots = {player_id: slot for slot, player_id in enumerate(players)}
+    mu = [state[p][0] for p in players]
+    sigma = [state[p][1] for p in players]
+    games_won = defaultdict(int, {p: state[p][2] for p in players})
+    games_lost = defaultdict(int, {p: state[p][3] for p in players})
+
+    def slot_of(player_id):
+        if player_id not in slots:
+            slots[player_id] = len(players)
+            players.append(player_id)
+            mu.append(PRIOR_MU)
+            sigma.append(PRIOR_SIGMA)
+        return slots[player_id]
+
+    position = start
+    while position < len(rows):
+        end = min(len(rows), (position // interval + 1) * interval)
+        matches = []
+        for _, player1_id, player2_id, winner_id, _ in rows[position:end]:
+            if not is_valid_match(player1_id, player2_id, winner_id):
+                continue
+            loser_id = player2_id if winner_id == player1_id else player1_id
+            matches.append((slot_of(winner_id), slot_of(loser_id)))
+            games_won[winner_id] += 1
+            games_lost[loser_id] += 1
+        replay_1vs1(mu, sigma, matches)
+        position = end
+        if position % interval == 0:
+            snapshot = {p: [mu[i], sigma[i], games_won[p], games_lost[p]]
+                        for i, p in enumerate(players)}
+            connection.execute(
+                text("INSERT INTO skill_checkpoints (guild_id, position, prefix_hash, state) "
+                     "VALUES (:g, :p, :h, :s)"),
+                {"g": guild_id, "p": position, "h": prefix[position], "s": json.dumps(snapshot)},
+            )
+
+    connection.execute(
+        text("UPDATE player_stats SET true_skill_mu = :mu, true_skill_sigma = :sig, "
+             "games_won = 0, games_lost = 0 WHERE guild_id = :g"),
+        {"mu": PRIOR_MU, "sig": PRIOR_SIGMA, "g": guild_id},
+    )
+    for slot, player_id in enumerate(players):
+        connection.execute(
+            text(
+                "INSERT INTO player_stats "
+                "(player_id, guild_id, true_skill_mu, true_skill_sigma, games_won, games_lost) "
+                "VALUES (:p, :g, :mu, :sig, :gw, :gl) "
+                "ON CONFLICT(player_id, guild_id) DO UPDATE SET "
+                "true_skill_mu = excluded.true_skill_mu, "
+                "true_skill_sigma = excluded.true_skill_sigma, "
+                "games_won = excluded.games_won, "
+                "games_lost = excluded.games_lost"
+            ),
+            {"mu": mu[slot], "sig": sigma[slot], "gw": games_won[player_id],
+             "gl": games_lost[player_id], "g": guild_id, "p": player_id},
+        )
+    return len(rows) - start
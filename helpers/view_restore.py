@@ -0,0 +1,126 @@
+"""Startup restoration of persistent views from DB state alone.
+
+Every view restored at startup is rebuilt from its DB row and hashed
+(``layout_signature``: the exact components payload Discord would receive).
+If registered_view_layouts says the message already carries that layout,
+the view is registered with ``bot.add_view(view, message_id=...)`` -- no
+fetch, no edit. Otherwise the message is edited once through the shared edit
+scheduler (helpers/message_edits.py, background priority, so it shares the
+rate budget and never crowds out live interactions) and the new signature is
+recorded. Signatures for messages that are gone, or were not restored this
+time, are dropped in the same batch write.
+
+StartupTimer collects per-phase wall time for the on_ready timing report.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Set, Tuple
+
+import discord
+from loguru import logger
+from sqlalchemy import delete, select
+
+from database.db_session import db_session
+from helpers.message_edits import PRIORITY_BACKGROUND, edit_message
+from models.view_layout import RegisteredViewLayout
+
+
+def layout_signature(view: discord.ui.View) -> str:
+    payload = json.dumps(view.to_components(), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ViewRestorer:
+    """Collects the views to restore, then applies them in one pass."""
+
+    def __init__(self, bot, known: Dict[str, str]):
+        self.bot = bot
+        self.known = known
+        self.seen: Set[str] = set()
+        self.registered = 0
+        self.edited = 0
+        self.missing = 0
+        self.failed = 0
+        self._edits: List[Tuple[object, str, discord.ui.View, str, str]] = []
+        self._changed: Dict[str, str] = {}
+        self._gone: Set[str] = set()
+
+    @classmethod
+    async def load(cls, bot) -> "ViewRestorer":
+        async with db_session() as session:
+            rows = (await session.execute(select(RegisteredViewLayout))).scalars().all()
+        return cls(bot, {row.message_id: row.signature for row in rows})
+
+    def restore(self, channel, message_id, view: discord.ui.View, label: str) -> None:
+        """Queue `view` for the message; registers it right away when the
+        message already carries this layout. `channel` may be None (the edit
+        path then skips the message, as a missing channel always did)."""
+        message_id = str(message_id)
+        self.seen.add(message_id)
+        signature = layout_signature(view)
+        if view.is_persistent() and self.known.get(message_id) == signature:
+            self.bot.add_view(view, message_id=int(message_id))
+            self.registered += 1
+            return
+        if channel is None:
+            return
+        self._edits.append((channel, message_id, view, signature, label))
+
+    async def _edit(self, channel, message_id: str, view, signature: str, label: str) -> None:
+        try:
+            await edit_message(channel, message_id, priority=PRIORITY_BACKGROUND, view=view)
+        except discord.NotFound:
+            self.missing += 1
+            self._gone.add(message_id)
+            logger.debug(f"[views] {label}: message {message_id} not found")
+            return
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"[views] {label}: failed to re-attach view to {message_id}: {e}")
+            return
+        self.edited += 1
+        self._changed[message_id] = signature
+
+    async def finish(self) -> None:
+        """Send the queued edits (rate-limited by the edit scheduler), then
+        write every signature change in one transaction."""
+        await asyncio.gather(*(self._edit(*job) for job in self._edits))
+        self._edits.clear()
+        stale = (set(self.known) - self.seen) | self._gone
+        if self._changed or stale:
+            async with db_session() as session:
+                if stale:
+                    await session.execute(delete(RegisteredViewLayout).where(
+                        RegisteredViewLayout.message_id.in_(list(stale))))
+                for message_id, signature in self._changed.items():
+                    await session.merge(RegisteredViewLayout(message_id=message_id, signature=signature))
+        logger.info(
+            f"[views] restored {self.registered + self.edited} views: {self.registered} "
+            f"registered without edits, {self.edited} edited, {self.missing} messages gone, "
+            f"{self.failed} failed"
+        )
+
+
+class StartupTimer:
+    """Wall time per startup phase, reported once on_ready is done."""
+
+    def __init__(self):
+        self.phases: List[Tuple[str, float]] = []
+        self._started = time.monotonic()
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.monotonic() - started))
+
+    def report(self) -> str:
+        total = time.monotonic() - self._started
+        lines = [f"  {name:<28} {seconds:7.2f}s" for name, seconds in self.phases]
+        return "Startup timing:\n" + "\n".join(lines) + f"\n  {'total':<28} {total:7.2f}s"
@@ -6,6 +6,7 @@ from session import AsyncSessionLocal, DraftSession, MatchResult, get_draft_sess
 from utils import calculate_team_wins
 from helpers.display_names import get_display_name, get_display_name_by_id
 from helpers.draft_footer import apply_draft_footer_from_session
+from helpers.message_edits import edit_message
 from loguru import logger
 
 async def manage_live_drafts_channel(bot, guild):
@@ -197,14 +198,11 @@ async def update_live_draft_summary(bot, draft_session_id):
             live_drafts_channel = await manage_live_drafts_channel(bot, guild)
             
             try:
-                # Get the message
-                message = await live_drafts_channel.fetch_message(int(draft_session.live_draft_message_id))
-                
                 # Generate updated embed
                 updated_embed = await generate_live_draft_embed(bot, draft_session)
                 
-                # Update the message
-                await message.edit(embed=updated_embed)
+                # Update the message (coalesced; no fetch needed)
+                await edit_message(live_drafts_channel, draft_session.live_draft_message_id, embed=updated_embed)
             except discord.NotFound:
                 # If message was deleted, create a new one (if needed)
                 # Uncomment the line below if you want to recreate deleted messages
@@ -266,35 +264,35 @@ async def re_register_live_drafts(bot):
         cleanup_result = await db_session.execute(cleanup_stmt)
         completed_drafts = cleanup_result.scalars().all()
 
-        for draft_session in completed_drafts:
+        async def _delete_live_message(draft_session):
             logger.info(f"Cleaning up live draft message for completed draft {draft_session.session_id}")
             guild = bot.get_guild(int(draft_session.guild_id))
-            if guild:
-                live_drafts_channel = discord.utils.get(guild.text_channels, name="live-drafts")
-                if live_drafts_channel:
-                    try:
-                        message = await live_drafts_channel.fetch_message(int(draft_session.live_draft_message_id))
-                        await message.delete()
-                    except discord.NotFound:
-                        pass  # Already deleted
-                    except Exception as e:
-                        logger.error(f"Failed to delete live draft message: {e}")
+            if not guild:
+                return
+            live_drafts_channel = discord.utils.get(guild.text_channels, name="live-drafts")
+            if not live_drafts_channel:
+                return
+            try:
+                await live_drafts_channel.get_partial_message(int(draft_session.live_draft_message_id)).delete()
+            except discord.NotFound:
+                pass  # Already deleted
+            except Exception as e:
+                logger.error(f"Failed to delete live draft message: {e}")
 
-            # Clear the message ID
-            draft_session.live_draft_message_id = None
-            db_session.add(draft_session)
+        await asyncio.gather(*(_delete_live_message(ds) for ds in completed_drafts))
 
+        # Clear the message IDs
+        for draft_session in completed_drafts:
+            draft_session.live_draft_message_id = None
         await db_session.commit()
 
         # Now handle active drafts that are still in pairings
-        stmt = select(DraftSession).where(
+        stmt = select(DraftSession.session_id).where(
             DraftSession.deletion_time > current_time,
             DraftSession.session_stage == "pairings",
             DraftSession.live_draft_message_id.isnot(None)
         )
-        result = await db_session.execute(stmt)
-        draft_sessions = result.scalars().all()
+        session_ids = (await db_session.execute(stmt)).scalars().all()
 
-        for draft_session in draft_sessions:
-            # Update the live draft summary
-            await update_live_draft_summary(bot, draft_session.session_id)
\ No newline at end of file
+    # Update the live draft summaries; their edits share the edit scheduler's budget.
+    await asyncio.gather(*(update_live_draft_summary(bot, session_id) for session_id in session_ids))
@@ -1,4 +1,6 @@
 from .draft_session import DraftSession
+from .draft_session_log import DraftSessionLog
+from .draft_session_channel import DraftSessionChannel
 from .match import MatchResult, Match
 from .player import PlayerStats, PlayerLimit
 from .team import Team, WeeklyLimit
@@ -17,6 +19,8 @@ from .quiz_session import QuizSession
 from .quiz_submission import QuizSubmission
 from .quiz_stats import QuizStats
 from .quiz_scheduling import QuizChannel, QuizSchedule
+from .quiz_eligible_seat import QuizEligibleSeat
+from .trophy_quiz_candidate import TrophyQuizCandidate
 from .debt_ledger import DebtLedger
 from .debt_summary_message import DebtSummaryMessage
 from .tournament import (
@@ -31,10 +35,15 @@ from .trophy_quiz_submission import TrophyQuizSubmission
 from .mtgo_account import MtgoAccount
 from .mtgo_job import MtgoJob
 from .wallet_tx import WalletTx
+from .ledger_balance import WalletBalance, DebtPairBalance
+from .view_layout import RegisteredViewLayout
+from .skill_checkpoint import SkillCheckpoint
 
 # Export all models
 __all__ = [
     'DraftSession',
+    'DraftSessionLog',
+    'DraftSessionChannel',
     'MatchResult',
     'Match',
     'PlayerStats',
@@ -61,6 +70,8 @@ __all__ = [
     'QuizStats',
     'QuizChannel',
     'QuizSchedule',
+    'QuizEligibleSeat',
+    'TrophyQuizCandidate',
     'DebtLedger',
     'DebtSummaryMessage',
     'Tournament',
@@ -73,4 +84,8 @@ __all__ = [
     'MtgoAccount',
     'MtgoJob',
     'WalletTx',
+    'WalletBalance',
+    'DebtPairBalance',
+    'RegisteredViewLayout',
+    'SkillCheckpoint',
 ]
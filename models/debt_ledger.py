@@ -8,7 +8,8 @@ class DebtLedger(Base):
     Ledger-style debt tracking table.
 
     Each debt or settlement creates TWO entries (one from each player's perspective).
-    Balance is calculated by SUM(amount) for a player-counterparty pair.
+    Balance is calculated by SUM(amount) for a player-counterparty pair; for tix that
+    sum is also materialized in debt_pair_balance (models/ledger_balance.py).
 
     Amount convention:
     - Positive: owed TO the player (they are owed money)
@@ -60,6 +61,9 @@ class DebtLedger(Base):
     # Composite index for balance queries
     __table_args__ = (
         Index('ix_debt_ledger_balance_lookup', 'guild_id', 'player_id', 'counterparty_id'),
+        # "Entries since" scans: the as-of balance path rewinds debt_pair_balance
+        # by the rows newer than a cutoff.
+        Index('ix_debt_ledger_guild_created', 'guild_id', 'created_at'),
     )
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, text, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy import select, desc
+from sqlalchemy import select
 from datetime import datetime
 from urllib.parse import quote
 from database.models_base import Base
@@ -45,7 +45,8 @@ class DraftSession(Base):
     tournament_match_id = Column(Integer, nullable=True)  # links result auto-recording to a TournamentMatch
     tracked_draft = Column(Boolean, default=False)
     swiss_matches = Column(JSON)
-    draft_data = Column(JSON)
+    # The raw Draftmancer log lives in draft_session_logs (DraftSessionLog), not
+    # on this row; read it with load_draft_data().
     data_received = Column(Boolean, default=False)
     logs_captured_at = Column(DateTime)  # set when the log is captured to DB/Spaces (pre-publish)
     spaces_object_key = Column(String(256), nullable=True)  # DigitalOcean Spaces object path
@@ -100,30 +101,27 @@ class DraftSession(Base):
     async def get_by_any_channel_id(cls, channel_id: int | str):
         """Get a draft session whose main chat OR any created channel matches.
 
-        Unlike get_by_channel_id (draft_chat_channel only), this also searches
-        the channel_ids JSON so lookups work from team chat channels too.
-
-        The SQL LIKE prefilter narrows candidates to sessions whose channel_ids
-        JSON contains the channel ID as a substring; the Python
-        channel_ids_contains check then confirms exact membership to avoid
-        false positives (e.g. channel 123 matching stored ID 51234).
+        Unlike get_by_channel_id (draft_chat_channel only), this also covers
+        the channel_ids JSON so lookups work from team chat channels too. Both
+        are indexed in draft_session_channels (see DraftSessionChannel), so
+        this is one primary-key lookup regardless of how much history exists.
         """
-        from helpers.substitutes import channel_ids_contains
+        from models.draft_session_channel import DraftSessionChannel
 
-        channel_id = str(channel_id)
-        found = await cls.get_by_channel_id(channel_id)
-        if found:
-            return found
         async with db_session() as session:
             query = (select(cls)
-                     .where(cls.channel_ids.isnot(None))
-                     .where(cls.channel_ids.cast(String).like(f'%{channel_id}%'))
-                     .order_by(desc(cls.draft_start_time)))
+                     .join(DraftSessionChannel, DraftSessionChannel.session_id == cls.session_id)
+                     .where(DraftSessionChannel.channel_id == str(channel_id)))
             result = await session.execute(query)
-            for draft in result.scalars().all():
-                if channel_ids_contains(draft.channel_ids, channel_id):
-                    return draft
-        return None
+            return result.scalar_one_or_none()
+
+    async def load_draft_data(self):
+        """Fetch and decode this session's raw Draftmancer log, or None if no
+        log was captured. Deliberately not a column: see DraftSessionLog."""
+        from models.draft_session_log import DraftSessionLog
+
+        async with db_session() as session:
+            return await DraftSessionLog.fetch(session, self.session_id)
 
     def is_user_participating(self, user_id: str) -> bool:
         """Check if a user is participating in this draft session"""
@@ -0,0 +1,43 @@
+from sqlalchemy import Column, String, ForeignKey
+from database.models_base import Base
+
+
+class DraftSessionChannel(Base):
+    """Which draft session a Discord channel belongs to.
+
+    The normalized, indexed form of draft_sessions.channel_ids (a JSON list)
+    plus draft_chat_channel, so a channel -> session lookup is a primary-key
+    hit instead of a LIKE scan over every session's channel_ids. Written by
+    register() wherever those two columns are set.
+
+    A channel belongs to at most one session. If a channel is reused (test
+    drafts use the queue channel as their chat), the most recently registered
+    session owns it -- the same session the old newest-first scan returned.
+    """
+    __tablename__ = 'draft_session_channels'
+
+    ROLE_DRAFT_CHAT = 'draft_chat'  # draft_sessions.draft_chat_channel
+    ROLE_CREATED = 'created'        # any other id in draft_sessions.channel_ids
+
+    channel_id = Column(String(64), primary_key=True)
+    session_id = Column(String(64), ForeignKey('draft_sessions.session_id', ondelete='CASCADE'),
+                        nullable=False, index=True)
+    role = Column(String(16), nullable=False)
+
+    def __repr__(self):
+        return f"<DraftSessionChannel(channel_id={self.channel_id}, session_id={self.session_id}, role={self.role})>"
+
+    @classmethod
+    async def register(cls, session, session_id: str, channel_ids=(), draft_chat_channel=None):
+        """Point each channel at `session_id` in the caller's session (the
+        caller commits). Accepts the int-or-str ids channel_ids stores."""
+        roles = {str(cid): cls.ROLE_CREATED for cid in channel_ids or ()}
+        if draft_chat_channel:
+            roles[str(draft_chat_channel)] = cls.ROLE_DRAFT_CHAT
+        for channel_id, role in roles.items():
+            row = await session.get(cls, channel_id)
+            if row is None:
+                session.add(cls(channel_id=channel_id, session_id=session_id, role=role))
+            else:
+                row.session_id = session_id
+                row.role = role
@@ -0,0 +1,52 @@
+import json
+import zlib
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, LargeBinary, ForeignKey, select
+from database.models_base import Base
+
+
+class DraftSessionLog(Base):
+    """The raw Draftmancer log for a draft session, stored off the session row.
+
+    A log is several hundred KB of JSON. Keeping it on draft_sessions meant
+    every select(DraftSession) -- queue lookups, view re-registration, the
+    cleanup and reconciler sweeps -- loaded and parsed it for nothing. It now
+    lives here as zlib-compressed JSON, one row per session, and is only
+    decoded by the paths that actually need it (publish, team-log posting,
+    analysis) via fetch() or DraftSession.load_draft_data().
+    """
+    __tablename__ = 'draft_session_logs'
+
+    session_id = Column(String(64), ForeignKey('draft_sessions.session_id', ondelete='CASCADE'), primary_key=True)
+    payload = Column(LargeBinary, nullable=False)  # zlib(json) of the Draftmancer log
+    stored_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<DraftSessionLog(session_id={self.session_id}, bytes={len(self.payload or b'')})>"
+
+    @staticmethod
+    def encode(draft_data: dict) -> bytes:
+        return zlib.compress(json.dumps(draft_data, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def decode(payload: bytes) -> dict:
+        return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+    @classmethod
+    async def fetch(cls, session, session_id: str):
+        """Decoded log for `session_id` using the caller's session, or None."""
+        result = await session.execute(select(cls.payload).where(cls.session_id == session_id))
+        payload = result.scalar_one_or_none()
+        return cls.decode(payload) if payload is not None else None
+
+    @classmethod
+    async def store(cls, session, session_id: str, draft_data: dict):
+        """Insert or replace the log for `session_id` in the caller's session
+        (the caller commits, so the write lands with whatever else it stamps)."""
+        row = await session.get(cls, session_id)
+        if row is None:
+            session.add(cls(session_id=session_id, payload=cls.encode(draft_data), stored_at=datetime.now()))
+        else:
+            row.payload = cls.encode(draft_data)
+            row.stored_at = datetime.now()
@@ -0,0 +1,74 @@
+from sqlalchemy import Column, Integer, String, event
+from sqlalchemy.dialects.sqlite import insert
+from database.models_base import Base
+from models.debt_ledger import DebtLedger
+from models.wallet_tx import WalletTx
+
+
+class WalletBalance(Base):
+    """
+    Materialized SUM(wallet_tx.amount) per (guild, holder).
+
+    WalletTx stays the source of truth -- this is a cache of its sum, kept by
+    the after_insert hook below inside the same transaction as the ledger row,
+    so a rollback takes both away and a reader in that transaction sees both.
+    wallet_service reads balances here instead of re-summing a holder's whole
+    history. services/ledger_balances.check_consistency re-derives it from the
+    ledger and reports (or repairs) any drift.
+    """
+    __tablename__ = 'wallet_balance'
+
+    guild_id = Column(String(64), primary_key=True)
+    player_id = Column(String(64), primary_key=True)
+    balance = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<WalletBalance(holder={self.player_id}, balance={self.balance})>"
+
+
+class DebtPairBalance(Base):
+    """
+    Materialized tix balance per (guild, player, counterparty): SUM(amount)
+    over that pair's debt_ledger rows with no card_name, same sign convention
+    (+ owed TO player, - player OWES). Card rows are not tix and never land
+    here.
+
+    Rows are kept when the balance returns to zero, so every pair that has
+    ever had a tix entry has a row -- the as-of path in debt_service relies on
+    that to rewind balances with only the entries since the cutoff.
+    """
+    __tablename__ = 'debt_pair_balance'
+
+    guild_id = Column(String(64), primary_key=True)
+    player_id = Column(String(64), primary_key=True)
+    counterparty_id = Column(String(64), primary_key=True)
+    balance = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f"<DebtPairBalance(player={self.player_id}, counterparty={self.counterparty_id}, "
+                f"balance={self.balance})>")
+
+
+def _add_to(table, amount: int, **key):
+    stmt = insert(table).values(balance=amount, **key)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key), set_={'balance': table.c.balance + amount})
+
+
+# Both ledgers are append-only (corrections are new rows), so an insert is the
+# only event that moves a balance. The hooks run on the flush's own connection.
+@event.listens_for(WalletTx, 'after_insert')
+def _wallet_tx_inserted(mapper, connection, target):
+    connection.execute(_add_to(
+        WalletBalance.__table__, target.amount,
+        guild_id=target.guild_id, player_id=target.player_id))
+
+
+@event.listens_for(DebtLedger, 'after_insert')
+def _debt_ledger_inserted(mapper, connection, target):
+    if target.card_name is not None:
+        return
+    connection.execute(_add_to(
+        DebtPairBalance.__table__, target.amount,
+        guild_id=target.guild_id, player_id=target.player_id,
+        counterparty_id=target.counterparty_id))
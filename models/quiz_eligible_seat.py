@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, delete
+from database.models_base import Base
+
+
+class QuizEligibleSeat(Base):
+    """A starting seat from which a draft's pack `pack_num` traces a complete
+    `num_picks`-pick chain -- i.e. a (draft, seat) the pick quiz can be built from.
+
+    Computed once from the full log when it is captured (and by
+    backfill_quiz_eligible_seats.py for older drafts), so quiz selection is one
+    anti-join against quiz_sessions instead of downloading and analysing drafts
+    until one has an unused seat. A captured draft with no valid seats simply
+    has no rows.
+    """
+    __tablename__ = 'quiz_eligible_seats'
+
+    session_id = Column(String(64), ForeignKey('draft_sessions.session_id', ondelete='CASCADE'),
+                        primary_key=True)
+    pack_num = Column(Integer, primary_key=True)
+    num_picks = Column(Integer, primary_key=True)
+    starting_seat = Column(Integer, primary_key=True)
+
+    def __repr__(self):
+        return (f"<QuizEligibleSeat(session_id={self.session_id}, pack={self.pack_num}, "
+                f"picks={self.num_picks}, seat={self.starting_seat})>")
+
+    @classmethod
+    async def record(cls, session, session_id: str, pack_num: int, num_picks: int, seats):
+        """Replace the seats stored for (session_id, pack_num, num_picks) in the
+        caller's session (the caller commits)."""
+        await session.execute(delete(cls).where(
+            cls.session_id == session_id, cls.pack_num == pack_num, cls.num_picks == num_picks))
+        session.add_all(cls(session_id=session_id, pack_num=pack_num, num_picks=num_picks,
+                            starting_seat=seat) for seat in sorted(set(seats)))
@@ -33,6 +33,8 @@ class QuizSession(Base):
     # Table constraints
     __table_args__ = (
         Index('ix_quiz_sessions_guild_display_id', 'guild_id', 'display_id', unique=True),
+        # Quiz selection's "is this draft+seat used?" anti-join.
+        Index('ix_quiz_sessions_draft_seat', 'draft_session_id', 'starting_seat'),
     )
 
     def __repr__(self):
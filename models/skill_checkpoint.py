@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from database.models_base import Base
+
+
+class SkillCheckpoint(Base):
+    """A guild's TrueSkill replay state after its first `position` rated rows.
+
+    `state` is JSON {player_id: [mu, sigma, games_won, games_lost]} and
+    `prefix_hash` chains those rows (id, players, winner, ordering time) in
+    replay order. A winner correction resumes the guild's replay from the
+    latest checkpoint whose prefix still hashes the same, so any edit to an
+    earlier row invalidates it on its own. Written and read with raw SQL by
+    helpers/skill.replay_guild_skill_ratings.
+    """
+    __tablename__ = 'skill_checkpoints'
+
+    guild_id = Column(String(64), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    prefix_hash = Column(String(64), nullable=False)
+    state = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<SkillCheckpoint(guild_id={self.guild_id}, position={self.position})>"
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, ForeignKey, delete
+from database.models_base import Base
+
+
+class TrophyQuizCandidate(Base):
+    """A drafter whose deck the trophy quiz could show: a clean Discord ->
+    Draftmancer mapping and a non-empty pool in the captured log.
+
+    Computed once from the full log when it is captured (and by
+    backfill_trophy_quiz_candidates.py for older drafts). Records are not
+    stored -- results are usually reported after capture -- so selection
+    aggregates match_results over these rows in one query and only downloads
+    the log of the draft it picks. A captured draft with no usable drafter
+    simply has no rows.
+    """
+    __tablename__ = 'trophy_quiz_candidates'
+
+    session_id = Column(String(64), ForeignKey('draft_sessions.session_id', ondelete='CASCADE'),
+                        primary_key=True)
+    drafter_id = Column(String(64), primary_key=True)  # Discord user id
+    dm_user_id = Column(String(64), nullable=False)    # Draftmancer user id
+
+    def __repr__(self):
+        return f"<TrophyQuizCandidate(session_id={self.session_id}, drafter={self.drafter_id})>"
+
+    @classmethod
+    async def record(cls, session, session_id: str, drafters):
+        """Replace the candidates stored for session_id in the caller's session
+        (the caller commits). `drafters` is candidate_drafters() output."""
+        await session.execute(delete(cls).where(cls.session_id == session_id))
+        session.add_all(cls(session_id=session_id, drafter_id=d["drafter_id"], dm_user_id=d["dm_id"])
+                        for d in drafters)
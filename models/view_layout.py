@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String
+from database.models_base import Base
+
+
+class RegisteredViewLayout(Base):
+    """The component layout a persistent view last put on a Discord message.
+
+    `signature` hashes the exact components payload (custom_ids, labels,
+    styles, disabled flags) of the view restored onto `message_id` at
+    startup. When the view rebuilt from DB state hashes the same, the
+    message already carries those components, so it is re-registered with
+    bot.add_view alone -- no fetch, no edit. See helpers/view_restore.py.
+    """
+    __tablename__ = 'registered_view_layouts'
+
+    message_id = Column(String(64), primary_key=True)
+    signature = Column(String(64), nullable=False)
+
+    def __repr__(self):
+        return f"<RegisteredViewLayout(message_id={self.message_id}, signature={self.signature})>"
@@ -12,6 +12,8 @@ class WalletTx(Base):
     rows, exactly like ``DebtLedger``. Nothing is mutated once written — a reversal
     is a new compensating row — so the balance at any past moment is reconstructible
     from the log alone, and it can never drift out of sync with its own history.
+    (``wallet_balance`` caches that sum per holder for reads; it is derived from these
+    rows, never the other way round -- see models/ledger_balance.py.)
 
     ``amount`` is SIGNED from the holder's perspective (+ credit, - debit). Rows come
     in exactly two shapes:
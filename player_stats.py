@@ -21,8 +21,11 @@ MIN_CUBE_DRAFTS_DISPLAY = 5
 MAX_SERVER_RANK_DISPLAY = 20
 
 async def get_player_statistics(user_id, time_frame=None, user_display_name=None, guild_id=None,
-                                snapshot=None):
-    """Get player statistics for a specific user and time frame, filtered by guild_id if provided."""
+                                snapshot=None, records=None):
+    """Get player statistics for a specific user and time frame, filtered by guild_id if provided.
+
+    `records` is this player's already-folded ledger view for `time_frame`
+    (see LedgerSnapshot.fold_windows); when omitted it is folded here."""
     try:
         # Calculate the start date based on time frame using shared utility
         start_date = get_timeframe_start_date(time_frame)
@@ -123,9 +126,10 @@ async def get_player_statistics(user_id, time_frame=None, user_display_name=None
                 # rating system already uses) instead of display artifacts
                 # like sign_ups JSON, victory-message ids, or
                 # trophy_drafters name strings.
-                if snapshot is None:
-                    snapshot = await LedgerSnapshot.fetch(guild_id)
-                records = snapshot.fold(player_id=user_id, since=start_date)
+                if records is None:
+                    if snapshot is None:
+                        snapshot = await LedgerSnapshot.fetch(guild_id)
+                    records = snapshot.fold(player_id=user_id, since=start_date)
                 totals = match_totals(records)
                 matches_played = totals["matches_played"]
                 matches_won = totals["matches_won"]
@@ -426,10 +430,10 @@ async def get_head_to_head_stats(user1_id, user2_id, user1_display_name=None, us
                 "win_percentage": calculate_team_draft_win_percentage(won, losses, drawn),
             }
 
-        # One SQL fetch; one pure fold per timeframe (the query doesn't
-        # vary by timeframe, so refetching per frame just repeated
-        # identical I/O). Timeframe policy comes from stats_core, same as
-        # /stats -- lifetime is since=None.
+        # One SQL fetch; one pure fold pass for all three timeframes (the
+        # query doesn't vary by timeframe, and fold_windows shares the
+        # per-session side inference across windows). Timeframe policy
+        # comes from stats_core, same as /stats -- lifetime is since=None.
         snapshot = await LedgerSnapshot.fetch(guild_id)
         results = {
             "user1_id": user1_id,
@@ -437,11 +441,13 @@ async def get_head_to_head_stats(user1_id, user2_id, user1_display_name=None, us
             "user1_display_name": user1_display_name,
             "user2_display_name": user2_display_name,
         }
-        for frame, since in (("lifetime", None),
-                             ("monthly", get_timeframe_start_date("month")),
-                             ("weekly", get_timeframe_start_date("week"))):
-            h = h2h_totals(snapshot.fold(player_id=user1_id, since=since),
-                           user2_id)
+        frames = (("lifetime", None),
+                  ("monthly", get_timeframe_start_date("month")),
+                  ("weekly", get_timeframe_start_date("week")))
+        folded = snapshot.fold_windows(player_id=user1_id,
+                                       windows=[since for _, since in frames])
+        for (frame, _), records in zip(frames, folded):
+            h = h2h_totals(records, user2_id)
             results[frame] = _match_record(h)
             results[f"opposing_{frame}"] = _draft_record(h, "against")
             results[f"teammate_{frame}"] = _draft_record(h, "with")
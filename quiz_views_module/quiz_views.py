@@ -6,6 +6,7 @@ from sqlalchemy import select, update, and_
 from database.db_session import db_session
 from models import QuizSession, QuizSubmission, QuizStats, DraftSession
 from services.draft_analysis import DraftAnalysis
+from services.quiz_trace_record import load_trace_record, trace_record
 from models.draft_domain import PackTrace
 from helpers.display_names import get_display_name
 from helpers.quiz_threads import post_quiz_share
@@ -180,7 +181,7 @@ async def _display_results(
 
     Args:
         interaction: Discord interaction
-        analysis: DraftAnalysis instance for card lookups
+        analysis: DraftAnalysis (or the stored RecordedCards) for card lookups
         pack_trace: PackTrace instance for pick information
         guesses: User's guessed card IDs
         correct_answers: Correct card IDs
@@ -394,7 +395,9 @@ class QuizPublicView(discord.ui.View):
 
     async def _load_quiz_data(self) -> bool:
         """
-        Lazy load analysis and pack_trace from database.
+        Lazy load the pack trace and card lookup from the QuizSession row.
+        Quizzes recorded before card names were stored fall back to a full
+        DraftAnalysis once, and the row is upgraded so later loads don't.
         Returns True if successful, False otherwise.
         """
         if self.analysis is not None and self.pack_trace is not None:
@@ -409,6 +412,11 @@ class QuizPublicView(discord.ui.View):
                 logger.error(f"QuizSession {self.quiz_id} not found")
                 return False
 
+            recorded = load_trace_record(quiz_session.pack_trace_data)
+            if recorded is not None:
+                self.pack_trace, self.analysis = recorded
+                return True
+
             # Store starting_seat for pack tracing
             starting_seat = quiz_session.starting_seat
 
@@ -421,11 +429,21 @@ class QuizPublicView(discord.ui.View):
             return False
 
         try:
-            self.analysis = await DraftAnalysis.from_session(draft_session)
-            if self.analysis:
+            analysis = await DraftAnalysis.from_session(draft_session)
+            if analysis:
                 # Use starting_seat from database to ensure correct pack trace after reconnection
-                self.pack_trace = self.analysis.trace_pack(pack_num=0, length=4, starting_seat=starting_seat)
-                return self.pack_trace is not None
+                pack_trace = analysis.trace_pack(pack_num=0, length=4, starting_seat=starting_seat)
+                if pack_trace is None:
+                    return False
+                self.analysis, self.pack_trace = analysis, pack_trace
+                async with db_session() as session:
+                    await session.execute(
+                        update(QuizSession)
+                        .where(QuizSession.quiz_id == self.quiz_id)
+                        .values(pack_trace_data=trace_record(pack_trace, analysis))
+                    )
+                    await session.commit()
+                return True
         except Exception as e:
             logger.error(f"Error loading quiz data for {self.quiz_id}: {e}", exc_info=True)
 
@@ -442,7 +460,7 @@ class QuizPublicView(discord.ui.View):
     async def from_metadata(cls, bot, metadata: dict):
         """
         Recreate QuizPublicView from stored metadata (sticky message system).
-        Reloads quiz data from database and regenerates analysis/pack_trace.
+        Reloads the pack trace and card names from the QuizSession row.
         """
         quiz_id = metadata.get("quiz_id")
         view = cls(quiz_id=quiz_id)
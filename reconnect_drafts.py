@@ -10,7 +10,8 @@ from loguru import logger
 async def reconnect_draft_setup_sessions(discord_client):
     """
     Reconnect to sessions that need draft setup after bot restart.
-    Running each connection sequentially with a 1-second delay between them.
+    Returns unstarted managers; bot.monitor_reconnection_tasks connects them
+    through services/reconnect_scheduler.
     """
     logger.info("Reconnecting to recent draft setup sessions after bot restart...")
     
@@ -36,7 +37,7 @@ async def reconnect_draft_setup_sessions(discord_client):
         
         logger.info(f"Found {len(active_sessions)} recent draft sessions needing setup")
         
-        # Instead of creating tasks, we'll return manager objects that will be processed one by one
+        # Return unstarted managers; the reconnection scheduler starts them
         managers = []
         for session in active_sessions:
             # Skip if missing required fields
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Backfill quiz_eligible_seats for drafts captured before the index existed.
+
+New drafts are indexed by capture_draft_log. This walks every draft with a
+Spaces log and no index rows yet, downloads the log once, and stores its valid
+quiz starting seats. Drafts with no valid seats get no rows, so they are
+re-examined on a later run (cheap: the download is served from the local
+Spaces cache).
+
+Usage: python scripts/backfill_quiz_eligible_seats.py [--days N]
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import select
+
+# Add parent directory to path to import project modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from session import AsyncSessionLocal
+from models import DraftSession
+from models.quiz_eligible_seat import QuizEligibleSeat
+from services.draft_data_loader import load_from_spaces
+from services.quiz_eligibility import index_quiz_seats
+from helpers.digital_ocean_helper import close_spaces_clients
+
+
+async def backfill_all(days):
+    """Main backfill function."""
+    print("🔧 Starting quiz eligible-seat backfill...")
+
+    async with AsyncSessionLocal() as session:
+        indexed = select(QuizEligibleSeat.session_id).where(
+            QuizEligibleSeat.session_id == DraftSession.session_id).exists()
+        stmt = select(DraftSession).where(
+            DraftSession.spaces_object_key.isnot(None), ~indexed)
+        if days is not None:
+            stmt = stmt.where(DraftSession.draft_start_time >= datetime.now() - timedelta(days=days))
+        drafts = (await session.execute(stmt)).scalars().all()
+
+        total = len(drafts)
+        if total == 0:
+            print("✅ No drafts need indexing!")
+            return
+        print(f"📊 Found {total} drafts to index")
+
+        seat_count = 0
+        fail_count = 0
+        for i, draft in enumerate(drafts, 1):
+            try:
+                draft_data = await load_from_spaces(draft.spaces_object_key)
+                if not draft_data:
+                    print(f"  ⚠ {draft.session_id}: could not load {draft.spaces_object_key}")
+                    fail_count += 1
+                    continue
+                seats = await index_quiz_seats(session, draft, draft_data)
+                seat_count += len(seats)
+                print(f"  ✓ {draft.session_id}: seats {seats}")
+            except Exception as e:
+                print(f"  ✗ {draft.session_id}: Error - {e}")
+                fail_count += 1
+
+            # Commit every 10 drafts
+            if i % 10 == 0:
+                await session.commit()
+                print(f"  📝 Committed batch ({i}/{total})...")
+
+        await session.commit()
+
+    print(f"\n✅ Backfill complete!")
+    print(f"   - {seat_count} eligible seats stored")
+    print(f"   - {fail_count} drafts failed")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=None,
+                        help="only drafts started in the last N days (default: all)")
+    args = parser.parse_args()
+    try:
+        await backfill_all(args.days)
+    finally:
+        await close_spaces_clients()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
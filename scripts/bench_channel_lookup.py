@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: channel -> session lookup, LIKE scan vs draft_session_channels.
+
+Seeds throwaway SQLite databases with growing draft history (each session
+with a draft chat plus Red/Blue team channels, as create_team_channel makes)
+and times both the old prefilter-and-confirm scan from
+get_by_any_channel_id and the indexed point query that replaced it. The old
+query's cost grows with history; the new one should stay flat.
+
+    python scripts/bench_channel_lookup.py [--sizes 1000 10000 50000] [--repeat 200]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import String, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.models_base import Base
+from helpers.substitutes import channel_ids_contains
+from models import DraftSession, DraftSessionChannel
+
+
+async def _seed(factory, n):
+    start = datetime(2024, 1, 1)
+    async with factory() as s:
+        for i in range(n):
+            sid = f"s{i}"
+            ids = [10_000_000 + 3 * i + k for k in range(3)]
+            s.add(DraftSession(session_id=sid, guild_id="g", channel_ids=ids,
+                               draft_chat_channel=str(ids[0]),
+                               draft_start_time=start + timedelta(minutes=i)))
+            s.add_all(DraftSessionChannel(channel_id=str(cid), session_id=sid,
+                                          role="draft_chat" if k == 0 else "created")
+                      for k, cid in enumerate(ids))
+        await s.commit()
+
+
+async def _old_lookup(factory, channel_id):
+    async with factory() as s:
+        query = (select(DraftSession)
+                 .where(DraftSession.channel_ids.isnot(None))
+                 .where(DraftSession.channel_ids.cast(String).like(f'%{channel_id}%'))
+                 .order_by(desc(DraftSession.draft_start_time)))
+        for draft in (await s.execute(query)).scalars().all():
+            if channel_ids_contains(draft.channel_ids, channel_id):
+                return draft
+    return None
+
+
+async def _new_lookup(factory, channel_id):
+    async with factory() as s:
+        query = (select(DraftSession)
+                 .join(DraftSessionChannel, DraftSessionChannel.session_id == DraftSession.session_id)
+                 .where(DraftSessionChannel.channel_id == channel_id))
+        return (await s.execute(query)).scalar_one_or_none()
+
+
+async def _time(fn, factory, channel_id, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        await fn(factory, channel_id)
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+async def main(sizes, repeat):
+    print(f"{'sessions':>10} {'old hit':>10} {'old miss':>10} {'new hit':>10} {'new miss':>10}   (ms/lookup)")
+    for n in sizes:
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        tmp.close()
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp.name}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            factory = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+            await _seed(factory, n)
+            team_channel = str(10_000_000 + 3 * (n // 2) + 2)   # a Blue-Team channel mid-history
+            missing = "99999999999"
+            old_reps = max(1, repeat // 20)
+            row = (n,
+                   await _time(_old_lookup, factory, team_channel, old_reps),
+                   await _time(_old_lookup, factory, missing, old_reps),
+                   await _time(_new_lookup, factory, team_channel, repeat),
+                   await _time(_new_lookup, factory, missing, repeat))
+            print(f"{row[0]:>10} {row[1]:>10.3f} {row[2]:>10.3f} {row[3]:>10.3f} {row[4]:>10.3f}")
+        finally:
+            await engine.dispose()
+            os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
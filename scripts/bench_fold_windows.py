@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Benchmark: /stats and /record timeframes as three folds vs one fold_windows.
+
+Reuses bench_ledger_fold's synthetic guild history (no database) and times,
+for a sample of players, the week / month / lifetime views folded one at a
+time vs in a single LedgerSnapshot.fold_windows pass. Also checks the two
+agree.
+
+    python scripts/bench_fold_windows.py [--sessions 3000] [--players 300] [--sample 50]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
+
+from bench_ledger_fold import synthetic_rows
+from services.ledger_stats import LedgerSnapshot
+
+
+def main(n_sessions, n_players, sample, days):
+    rows = synthetic_rows(n_sessions, n_players, days=days)
+    snapshot = LedgerSnapshot(rows)
+    players = sorted({r.player1_id for r in rows})[:sample]
+    now = datetime.now()
+    windows = [now - timedelta(days=7), now - timedelta(days=30), None]
+    print(f"{len(rows)} match rows, {n_sessions} sessions, {len(players)} players sampled")
+
+    t0 = time.perf_counter()
+    separate = [[snapshot.fold(player_id=p, since=since) for since in windows] for p in players]
+    t_separate = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    single = [snapshot.fold_windows(player_id=p, windows=windows) for p in players]
+    t_single = time.perf_counter() - t0
+
+    assert separate == single, "fold_windows disagrees with per-window folds"
+    print(f"three folds  : {t_separate * 1000 / len(players):8.2f} ms/player")
+    print(f"fold_windows : {t_single * 1000 / len(players):8.2f} ms/player"
+          f"   speedup x{t_separate / t_single:4.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=3000)
+    parser.add_argument("--players", type=int, default=300)
+    parser.add_argument("--sample", type=int, default=50)
+    parser.add_argument("--days", type=int, default=720)
+    args = parser.parse_args()
+    main(args.sessions, args.players, args.sample, args.days)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark: leaderboard assembly on the record fold vs the columnar engine.
+
+Builds a synthetic guild history in memory (no database: LedgerSnapshot is
+fed labeled rows shaped like fetch_guild_rows') and times, per timeframe,
+the guild-wide projections the leaderboards need -- match_totals,
+draft_totals, team_record and the teammate pass -- computed from
+SessionRecords vs from LedgerColumns. Also checks the two agree.
+
+    python scripts/bench_ledger_fold.py [--sessions 3000] [--players 300]
+"""
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.ledger_stats import (
+    LedgerSnapshot, draft_totals, match_totals, side_eligible, side_outcome, team_record)
+
+Row = namedtuple("Row", [
+    "player1_id", "player2_id", "winner_id", "result_submitted_at", "id",
+    "session_id", "session_type", "session_stage",
+    "victory_message_id_results_channel", "team_a", "team_b", "cube",
+    "draft_start_time"])
+
+
+def synthetic_rows(n_sessions, n_players, seed=0, days=720):
+    rng = random.Random(seed)
+    players = [str(10**17 + i) for i in range(n_players)]
+    start = datetime.now() - timedelta(days=days)
+    rows, match_id = [], 0
+    for s in range(n_sessions):
+        size = rng.choice([2, 3, 4])
+        roster = rng.sample(players, 2 * size)
+        team_a, team_b = roster[:size], roster[size:]
+        began = start + timedelta(hours=s * days * 24 / n_sessions)
+        for rnd in range(3):
+            for i in range(size):
+                p1, p2 = team_a[i], team_b[(i + rnd) % size]
+                match_id += 1
+                rows.append(Row(p1, p2, rng.choice([p1, p2]), began + timedelta(minutes=50 * (rnd + 1)),
+                                match_id, f"s{s}", "staked", "completed", "v", team_a, team_b,
+                                rng.choice(["LSVCube", "Vintage", "Powered"]), began))
+    return rows
+
+
+def assemble_from_records(snapshot, since):
+    per_player = {}
+    for r in snapshot.fold(since=since):
+        per_player.setdefault(r.player_id, []).append(r)
+    out = {}
+    for pid, recs in per_player.items():
+        teammates = {}
+        for r in recs:
+            if side_eligible(r):
+                for mate in r.teammates:
+                    entry = teammates.setdefault(mate, {"drafts_played": 0, "drafts_won": 0,
+                                                        "drafts_lost": 0, "drafts_tied": 0})
+                    entry["drafts_played"] += 1
+                    entry[f"drafts_{side_outcome(r)}"] += 1
+        out[pid] = (match_totals(recs), draft_totals(recs), team_record(recs), teammates)
+    return out
+
+
+def assemble_from_columns(snapshot, since):
+    window = snapshot.columns().window(since)
+    totals, drafts, teams = window.match_totals(), window.draft_totals(), window.team_record()
+    matrix = window.teammate_matrix()
+    return {pid: (totals[pid], drafts[pid], teams[pid], matrix.get(pid, {})) for pid in totals}
+
+
+def main(n_sessions, n_players):
+    rows = synthetic_rows(n_sessions, n_players)
+    snapshot = LedgerSnapshot(rows)
+    print(f"{len(rows)} match rows, {n_sessions} sessions, {n_players} players")
+
+    t0 = time.perf_counter()
+    snapshot.columns()
+    print(f"columns build (once per snapshot): {(time.perf_counter() - t0) * 1000:8.1f} ms")
+
+    now = datetime.now()
+    for label, since in (("lifetime", None), ("90d", now - timedelta(days=90)),
+                         ("30d", now - timedelta(days=30))):
+        t0 = time.perf_counter()
+        by_records = assemble_from_records(snapshot, since)
+        t_records = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        by_columns = assemble_from_columns(snapshot, since)
+        t_columns = time.perf_counter() - t0
+        assert by_records == by_columns, f"engines disagree for {label}"
+        print(f"{label:>9}: records {t_records * 1000:8.1f} ms   columns {t_columns * 1000:8.1f} ms"
+              f"   speedup x{t_records / t_columns:5.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=3000)
+    parser.add_argument("--players", type=int, default=300)
+    args = parser.parse_args()
+    main(args.sessions, args.players)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark: TrueSkill history replay, library objects vs the closed form.
+
+Generates a synthetic chronological 1v1 history and replays it twice: once
+the way backfill_skill_ratings used to (two trueskill.Rating objects and a
+SKILL_ENV.rate_1vs1 factor graph per match, keyed dicts), and once through
+helpers.skill.replay_1vs1 over flat float lists. Reports both timings and
+the largest mu/sigma disagreement.
+
+    python scripts/bench_skill_replay.py [--matches 100000] [--players 500]
+"""
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.skill import PRIOR_MU, PRIOR_SIGMA, SKILL_ENV, replay_1vs1
+
+
+def library_replay(matches):
+    mu = defaultdict(lambda: PRIOR_MU)
+    sigma = defaultdict(lambda: PRIOR_SIGMA)
+    for winner, loser in matches:
+        new_winner, new_loser = SKILL_ENV.rate_1vs1(
+            SKILL_ENV.create_rating(mu=mu[winner], sigma=sigma[winner]),
+            SKILL_ENV.create_rating(mu=mu[loser], sigma=sigma[loser]),
+        )
+        mu[winner], sigma[winner] = new_winner.mu, new_winner.sigma
+        mu[loser], sigma[loser] = new_loser.mu, new_loser.sigma
+    return mu, sigma
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=100_000)
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Skewed strengths so ratings spread out like a real pod.
+    strength = [rng.gauss(0, 1) for _ in range(args.players)]
+    matches = []
+    for _ in range(args.matches):
+        a, b = rng.sample(range(args.players), 2)
+        a_wins = rng.random() < 1 / (1 + 10 ** (strength[b] - strength[a]))
+        matches.append((a, b) if a_wins else (b, a))
+
+    started = time.perf_counter()
+    lib_mu, lib_sigma = library_replay(matches)
+    library_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    mu = [PRIOR_MU] * args.players
+    sigma = [PRIOR_SIGMA] * args.players
+    replay_1vs1(mu, sigma, matches)
+    closed_s = time.perf_counter() - started
+
+    worst = max(max(abs(mu[p] - lib_mu[p]), abs(sigma[p] - lib_sigma[p])) for p in lib_mu)
+    print(f"{args.matches} matches, {args.players} players")
+    print(f"  trueskill objects: {library_s:8.3f}s  ({args.matches / library_s:,.0f} matches/s)")
+    print(f"  closed form:       {closed_s:8.3f}s  ({args.matches / closed_s:,.0f} matches/s)")
+    print(f"  speedup {library_s / closed_s:.1f}x, max |difference| {worst:.2e}")
+
+
+if __name__ == "__main__":
+    main()
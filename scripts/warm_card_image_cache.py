@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Pre-fetch a cube's card images into the local card-image cache.
+
+The cube's card list is taken from its captured draft logs (their carddata
+carries each printing's image URLs). Every card is downloaded once and stored
+at both compositor sizes, so later pack/pile/quiz composites for the cube are
+served from disk without touching Scryfall.
+
+Usage: python scripts/warm_card_image_cache.py CUBE [--days N]
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import select
+
+# Add parent directory to path to import project modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from session import AsyncSessionLocal
+from models import DraftSession
+from services.draft_data_loader import load_from_spaces
+from helpers.card_image_cache import warm_card_images, close_card_image_session
+from helpers.digital_ocean_helper import close_spaces_clients
+
+
+async def warm_cube(cube, days):
+    """Main warm-up function."""
+    print(f"🔧 Warming card images for cube {cube}...")
+
+    async with AsyncSessionLocal() as session:
+        stmt = select(DraftSession.spaces_object_key).where(
+            DraftSession.cube == cube, DraftSession.spaces_object_key.isnot(None))
+        if days is not None:
+            stmt = stmt.where(DraftSession.draft_start_time >= datetime.now() - timedelta(days=days))
+        object_keys = (await session.execute(stmt)).scalars().all()
+
+    if not object_keys:
+        print("✅ No captured drafts for this cube!")
+        return
+    print(f"📊 Reading {len(object_keys)} draft logs")
+
+    carddata = {}
+    for object_key in object_keys:
+        draft_data = await load_from_spaces(object_key)
+        if not draft_data:
+            print(f"  ⚠ could not load {object_key}")
+            continue
+        carddata.update(draft_data.get("carddata", {}))
+
+    print(f"🖼  Fetching {len(carddata)} cards")
+    cached, failed = await warm_card_images(list(carddata), carddata)
+
+    print(f"\n✅ Warm-up complete!")
+    print(f"   - {cached} cards cached")
+    print(f"   - {failed} cards failed")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cube", help="cube name as stored on draft sessions")
+    parser.add_argument("--days", type=int, default=None,
+                        help="only drafts started in the last N days (default: all)")
+    args = parser.parse_args()
+    try:
+        await warm_cube(args.cube, args.days)
+    finally:
+        await close_card_image_session()
+        await close_spaces_clients()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,6 +5,10 @@ Manages Discord roles based on leaderboard #1 positions.
 Players who hold #1 on multiple leaderboards get higher crown roles.
 """
 
+import asyncio
+from dataclasses import dataclass
+from typing import List, Tuple
+
 import discord
 from loguru import logger
 from config import get_config
@@ -15,6 +19,12 @@ from leaderboard_config import DEFAULT_CROWN_ROLE_NAMES as _DEFAULT_ROLE_NAMES
 # Convert string keys from config to int keys for internal use
 DEFAULT_CROWN_ROLE_NAMES = {int(k): v for k, v in _DEFAULT_ROLE_NAMES.items()}
 
+# Role edits in flight at once, and edits started per second, when a refresh
+# changes many crowns (e.g. a new crown cycle). py-cord still honours the
+# per-route 429s; this keeps a big sync from queueing behind them.
+CROWN_ROLE_CONCURRENCY = 4
+CROWN_ROLE_RATE = 5.0
+
 
 async def update_crown_roles_for_guild(bot, guild_id: str, cache=None):
     """
@@ -94,52 +104,140 @@ async def update_crown_roles_for_guild(bot, guild_id: str, cache=None):
     logger.info(f"Finished updating crown roles for guild {guild_id}")
 
 
-async def sync_crown_roles(guild: discord.Guild, crown_counts: dict, crown_roles: dict):
+@dataclass
+class CrownRoleChange:
+    """One member's crown-role edit: the roles to add and remove."""
+    member: discord.Member
+    add: Tuple[discord.Role, ...] = ()
+    remove: Tuple[discord.Role, ...] = ()
+
+    def final_roles(self) -> List[discord.Role]:
+        """The member's full role list after the change (@everyone excluded,
+        as Member.edit expects)."""
+        removed = set(self.remove)
+        kept = [r for r in self.member.roles if not r.is_default() and r not in removed]
+        return kept + [r for r in self.add if r not in kept]
+
+
+def plan_crown_role_sync(guild: discord.Guild, crown_counts: dict,
+                         crown_roles: dict) -> List[CrownRoleChange]:
     """
-    Sync crown roles for all members:
-    - Remove crown roles from players who no longer qualify
-    - Assign correct crown role to players who do qualify
-    - Ensure each player has at most one crown role (their highest)
+    Compute the minimal set of crown-role edits.
+
+    Only members that can need a change are visited: the current holders of a
+    crown role (role.members) plus the players in crown_counts. Everyone else
+    has no crown role and should have none, so they are never touched.
 
     Args:
         guild: The Discord guild
         crown_counts: dict mapping player_id -> number of crowns
         crown_roles: dict mapping crown count -> Discord role
+
+    Returns:
+        list of CrownRoleChange, one per member whose roles differ
     """
     all_crown_roles = set(crown_roles.values())
-
     if not all_crown_roles:
-        return
+        return []
+
+    candidates = {}
+    for role in all_crown_roles:
+        for member in role.members:
+            candidates[member.id] = member
+    for player_id, count in crown_counts.items():
+        if count <= 0 or crown_roles.get(count) is None:
+            continue
+        try:
+            member = guild.get_member(int(player_id))
+        except (TypeError, ValueError):
+            continue
+        if member is not None:
+            candidates[member.id] = member
 
-    for member in guild.members:
+    plan = []
+    for member in candidates.values():
         # Skip bot accounts
         if member.bot:
             continue
 
-        player_id = str(member.id)
-        expected_crowns = crown_counts.get(player_id, 0)
+        expected_crowns = crown_counts.get(str(member.id), 0)
         expected_role = crown_roles.get(expected_crowns) if expected_crowns > 0 else None
+        expected = {expected_role} if expected_role else set()
+        current = set(member.roles) & all_crown_roles
+
+        add = tuple(expected - current)
+        remove = tuple(sorted(current - expected, key=lambda r: r.id))
+        if add or remove:
+            plan.append(CrownRoleChange(member, add, remove))
+    return plan
+
+
+async def _apply_crown_role_change(guild: discord.Guild, change: CrownRoleChange) -> None:
+    member = change.member
+    name = get_display_name(member, guild)
+    summary = ", ".join([f"+{r.name}" for r in change.add] + [f"-{r.name}" for r in change.remove])
+    try:
+        if change.add and not change.remove and len(change.add) == 1:
+            await member.add_roles(*change.add)
+        elif change.remove and not change.add and len(change.remove) == 1:
+            await member.remove_roles(*change.remove)
+        else:
+            # Swapping crowns (or clearing several) in a single request.
+            await member.edit(roles=change.final_roles())
+        logger.info(f"Crown roles for {name}: {summary}")
+    except discord.Forbidden:
+        logger.warning(f"Cannot update crown roles ({summary}) for {name} - missing permissions")
+    except discord.HTTPException as e:
+        logger.error(f"HTTP error updating crown roles ({summary}) for {name}: {e}")
+
+
+async def apply_crown_role_plan(guild: discord.Guild, plan: List[CrownRoleChange],
+                                concurrency: int = CROWN_ROLE_CONCURRENCY,
+                                rate: float = CROWN_ROLE_RATE) -> None:
+    """
+    Apply a crown-role plan concurrently: at most `concurrency` edits in
+    flight, and new edits started no faster than `rate` per second.
+    """
+    if not plan:
+        return
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    interval = 1.0 / rate if rate > 0 else 0.0
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def run(change):
+        nonlocal next_start
+        async with semaphore:
+            now = loop.time()
+            start = max(now, next_start)
+            next_start = start + interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            await _apply_crown_role_change(guild, change)
+
+    await asyncio.gather(*(run(change) for change in plan))
+
+
+async def sync_crown_roles(guild: discord.Guild, crown_counts: dict, crown_roles: dict,
+                           dry_run: bool = False) -> List[CrownRoleChange]:
+    """
+    Sync crown roles for all members:
+    - Remove crown roles from players who no longer qualify
+    - Assign correct crown role to players who do qualify
+    - Ensure each player has at most one crown role (their highest)
 
-        # Get member's current crown roles
-        current_crown_roles = set(member.roles) & all_crown_roles
-
-        # Remove any crown roles that aren't the expected one
-        roles_to_remove = current_crown_roles - ({expected_role} if expected_role else set())
-        for role in roles_to_remove:
-            try:
-                await member.remove_roles(role)
-                logger.info(f"Removed {role.name} from {get_display_name(member, guild)}")
-            except discord.Forbidden:
-                logger.warning(f"Cannot remove role {role.name} from {get_display_name(member, guild)} - missing permissions")
-            except discord.HTTPException as e:
-                logger.error(f"HTTP error removing role {role.name} from {get_display_name(member, guild)}: {e}")
-
-        # Add the expected role if they don't have it
-        if expected_role and expected_role not in member.roles:
-            try:
-                await member.add_roles(expected_role)
-                logger.info(f"Added {expected_role.name} to {get_display_name(member, guild)}")
-            except discord.Forbidden:
-                logger.warning(f"Cannot add role {expected_role.name} to {get_display_name(member, guild)} - missing permissions")
-            except discord.HTTPException as e:
-                logger.error(f"HTTP error adding role {expected_role.name} to {get_display_name(member, guild)}: {e}")
+    Args:
+        guild: The Discord guild
+        crown_counts: dict mapping player_id -> number of crowns
+        crown_roles: dict mapping crown count -> Discord role
+        dry_run: compute and return the plan without editing any roles
+
+    Returns:
+        the list of CrownRoleChange that was (or would be) applied
+    """
+    plan = plan_crown_role_sync(guild, crown_counts, crown_roles)
+    if plan:
+        logger.debug(f"Crown role plan for guild {guild.id}: {len(plan)} member(s) to update")
+    if not dry_run:
+        await apply_crown_role_plan(guild, plan)
+    return plan
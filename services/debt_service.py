@@ -5,10 +5,11 @@ import asyncio
 import uuid
 from datetime import datetime, timedelta
 from loguru import logger
-from sqlalchemy import select, func, or_, tuple_, case
+from sqlalchemy import select, func, or_, and_, tuple_, case
 from sqlalchemy.exc import OperationalError
 from database.db_session import db_session
 from models.debt_ledger import DebtLedger
+from models.ledger_balance import DebtPairBalance
 from models.stake import StakeInfo
 from models.stake_pairing import StakePairing
 
@@ -26,6 +27,20 @@ TIX_ONLY = DebtLedger.card_name.is_(None)
 _STAKE_DEBT_LOCK = asyncio.Lock()
 
 
+async def pair_balance_in(session, guild_id: str, player_id: str, counterparty_id: str) -> int:
+    """The tix balance between two players, from player's perspective, inside the
+    caller's session/transaction. Reads the materialized debt_pair_balance row (kept by
+    models/ledger_balance.py on every tix insert), so it costs one primary-key lookup
+    however long the pair's history is."""
+    result = await session.execute(
+        select(DebtPairBalance.balance).where(
+            DebtPairBalance.guild_id == guild_id,
+            DebtPairBalance.player_id == player_id,
+            DebtPairBalance.counterparty_id == counterparty_id,
+        ))
+    return int(result.scalar() or 0)
+
+
 async def create_ledger_entries(
     guild_id: str,
     debtor_id: str,
@@ -200,25 +215,22 @@ async def get_balance_with(
         Net balance as integer (positive = owed to player, negative = player owes)
     """
     async with db_session() as session:
-        conditions = [
-            DebtLedger.guild_id == guild_id,
-            DebtLedger.player_id == player_id,
-            DebtLedger.counterparty_id == counterparty_id,
-            TIX_ONLY,
-        ]
-
-        # Exclude entries from a specific session if requested
         if exclude_session_id:
-            conditions.append(
+            # Pre-draft balance: the materialized total can't leave one session
+            # out, so sum the pair's rows (index ix_debt_ledger_balance_lookup).
+            query = select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(
+                DebtLedger.guild_id == guild_id,
+                DebtLedger.player_id == player_id,
+                DebtLedger.counterparty_id == counterparty_id,
+                TIX_ONLY,
                 or_(
                     DebtLedger.source_type != 'draft',
                     DebtLedger.source_id != exclude_session_id
-                )
+                ),
             )
-
-        query = select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(*conditions)
-        result = await session.execute(query)
-        balance = result.scalar()
+            balance = (await session.execute(query)).scalar()
+        else:
+            balance = await pair_balance_in(session, guild_id, player_id, counterparty_id)
 
         logger.debug(f"Balance for {player_id} with {counterparty_id} in {guild_id}: {balance}")
 
@@ -482,14 +494,7 @@ async def create_settlement(
 
                 # Balance check: Verify payer owes money and isn't overpaying
                 # We must run this query inside the same transaction to prevent race conditions
-                balance_query = select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(
-                    DebtLedger.guild_id == guild_id,
-                    DebtLedger.player_id == payer_id,
-                    DebtLedger.counterparty_id == payee_id,
-                    TIX_ONLY,
-                )
-                balance_result = await session.execute(balance_query)
-                current_balance = balance_result.scalar()
+                current_balance = await pair_balance_in(session, guild_id, payer_id, payee_id)
 
                 # Payer needs to owe money (balance should be negative)
                 if current_balance >= 0:
@@ -900,14 +905,7 @@ async def create_debt_transfer(
                     return tuple(existing_entries[:6])
 
                 # Validate: A owes B >= amount
-                a_owes_b_query = select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(
-                    DebtLedger.guild_id == guild_id,
-                    DebtLedger.player_id == debtor_id,
-                    DebtLedger.counterparty_id == transferrer_id,
-                    TIX_ONLY,
-                )
-                a_owes_b_result = await session.execute(a_owes_b_query)
-                a_balance_with_b = a_owes_b_result.scalar()
+                a_balance_with_b = await pair_balance_in(session, guild_id, debtor_id, transferrer_id)
 
                 if a_balance_with_b >= 0:
                     raise ValueError(
@@ -919,14 +917,7 @@ async def create_debt_transfer(
                     )
 
                 # Validate: B owes C >= amount
-                b_owes_c_query = select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(
-                    DebtLedger.guild_id == guild_id,
-                    DebtLedger.player_id == transferrer_id,
-                    DebtLedger.counterparty_id == creditor_id,
-                    TIX_ONLY,
-                )
-                b_owes_c_result = await session.execute(b_owes_c_query)
-                b_balance_with_c = b_owes_c_result.scalar()
+                b_balance_with_c = await pair_balance_in(session, guild_id, transferrer_id, creditor_id)
 
                 if b_balance_with_c >= 0:
                     raise ValueError(
@@ -1276,27 +1267,41 @@ async def _negative_pair_balances(guild_id: str, player_ids=None, created_before
 
     Single source of truth for the ledger's debt-sign convention — both the
     guild-wide debt rows and the per-player total-owed map derive from it.
-    With created_before, sums only entries older than that instant — the
-    ledger is append-only, so this IS the pair balance as of that time.
+    Reads the materialized debt_pair_balance rows rather than summing the
+    ledger. With created_before, gives the pair balance as of that instant:
+    the ledger is append-only, so that is the current balance minus the
+    entries since — which touches only recent rows (ix_debt_ledger_guild_created)
+    however old the ledger is.
     """
-    query = (
-        select(
-            DebtLedger.player_id,
-            DebtLedger.counterparty_id,
-            func.sum(DebtLedger.amount).label('balance')
-        )
-        .where(
-            DebtLedger.guild_id == guild_id,
-            TIX_ONLY,
+    balance = DebtPairBalance.balance
+    query = select(DebtPairBalance.player_id, DebtPairBalance.counterparty_id)
+    if created_before is not None:
+        since = (
+            select(
+                DebtLedger.player_id,
+                DebtLedger.counterparty_id,
+                func.sum(DebtLedger.amount).label('delta')
+            )
+            .where(
+                DebtLedger.guild_id == guild_id,
+                DebtLedger.created_at >= created_before,
+                TIX_ONLY,
+            )
+            .group_by(DebtLedger.player_id, DebtLedger.counterparty_id)
+            .subquery()
         )
-        .group_by(DebtLedger.player_id, DebtLedger.counterparty_id)
-        .having(func.sum(DebtLedger.amount) < 0)
-        .order_by(func.sum(DebtLedger.amount).asc())
+        balance = balance - func.coalesce(since.c.delta, 0)
+        query = query.outerjoin(since, and_(
+            since.c.player_id == DebtPairBalance.player_id,
+            since.c.counterparty_id == DebtPairBalance.counterparty_id,
+        ))
+    query = (
+        query.add_columns(balance.label('balance'))
+        .where(DebtPairBalance.guild_id == guild_id, balance < 0)
+        .order_by(balance.asc())
     )
     if player_ids is not None:
-        query = query.where(DebtLedger.player_id.in_(list(player_ids)))
-    if created_before is not None:
-        query = query.where(DebtLedger.created_at < created_before)
+        query = query.where(DebtPairBalance.player_id.in_(list(player_ids)))
     async with db_session() as session:
         result = await session.execute(query)
         return result.all()
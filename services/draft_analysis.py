@@ -20,6 +20,7 @@ Example usage:
         print(f"Available cards: {len(pick.booster_ids)}")
 """
 
+from collections import OrderedDict
 from typing import Optional, List
 from models.draft_domain import Pick, Player, Card, PackTrace
 from models import DraftSession
@@ -27,6 +28,35 @@ from services.draft_indexer import DraftIndexer
 from services.pack_tracer import PackTracer
 from services.draft_data_loader import load_from_spaces
 
+# Recently built analyses, keyed by (spaces object key, DraftSession.session_id
+# or None for from_spaces). A quiz post touches the same draft from selection,
+# preparation and the view, so this makes that one download and one indexer
+# build. Captured logs are immutable and the DB fields read (teams, seating,
+# cube) are settled by then, so entries are never stale; a small LRU bound
+# keeps memory flat.
+_MEMO_SIZE = 16
+_MEMO: "OrderedDict[tuple, DraftAnalysis]" = OrderedDict()
+
+
+def _remember(key: tuple, analysis: 'DraftAnalysis') -> 'DraftAnalysis':
+    _MEMO[key] = analysis
+    _MEMO.move_to_end(key)
+    while len(_MEMO) > _MEMO_SIZE:
+        _MEMO.popitem(last=False)
+    return analysis
+
+
+def _recall(key: tuple) -> Optional['DraftAnalysis']:
+    analysis = _MEMO.get(key)
+    if analysis is not None:
+        _MEMO.move_to_end(key)
+    return analysis
+
+
+def clear_analysis_memo() -> None:
+    """Forget every memoized analysis (tests; or after rewriting a log in Spaces)."""
+    _MEMO.clear()
+
 
 class DraftAnalysis:
     """
@@ -36,6 +66,9 @@ class DraftAnalysis:
     All methods return domain objects for type safety.
 
     Phase 2: Aggregates Draftmancer data + DB metadata for complete analysis.
+
+    Instances from the factories may be shared (see _MEMO): treat them, and
+    the draft_data they expose, as read-only.
     """
 
     def __init__(self, draft_data: dict, draft_session: Optional[DraftSession] = None):
@@ -48,6 +81,7 @@ class DraftAnalysis:
             draft_data: Raw draft data from Draftmancer/Spaces
             draft_session: Optional DraftSession for DB metadata
         """
+        self._draft_data = draft_data
         self._indexer = DraftIndexer(draft_data, draft_session)
         self._tracer = PackTracer(self._indexer)
 
@@ -68,10 +102,14 @@ class DraftAnalysis:
         if not session.spaces_object_key:
             return None
 
+        key = (session.spaces_object_key, session.session_id)
+        cached = _recall(key)
+        if cached is not None:
+            return cached
         draft_data = await load_from_spaces(session.spaces_object_key)
         if draft_data:
             # Phase 2: Pass session for DB metadata and seating
-            return cls(draft_data, draft_session=session)
+            return _remember(key, cls(draft_data, draft_session=session))
         return None
 
     @classmethod
@@ -85,13 +123,22 @@ class DraftAnalysis:
         Returns:
             DraftAnalysis instance or None if load failed
         """
+        key = (object_key, None)
+        cached = _recall(key)
+        if cached is not None:
+            return cached
         draft_data = await load_from_spaces(object_key)
         if draft_data:
-            return cls(draft_data)
+            return _remember(key, cls(draft_data))
         return None
 
     # === Properties ===
 
+    @property
+    def draft_data(self) -> dict:
+        """The raw Draftmancer log this analysis was built from (read-only)."""
+        return self._draft_data
+
     @property
     def session_id(self) -> str:
         """Draftmancer session ID."""
@@ -16,6 +16,7 @@ from database.db_session import db_session
 from helpers.pile_compositor import PileImageBuilder
 from helpers.substitutes import TEAM_A_CHANNEL_PREFIX, TEAM_B_CHANNEL_PREFIX
 from models.draft_session import DraftSession
+from models.draft_session_log import DraftSessionLog
 
 
 def _grouped_lines(card_ids: list, carddata: dict) -> list:
@@ -161,7 +162,7 @@ async def _post_team_logs_locked(session_id: str, bot) -> bool:
             return False
         if ds.team_logs_posted_at is not None:
             return True
-        draft_data = ds.draft_data
+        draft_data = await DraftSessionLog.fetch(session, session_id)
         if not draft_data:
             return False
         team_a = list(ds.team_a or [])
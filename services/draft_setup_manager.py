@@ -15,17 +15,21 @@ from config import (get_draftmancer_websocket_url, get_draftmancer_base_url,
                     get_draftmancer_session_url, is_disconnect_autopause_enabled, is_test_mode)
 from database.db_session import db_session
 from models.draft_session import DraftSession
+from models.draft_session_log import DraftSessionLog
 from models.match import MatchResult
 from bot_registry import get_bot
 from session import AsyncSessionLocal
 from sqlalchemy import select
 from helpers.digital_ocean_helper import DigitalOceanHelper
+from services.quiz_eligibility import index_quiz_seats
+from services.trophy_quiz_candidates import index_trophy_candidates
 from helpers.draft_footer import apply_draft_footer
 from helpers.magicprotools_helper import MagicProtoolsHelper
 from helpers.seating import resolve_seating_ids
 from notification_service import send_ready_check_dms
 from services.draft_socket_client import DraftSocketClient
 from services.draft_log_store import post_team_logs
+from services.manager_supervisor import get_supervisor
 from cube_views.pack_options import DEFAULT_PACKS_PER_PLAYER, DEFAULT_CARDS_PER_PACK
 
 # Constants
@@ -36,8 +40,6 @@ READY_CHECK_INSTRUCTIONS = (
 
 # Victory detection constants
 VICTORY_CHECK_TIMEOUT = 600  # Maximum 10 minutes to wait for victory
-VICTORY_CHECK_INTERVAL = 30  # Check every 30 seconds
-VICTORY_CHECK_INITIAL_DELAY = 10  # Initial delay for immediate victory detection
 
 # Session stage constants (subset - full list in models/draft_session.py)
 # Valid stages: None (initial), "teams", "pairings", "completed"
@@ -76,7 +78,11 @@ PAUSED_DRAFT_OPTIONS = (
     "\u2022 Use `/scrap` to start a vote to cancel the draft."
 )
 SOCKET_OPERATION_DELAY = 0.5  # Seconds between socket operations
-CONNECTION_CHECK_INTERVAL = 10  # Seconds between connection check iterations
+CONNECTION_CHECK_INTERVAL = 10  # Seconds between loop iterations while setup is pending
+# Once the cube is imported and settings applied, the loop only wakes for socket
+# events (disconnect) or this slow getUsers refresh; Draftmancer pushes
+# sessionUsers on every join/leave anyway.
+IDLE_REFRESH_INTERVAL = 60
 SETTINGS_OPERATION_DELAY = 1  # Seconds after setting operations
 
 # DEFAULT_PACKS_PER_PLAYER / DEFAULT_CARDS_PER_PACK are imported from
@@ -90,6 +96,14 @@ load_dotenv()
 ACTIVE_MANAGERS = {}
 
 
+def notify_victory(session_id):
+    """Called when a victory/draw message is posted for `session_id`: wakes a
+    manager waiting in _handle_victory_aware_disconnect, instead of it polling."""
+    manager = ACTIVE_MANAGERS.get(session_id)
+    if manager is not None and getattr(manager, "_victory_event", None) is not None:
+        manager._victory_event.set()
+
+
 def mpt_embed_field_value(direct_url):
     """Embed field value for one player's MagicProTools link, or an unavailable
     note when the direct API push returned no URL."""
@@ -183,6 +197,13 @@ class DraftSetupManager:
         """Handler for 'disconnect' event."""
         self.logger.info(f"Disconnected from the websocket for draft_id: DB{self.draft_id}")
         self._is_connecting = False
+        self._wake_loop()
+
+    def _wake_loop(self):
+        """Wake keep_connection_alive now instead of at its next timer."""
+        wake = getattr(self, "_loop_wake", None)
+        if wake is not None:
+            wake.set()
 
     def __init__(self, session_id: str, draft_id: str, cube_id: str, guild_id: str = None,
                  packs_per_player: int = DEFAULT_PACKS_PER_PLAYER,
@@ -235,6 +256,8 @@ class DraftSetupManager:
         self._is_connecting = False  # Tracks if connection attempt is in progress (set by event handlers)
         self._should_disconnect = False
         self._seating_lock = asyncio.Lock()  # Lock for seating attempts
+        self._loop_wake = asyncio.Event()     # set by socket events / supervisor timer
+        self._victory_event = asyncio.Event() # set by notify_victory
 
         # Ready Check variables 
         self.ready_check_active = False
@@ -1078,13 +1101,13 @@ class DraftSetupManager:
     async def capture_draft_log(self, draft_data):
         """Persist the draft log as soon as the draft ends, WITHOUT posting it.
 
-        Saves the raw log to the DB (`draft_data`) and DigitalOcean Spaces (raw
+        Saves the raw log to the DB (`DraftSessionLog`) and DigitalOcean Spaces (raw
         JSON + per-player MagicProTools files via save_to_digitalocean_spaces),
         records pack first-picks, and stamps `logs_captured_at`. Does NOT post the
         Discord embed or set `data_received` — that happens at publish.
 
         The raw log is always written to the DB so it is never lost (publish can
-        post from `draft_data` even if Spaces failed). `logs_captured_at` /
+        post from the stored log even if Spaces failed). `logs_captured_at` /
         `pack_first_picks` are only set when the Spaces upload succeeds, so a
         failed upload stays retryable (logs_captured_at stays NULL -> reconnect
         re-captures). Idempotent: a session already captured is skipped.
@@ -1118,7 +1141,7 @@ class DraftSetupManager:
                     return False
 
                 # Always persist the raw log so the data is never lost.
-                draft_session.draft_data = draft_data
+                await DraftSessionLog.store(session, self.session_id, draft_data)
 
                 # Only mark fully captured when Spaces succeeded, so a failed
                 # upload stays retryable (logs_captured_at stays NULL).
@@ -1139,6 +1162,17 @@ class DraftSetupManager:
                         seconds=PUBLISH_DELAY_SECONDS
                     )
                     draft_session.spaces_object_key = object_key
+                    # Index the quiz-eligible seats and trophy quiz candidates now,
+                    # while the log is in hand, so quiz selection never has to
+                    # download it. Never fatal.
+                    try:
+                        await index_quiz_seats(session, draft_session, draft_data)
+                    except Exception as e:
+                        self.logger.warning(f"Could not index quiz seats for {self.session_id}: {e}")
+                    try:
+                        await index_trophy_candidates(session, draft_session, draft_data)
+                    except Exception as e:
+                        self.logger.warning(f"Could not index trophy quiz candidates for {self.session_id}: {e}")
 
                 await session.commit()
 
@@ -1151,7 +1185,7 @@ class DraftSetupManager:
     async def publish_draft_log(self, release=False):
         """Post the captured draft log to Discord and mark it published.
 
-        Reads the already-captured `draft_data` from the DB (capture runs at
+        Reads the already-captured log from the DB (capture runs at
         draft-end), posts the MagicProTools embed, and sets `data_received`.
         Works without a live socket — it operates on the saved data. Idempotent:
         a session already published (`data_received`) is skipped.
@@ -1171,10 +1205,10 @@ class DraftSetupManager:
                 if draft_session.data_received:
                     self.logger.info(f"Draft log already published for {self.session_id}; skipping")
                     return True
-                draft_data = draft_session.draft_data
+                draft_data = await DraftSessionLog.fetch(session, self.session_id)
 
             if not draft_data:
-                self.logger.warning(f"No captured draft_data for {self.session_id}; nothing to publish")
+                self.logger.warning(f"No captured draft log for {self.session_id}; nothing to publish")
                 return False
 
             # Manual early release: unlock the Draftmancer log now (best-effort).
@@ -1386,6 +1420,14 @@ class DraftSetupManager:
             
             # Dictionary to store MagicProTools links for each Discord ID
             magicprotools_links = {}
+
+            # Submit every seat up front, concurrently; the loop below only lays out the embed
+            try:
+                mpt_urls = await self.mpt_helper.submit_all(
+                    [user_id for user_id, _ in sorted_users], draft_data)
+            except Exception as e:
+                self.logger.error(f"Error submitting to MagicProTools API: {e}")
+                mpt_urls = {}
             
             for idx, (user_id, user_data) in enumerate(sorted_users):
                 user_name = user_data["userName"]
@@ -1413,13 +1455,7 @@ class DraftSetupManager:
                 if discord_name:
                     display_name = f"{team_emoji} {user_name} - {discord_name}{record_str} {trophy_emoji}"
                 
-                self.logger.info(f"Getting MagicProTools URL for {user_name} (ID: {user_id})")
-                direct_mpt_url = None
-                try:
-                    direct_mpt_url = await self.mpt_helper.submit_to_api(user_id, draft_data)
-                except Exception as e:
-                    self.logger.error(f"Error submitting to MagicProTools API for {user_name}: {e}")
-
+                direct_mpt_url = mpt_urls.get(user_id)
                 if not direct_mpt_url:
                     self.logger.warning(f"No MagicProTools URL for {user_name}; showing unavailable note")
 
@@ -1593,7 +1629,7 @@ class DraftSetupManager:
                 )
 
             # Start timeout timer
-            self.ready_check_timer = asyncio.create_task(self.ready_check_timeout(90, bot))
+            self.ready_check_timer = get_supervisor().call_later(90, self.ready_check_timeout, 90, bot)
             
             # Emit ready check to Draftmancer
             await self.socket_client.emit('readyCheck')
@@ -1756,52 +1792,46 @@ class DraftSetupManager:
         return message is not None
 
     async def ready_check_timeout(self, seconds, bot):
-        """Handles timeout for the ready check"""
-        try:
-            await asyncio.sleep(seconds)
-
-            # Delete the timeout message after the time expires
-            channel = await self._get_draft_channel()
-            if channel and self.timeout_message_id:
-                await self._safe_delete_message(channel, self.timeout_message_id)
-                self.logger.info("Timeout message successfully deleted")
-                self.timeout_message_id = None
-
-            # If we reach here, the ready check timed out
-            if self.ready_check_active:
-                self.logger.info("Ready check timed out, but continuing to track readiness")
-                self.ready_check_active = False
+        """Handles timeout for the ready check. Runs when the supervisor timer
+        set in initiate_ready_check fires (complete_ready_check cancels it)."""
+        # Delete the timeout message after the time expires
+        channel = await self._get_draft_channel()
+        if channel and self.timeout_message_id:
+            await self._safe_delete_message(channel, self.timeout_message_id)
+            self.logger.info("Timeout message successfully deleted")
+            self.timeout_message_id = None
 
-                # Initialize post-timeout tracking with currently ready users
-                self.post_timeout_ready_users = self.ready_users.copy()
+        # If we reach here, the ready check timed out
+        if self.ready_check_active:
+            self.logger.info("Ready check timed out, but continuing to track readiness")
+            self.ready_check_active = False
 
-                # Identify which users weren't ready at timeout
-                missing_users = [
-                    user.get('userName') for user in self.session_users
-                    if user.get('userName') != 'DraftBot' and user.get('userID') not in self.ready_users
-                ]
+            # Initialize post-timeout tracking with currently ready users
+            self.post_timeout_ready_users = self.ready_users.copy()
 
-                # Format missing users for display
-                missing_text = f"\nWaiting for: **{', '.join(missing_users)}**" if missing_users else ""
+            # Identify which users weren't ready at timeout
+            missing_users = [
+                user.get('userName') for user in self.session_users
+                if user.get('userName') != 'DraftBot' and user.get('userID') not in self.ready_users
+            ]
 
-                # Prepare and send the timeout message
-                timeout_message = (
-                    f"⚠️ **Ready check failed!** Timed out after {seconds} seconds.{missing_text}\n"
-                    f"A new ready check will start automatically when all players are present."
-                    f"{READY_CHECK_INSTRUCTIONS}"
-                )
+            # Format missing users for display
+            missing_text = f"\nWaiting for: **{', '.join(missing_users)}**" if missing_users else ""
 
-                if channel and self.ready_check_message_id:
-                    await self._update_or_send_message(channel, self.ready_check_message_id, content=timeout_message)
-                    self.logger.info("Ready check message updated for timeout")
+            # Prepare and send the timeout message
+            timeout_message = (
+                f"⚠️ **Ready check failed!** Timed out after {seconds} seconds.{missing_text}\n"
+                f"A new ready check will start automatically when all players are present."
+                f"{READY_CHECK_INSTRUCTIONS}"
+            )
 
-                # Reset message ID but keep tracking readiness
-                self.ready_check_message_id = None
-                self.ready_users.clear()
+            if channel and self.ready_check_message_id:
+                await self._update_or_send_message(channel, self.ready_check_message_id, content=timeout_message)
+                self.logger.info("Ready check message updated for timeout")
 
-        except asyncio.CancelledError:
-            # Expected if the timer is cancelled when all users become ready
-            pass
+            # Reset message ID but keep tracking readiness
+            self.ready_check_message_id = None
+            self.ready_users.clear()
 
     async def complete_ready_check(self):
         """Called when all users are ready"""
@@ -2128,10 +2158,9 @@ class DraftSetupManager:
     async def disconnect_after_delay(self, delay_seconds):
         """
         Disconnects from the session after a delay to ensure commands have been processed.
-        Ensures proper cleanup and logging.
+        Schedules disconnect_safely on the supervisor and returns its timer handle.
         """
-        await asyncio.sleep(delay_seconds)
-        await self.disconnect_safely()
+        return get_supervisor().call_later(delay_seconds, self.disconnect_safely)
 
     async def mark_draft_cancelled(self):
         """Mark that the draft is being cancelled manually, skip log collection"""
@@ -2198,25 +2227,17 @@ class DraftSetupManager:
     
     async def _wait_for_victory(self):
         """
-        Continuously check for victory until detected.
-        
-        This method will run until victory is detected or cancelled by timeout.
+        Wait until victory is detected.
+
+        One DB check covers a victory posted before we started waiting; after
+        that, notify_victory (called when the victory message is posted) wakes
+        us. Runs until then or until cancelled by timeout.
         """
-        # Initial short delay for immediate victory detection
-        self.logger.debug(f"Initial {VICTORY_CHECK_INITIAL_DELAY}s delay for immediate victory detection")
-        await asyncio.sleep(VICTORY_CHECK_INITIAL_DELAY)
-        
-        check_count = 0
-        while True:
-            victory_detected = await self._check_victory_status()
-            
-            if victory_detected:
-                return  # Victory found, exit the loop
-            
-            check_count += 1
-            self.logger.debug(f"Victory not yet detected (check #{check_count}), waiting {VICTORY_CHECK_INTERVAL}s")
-            await asyncio.sleep(VICTORY_CHECK_INTERVAL)
-    
+        if await self._check_victory_status():
+            return
+        self.logger.debug("Victory not yet detected, waiting for the victory message")
+        await self._victory_event.wait()
+
     async def _check_victory_status(self):
         """
         Check if victory has been detected for this draft session.
@@ -2289,14 +2310,13 @@ class DraftSetupManager:
             # Update database to indicate failure
             draft_session = await DraftSession.get_by_session_id(self.draft_id)
             if draft_session:
-                await draft_session.update(
-                    data_received=True,
-                    draft_data={
+                await draft_session.update(data_received=True)
+                async with db_session() as session:
+                    await DraftSessionLog.store(session, draft_session.session_id, {
                         "seating_failed": True,
                         "missing_users": missing_users,
                         "timestamp": datetime.now().isoformat()
-                    }
-                )
+                    })
                 self.logger.info("Updated database with seating failure information")
         except Exception as e:
             self.logger.exception(f"Failed to update database with seating failure: {e}")
@@ -2642,6 +2662,20 @@ class DraftSetupManager:
         except Exception as e:
             self.logger.error(f"Error emitting getUsers: {e}")
 
+    async def _wait_for_wake(self) -> None:
+        """Park the loop until a socket event wakes it or the supervisor timer
+        fires: CONNECTION_CHECK_INTERVAL while setup is pending, otherwise
+        IDLE_REFRESH_INTERVAL."""
+        pending_setup = not (self.cube_imported and self.settings_updated)
+        interval = CONNECTION_CHECK_INTERVAL if pending_setup else IDLE_REFRESH_INTERVAL
+        self._loop_wake.clear()
+        timer = get_supervisor().call_later(interval, self._loop_wake.set)
+        self.logger.debug(f"[LOOP] Waiting up to {interval}s before next iteration")
+        try:
+            await self._loop_wake.wait()
+        finally:
+            timer.cancel()
+
     async def keep_connection_alive(self):
         """
         Main loop to keep connection alive and manage draft state.
@@ -2697,9 +2731,8 @@ class DraftSetupManager:
                         self.logger.debug(f"[LOOP] Cube import failed, continuing loop")
                         continue
 
-                # Sleep before next iteration
-                self.logger.debug(f"[LOOP] Sleeping for {CONNECTION_CHECK_INTERVAL}s before next iteration")
-                await asyncio.sleep(CONNECTION_CHECK_INTERVAL)
+                # Park until a socket event or the next supervisor timer
+                await self._wait_for_wake()
 
         except Exception as e:
             self.logger.exception(f"[LOOP] Fatal error in keep_connection_alive: {e}")
@@ -2778,8 +2811,10 @@ class DraftSetupManager:
                 self.logger.error(f"Error verifying channel access: {e}")
         
     @classmethod
-    async def spawn_for_existing_session(cls, session_id, bot):
-        """Create a manager for an existing session and add the bot reference"""
+    async def spawn_for_existing_session(cls, session_id, bot, start=True):
+        """Create a manager for an existing session and add the bot reference.
+        With start=False a newly created manager is returned unconnected, for
+        the caller to start (see services/reconnect_scheduler.start_manager)."""
         # Get the draft session
         draft_session = await DraftSession.get_by_session_id(session_id)
         if not draft_session:
@@ -2812,7 +2847,8 @@ class DraftSetupManager:
             manager.status_message_id = draft_session.status_message_id
         
         # Start connection in background
-        asyncio.create_task(manager.keep_connection_alive())
+        if start:
+            asyncio.create_task(manager.keep_connection_alive())
         
         return manager
     
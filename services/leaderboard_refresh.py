@@ -0,0 +1,116 @@
+"""Debounced, per-guild leaderboard refresh.
+
+update_leaderboards_for_guild re-renders every auto-updated board, edits each
+message and then runs the crown-role and ring-bearer passes -- 20+ seconds
+under Discord's rate limits. It is triggered per completed draft, so pods
+finishing a few minutes apart used to start overlapping refreshes that redid
+identical work.
+
+LeaderboardRefreshCoordinator sits in front of it:
+
+- triggers for a guild inside LEADERBOARD_REFRESH_WINDOW coalesce into one
+  refresh;
+- at most one refresh per guild runs at a time; triggers that arrive while it
+  runs are merged and served by exactly one follow-up refresh;
+- coalesced triggers carry their session ids and the union of their
+  streak_extensions forward, so the ring-bearer pass sees every extension.
+
+It also remembers a digest of the last embed posted to each board message so
+a refresh skips the edit when the rendered board hasn't changed.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import discord
+from loguru import logger
+
+LEADERBOARD_REFRESH_WINDOW = 30.0  # seconds
+
+# message_id -> digest of the embed last posted to it (process lifetime only;
+# the first refresh after a restart edits every board once).
+_POSTED_DIGESTS: Dict[int, str] = {}
+
+
+def embed_digest(embed: discord.Embed, *extra) -> str:
+    """Stable hash of an embed's content. The embed timestamp is left out --
+    every render stamps datetime.now(), which would make every board look
+    changed. `extra` folds in anything else the edit carries (e.g. the
+    timeframe its selector view shows)."""
+    data = embed.to_dict()
+    data.pop("timestamp", None)
+    payload = json.dumps([data, [str(e) for e in extra]], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_already_posted(message_id, digest: str) -> bool:
+    return _POSTED_DIGESTS.get(int(message_id)) == digest
+
+
+def remember_posted(message_id, digest: str) -> None:
+    _POSTED_DIGESTS[int(message_id)] = digest
+
+
+def merge_streak_extensions(into: dict, extensions: Optional[dict]) -> dict:
+    """OR each player's *_increased flags into `into`."""
+    for player_id, flags in (extensions or {}).items():
+        merged = into.setdefault(player_id, {})
+        for key, value in flags.items():
+            merged[key] = bool(merged.get(key, False) or value)
+    return into
+
+
+class _PendingRefresh:
+    __slots__ = ("session_ids", "streak_extensions")
+
+    def __init__(self):
+        self.session_ids: Set[str] = set()
+        self.streak_extensions: dict = {}
+
+
+class LeaderboardRefreshCoordinator:
+    """See the module docstring. `refresh` is called as
+    refresh(bot, guild_id, session_id=..., streak_extensions=...)."""
+
+    def __init__(self, refresh: Callable[..., Awaitable], window: float = LEADERBOARD_REFRESH_WINDOW):
+        self.refresh = refresh
+        self.window = window
+        self._pending: Dict[str, _PendingRefresh] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    def request(self, bot, guild_id: str, session_id: Optional[str] = None,
+                streak_extensions: Optional[dict] = None) -> asyncio.Task:
+        """Queue a refresh for `guild_id`; returns the guild's worker task."""
+        guild_id = str(guild_id)
+        pending = self._pending.setdefault(guild_id, _PendingRefresh())
+        if session_id:
+            pending.session_ids.add(str(session_id))
+        merge_streak_extensions(pending.streak_extensions, streak_extensions)
+
+        worker = self._workers.get(guild_id)
+        # A worker left behind by another (test) event loop never finishes.
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            worker = asyncio.create_task(self._run(bot, guild_id))
+            self._workers[guild_id] = worker
+        else:
+            logger.debug(f"Leaderboard refresh for guild {guild_id} coalesced (session {session_id})")
+        return worker
+
+    async def _run(self, bot, guild_id: str) -> None:
+        try:
+            while guild_id in self._pending:
+                await asyncio.sleep(self.window)
+                pending = self._pending.pop(guild_id, None)
+                if pending is None:
+                    break
+                session_id = ", ".join(sorted(pending.session_ids)) or None
+                try:
+                    await self.refresh(bot, guild_id, session_id=session_id,
+                                       streak_extensions=pending.streak_extensions or None)
+                except Exception as e:
+                    logger.error(f"Error refreshing leaderboards for guild {guild_id}: {e}")
+        finally:
+            if self._workers.get(guild_id) is asyncio.current_task():
+                del self._workers[guild_id]
@@ -13,9 +13,7 @@ from models.player import PlayerStats
 from models import QuizStats, QuizSubmission, QuizSession
 from models.trophy_quiz_submission import TrophyQuizSubmission
 from models.trophy_quiz_session import TrophyQuizSession
-from services.ledger_stats import (
-    LedgerSnapshot, match_totals, draft_totals, team_record,
-    side_eligible, side_outcome)
+from services.ledger_stats import LedgerSnapshot
 from stats_core import calculate_win_percentage, calculate_team_draft_win_percentage
 
 # Win Streak minimum requirements by timeframe
@@ -140,30 +138,37 @@ def _assemble_players_data(snapshot, start_date) -> dict:
     state. display_name/teammate_name are filled afterward by
     build_players_data, once, from stored names.
 
-    The teammate pass uses each record's `teammates` set -- real sides,
-    not "never appeared as an opponent" (that heuristic misclassifies an
-    opposing player you simply never got paired against, e.g. in a 4v4
-    where 3 rounds only cover 3 of each player's 4 possible opponents).
-    Side-dependent facts are gated by side_eligible, same as team_record
-    and h2h.
+    Computed on the snapshot's columnar engine (services.ledger_columns),
+    which applies the same policies as the record fold -- match_totals,
+    draft_totals, team_record, and a teammate pass over real sides gated
+    by side_eligible -- as vectorized group-bys instead of one
+    SessionRecord per (player, session).
     """
-    records = snapshot.fold(since=start_date)
-    per_player: dict[str, list] = {}
-    for r in records:
-        per_player.setdefault(r.player_id, []).append(r)
+    window = snapshot.columns().window(start_date)
+    totals = window.match_totals()
+    drafts = window.draft_totals()
+    teams = window.team_record()
+    teammates = window.teammate_matrix()
 
     players_data = {}
-    for player_id, player_records in per_player.items():
-        totals = match_totals(player_records)
-        matches_played = totals["matches_played"]
-        matches_won = totals["matches_won"]
+    for player_id, player_totals in totals.items():
+        matches_played = player_totals["matches_played"]
+        matches_won = player_totals["matches_won"]
         matches_lost = matches_played - matches_won
 
-        team = team_record(player_records)
+        team = teams[player_id]
+        teammate_stats = {}
+        for teammate_id, entry in teammates.get(player_id, {}).items():
+            teammate_stats[teammate_id] = {
+                **entry,
+                "win_percentage": calculate_team_draft_win_percentage(
+                    entry["drafts_won"], entry["drafts_lost"], entry["drafts_tied"]),
+                "teammate_name": None,  # filled by build_players_data
+            }
         players_data[player_id] = {
             "player_id": player_id,
             "display_name": None,       # filled by build_players_data
-            "drafts_played": draft_totals(player_records),
+            "drafts_played": drafts[player_id],
             "completed_matches": matches_played,  # Every reported match counts
             "matches_won": matches_won,
             "matches_lost": matches_lost,
@@ -176,36 +181,8 @@ def _assemble_players_data(snapshot, start_date) -> dict:
             # (stats_core owns the formula).
             "team_draft_win_percentage": calculate_team_draft_win_percentage(
                 team["won"], team["lost"], team["tied"]),
-            "teammate_win_rates": {}
+            "teammate_win_rates": teammate_stats,
         }
-
-    for player_id, player_records in per_player.items():
-        teammate_stats = players_data[player_id]["teammate_win_rates"]
-        for r in player_records:
-            if not side_eligible(r):
-                continue
-            if not r.teammates:
-                continue
-            outcome = side_outcome(r)
-            for teammate_id in r.teammates:
-                if teammate_id not in players_data:
-                    continue
-                entry = teammate_stats.setdefault(teammate_id, {
-                    "drafts_played": 0,
-                    "drafts_won": 0,
-                    "drafts_lost": 0,
-                    "drafts_tied": 0,
-                    "win_percentage": 0,
-                    "teammate_name": None,  # filled by build_players_data
-                })
-                entry["drafts_played"] += 1
-                entry[f"drafts_{outcome}"] += 1
-
-    for player_data in players_data.values():
-        for teammate_data in player_data["teammate_win_rates"].values():
-            teammate_data["win_percentage"] = calculate_team_draft_win_percentage(
-                teammate_data["drafts_won"], teammate_data["drafts_lost"],
-                teammate_data["drafts_tied"])
     return players_data
 
 
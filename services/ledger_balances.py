@@ -0,0 +1,87 @@
+"""
+Consistency check for the materialized ledger balances.
+
+``wallet_balance`` and ``debt_pair_balance`` (models/ledger_balance.py) are caches of
+SUM(amount) over the append-only ``wallet_tx`` and ``debt_ledger`` logs, maintained by
+an insert hook in the same transaction as each ledger row. The logs stay the source of
+truth: this module re-derives both tables from them with the old grouped scans and
+reports every key whose cached balance disagrees (or, for debt pairs, is missing -- the
+as-of path needs a row for every pair ever written). ``repair=True`` rewrites the
+tables from the derivation.
+
+Runs at startup (bot.py); cheap enough to run by hand after any manual DB surgery.
+"""
+from loguru import logger
+from sqlalchemy import select, func, delete
+
+from database.db_session import db_session
+from models.debt_ledger import DebtLedger
+from models.ledger_balance import WalletBalance, DebtPairBalance
+from models.wallet_tx import WalletTx
+from services.wallet_service import MONEY_LOCK
+
+
+async def _derived_wallets(session) -> dict:
+    rows = (await session.execute(
+        select(WalletTx.guild_id, WalletTx.player_id, func.sum(WalletTx.amount))
+        .group_by(WalletTx.guild_id, WalletTx.player_id)
+    )).all()
+    return {(g, p): int(total) for g, p, total in rows}
+
+
+async def _derived_pairs(session) -> dict:
+    rows = (await session.execute(
+        select(DebtLedger.guild_id, DebtLedger.player_id, DebtLedger.counterparty_id,
+               func.sum(DebtLedger.amount))
+        .where(DebtLedger.card_name.is_(None))
+        .group_by(DebtLedger.guild_id, DebtLedger.player_id, DebtLedger.counterparty_id)
+    )).all()
+    return {(g, p, c): int(total) for g, p, c, total in rows}
+
+
+def _mismatches(derived: dict, stored: dict, require_rows: bool) -> list[tuple]:
+    """(key, derived, stored) for every disagreeing key; stored is None when the row
+    is missing. A missing row reading as 0 is only acceptable when not require_rows."""
+    out = []
+    for key in derived.keys() | stored.keys():
+        want, have = derived.get(key, 0), stored.get(key)
+        if have is None and not require_rows and want == 0:
+            continue
+        if have != want:
+            out.append((key, want, have))
+    return sorted(out, key=lambda m: m[0])
+
+
+async def check_consistency(repair: bool = False) -> dict:
+    """Compare both balance tables to their ledgers. Returns {ok, wallet_mismatches,
+    debt_mismatches, repaired}; each mismatch is (key, ledger_sum, cached_or_None).
+    With repair, mismatching tables are rebuilt from the ledger in one transaction,
+    under MONEY_LOCK so no debit reads a half-rebuilt balance."""
+    async with MONEY_LOCK:
+        async with db_session() as session:
+            wallets = await _derived_wallets(session)
+            pairs = await _derived_pairs(session)
+            stored_wallets = {(r.guild_id, r.player_id): r.balance for r in
+                              (await session.execute(select(WalletBalance))).scalars()}
+            stored_pairs = {(r.guild_id, r.player_id, r.counterparty_id): r.balance for r in
+                            (await session.execute(select(DebtPairBalance))).scalars()}
+            wallet_bad = _mismatches(wallets, stored_wallets, require_rows=False)
+            debt_bad = _mismatches(pairs, stored_pairs, require_rows=True)
+
+            if repair and wallet_bad:
+                await session.execute(delete(WalletBalance))
+                session.add_all(WalletBalance(guild_id=g, player_id=p, balance=b)
+                                for (g, p), b in wallets.items())
+            if repair and debt_bad:
+                await session.execute(delete(DebtPairBalance))
+                session.add_all(DebtPairBalance(guild_id=g, player_id=p, counterparty_id=c,
+                                                balance=b)
+                                for (g, p, c), b in pairs.items())
+
+    ok = not wallet_bad and not debt_bad
+    if not ok:
+        logger.warning(
+            f"Ledger balance drift: {len(wallet_bad)} wallet, {len(debt_bad)} debt pair(s)"
+            f"{' (repaired)' if repair else ''}; first: {(wallet_bad + debt_bad)[0]}")
+    return {"ok": ok, "wallet_mismatches": wallet_bad, "debt_mismatches": debt_bad,
+            "repaired": repair and not ok}
@@ -0,0 +1,245 @@
+"""Columnar (NumPy) engine for the ledger fold -- the leaderboard path.
+
+services/ledger_stats folds a snapshot into one SessionRecord per
+(player, session): the right shape for /stats and /record, which look at a
+single player, but a guild-wide leaderboard build then walks tens of
+thousands of frozen records with their frozensets and proxies. LedgerColumns
+keeps the same history as typed arrays instead -- one row per
+(player, session) entry and one per match participation -- and computes
+the guild-wide projections (match_totals, draft_totals, team_record,
+cube_breakdown, the teammate matrix) as vectorized group-bys.
+
+Everything window-independent is done once, when the columns are built
+from a snapshot's session buckets: validity (already applied by the
+snapshot), side inference, full-session side tallies, event bounds. A
+window then only costs a handful of array passes. Policies are exactly the
+record fold's (same _side_map, same fits_window/all-or-nothing rule, same
+side_eligible gate), and test_ledger_stats.py holds the two engines to
+parity.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from services.ledger_stats import _event_time, _is_completed, _side_map
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_EVENT = np.iinfo(np.int64).min
+_SIDE_CODE = {"a": 0, "b": 1}
+
+
+def _micros(when) -> int:
+    return (when - _EPOCH) // timedelta(microseconds=1)
+
+
+class LedgerColumns:
+    """One snapshot's history as arrays, built from its session buckets --
+    get it via LedgerSnapshot.columns(), which builds it once per snapshot.
+    Read-only afterward, so it is safe to share across worker threads."""
+
+    def __init__(self, sessions: dict):
+        players: dict[str, int] = {}
+        cubes: dict[str, int] = {}
+        ordered = sorted(sessions.items(), key=lambda item: (
+            item[1]["matches"][0].draft_start_time or datetime.min, item[0]))
+
+        s_completed, s_cube, s_tally, s_min_event, s_all_events = [], [], [], [], []
+        e_player, e_session, e_side = [], [], []
+        p_entry, p_won, p_event = [], [], []
+
+        for s_idx, (_, bucket) in enumerate(ordered):
+            matches = bucket["matches"]
+            session_row = matches[0]
+            sides = _side_map(session_row, matches)
+            tally = [0, 0]
+            entries: dict[str, int] = {}
+            events = []
+            for m in matches:
+                winner = m.winner_id
+                loser = m.player2_id if winner == m.player1_id else m.player1_id
+                if winner in sides:
+                    tally[_SIDE_CODE[sides[winner]]] += 1
+                event = _event_time(m)
+                events.append(event)
+                micros = _micros(event) if event is not None else _NO_EVENT
+                for me, won in ((winner, True), (loser, False)):
+                    if me not in entries:
+                        entries[me] = len(e_player)
+                        e_player.append(players.setdefault(me, len(players)))
+                        e_session.append(s_idx)
+                        e_side.append(_SIDE_CODE.get(sides.get(me), -1))
+                    p_entry.append(entries[me])
+                    p_won.append(won)
+                    p_event.append(micros)
+            s_completed.append(_is_completed(session_row))
+            s_cube.append(cubes.setdefault(session_row.cube, len(cubes))
+                          if session_row.cube else -1)
+            s_tally.append(tally)
+            known = [_micros(e) for e in events if e is not None]
+            s_all_events.append(len(known) == len(events))
+            s_min_event.append(min(known) if known else _NO_EVENT)
+
+        self.player_ids = list(players)
+        self.cube_names = list(cubes)
+        self.s_completed = np.array(s_completed, dtype=bool)
+        self.s_cube = np.array(s_cube, dtype=np.int64)
+        self.s_tally = np.array(s_tally, dtype=np.int64).reshape(-1, 2)
+        self.s_min_event = np.array(s_min_event, dtype=np.int64)
+        self.s_all_events = np.array(s_all_events, dtype=bool)
+        self.e_player = np.array(e_player, dtype=np.int64)
+        self.e_session = np.array(e_session, dtype=np.int64)
+        self.e_side = np.array(e_side, dtype=np.int64)
+        self.p_entry = np.array(p_entry, dtype=np.int64)
+        self.p_won = np.array(p_won, dtype=bool)
+        self.p_event = np.array(p_event, dtype=np.int64)
+
+    # ---- windowing ---------------------------------------------------------
+
+    def window(self, since=None) -> "LedgerWindow":
+        """The per-entry facts for one window -- the columnar equivalent of
+        snapshot.fold(since=since) for every player at once."""
+        n_entries = len(self.e_player)
+        if since is None:
+            in_window = np.ones(len(self.p_entry), dtype=bool)
+            fits = np.ones(len(self.s_completed), dtype=bool)
+        else:
+            cutoff = _micros(since)
+            in_window = (self.p_event != _NO_EVENT) & (self.p_event >= cutoff)
+            fits = self.s_all_events & (self.s_min_event >= cutoff)
+        w_matches = np.bincount(self.p_entry, weights=in_window,
+                                minlength=n_entries).astype(np.int64)
+        w_wins = np.bincount(self.p_entry, weights=in_window & self.p_won,
+                             minlength=n_entries).astype(np.int64)
+        return LedgerWindow(self, fits[self.e_session], w_matches, w_wins)
+
+
+class LedgerWindow:
+    """Projections over one window of a LedgerColumns. Every method returns
+    per-player results keyed by player_id, covering exactly the players the
+    record fold would emit at least one record for."""
+
+    def __init__(self, columns: LedgerColumns, e_fits, w_matches, w_wins):
+        self.columns = columns
+        self.e_fits = e_fits
+        self.w_matches = w_matches
+        self.w_wins = w_wins
+        self.emitted = (w_matches > 0) | e_fits
+        c = columns
+        self.e_completed = c.s_completed[c.e_session]
+        # side_eligible: completed, fits the window entirely, resolved side.
+        self.eligible = self.emitted & self.e_completed & e_fits & (c.e_side >= 0)
+        tally = c.s_tally[c.e_session]
+        side = np.where(c.e_side >= 0, c.e_side, 0)
+        side_wins = tally[np.arange(len(side)), side]
+        side_losses = tally.sum(axis=1) - side_wins
+        # 0 won, 1 lost, 2 tied.
+        self.outcome = np.where(side_wins > side_losses, 0,
+                                np.where(side_wins < side_losses, 1, 2))
+
+    def _per_player(self, values, mask) -> np.ndarray:
+        return np.bincount(self.columns.e_player[mask], weights=values[mask],
+                           minlength=len(self.columns.player_ids)).astype(np.int64)
+
+    def _present(self) -> list:
+        """Indexes of players with at least one emitted entry."""
+        return np.unique(self.columns.e_player[self.emitted]).tolist()
+
+    def player_ids(self) -> list:
+        return [self.columns.player_ids[i] for i in self._present()]
+
+    def match_totals(self) -> dict:
+        played = self._per_player(self.w_matches, self.emitted).tolist()
+        won = self._per_player(self.w_wins, self.emitted).tolist()
+        return {self.columns.player_ids[i]: {"matches_played": played[i],
+                                             "matches_won": won[i]}
+                for i in self._present()}
+
+    def draft_totals(self) -> dict:
+        mask = self.emitted & self.e_completed & self.e_fits
+        drafts = self._per_player(np.ones_like(self.w_matches), mask).tolist()
+        return {self.columns.player_ids[i]: drafts[i] for i in self._present()}
+
+    def team_record(self) -> dict:
+        counts = np.zeros((len(self.columns.player_ids), 3), dtype=np.int64)
+        np.add.at(counts, (self.columns.e_player[self.eligible],
+                           self.outcome[self.eligible]), 1)
+        counts = counts.tolist()
+        result = {}
+        for i in self._present():
+            won, lost, tied = counts[i]
+            result[self.columns.player_ids[i]] = {
+                "played": won + lost + tied, "won": won, "lost": lost, "tied": tied}
+        return result
+
+    def cube_breakdown(self, player_id: str) -> dict:
+        """Same contract as ledger_stats.cube_breakdown for one player."""
+        c = self.columns
+        try:
+            p = c.player_ids.index(player_id)
+        except ValueError:
+            return {}
+        # Entries are laid out in session (started_at, session_id) order --
+        # the record fold's order, which the spelling tie-break depends on.
+        rows = np.flatnonzero(self.emitted & (c.e_player == p))
+        cube = c.s_cube[c.e_session[rows]]
+        groups: dict = {}
+        for r, cube_idx in zip(rows, cube):
+            name = c.cube_names[cube_idx] if cube_idx >= 0 else None
+            key = name.lower() if name else None
+            group = groups.setdefault(key, {
+                "wins": 0, "losses": 0, "drafts": 0, "spelling_counts": {}})
+            group["wins"] += int(self.w_wins[r])
+            group["losses"] += int(self.w_matches[r] - self.w_wins[r])
+            if self.e_completed[r] and self.e_fits[r]:
+                group["drafts"] += 1
+            if name:
+                group["spelling_counts"][name] = group["spelling_counts"].get(name, 0) + 1
+                group["last_spelling"] = name
+        cubes: dict = {}
+        for key, group in groups.items():
+            spelling_counts = group.pop("spelling_counts")
+            last_spelling = group.pop("last_spelling", None)
+            display_spelling = None if key is None else max(
+                spelling_counts,
+                key=lambda s: (spelling_counts[s], s == last_spelling))
+            cubes[display_spelling] = group
+        return cubes
+
+    def teammate_matrix(self) -> dict:
+        """player_id -> teammate_id -> {"drafts_played", "drafts_won",
+        "drafts_lost", "drafts_tied"} over side-eligible sessions: the
+        leaderboard's Vault/Key pass. Teammates are same-session, same-side
+        entries (real sides, as _compute_teammates)."""
+        c = self.columns
+        rows = np.flatnonzero(self.eligible)
+        if len(rows) == 0:
+            return {}
+        # Group eligible entries by (session, side); every ordered pair of
+        # distinct entries in a group is one (player, teammate) draft.
+        key = c.e_session[rows] * 2 + c.e_side[rows]
+        order = np.argsort(key, kind="stable")
+        rows, key = rows[order], key[order]
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        sizes = np.diff(np.r_[starts, len(rows)])
+        group_of = np.repeat(np.arange(len(starts)), sizes)
+        reps = sizes[group_of]
+        me = np.repeat(np.arange(len(rows)), reps)
+        offset = np.arange(len(me)) - np.repeat(np.cumsum(reps) - reps, reps)
+        mate = starts[group_of[me]] + offset
+        keep = mate != me
+        me, mate = rows[me[keep]], rows[mate[keep]]
+
+        n = len(c.player_ids)
+        pair = c.e_player[me] * n + c.e_player[mate]
+        uniq, inverse = np.unique(pair, return_inverse=True)
+        flat = np.zeros((len(uniq), 3), dtype=np.int64)
+        np.add.at(flat, (inverse, self.outcome[me]), 1)
+        matrix: dict = {}
+        for code, (won, lost, tied) in zip(uniq.tolist(), flat.tolist()):
+            player_id = c.player_ids[code // n]
+            teammate_id = c.player_ids[code % n]
+            matrix.setdefault(player_id, {})[teammate_id] = {
+                "drafts_played": won + lost + tied,
+                "drafts_won": won, "drafts_lost": lost, "drafts_tied": tied,
+            }
+        return matrix
@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from types import MappingProxyType
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from database.db_session import db_session
 from helpers.legacy_import import LEGACY_SESSION_PREFIX
@@ -147,32 +147,48 @@ def _compute_teammates(pid, participants, sides, opponents) -> set:
     return teammates
 
 
-async def fetch_guild_rows(guild_id: str) -> list:
+def _guild_rated(query, guild_id: str):
+    """The guild/rated-type filter every ledger query shares."""
+    return (query
+            .join(DraftSession, MatchResult.session_id == DraftSession.session_id)
+            .where(DraftSession.guild_id == guild_id,
+                   DraftSession.session_type.in_(RATING_SESSION_TYPES)))
+
+
+async def fetch_guild_rows(guild_id: str, session_ids=None) -> list:
     """One SQL fetch of a guild's whole rated reported history (labeled
     column rows, never ORM entities -- materializing entity pairs measured
     ~10s on prod scale). The query deliberately takes no player/since
     params: callers that need several views of the same guild fetch once
-    and fold repeatedly."""
+    and fold repeatedly. session_ids narrows it to just those sessions --
+    how LedgerSnapshot.fetch refreshes a cached snapshot."""
+    query = _guild_rated(select(
+        MatchResult.player1_id, MatchResult.player2_id,
+        MatchResult.winner_id, MatchResult.result_submitted_at,
+        MatchResult.id,
+        DraftSession.session_id, DraftSession.session_type,
+        DraftSession.session_stage,
+        DraftSession.victory_message_id_results_channel,
+        DraftSession.team_a, DraftSession.team_b,
+        DraftSession.cube, DraftSession.draft_start_time,
+    ), guild_id).where(MatchResult.winner_id.isnot(None))
+    if session_ids is not None:
+        query = query.where(DraftSession.session_id.in_(list(session_ids)))
     async with db_session() as s:
-        return (await s.execute(
-            select(
-                MatchResult.player1_id, MatchResult.player2_id,
-                MatchResult.winner_id, MatchResult.result_submitted_at,
-                MatchResult.id,
-                DraftSession.session_id, DraftSession.session_type,
-                DraftSession.session_stage,
-                DraftSession.victory_message_id_results_channel,
-                DraftSession.team_a, DraftSession.team_b,
-                DraftSession.cube, DraftSession.draft_start_time,
-            )
-            .join(DraftSession, MatchResult.session_id == DraftSession.session_id)
-            .where(
-                DraftSession.guild_id == guild_id,
-                DraftSession.session_type.in_(RATING_SESSION_TYPES),
-                MatchResult.winner_id.isnot(None),
-            )
-            .order_by(MatchResult.id)
+        return (await s.execute(query.order_by(MatchResult.id))).all()
+
+
+async def _sessions_since(guild_id: str, high_water: int) -> tuple[set, int]:
+    """(session ids with any match row above high_water, new high-water
+    mark). Counts unreported rows too: a new draft's rows are created at
+    pairing time, so its session shows up here as soon as it exists."""
+    async with db_session() as s:
+        rows = (await s.execute(
+            _guild_rated(select(MatchResult.session_id, func.max(MatchResult.id)), guild_id)
+            .where(MatchResult.id > high_water)
+            .group_by(MatchResult.session_id)
         )).all()
+    return {r[0] for r in rows}, max((r[1] for r in rows), default=high_water)
 
 
 def _event_time(row):
@@ -182,6 +198,33 @@ def _event_time(row):
     return row.result_submitted_at or row.draft_start_time
 
 
+# Process-wide snapshot per guild, advanced incrementally by
+# LedgerSnapshot.fetch. Never mutated in place: a refresh builds a new
+# snapshot sharing the untouched buckets, so a fold already running in a
+# worker thread keeps iterating the one it was handed.
+_SNAPSHOTS: dict[str, "LedgerSnapshot"] = {}
+_SNAPSHOT_LOCKS: dict[str, asyncio.Lock] = {}
+# Sessions whose rows changed in ways the high-water mark can't see (a
+# report on a row created before the mark). Tracked per cached guild.
+_DIRTY: dict[str, set] = {}
+
+
+def invalidate_session(session_id: str) -> None:
+    """Mark a session's ledger rows stale in every cached snapshot; the next
+    LedgerSnapshot.fetch refetches just that session. Call after writing a
+    result (first report, correction, or un-report) -- see
+    utils.apply_result_report."""
+    for dirty in _DIRTY.values():
+        dirty.add(session_id)
+
+
+def reset_snapshot_cache() -> None:
+    """Drop every cached snapshot (tests, or after bulk ledger rewrites such
+    as a legacy import)."""
+    _SNAPSHOTS.clear()
+    _DIRTY.clear()
+
+
 class LedgerSnapshot:
     """An opaque, already-fetched view of one guild's whole rated reported
     history, wrapped so callers never see or hold onto the row shape
@@ -191,30 +234,90 @@ class LedgerSnapshot:
     requested player/window view before doing any per-session work, so a
     weekly or single-player fold costs a fraction of a lifetime one.
     Multi-timeframe callers (three timeframes of /stats or /record) should
-    `await LedgerSnapshot.fetch(guild_id)` once and `.fold()` per view
-    instead of re-fetching per view.
+    `await LedgerSnapshot.fetch(guild_id)` once and `.fold_windows()` all
+    their views in one pass instead of re-fetching or re-folding per view.
+
+    fetch() keeps one snapshot per guild for the life of the process and
+    advances it rather than refetching the guild's history: only sessions
+    with match rows above the last high-water mark on MatchResult.id, plus
+    sessions not yet completed (their stage, victory message and team JSON
+    can still change -- completed sessions' can't) and sessions flagged by
+    invalidate_session, are refetched and regrouped.
     """
 
-    def __init__(self, rows: list):
+    def __init__(self, rows: list, high_water: int = 0):
         self._sessions = _group_sessions(rows)
+        self._high_water = high_water
+        self._columns = None
 
     @classmethod
     async def fetch(cls, guild_id: str) -> "LedgerSnapshot":
-        rows = await fetch_guild_rows(guild_id)
-        # Group off the event loop: at prod scale (~22k rows) grouping is
-        # hundreds of ms of pure Python that would stall every other
-        # interaction in this single-process bot.
-        return await asyncio.to_thread(cls, rows)
+        lock = _SNAPSHOT_LOCKS.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            cached = _SNAPSHOTS.get(guild_id)
+            if cached is None:
+                _DIRTY[guild_id] = set()
+                # Mark first: rows written between the two queries are then
+                # above the mark and picked up by the next refresh.
+                _, high_water = await _sessions_since(guild_id, 0)
+                rows = await fetch_guild_rows(guild_id)
+                # Group off the event loop: at prod scale (~22k rows) grouping is
+                # hundreds of ms of pure Python that would stall every other
+                # interaction in this single-process bot.
+                snapshot = await asyncio.to_thread(cls, rows, high_water)
+            else:
+                dirty, _DIRTY[guild_id] = _DIRTY[guild_id], set()
+                changed, high_water = await _sessions_since(guild_id, cached._high_water)
+                stale = changed | dirty | cached._open_sessions()
+                if not stale:
+                    return cached
+                rows = await fetch_guild_rows(guild_id, session_ids=stale)
+                snapshot = cached._advanced(stale, rows, high_water)
+            _SNAPSHOTS[guild_id] = snapshot
+            return snapshot
+
+    def _open_sessions(self) -> set:
+        return {sid for sid, bucket in self._sessions.items()
+                if not _is_completed(bucket["matches"][0])}
+
+    def _advanced(self, stale: set, rows: list, high_water: int) -> "LedgerSnapshot":
+        """A new snapshot with the `stale` sessions' buckets replaced by
+        those regrouped from `rows` (a session with no rows left -- e.g.
+        abandoned -- drops out). Every other bucket is shared as-is."""
+        sessions = {sid: bucket for sid, bucket in self._sessions.items()
+                    if sid not in stale}
+        sessions.update(_group_sessions(rows))
+        snapshot = LedgerSnapshot.__new__(LedgerSnapshot)
+        snapshot._sessions = sessions
+        snapshot._high_water = high_water
+        snapshot._columns = None
+        return snapshot
 
     def fold(self, player_id: str = None, since=None) -> list[SessionRecord]:
         return _fold_grouped(self._sessions, player_id=player_id, since=since)
 
+    def fold_windows(self, player_id: str = None, windows=(None,)) -> list[list[SessionRecord]]:
+        """One .fold() per entry of `windows` (each a `since`; None is
+        lifetime), computed in a single pass that shares the per-session
+        side inference and teammate sets across windows. Returns the record
+        lists in the order of `windows`."""
+        return _fold_windows(self._sessions, player_id=player_id, windows=windows)
+
+    def columns(self):
+        """This snapshot as a services.ledger_columns.LedgerColumns -- the
+        vectorized engine for guild-wide (leaderboard) projections. Built on
+        first use and kept with the snapshot; call it off the event loop."""
+        if self._columns is None:
+            from services.ledger_columns import LedgerColumns
+            self._columns = LedgerColumns(self._sessions)
+        return self._columns
+
 
 async def fetch_session_records(guild_id: str, player_id: str = None,
                                 since=None) -> list[SessionRecord]:
     """LedgerSnapshot.fetch + .fold in one call, for callers that need a
     single view. Multi-timeframe callers should fetch a snapshot once and
-    fold per timeframe instead of calling this repeatedly."""
+    .fold_windows() instead of calling this repeatedly."""
     snapshot = await LedgerSnapshot.fetch(guild_id)
     return snapshot.fold(player_id=player_id, since=since)
 
@@ -243,7 +346,7 @@ def _group_sessions(rows) -> dict:
 
 
 def _fold_grouped(by_session: dict, player_id: str = None, since=None) -> list[SessionRecord]:
-    """The fold body over pre-grouped session buckets.
+    """The fold body over pre-grouped session buckets, for one window.
 
     since filters individual matches by their event time; records with no
     in-window matches are omitted. When since is None (lifetime), that
@@ -252,95 +355,127 @@ def _fold_grouped(by_session: dict, player_id: str = None, since=None) -> list[S
     it precedes all data, so every lifetime caller (/stats, h2h,
     leaderboards) sees the same lifetime set regardless of which of those
     two spellings it used to pass.
+    """
+    return _fold_windows(by_session, player_id=player_id, windows=(since,))[0]
 
-    Sessions that can't contribute to the requested view are skipped
-    before any per-session work (side inference, teammate computation):
-    the requested player isn't a participant, or no match event reaches
-    the window (equivalent to every emitted record being dropped by the
-    window_matches==0 filter below, just without paying for it first).
+
+def _fold_windows(by_session: dict, player_id: str = None,
+                  windows=(None,)) -> list[list[SessionRecord]]:
+    """_fold_grouped for several windows in one pass: returns one record
+    list per entry of `windows` (each a `since`, None = lifetime), exactly
+    what _fold_grouped would return for it.
+
+    The window-independent work -- side inference, the side tally,
+    whole-session totals and teammate sets -- runs once per session; only
+    the in-window tallies are recomputed per window. A single-player fold
+    tallies only that player's side of each match.
+
+    Sessions that can't contribute to a window are skipped for it before
+    any per-session work: the requested player isn't a participant, or no
+    match event reaches the window (equivalent to every emitted record
+    being dropped by the window_matches==0 filter below, just without
+    paying for it first).
     """
-    records = []
+    windows = list(windows)
+    results: list[list[SessionRecord]] = [[] for _ in windows]
     for session_id, bucket in by_session.items():
         if player_id is not None and player_id not in bucket["participants"]:
             continue
-        if since is not None and (bucket["max_event"] is None
-                                  or bucket["max_event"] < since):
+        max_event = bucket["max_event"]
+        live = [i for i, since in enumerate(windows)
+                if since is None or (max_event is not None and max_event >= since)]
+        if not live:
             continue
         matches = bucket["matches"]
         session_row = matches[0]    # session columns repeat on every row
-        window_flags = [since is None or
-                        (_event_time(m) is not None and _event_time(m) >= since)
-                        for m in matches]
-        # Owner-ruled windowing: whole-session facts are all-or-nothing —
-        # the session "fits" only when EVERY match event lies inside the
-        # window. Straddlers contribute their in-window matches to match
-        # totals but nothing at the draft level (no partial-session draft
-        # outcomes, e.g. a 5-1 session must never read as a windowed tie).
-        fits_window = all(window_flags)
+        outcomes = []               # (winner, loser, event_time) per match
         sides = _side_map(session_row, matches)
         side_tally = {"a": 0, "b": 0}
         per_player: dict[str, dict] = {}
-        for m, in_window in zip(matches, window_flags):
+        for m in matches:
             winner = m.winner_id
             loser = m.player2_id if winner == m.player1_id else m.player1_id
+            outcomes.append((winner, loser, _event_time(m)))
             winner_side = sides.get(winner)
             if winner_side:
                 side_tally[winner_side] += 1
             for me, opp, won in ((winner, loser, True), (loser, winner, False)):
-                rec = per_player.setdefault(me, {
-                    "wins": 0, "losses": 0, "opponents": {},
-                    "window_wins": 0, "window_matches": 0,
-                    "window_opponents": {}})
+                if player_id is not None and me != player_id:
+                    continue
+                rec = per_player.setdefault(me, {"wins": 0, "losses": 0, "opponents": {}})
                 rec["wins" if won else "losses"] += 1
                 pair = rec["opponents"].setdefault(opp, [0, 0])
                 pair[0 if won else 1] += 1
-                if in_window:
-                    rec["window_matches"] += 1
-                    rec["window_wins"] += 1 if won else 0
-                    wpair = rec["window_opponents"].setdefault(opp, [0, 0])
-                    wpair[0 if won else 1] += 1
 
         total = side_tally["a"] + side_tally["b"]
         completed = _is_completed(session_row)
-        participants = set(per_player.keys())
-        for pid, rec in per_player.items():
-            if player_id is not None and pid != player_id:
-                continue
-            if rec["window_matches"] == 0 and not fits_window:
-                continue    # nothing of this session touches the window
-            my_side = sides.get(pid)
-            if my_side:
-                side_wins = side_tally.get(my_side, 0)
-                side_losses = total - side_wins
-            else:
-                # Unrepresentable rather than fabricated: a side=None
-                # record has no side outcome, so reading these as numbers
-                # must throw, not miscount (see side_eligible).
-                side_wins = side_losses = None
-            records.append(SessionRecord(
-                player_id=pid,
-                session_id=session_id,
-                session_type=session_row.session_type,
-                cube=session_row.cube,
-                completed=completed,
-                started_at=session_row.draft_start_time,
-                wins=rec["wins"],
-                matches=rec["wins"] + rec["losses"],
-                side=my_side,
-                side_wins=side_wins,
-                side_losses=side_losses,
-                fits_window=fits_window,
-                window_wins=rec["window_wins"],
-                window_matches=rec["window_matches"],
-                window_opponents=MappingProxyType(
-                    {opp: tuple(pair)
-                     for opp, pair in rec["window_opponents"].items()}),
-                participants=frozenset(participants),
-                teammates=frozenset(_compute_teammates(
-                    pid, participants, sides, rec["opponents"])),
-            ))
-    records.sort(key=lambda r: (r.started_at or datetime.min, r.session_id))
-    return records
+        participants = frozenset(bucket["participants"])
+        # Window-independent per-player facts, built on first use.
+        shared: dict[str, tuple] = {}
+        for i in live:
+            since = windows[i]
+            window_flags = [since is None or (t is not None and t >= since)
+                            for _, _, t in outcomes]
+            # Owner-ruled windowing: whole-session facts are all-or-nothing —
+            # the session "fits" only when EVERY match event lies inside the
+            # window. Straddlers contribute their in-window matches to match
+            # totals but nothing at the draft level (no partial-session draft
+            # outcomes, e.g. a 5-1 session must never read as a windowed tie).
+            fits_window = all(window_flags)
+            in_window: dict[str, dict] = {}
+            for (winner, loser, _), flag in zip(outcomes, window_flags):
+                if not flag:
+                    continue
+                for me, opp, won in ((winner, loser, True), (loser, winner, False)):
+                    if player_id is not None and me != player_id:
+                        continue
+                    rec = in_window.setdefault(me, {"wins": 0, "matches": 0, "opponents": {}})
+                    rec["matches"] += 1
+                    rec["wins"] += 1 if won else 0
+                    pair = rec["opponents"].setdefault(opp, [0, 0])
+                    pair[0 if won else 1] += 1
+
+            for pid, rec in per_player.items():
+                window = in_window.get(pid)
+                if window is None and not fits_window:
+                    continue    # nothing of this session touches the window
+                if pid not in shared:
+                    my_side = sides.get(pid)
+                    if my_side:
+                        side_wins = side_tally.get(my_side, 0)
+                        side_losses = total - side_wins
+                    else:
+                        # Unrepresentable rather than fabricated: a side=None
+                        # record has no side outcome, so reading these as numbers
+                        # must throw, not miscount (see side_eligible).
+                        side_wins = side_losses = None
+                    shared[pid] = (my_side, side_wins, side_losses, frozenset(
+                        _compute_teammates(pid, participants, sides, rec["opponents"])))
+                my_side, side_wins, side_losses, teammates = shared[pid]
+                results[i].append(SessionRecord(
+                    player_id=pid,
+                    session_id=session_id,
+                    session_type=session_row.session_type,
+                    cube=session_row.cube,
+                    completed=completed,
+                    started_at=session_row.draft_start_time,
+                    wins=rec["wins"],
+                    matches=rec["wins"] + rec["losses"],
+                    side=my_side,
+                    side_wins=side_wins,
+                    side_losses=side_losses,
+                    fits_window=fits_window,
+                    window_wins=window["wins"] if window else 0,
+                    window_matches=window["matches"] if window else 0,
+                    window_opponents=MappingProxyType(
+                        {opp: tuple(pair)
+                         for opp, pair in window["opponents"].items()} if window else {}),
+                    participants=participants,
+                    teammates=teammates,
+                ))
+    for records in results:
+        records.sort(key=lambda r: (r.started_at or datetime.min, r.session_id))
+    return results
 
 
 def match_totals(records) -> dict:
@@ -12,6 +12,7 @@ from database.db_session import db_session
 from models.draft_session import DraftSession
 from services.draft_log_store import post_team_logs
 from services.draft_setup_manager import ACTIVE_MANAGERS, DraftSetupManager
+from services.reconnect_scheduler import get_reconnect_scheduler, start_manager
 
 RECONCILE_INTERVAL_SECONDS: int = 60
 CAPTURE_RETRY_WINDOW_HOURS: int = 12   # only chase recently-active drafts
@@ -34,7 +35,9 @@ _RECONCILER_RUNNING: bool = False  # guards against on_ready firing on every gat
 async def reconcile_capture(bot) -> None:
     """Backup for a missed endDraft push: reconnect the owner socket for
     uncaptured, recently-active drafts and capture the log the session
-    re-delivers on join. Bounded by Draftmancer's ~28-min retention."""
+    re-delivers on join. Bounded by Draftmancer's ~28-min retention.
+    Drafts are handled concurrently; new sockets connect through the shared
+    reconnection scheduler."""
     cutoff = datetime.now() - timedelta(hours=CAPTURE_RETRY_WINDOW_HOURS)
     async with db_session() as session:
         uncaptured = (await session.execute(
@@ -47,23 +50,31 @@ async def reconcile_capture(bot) -> None:
             )
         )).scalars().all()
 
-    for ds in uncaptured:
-        session_id = ds.session_id
-        try:
-            manager = await DraftSetupManager.spawn_for_existing_session(session_id, bot)
-            if manager is None:
-                continue
-            for _ in range(CAPTURE_LOG_WAIT_ATTEMPTS):
-                if getattr(manager, "current_draft_log", None):
-                    break
-                await asyncio.sleep(CAPTURE_LOG_WAIT_INTERVAL)
-            draft_log = getattr(manager, "current_draft_log", None)
-            if draft_log:
-                await manager.capture_draft_log(draft_log)
-            else:
-                logger.info(f"[reconciler] no log yet for {session_id}; will retry next tick")
-        except Exception as e:
-            logger.error(f"[reconciler] capture retry failed for {session_id}: {e}")
+    await asyncio.gather(*(_capture_one(bot, ds.session_id, ds.session_stage) for ds in uncaptured))
+
+
+async def _capture_one(bot, session_id, stage) -> None:
+    try:
+        existing = DraftSetupManager.get_active_manager(session_id)
+        manager = await DraftSetupManager.spawn_for_existing_session(session_id, bot, start=False)
+        if manager is None:
+            return
+        if manager is not existing:
+            result = await get_reconnect_scheduler().submit(
+                session_id, stage, lambda: start_manager(manager))
+            if not result.ok:
+                return
+        for _ in range(CAPTURE_LOG_WAIT_ATTEMPTS):
+            if getattr(manager, "current_draft_log", None):
+                break
+            await asyncio.sleep(CAPTURE_LOG_WAIT_INTERVAL)
+        draft_log = getattr(manager, "current_draft_log", None)
+        if draft_log:
+            await manager.capture_draft_log(draft_log)
+        else:
+            logger.info(f"[reconciler] no log yet for {session_id}; will retry next tick")
+    except Exception as e:
+        logger.error(f"[reconciler] capture retry failed for {session_id}: {e}")
 
 
 async def reconcile_publish_and_team_logs(bot) -> None:
@@ -0,0 +1,116 @@
+"""One timer heap for every DraftSetupManager in the process.
+
+Managers used to park a sleeping task per timer -- the 90s ready-check
+timeout, delayed disconnects, the keep_connection_alive poll -- and a
+victory-aware disconnect polled the DB every 30s for up to 10 minutes. Now
+each of those is a deadline on this supervisor's heap; a single dispatcher
+task sleeps until the earliest one, so an idle draft costs no wakeups until
+something is actually due. Timers are cancelled through the handle that
+``call_later`` returns (same ``cancel()`` as the task it replaces).
+
+Everything else is event-driven: socket events wake a manager's loop
+directly, and a posted victory/draw message notifies the manager waiting on
+it (draft_setup_manager.notify_victory) instead of being polled for.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import time
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+
+class TimerHandle:
+    __slots__ = ("when", "callback", "args", "cancelled")
+
+    def __init__(self, when: float, callback: Callable, args: tuple):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class ManagerSupervisor:
+    """See the module docstring. One per event loop."""
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._tasks: set = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Only tests run more than one loop per process.
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._dispatcher = None
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._run())
+        self._wake.set()
+
+    def call_later(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """Run `callback(*args)` after `delay` seconds. Coroutine functions
+        run as their own task, so a slow callback never delays other timers."""
+        handle = TimerHandle(time.monotonic() + max(0.0, delay), callback, args)
+        heapq.heappush(self._heap, (handle.when, next(self._seq), handle))
+        self._ensure_dispatcher()
+        return handle
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for _, _, handle in self._heap if not handle.cancelled)
+
+    def _fire(self, handle: TimerHandle) -> None:
+        self.fired += 1
+        try:
+            result = handle.callback(*handle.args)
+        except Exception as e:
+            logger.exception(f"[supervisor] timer callback {handle.callback!r} failed: {e}")
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error("[supervisor] timer task failed")
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                await self._wake.wait()
+                continue
+            now = time.monotonic()
+            when, _, handle = self._heap[0]
+            if when > now:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), when - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            self._fire(handle)
+
+
+_SUPERVISOR = ManagerSupervisor()
+
+
+def get_supervisor() -> ManagerSupervisor:
+    return _SUPERVISOR
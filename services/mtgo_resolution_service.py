@@ -26,7 +26,7 @@ from collections.abc import Iterable
 from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from database.db_session import db_session
 from database.retry import with_db_retry
@@ -467,14 +467,10 @@ async def settle_debt_from_wallet(guild_id: str, payer_id: str, creditor_id: str
             # COPIES, so without it a lent card nets against money owed — a payer owing 5
             # tix who has lent 3 cards to the same person reads as owing 2, and their
             # settlement is refused as exceeding the debt, leaving real tix uncollected.
-            # Every other balance read in debt_service applies the same filter.
-            debt_balance = int((await session.execute(
-                select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(
-                    DebtLedger.guild_id == guild_id,
-                    DebtLedger.player_id == payer_id,
-                    DebtLedger.counterparty_id == creditor_id,
-                    debt_service.TIX_ONLY,
-                ))).scalar() or 0)
+            # Every other balance read in debt_service applies the same filter; the
+            # materialized pair balance only ever counts tix rows.
+            debt_balance = await debt_service.pair_balance_in(
+                session, guild_id, payer_id, creditor_id)
             if debt_balance >= 0:
                 return {"ok": False, "error": "no outstanding debt to this creditor"}
             owed = -debt_balance
@@ -0,0 +1,80 @@
+"""
+Quiz eligibility index: which (draft, starting seat) pairs the pick quiz can use.
+
+A pick quiz traces QUIZ_NUM_PICKS consecutive picks of pack QUIZ_PACK_NUMBER
+from one starting seat, which needs the full Draftmancer log. The valid seats
+are computed here once, when the log is captured, and stored as
+QuizEligibleSeat rows; picking a quiz is then a single query for a stored seat
+no QuizSession has used yet.
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import select, and_, func
+
+from database.db_session import db_session
+from models import DraftSession, QuizSession
+from models.quiz_eligible_seat import QuizEligibleSeat
+from services.draft_analysis import DraftAnalysis
+
+QUIZ_PACK_NUMBER = 0  # First pack
+QUIZ_NUM_PICKS = 4  # Number of picks to quiz on
+
+
+def valid_quiz_seats(draft_data: dict, draft_session: DraftSession) -> list[int]:
+    """Starting seats whose QUIZ_PACK_NUMBER trace is a full QUIZ_NUM_PICKS chain."""
+    analysis = DraftAnalysis(draft_data, draft_session=draft_session)
+    return analysis.get_valid_starting_seats(QUIZ_PACK_NUMBER, QUIZ_NUM_PICKS)
+
+
+async def index_quiz_seats(session, draft_session: DraftSession, draft_data: dict) -> list[int]:
+    """Compute and store the quiz seats for a captured draft in the caller's
+    session (the caller commits). Returns the seats stored."""
+    seats = valid_quiz_seats(draft_data, draft_session)
+    await QuizEligibleSeat.record(session, draft_session.session_id,
+                                  QUIZ_PACK_NUMBER, QUIZ_NUM_PICKS, seats)
+    return seats
+
+
+async def pick_unused_seat(guild_id: str, since: datetime) -> Tuple[Optional[DraftSession], Optional[int]]:
+    """A random (DraftSession, starting_seat) from the guild's drafts since `since`
+    that no QuizSession has used, or (None, None).
+
+    Any quiz row for the pair counts as used, posted or not (see
+    QuizCommands._create_and_post_quiz for why rows are written last).
+    """
+    used = (
+        select(QuizSession.quiz_id)
+        .where(
+            QuizSession.guild_id == str(guild_id),
+            QuizSession.draft_session_id == QuizEligibleSeat.session_id,
+            QuizSession.starting_seat == QuizEligibleSeat.starting_seat,
+        )
+        .exists()
+    )
+    stmt = (
+        select(DraftSession, QuizEligibleSeat.starting_seat)
+        .join(QuizEligibleSeat, QuizEligibleSeat.session_id == DraftSession.session_id)
+        .where(
+            and_(
+                DraftSession.guild_id == str(guild_id),
+                DraftSession.spaces_object_key.isnot(None),
+                DraftSession.draft_start_time >= since,
+                QuizEligibleSeat.pack_num == QUIZ_PACK_NUMBER,
+                QuizEligibleSeat.num_picks == QUIZ_NUM_PICKS,
+                ~used,
+            )
+        )
+        .order_by(func.random())
+        .limit(1)
+    )
+    async with db_session() as session:
+        row = (await session.execute(stmt)).first()
+    if row is None:
+        logger.warning(f"No unused indexed draft+seat combinations for guild {guild_id}")
+        return None, None
+    draft, seat = row
+    logger.info(f"Selected draft {draft.session_id} (cube: {draft.cube}) seat {seat}")
+    return draft, seat
+
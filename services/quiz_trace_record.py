@@ -0,0 +1,64 @@
+"""
+The traced pack a pick quiz is built on, stored with its QuizSession.
+
+QuizSession.pack_trace_data holds the traced picks plus the name of every card
+they show, so QuizPublicView and submissions rebuild the PackTrace and answer
+card lookups from the row alone -- no Spaces download, no DraftIndexer build.
+Quizzes created before the names were stored have no "cards" key;
+load_trace_record returns None for them and the caller falls back to a full
+DraftAnalysis (then upgrades the row with trace_record).
+"""
+from typing import Dict, Optional, Tuple
+
+from models.draft_domain import Card, PackTrace, Pick
+
+
+class RecordedCards:
+    """Stands in for DraftAnalysis.get_card with the names stored in the record."""
+
+    def __init__(self, names: Dict[str, str]):
+        self._names = names
+
+    def get_card(self, card_id: str) -> Card:
+        name = self._names.get(card_id)
+        return Card.from_dict(card_id, {"name": name} if name is not None else {})
+
+
+def trace_record(pack_trace: PackTrace, analysis) -> dict:
+    """Serialize a PackTrace, with the names of every card in its boosters,
+    for QuizSession.pack_trace_data."""
+    card_ids = {cid for pick in pack_trace.picks for cid in pick.booster_ids}
+    return {
+        "pack_num": pack_trace.pack_num,
+        "picks": [
+            {
+                "user_id": pick.user_id,
+                "user_name": pick.user_name,
+                "pick_num": pick.pick_num,
+                "booster_ids": pick.booster_ids,
+                "picked_id": pick.picked_id,
+            }
+            for pick in pack_trace.picks
+        ],
+        "cards": {cid: analysis.get_card(cid).name for cid in sorted(card_ids)},
+    }
+
+
+def load_trace_record(data: Optional[dict]) -> Optional[Tuple[PackTrace, RecordedCards]]:
+    """(PackTrace, RecordedCards) from a stored record, or None if the record
+    predates stored card names (or is missing)."""
+    if not data or "cards" not in data or not data.get("picks"):
+        return None
+    pack_num = data.get("pack_num", 0)
+    picks = [
+        Pick(
+            user_id=p.get("user_id"),
+            user_name=p["user_name"],
+            pack_num=pack_num,
+            pick_num=p.get("pick_num"),
+            booster_ids=list(p["booster_ids"]),
+            picked_id=p["picked_id"],
+        )
+        for p in data["picks"]
+    ]
+    return PackTrace(pack_num=pack_num, picks=picks), RecordedCards(data["cards"])
@@ -0,0 +1,187 @@
+"""Concurrent, prioritized Draftmancer reconnection after a restart.
+
+Every socket (re)connection a restart triggers -- the queue-stage setup
+managers from reconnect_drafts and the capture-retry managers the log
+reconciler spawns -- goes through one process-wide ReconnectScheduler:
+
+- at most RECONNECT_CONCURRENCY connection handshakes in flight at once;
+- new handshakes are paced by a token bucket (RECONNECT_RATE per second,
+  bursts of RECONNECT_BURST) so a restart with many live drafts doesn't hit
+  Draftmancer with every connect in the same instant;
+- waiting jobs start in session-stage order: drafts already in progress
+  (teams / pairings) before queues, then first come first served.
+
+A slot is held only for the handshake; once connected, the manager's
+keep_connection_alive loop takes over and the slot is released. Each job's
+latency (time queued + time connecting) is logged per session.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+from loguru import logger
+
+from config import get_draftmancer_websocket_url
+
+STAGE_PRIORITY = {"teams": 0, "pairings": 0}
+QUEUE_PRIORITY = 1
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        logger.warning(f"[reconnect] ignoring invalid {name}={os.getenv(name)!r}")
+        return cast(default)
+
+
+def stage_priority(stage: Optional[str]) -> int:
+    return STAGE_PRIORITY.get(stage, QUEUE_PRIORITY)
+
+
+@dataclass
+class ReconnectResult:
+    session_id: str
+    stage: Optional[str]
+    ok: bool
+    queued_seconds: float
+    connect_seconds: float
+
+    @property
+    def latency(self) -> float:
+        return self.queued_seconds + self.connect_seconds
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1 or self.rate <= 0:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+class ReconnectScheduler:
+    """See the module docstring. Configurable per instance; the process-wide
+    one reads RECONNECT_CONCURRENCY / RECONNECT_RATE / RECONNECT_BURST."""
+
+    def __init__(self, concurrency: Optional[int] = None, rate: Optional[float] = None,
+                 burst: Optional[int] = None):
+        self.concurrency = max(1, concurrency or _env_number("RECONNECT_CONCURRENCY", "5", int))
+        rate = rate if rate is not None else _env_number("RECONNECT_RATE", "2", float)
+        burst = burst or _env_number("RECONNECT_BURST", str(self.concurrency), int)
+        self._bucket = _TokenBucket(rate, burst)
+        self._waiting: list = []
+        self._active = 0
+        self._seq = itertools.count()
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop = None
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Only tests run more than one loop per process.
+            self._loop = loop
+            self._cond = asyncio.Condition()
+            self._waiting = []
+            self._active = 0
+        return self._cond
+
+    async def submit(self, session_id: str, stage: Optional[str],
+                     connect: Callable[[], Awaitable[bool]]) -> ReconnectResult:
+        """Wait for this job's turn, run `connect` (True on success) and
+        return its latency breakdown. Exceptions from `connect` count as a
+        failed reconnect and are logged, not raised."""
+        cond = self._condition()
+        queued_at = time.monotonic()
+        entry = (stage_priority(stage), next(self._seq))
+        async with cond:
+            heapq.heappush(self._waiting, entry)
+            while True:
+                if self._waiting[0] == entry and self._active < self.concurrency:
+                    delay = self._bucket.wait_time(time.monotonic())
+                    if delay <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(cond.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await cond.wait()
+            heapq.heappop(self._waiting)
+            self._bucket.take()
+            self._active += 1
+            cond.notify_all()
+
+        started = time.monotonic()
+        try:
+            ok = bool(await connect())
+        except Exception as e:
+            logger.error(f"[reconnect] {session_id}: reconnect failed: {e}")
+            ok = False
+        finally:
+            async with cond:
+                self._active -= 1
+                cond.notify_all()
+
+        result = ReconnectResult(session_id, stage, ok, started - queued_at, time.monotonic() - started)
+        logger.info(
+            f"[reconnect] {session_id} ({stage or 'queue'}): "
+            f"{'connected' if ok else 'failed'} after {result.latency:.2f}s "
+            f"(queued {result.queued_seconds:.2f}s, connect {result.connect_seconds:.2f}s)"
+        )
+        return result
+
+
+_SCHEDULER: Optional[ReconnectScheduler] = None
+
+
+def get_reconnect_scheduler() -> ReconnectScheduler:
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = ReconnectScheduler()
+    return _SCHEDULER
+
+
+async def start_manager(manager) -> bool:
+    """Connect a not-yet-started DraftSetupManager, then hand it to its
+    keep_connection_alive loop (which finds the socket already connected)."""
+    url = get_draftmancer_websocket_url(manager.draft_id)
+    if not await manager.socket_client.connect_with_retry(url):
+        manager.logger.error("Initial connection failed after retries. Aborting.")
+        return False
+    asyncio.create_task(manager.keep_connection_alive())
+    return True
+
+
+async def reconnect_managers(managers: Iterable, stage: Optional[str] = None,
+                             scheduler: Optional[ReconnectScheduler] = None) -> List[ReconnectResult]:
+    """Reconnect every manager through the scheduler, concurrently."""
+    scheduler = scheduler or get_reconnect_scheduler()
+    managers = list(managers)
+    results = await asyncio.gather(*(
+        scheduler.submit(manager.session_id, stage, lambda m=manager: start_manager(m))
+        for manager in managers
+    ))
+    if results:
+        connected = sum(1 for r in results if r.ok)
+        logger.info(
+            f"[reconnect] {connected}/{len(results)} managers reconnected; "
+            f"slowest {max(r.latency for r in results):.2f}s"
+        )
+    return results
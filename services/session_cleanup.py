@@ -0,0 +1,260 @@
+"""
+Periodic cleanup of expired draft sessions, stale queues and old challenges.
+
+Each tick runs in three phases so no SQLite write transaction is ever held
+across a Discord call:
+
+1. plan    -- one short transaction selects the work (and pushes out the
+              deletion_time of drafts whose tournament match is unfinished),
+              then snapshots it into plain work items;
+2. discord -- channel/message deletions and queue-cancellation notices run
+              concurrently (CLEANUP_DISCORD_CONCURRENCY at a time), outside
+              any transaction;
+3. commit  -- the row deletions for cancelled queues and old challenges are
+              written in one batch.
+
+``run_cleanup_tick`` returns a CleanupMetrics for the tick, which is also
+logged (utils.cleanup_sessions_task drives the loop).
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import discord
+from loguru import logger
+from sqlalchemy import delete, select
+
+from config import is_cleanup_exempt
+from database.db_session import db_session
+from models import Challenge, DraftSession
+
+CLEANUP_DISCORD_CONCURRENCY = 5
+EXPIRED_SESSION_WINDOW = timedelta(hours=24)
+CHALLENGE_LIFETIME = timedelta(hours=2)
+
+
+@dataclass
+class _QueueCancellation:
+    session_id: str
+    friendly_id: Optional[str]
+    draft_channel_id: Optional[str]
+    message_id: Optional[str]
+
+
+@dataclass
+class _ExpiredSession:
+    session_id: str
+    channel_ids: List[str]
+    draft_channel_id: Optional[str]
+    message_id: Optional[str]
+
+
+@dataclass
+class _ChallengeCleanup:
+    challenge_id: int
+    channel_id: Optional[str]
+    message_id: Optional[str]
+
+
+@dataclass
+class CleanupPlan:
+    cancellations: List[_QueueCancellation] = field(default_factory=list)
+    expired: List[_ExpiredSession] = field(default_factory=list)
+    challenges: List[_ChallengeCleanup] = field(default_factory=list)
+    extended: int = 0
+
+
+@dataclass
+class CleanupMetrics:
+    queues_cancelled: int = 0
+    sessions_expired: int = 0
+    sessions_extended: int = 0
+    challenges_removed: int = 0
+    channels_deleted: int = 0
+    messages_deleted: int = 0
+    discord_errors: int = 0
+    plan_seconds: float = 0.0
+    discord_seconds: float = 0.0
+    commit_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"cancelled={self.queues_cancelled} expired={self.sessions_expired} "
+            f"extended={self.sessions_extended} challenges={self.challenges_removed} "
+            f"channels_deleted={self.channels_deleted} messages_deleted={self.messages_deleted} "
+            f"discord_errors={self.discord_errors} | plan={self.plan_seconds:.2f}s "
+            f"discord={self.discord_seconds:.2f}s commit={self.commit_seconds:.2f}s"
+        )
+
+
+async def plan_cleanup(now: datetime) -> CleanupPlan:
+    """Phase 1: select this tick's work in one short transaction."""
+    from services.tournament_service import extend_deletion_if_unfinished
+
+    plan = CleanupPlan()
+    async with db_session() as session:
+        inactive = (await session.execute(
+            select(DraftSession).where(
+                DraftSession.session_stage.is_(None),  # Only initial queue stage
+                DraftSession.deletion_time < now,
+            )
+        )).scalars().all()
+        for ds in inactive:
+            # Skip queue cleanup for guilds marked as cleanup_exempt
+            if is_cleanup_exempt(ds.guild_id):
+                continue
+            plan.cancellations.append(_QueueCancellation(
+                ds.session_id, ds.friendly_id, ds.draft_channel_id, ds.message_id))
+
+        expired = (await session.execute(
+            select(DraftSession).where(
+                DraftSession.deletion_time.between(now - EXPIRED_SESSION_WINDOW, now))
+        )).scalars().all()
+        cancelled = {item.session_id for item in plan.cancellations}
+        for ds in expired:
+            if ds.session_id in cancelled:
+                continue   # its message is already handled as a queue cancellation
+            # Never reap a draft whose tournament match is still unfinished --
+            # extend its lifespan instead so the pairing buttons stay alive.
+            if await extend_deletion_if_unfinished(session, ds, now):
+                logger.info(
+                    f"Skipped cleanup for session {ds.session_id}: tournament "
+                    f"match {ds.tournament_match_id} unfinished; deletion_time extended"
+                )
+                plan.extended += 1
+                continue
+            message_id = ds.message_id
+            if ds.session_type == "winston" and (not ds.sign_ups or len(ds.sign_ups) < 2):
+                message_id = None
+            plan.expired.append(_ExpiredSession(
+                ds.session_id, list(ds.channel_ids or []), ds.draft_channel_id, message_id))
+
+        challenges = (await session.execute(
+            select(Challenge).where(Challenge.start_time < now - CHALLENGE_LIFETIME)
+        )).scalars().all()
+        plan.challenges = [
+            _ChallengeCleanup(c.id, c.channel_id, c.message_id) for c in challenges
+        ]
+    return plan
+
+
+async def _delete_message(bot, channel_id, message_id, metrics: CleanupMetrics, channel=None) -> bool:
+    channel = channel or bot.get_channel(int(channel_id))
+    if not channel:
+        return False
+    try:
+        await channel.get_partial_message(int(message_id)).delete()
+    except discord.NotFound:
+        return False
+    except discord.HTTPException as e:
+        metrics.discord_errors += 1
+        logger.error(f"Failed to delete message ID {message_id} in channel {channel_id}. Reason: {e}")
+        return False
+    metrics.messages_deleted += 1
+    return True
+
+
+async def _cancel_queue(bot, item: _QueueCancellation, metrics: CleanupMetrics) -> None:
+    if not (item.draft_channel_id and item.message_id):
+        return
+    draft_channel = bot.get_channel(int(item.draft_channel_id))
+    if not draft_channel:
+        return
+    if await _delete_message(bot, item.draft_channel_id, item.message_id, metrics, draft_channel):
+        await draft_channel.send(
+            f"Queue for `{item.friendly_id}` has been cancelled due to inactivity "
+            "(no new signups for 180 minutes)."
+        )
+        logger.info(f"Cancelled inactive queue for session {item.session_id} ({item.friendly_id})")
+    from ready_check import ReadyCheckSession
+    await ReadyCheckSession.cleanup(item.session_id, draft_channel)
+
+
+async def _delete_channel(bot, channel_id, metrics: CleanupMetrics) -> None:
+    channel = bot.get_channel(int(channel_id))
+    if not channel:
+        return
+    try:
+        await channel.delete(reason="Session expired.")
+    except discord.NotFound:
+        return
+    except discord.HTTPException as e:
+        metrics.discord_errors += 1
+        logger.error(f"Failed to delete channel: {channel.name}. Reason: {e}")
+        return
+    metrics.channels_deleted += 1
+
+
+async def run_discord_cleanup(bot, plan: CleanupPlan, metrics: CleanupMetrics,
+                              concurrency: int = CLEANUP_DISCORD_CONCURRENCY) -> None:
+    """Phase 2: every Discord deletion for the plan, bounded, no DB access."""
+    semaphore = asyncio.Semaphore(concurrency)
+    jobs = []
+    for item in plan.cancellations:
+        jobs.append(lambda item=item: _cancel_queue(bot, item, metrics))
+    for item in plan.expired:
+        for channel_id in item.channel_ids:
+            jobs.append(lambda cid=channel_id: _delete_channel(bot, cid, metrics))
+        if item.draft_channel_id and item.message_id:
+            jobs.append(lambda item=item: _delete_message(
+                bot, item.draft_channel_id, item.message_id, metrics))
+    for item in plan.challenges:
+        if item.channel_id and item.message_id:
+            jobs.append(lambda item=item: _delete_message(
+                bot, item.channel_id, item.message_id, metrics))
+
+    async def _bounded(job):
+        async with semaphore:
+            try:
+                await job()
+            except Exception as e:
+                metrics.discord_errors += 1
+                logger.error(f"Cleanup Discord job failed: {e}")
+
+    await asyncio.gather(*(_bounded(job) for job in jobs))
+
+
+async def commit_cleanup(plan: CleanupPlan, metrics: CleanupMetrics) -> None:
+    """Phase 3: delete the cancelled queues and old challenges in one batch.
+    A queue that left the initial stage while phase 2 ran is kept."""
+    session_ids = [item.session_id for item in plan.cancellations]
+    challenge_ids = [item.challenge_id for item in plan.challenges]
+    if not session_ids and not challenge_ids:
+        return
+    async with db_session() as session:
+        if session_ids:
+            result = await session.execute(
+                delete(DraftSession).where(
+                    DraftSession.session_id.in_(session_ids),
+                    DraftSession.session_stage.is_(None),
+                )
+            )
+            metrics.queues_cancelled = result.rowcount
+        if challenge_ids:
+            result = await session.execute(delete(Challenge).where(Challenge.id.in_(challenge_ids)))
+            metrics.challenges_removed = result.rowcount
+
+
+async def run_cleanup_tick(bot, now: Optional[datetime] = None) -> CleanupMetrics:
+    """One full plan -> discord -> commit pass."""
+    now = now or datetime.now()
+    metrics = CleanupMetrics()
+
+    started = time.monotonic()
+    plan = await plan_cleanup(now)
+    metrics.sessions_expired = len(plan.expired)
+    metrics.sessions_extended = plan.extended
+    metrics.plan_seconds = time.monotonic() - started
+
+    started = time.monotonic()
+    await run_discord_cleanup(bot, plan, metrics)
+    metrics.discord_seconds = time.monotonic() - started
+
+    started = time.monotonic()
+    await commit_cleanup(plan, metrics)
+    metrics.commit_seconds = time.monotonic() - started
+
+    logger.info(f"[cleanup] tick: {metrics.summary()}")
+    return metrics
@@ -0,0 +1,74 @@
+"""
+Trophy quiz candidate index: which drafters of which drafts the quiz can show.
+
+The log-derived half of select_two_decks' eligibility (clean seat mapping,
+non-empty pool) is computed once when the log is captured and stored as
+TrophyQuizCandidate rows. The record half changes as results are reported, so
+it is aggregated from match_results at selection time -- in the same single
+query -- and only the draft finally chosen has its log downloaded.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import and_, case, func, or_, select
+
+from database.db_session import db_session
+from models import DraftSession, MatchResult, TrophyQuizSession
+from models.trophy_quiz_candidate import TrophyQuizCandidate
+from services.trophy_quiz_service import candidate_drafters, is_fully_reported
+
+
+async def index_trophy_candidates(session, draft_session: DraftSession, draft_data: dict) -> list:
+    """Compute and store the trophy quiz candidates for a captured draft in the
+    caller's session (the caller commits). Returns the candidates stored."""
+    drafters = candidate_drafters(draft_data, draft_session.sign_ups or {})
+    await TrophyQuizCandidate.record(session, draft_session.session_id, drafters)
+    return drafters
+
+
+async def qualifying_by_draft(guild_id: str, since: datetime, exclude_draft_ids=()) -> Dict[str, List[dict]]:
+    """{session_id: [{drafter_id, dm_id, wins}]} of fully-reported candidates in
+    the guild's non-swiss drafts since `since` that have no trophy quiz yet
+    (and are not in exclude_draft_ids). One query; no log downloads."""
+    in_match = or_(MatchResult.player1_id == TrophyQuizCandidate.drafter_id,
+                   MatchResult.player2_id == TrophyQuizCandidate.drafter_id)
+    used = (
+        select(TrophyQuizSession.quiz_id)
+        .where(
+            TrophyQuizSession.guild_id == str(guild_id),
+            TrophyQuizSession.draft_session_id == TrophyQuizCandidate.session_id,
+        )
+        .exists()
+    )
+    conditions = [
+        DraftSession.guild_id == str(guild_id),
+        DraftSession.spaces_object_key.isnot(None),
+        DraftSession.session_type != "swiss",
+        DraftSession.draft_start_time >= since,
+        ~used,
+    ]
+    if exclude_draft_ids:
+        conditions.append(TrophyQuizCandidate.session_id.notin_(list(exclude_draft_ids)))
+    stmt = (
+        select(
+            TrophyQuizCandidate.session_id,
+            TrophyQuizCandidate.drafter_id,
+            TrophyQuizCandidate.dm_user_id,
+            func.count(MatchResult.id),
+            func.count(MatchResult.winner_id),
+            func.sum(case((MatchResult.winner_id == TrophyQuizCandidate.drafter_id, 1), else_=0)),
+        )
+        .join(DraftSession, DraftSession.session_id == TrophyQuizCandidate.session_id)
+        .join(MatchResult, and_(MatchResult.session_id == TrophyQuizCandidate.session_id, in_match))
+        .where(and_(*conditions))
+        .group_by(TrophyQuizCandidate.session_id, TrophyQuizCandidate.drafter_id)
+    )
+    async with db_session() as session:
+        rows = (await session.execute(stmt)).all()
+
+    by_draft: Dict[str, List[dict]] = defaultdict(list)
+    for session_id, drafter_id, dm_id, matches, reported, wins in rows:
+        if is_fully_reported({"matches": matches, "reported": reported}):
+            by_draft[session_id].append({"drafter_id": drafter_id, "dm_id": dm_id, "wins": wins})
+    return dict(by_draft)
@@ -87,6 +87,45 @@ def _pick_from_bucket(bucket, rng):
     return rng.choice(group)
 
 
+def candidate_drafters(draft_data, sign_ups) -> list:
+    """[{drafter_id, dm_id}] for drafters the quiz could show: a clean
+    Discord -> Draftmancer mapping and a non-empty pool. Depends only on the
+    log, so it is computed once at capture (TrophyQuizCandidate)."""
+    mapping = map_discord_to_draftmancer(draft_data, sign_ups)
+    return [
+        {"drafter_id": discord_id, "dm_id": dm_id}
+        for discord_id, dm_id in mapping.items()
+        if render_pool(draft_data, dm_id)
+    ]
+
+
+def is_fully_reported(rec) -> bool:
+    """Exactly 3 matches, all decided -- the only records the quiz shows."""
+    return rec["matches"] == 3 and rec["reported"] == 3
+
+
+def is_eligible_pod(qualifying) -> bool:
+    """A pod the quiz can use: >=1 better (wins>=2), >=1 worse (wins<=1) and
+    >=1 extreme (3-0/0-3) among its qualifying drafters."""
+    return (any(q["wins"] >= 2 for q in qualifying)
+            and any(q["wins"] <= 1 for q in qualifying)
+            and any(is_extreme(q["wins"]) for q in qualifying))
+
+
+def pick_deck_pair(qualifying, rng):
+    """One better-bucket (wins>=2) and one worse-bucket (wins<=1) entry from
+    `qualifying` (dicts with a "wins" key), or None if not is_eligible_pod.
+    Biased toward extremes (EXTREME_TARGET_RATE), not forced."""
+    if not is_eligible_pod(qualifying):
+        return None
+    better = [q for q in qualifying if q["wins"] >= 2]
+    worse = [q for q in qualifying if q["wins"] <= 1]
+
+    pair = [_pick_from_bucket(better, rng), _pick_from_bucket(worse, rng)]
+    rng.shuffle(pair)
+    return pair
+
+
 def select_two_decks(draft_data, sign_ups, match_results, rng):
     """Pick one better-bucket (wins>=2) and one worse-bucket (wins<=1) deck from
     a pod that has >=1 extreme (3-0/0-3), or None if ineligible.
@@ -103,19 +142,11 @@ def select_two_decks(draft_data, sign_ups, match_results, rng):
     qualifying = []
     for discord_id, dm_id in mapping.items():
         rec = records.get(discord_id)
-        if not rec or rec["matches"] != 3 or rec["reported"] != 3:
+        if not rec or not is_fully_reported(rec):
             continue
         pool = render_pool(draft_data, dm_id)
         if not pool:
             continue
         qualifying.append({"drafter_id": discord_id, "wins": rec["wins"], "pool": pool})
 
-    better = [q for q in qualifying if q["wins"] >= 2]
-    worse = [q for q in qualifying if q["wins"] <= 1]
-    has_extreme = any(is_extreme(q["wins"]) for q in qualifying)
-    if not better or not worse or not has_extreme:
-        return None
-
-    pair = [_pick_from_bucket(better, rng), _pick_from_bucket(worse, rng)]
-    rng.shuffle(pair)
-    return pair
+    return pick_deck_pair(qualifying, rng)
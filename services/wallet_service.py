@@ -5,9 +5,11 @@ Strict double-entry over an append-only log. A wallet is a *view* over its rows:
 
     balance = SUM(amount)
 
-That's the whole rule. There is no stored balance, no row status, and nothing is ever
-mutated after it's written — every correction is a new compensating row, so the balance
-at any past moment is reconstructible from the log alone.
+That's the whole rule. There is no row status, and nothing is ever mutated after it's
+written — every correction is a new compensating row, so the balance at any past moment
+is reconstructible from the log alone. ``wallet_balance`` (models/ledger_balance.py)
+materializes that sum per holder, maintained in the same transaction as each insert, so
+reads don't re-sum a holder's history; services/ledger_balances checks it against the log.
 
 Two kinds of movement:
 
@@ -38,6 +40,7 @@ from sqlalchemy.exc import IntegrityError
 
 from database.db_session import db_session
 from database.retry import with_db_retry
+from models.ledger_balance import WalletBalance
 from models.wallet_tx import WalletTx
 
 # Synthetic holders. Not people: they own claims the same way a player does, which is
@@ -105,9 +108,12 @@ class InsufficientFunds(ValueError):
 
 async def balance_in(session, guild_id: str, player_id: str) -> int:
     """A holder's balance inside an existing session/transaction — the single definition,
-    reused by every caller that needs to check funds within its own transaction."""
-    return await _sum_amount(
-        session, WalletTx.guild_id == guild_id, WalletTx.player_id == player_id)
+    reused by every caller that needs to check funds within its own transaction. Reads the
+    materialized row; rows this transaction added are flushed (and so counted) first."""
+    result = await session.execute(
+        select(WalletBalance.balance).where(
+            WalletBalance.guild_id == guild_id, WalletBalance.player_id == player_id))
+    return int(result.scalar() or 0)
 
 
 async def balances_for(guild_id: str, player_ids) -> dict[str, int]:
@@ -118,9 +124,8 @@ async def balances_for(guild_id: str, player_ids) -> dict[str, int]:
         return {}
     async with db_session() as session:
         rows = (await session.execute(
-            select(WalletTx.player_id, func.coalesce(func.sum(WalletTx.amount), 0))
-            .where(WalletTx.guild_id == guild_id, WalletTx.player_id.in_(ids))
-            .group_by(WalletTx.player_id)
+            select(WalletBalance.player_id, WalletBalance.balance)
+            .where(WalletBalance.guild_id == guild_id, WalletBalance.player_id.in_(ids))
         )).all()
     found = {pid: int(total) for pid, total in rows}
     return {pid: found.get(pid, 0) for pid in ids}
@@ -11,6 +11,7 @@ from models import QuizStats, TrophyQuizSession, TrophyQuizSubmission
 from models.player import PlayerStats
 from helpers.skill import is_established, skill_rating
 from services.ledger_stats import LedgerSnapshot
+from stats_core import get_timeframe_start_date
 
 
 async def _player_skill_standing(player_id, guild_id):
@@ -152,14 +153,18 @@ async def get_stats_embed_for_player(
                 self.avatar = None
         user = MockUser(player_id, display_name)
 
-    # Get stats for all 3 timeframes -- one guild-history fetch, three folds
+    # Get stats for all 3 timeframes -- one guild-history fetch, one fold
+    # pass over the player's sessions for all three windows
     snapshot = await LedgerSnapshot.fetch(guild_id)
+    weekly, monthly, lifetime = snapshot.fold_windows(
+        player_id=player_id,
+        windows=[get_timeframe_start_date('week'), get_timeframe_start_date('month'), None])
     stats_weekly = await get_player_statistics(player_id, 'week', display_name, guild_id,
-                                               snapshot=snapshot)
+                                               records=weekly)
     stats_monthly = await get_player_statistics(player_id, 'month', display_name, guild_id,
-                                                snapshot=snapshot)
+                                                records=monthly)
     stats_lifetime = await get_player_statistics(player_id, None, display_name, guild_id,
-                                                 snapshot=snapshot)
+                                                 records=lifetime)
 
     # Skill rating from stored TrueSkill μ/σ, gated on lifetime rated games.
     rating, provisional, server_rank, rank_pool = await _player_skill_standing(player_id, guild_id)
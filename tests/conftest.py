@@ -34,19 +34,55 @@ import random
 import tempfile
 from datetime import datetime
 
+import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from database.models_base import Base
 from database.db_session import AsyncSessionLocal
+from database.message_management import reset_sticky_registry
 from models.debt_ledger import DebtLedger
 from models.draft_session import DraftSession
 from models.match import MatchResult
 from models.tournament import TournamentMatch
+from services.draft_analysis import clear_analysis_memo
+from services.ledger_stats import reset_snapshot_cache
 from services.tournament_service import create_tournament, register_team, start_tournament
 
 
+@pytest.fixture(autouse=True)
+def _fresh_ledger_snapshots():
+    """LedgerSnapshot.fetch caches per guild for the life of the process;
+    every test gets its own database, so it must also start uncached."""
+    reset_snapshot_cache()
+    yield
+    reset_snapshot_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sticky_registry():
+    """The sticky activity registry is process-global; start each test empty."""
+    reset_sticky_registry()
+    yield
+    reset_sticky_registry()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_card_image_cache(tmp_path, monkeypatch):
+    """The card-image cache persists on disk; point each test at its own."""
+    monkeypatch.setenv("CARD_IMAGE_CACHE_DIR", str(tmp_path / "card_images"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_analysis_memo():
+    """DraftAnalysis.from_session memoizes per object key for the process;
+    tests reuse keys with different logs, so each starts with an empty memo."""
+    clear_analysis_memo()
+    yield
+    clear_analysis_memo()
+
+
 @pytest_asyncio.fixture
 async def test_db():
     tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
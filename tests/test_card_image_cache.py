@@ -0,0 +1,96 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from PIL import Image
+
+from helpers.card_image_cache import (
+    PACK_CARD_SIZE, PILE_CARD_SIZE, CardImageCache, close_card_image_session,
+    get_card_image, warm_card_images,
+)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _close_shared_session():
+    yield
+    await close_card_image_session()
+
+
+def _scan():
+    return Image.new("RGBA", (488, 680), (200, 10, 10, 255))
+
+
+def _cd(url="http://cdn/bolt.jpg"):
+    return {"cid1": {"name": "Lightning Bolt", "image_uris": {"normal": url}},
+            "cid2": {"name": "Counterspell", "image_uris": {"normal": "http://cdn/cs.jpg"}}}
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_resized_from_disk():
+    with patch("helpers.card_image_cache.fetch_card_image",
+               new=AsyncMock(return_value=_scan())) as fetch:
+        first = await get_card_image("cid1", _cd(), PACK_CARD_SIZE)
+        second = await get_card_image("cid1", _cd(), PACK_CARD_SIZE)
+    assert fetch.await_count == 1
+    assert first.size == second.size == PACK_CARD_SIZE
+    assert second.format == "WEBP" and second.mode == "RGB"
+
+
+@pytest.mark.asyncio
+async def test_entries_are_per_size_and_per_printing():
+    with patch("helpers.card_image_cache.fetch_card_image",
+               new=AsyncMock(return_value=_scan())) as fetch:
+        await get_card_image("cid1", _cd(), PACK_CARD_SIZE)
+        pile = await get_card_image("cid1", _cd(), PILE_CARD_SIZE)
+        await get_card_image("cid1", _cd("http://cdn/bolt-promo.jpg"), PACK_CARD_SIZE)
+    assert pile.size == PILE_CARD_SIZE
+    assert fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unfetchable_card_is_none_and_not_cached():
+    with patch("helpers.card_image_cache.fetch_card_image",
+               new=AsyncMock(side_effect=[None, _scan()])) as fetch:
+        assert await get_card_image("cid1", _cd(), PACK_CARD_SIZE) is None
+        assert await get_card_image("cid1", _cd(), PACK_CARD_SIZE) is not None
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_still_resizes(monkeypatch):
+    monkeypatch.setenv("CARD_IMAGE_CACHE_MB", "0")
+    with patch("helpers.card_image_cache.fetch_card_image",
+               new=AsyncMock(return_value=_scan())) as fetch:
+        for _ in range(2):
+            assert (await get_card_image("cid1", _cd(), PILE_CARD_SIZE)).size == PILE_CARD_SIZE
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_fetches_each_card_once_for_every_size():
+    with patch("helpers.card_image_cache.fetch_card_image",
+               new=AsyncMock(side_effect=lambda s, cid, cd, **kw: _scan() if cid == "cid1" else None)) as fetch:
+        assert await warm_card_images(["cid1", "cid2", "cid1"], _cd()) == (1, 1)
+        assert fetch.await_count == 2
+        assert await warm_card_images(["cid1"], _cd()) == (1, 0)   # already warm
+        assert fetch.await_count == 2
+        await get_card_image("cid1", _cd(), PILE_CARD_SIZE)
+        assert fetch.await_count == 2
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    img = Image.effect_noise(PILE_CARD_SIZE, 64).convert("RGB")
+    probe = CardImageCache(str(tmp_path / "probe"), 10 ** 9)
+    probe.put("x", "p", PILE_CARD_SIZE, img)
+    entry = os.path.getsize(probe._path("x", "p", PILE_CARD_SIZE))
+
+    cache = CardImageCache(str(tmp_path / "c"), int(entry * 2.5))
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, "p", PILE_CARD_SIZE, img)
+        os.utime(cache._path(key, "p", PILE_CARD_SIZE), (1000 + i, 1000 + i))
+    assert cache.get("a", "p", PILE_CARD_SIZE) is None
+    assert cache.get("b", "p", PILE_CARD_SIZE) is not None   # touch: b is now the most recent
+    cache.put("d", "p", PILE_CARD_SIZE, img)
+    assert cache.get("c", "p", PILE_CARD_SIZE) is None
+    assert cache.get("b", "p", PILE_CARD_SIZE) is not None
@@ -0,0 +1,61 @@
+"""chanindex01 migration: backfill draft_session_channels from channel_ids /
+draft_chat_channel. The logic is frozen in the migration file, so these tests
+load that module directly."""
+import importlib.util
+import json
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+_spec = importlib.util.spec_from_file_location(
+    "chanindex01",
+    Path(__file__).parent.parent / "alembic" / "versions" /
+    "chanindex01_add_draft_session_channels.py")
+chanindex01 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(chanindex01)
+
+
+def _conn():
+    conn = create_engine("sqlite://").connect()
+    conn.execute(text(
+        "CREATE TABLE draft_sessions (id INTEGER PRIMARY KEY, session_id TEXT, "
+        "channel_ids TEXT, draft_chat_channel TEXT, draft_start_time TEXT)"))
+    conn.execute(text(
+        "CREATE TABLE draft_session_channels (channel_id TEXT PRIMARY KEY, session_id TEXT, role TEXT)"))
+    return conn
+
+
+def _session(conn, sid, ids, chat, start):
+    conn.execute(text(
+        "INSERT INTO draft_sessions (session_id, channel_ids, draft_chat_channel, draft_start_time) "
+        "VALUES (:s, :i, :c, :t)"), {"s": sid, "i": json.dumps(ids) if ids is not None else None,
+                                     "c": chat, "t": start})
+
+
+def _rows(conn):
+    return {r[0]: (r[1], r[2]) for r in conn.execute(text("SELECT * FROM draft_session_channels"))}
+
+
+def test_backfill_roles_and_newest_owner_wins():
+    conn = _conn()
+    _session(conn, "s1", [111, 222, 333], "111", "2026-01-01")
+    _session(conn, "t_new", None, "900", "2026-03-01")   # test draft: chat = queue channel
+    _session(conn, "t_old", None, "900", "2026-02-01")
+    _session(conn, "queue", None, None, "2026-04-01")     # never got channels
+
+    chanindex01.backfill_channels(conn)
+
+    assert _rows(conn) == {
+        "111": ("s1", "draft_chat"),
+        "222": ("s1", "created"),
+        "333": ("s1", "created"),
+        "900": ("t_new", "draft_chat"),
+    }
+
+
+def test_backfill_is_rerunnable():
+    conn = _conn()
+    _session(conn, "s1", ["111", "222"], "111", "2026-01-01")
+    chanindex01.backfill_channels(conn)
+    chanindex01.backfill_channels(conn)
+    assert len(_rows(conn)) == 2
@@ -0,0 +1,106 @@
+"""services/crown_roles: the crown-role sync plans from role membership and
+crown_counts only, edits the minimal set, and applies it concurrently."""
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from services.crown_roles import plan_crown_role_sync, sync_crown_roles
+
+
+def _role(role_id, name, default=False):
+    role = MagicMock(name=name)
+    role.id = role_id
+    role.name = name
+    role.is_default.return_value = default
+    role.members = []
+    return role
+
+
+def _member(member_id, *roles, bot=False):
+    member = MagicMock()
+    member.id = member_id
+    member.bot = bot
+    member.roles = [EVERYONE, *roles]
+    member.display_name = f"m{member_id}"
+    member.add_roles = AsyncMock()
+    member.remove_roles = AsyncMock()
+    member.edit = AsyncMock()
+    for role in roles:
+        role.members.append(member)
+    return member
+
+
+EVERYONE = _role(0, "@everyone", default=True)
+
+
+def _guild(*members):
+    guild = MagicMock()
+    guild.id = 1
+    guild.members = MagicMock(side_effect=AssertionError("guild.members scanned"))
+    by_id = {m.id: m for m in members}
+    guild.get_member.side_effect = by_id.get
+    return guild
+
+
+def _setup():
+    one, two = _role(1, "Crown"), _role(2, "Double Crown")
+    other = _role(9, "Regular")
+    keeper = _member(10, one)                 # keeps one crown
+    promoted = _member(11, one, other)        # one -> two crowns
+    dethroned = _member(12, two)              # loses every crown
+    newcomer = _member(13, other)             # gains a crown
+    bystander = _member(14, other)            # never involved
+    robot = _member(15, one, bot=True)
+    guild = _guild(keeper, promoted, dethroned, newcomer, bystander, robot)
+    counts = {"10": 1, "11": 2, "13": 1}
+    return guild, {1: one, 2: two}, counts, (keeper, promoted, dethroned, newcomer, bystander, robot)
+
+
+def test_plan_is_minimal_and_skips_untouched_members():
+    guild, roles, counts, (keeper, promoted, dethroned, newcomer, bystander, robot) = _setup()
+    plan = {c.member.id: c for c in plan_crown_role_sync(guild, counts, roles)}
+
+    assert set(plan) == {11, 12, 13}
+    assert plan[11].add == (roles[2],) and plan[11].remove == (roles[1],)
+    assert plan[12].add == () and plan[12].remove == (roles[2],)
+    assert plan[13].add == (roles[1],) and plan[13].remove == ()
+    assert plan[11].final_roles() == [promoted.roles[2], roles[2]]
+
+
+@pytest.mark.asyncio
+async def test_dry_run_returns_plan_without_editing():
+    guild, roles, counts, members = _setup()
+    plan = await sync_crown_roles(guild, counts, roles, dry_run=True)
+
+    assert len(plan) == 3
+    for member in members:
+        member.add_roles.assert_not_called()
+        member.remove_roles.assert_not_called()
+        member.edit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_apply_uses_one_request_per_member():
+    guild, roles, counts, (keeper, promoted, dethroned, newcomer, bystander, robot) = _setup()
+    await sync_crown_roles(guild, counts, roles)
+
+    promoted.edit.assert_awaited_once_with(roles=[promoted.roles[2], roles[2]])
+    promoted.add_roles.assert_not_called()
+    promoted.remove_roles.assert_not_called()
+    dethroned.remove_roles.assert_awaited_once_with(roles[2])
+    newcomer.add_roles.assert_awaited_once_with(roles[1])
+    for untouched in (keeper, bystander, robot):
+        untouched.edit.assert_not_called()
+        untouched.add_roles.assert_not_called()
+        untouched.remove_roles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_edit_does_not_stop_the_rest():
+    guild, roles, counts, (keeper, promoted, dethroned, newcomer, bystander, robot) = _setup()
+    promoted.edit.side_effect = discord.Forbidden(MagicMock(status=403), "nope")
+    await sync_crown_roles(guild, counts, roles)
+
+    dethroned.remove_roles.assert_awaited_once()
+    newcomer.add_roles.assert_awaited_once()
@@ -0,0 +1,113 @@
+"""DigitalOceanHelper against a local S3 stand-in (moto's server): one pooled
+client per process, and download_json served from the ETag-validated disk
+cache."""
+import os
+import socket
+
+import pytest
+import pytest_asyncio
+
+from helpers.digital_ocean_helper import DigitalOceanHelper, _DiskCache, close_spaces_clients
+
+moto_server = pytest.importorskip("moto.server")
+
+BUCKET = "draft-logs"
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest_asyncio.fixture
+async def helper(s3_endpoint, tmp_path, monkeypatch):
+    for name, value in {
+        "DO_SPACES_REGION": "us-east-1",
+        "DO_SPACES_ENDPOINT": s3_endpoint,
+        "DO_SPACES_RAW_ENDPOINT": s3_endpoint,
+        "DO_SPACES_KEY": "test",
+        "DO_SPACES_SECRET": "test",
+        "DO_SPACES_BUCKET": BUCKET,
+        "DO_SPACES_CACHE_DIR": str(tmp_path / "cache"),
+    }.items():
+        monkeypatch.setenv(name, value)
+    do = DigitalOceanHelper()
+    async with await do.create_client() as s3:
+        try:
+            await s3.create_bucket(Bucket=BUCKET)
+        except s3.exceptions.BucketAlreadyOwnedByYou:
+            pass
+    yield do
+    await close_spaces_clients()
+
+
+def _rewrite_cached_body(do, key, body: bytes):
+    etag, _ = do.cache.get(key)
+    with open(do.cache._path(key), "wb") as f:
+        f.write(etag.encode() + b"\n" + body)
+
+
+@pytest.mark.asyncio
+async def test_clients_are_pooled_across_helpers(helper):
+    async with await helper.create_client() as first:
+        pass
+    async with await DigitalOceanHelper().create_client() as second:
+        assert second is first
+        await second.head_bucket(Bucket=BUCKET)   # still open after the first exit
+
+
+@pytest.mark.asyncio
+async def test_download_is_served_from_cache_while_etag_matches(helper):
+    result = await helper.upload_json({"sessionID": "DB1"}, "team", "a.json")
+    assert result.success
+
+    # The upload seeded the cache; prove the next read uses it (a 304, no body)
+    # by planting a body the server doesn't have under the same ETag.
+    _rewrite_cached_body(helper, "team/a.json", b'{"from": "cache"}')
+    assert await helper.download_json("team/a.json") == {"from": "cache"}
+
+
+@pytest.mark.asyncio
+async def test_overwritten_object_is_refetched(helper):
+    await helper.upload_json({"v": 1}, "team", "b.json")
+    async with await helper.create_client() as s3:   # behind the helper's back
+        await s3.put_object(Bucket=BUCKET, Key="team/b.json", Body=b'{"v": 2}')
+    assert await helper.download_json("team/b.json") == {"v": 2}
+    assert helper.cache.get("team/b.json")[1] == b'{"v": 2}'
+
+
+@pytest.mark.asyncio
+async def test_cold_download_fills_cache_and_missing_key_is_none(helper):
+    async with await helper.create_client() as s3:
+        await s3.put_object(Bucket=BUCKET, Key="team/c.json", Body=b'{"v": 3}')
+    assert helper.cache.get("team/c.json") is None
+    assert await helper.download_json("team/c.json") == {"v": 3}
+    assert helper.cache.get("team/c.json") is not None
+    assert await helper.download_json("team/missing.json") is None
+
+
+@pytest.mark.asyncio
+async def test_list_objects_through_pooled_raw_client(helper):
+    for name in ("x.json", "y.json"):
+        await helper.upload_json({}, "listing", name)
+    assert sorted(await helper.list_objects("listing/")) == ["listing/x.json", "listing/y.json"]
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = _DiskCache(str(tmp_path), max_bytes=250)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, f'"e{key}"', b"x" * 90)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    # a, b, c are ~95 bytes each: the third put pushed "a" (oldest) out.
+    assert cache.get("a") is None
+    cache.get("b")                      # touch: b is now the most recent
+    cache.put("d", '"ed"', b"x" * 90)
+    assert cache.get("c") is None
+    assert cache.get("b") == ('"eb"', b"x" * 90)
+    assert cache.get("d") is not None
@@ -478,6 +478,44 @@ class TestRotationLogic:
         pytest.skip("Optional feature: rotation direction (rarely needed)")
 
 
+class TestFactoryMemo:
+    """from_session/from_spaces share one download + index build per object key"""
+
+    @staticmethod
+    def _session(key="team/x.json", session_id="s1"):
+        from types import SimpleNamespace
+        return SimpleNamespace(spaces_object_key=key, session_id=session_id,
+                               id=1, session_type=None, cube=None, team_a=None, team_b=None,
+                               sign_ups=None)
+
+    @pytest.mark.asyncio
+    async def test_should_load_once_and_expose_raw_draft_data(self):
+        from unittest.mock import AsyncMock, patch
+        data = create_mock_draft_data()
+        with patch("services.draft_analysis.load_from_spaces", AsyncMock(return_value=data)) as load:
+            first = await DraftAnalysis.from_session(self._session())
+            second = await DraftAnalysis.from_session(self._session())
+        assert second is first
+        assert first.draft_data is data
+        load.assert_awaited_once_with("team/x.json")
+
+    @pytest.mark.asyncio
+    async def test_should_evict_least_recently_used_and_not_memo_failures(self):
+        from unittest.mock import AsyncMock, patch
+        from services import draft_analysis
+        data = create_mock_draft_data()
+        with patch("services.draft_analysis.load_from_spaces", AsyncMock(return_value=None)):
+            assert await DraftAnalysis.from_spaces("team/missing.json") is None
+        with patch("services.draft_analysis.load_from_spaces", AsyncMock(return_value=data)) as load:
+            assert await DraftAnalysis.from_spaces("team/missing.json") is not None
+            for i in range(draft_analysis._MEMO_SIZE):
+                await DraftAnalysis.from_spaces(f"team/{i}.json")
+            load.reset_mock()
+            await DraftAnalysis.from_spaces("team/missing.json")   # evicted: oldest
+            await DraftAnalysis.from_spaces(f"team/{draft_analysis._MEMO_SIZE - 1}.json")   # kept
+        load.assert_awaited_once_with("team/missing.json")
+
+
 class TestEdgeCases:
     """Edge cases and error handling - DEFERRED TO PHASE 2"""
 
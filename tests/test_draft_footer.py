@@ -142,6 +142,7 @@ async def test_update_draft_message_restamps_footer_after_cube_change():
     message.edit = AsyncMock()
     channel = MagicMock()
     channel.fetch_message = AsyncMock(return_value=message)
+    channel.get_partial_message = MagicMock(return_value=message)
     channel.guild = MagicMock()
     bot = MagicMock()
     bot.get_channel.return_value = channel
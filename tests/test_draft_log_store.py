@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from models.draft_session_log import DraftSessionLog
 from services.draft_log_store import (
     map_discord_to_draftmancer,
     post_team_logs,
@@ -11,6 +12,17 @@ from services.draft_log_store import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _log_store_on_stand_in():
+    """Read the captured log off the stand-in's `draft_data` attribute instead
+    of the draft_session_logs table (see _db_ctx)."""
+    async def fetch(session, session_id):
+        return session.draft_session.draft_data
+
+    with patch.object(DraftSessionLog, "fetch", fetch):
+        yield
+
+
 def _log():
     return {
         "carddata": {
@@ -110,6 +122,7 @@ def _db_ctx(ds):
     re-reads it to stamp). Returns `session` too so tests can assert on commit."""
     result = MagicMock(); result.scalar_one_or_none.return_value = ds
     session = MagicMock()
+    session.draft_session = ds
     session.execute = AsyncMock(return_value=result); session.commit = AsyncMock()
     ctx = MagicMock(); ctx.__aenter__ = AsyncMock(return_value=session); ctx.__aexit__ = AsyncMock(return_value=None)
     return session, ctx
@@ -0,0 +1,79 @@
+"""DraftSessionLog: the raw Draftmancer log lives in its own compressed table
+and is only decoded on demand, never by a plain select(DraftSession)."""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from conftest import seed_session
+from database.db_session import AsyncSessionLocal
+from models.draft_session import DraftSession
+from models.draft_session_log import DraftSessionLog
+
+_spec = importlib.util.spec_from_file_location(
+    "draftlogblob01",
+    Path(__file__).parent.parent / "alembic" / "versions" /
+    "draftlogblob01_move_draft_data_to_draft_session_logs.py")
+draftlogblob01 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(draftlogblob01)
+
+
+def _log():
+    return {"sessionID": "DB1", "users": {"u1": {"userName": "Alice", "picks": [{"booster": ["c1"]}]}},
+            "carddata": {"c1": {"name": "Lightning Bolt"}}}
+
+
+@pytest.mark.asyncio
+async def test_store_fetch_round_trip_and_replace(test_db):
+    await seed_session("s1")
+    async with AsyncSessionLocal() as s:
+        await DraftSessionLog.store(s, "s1", _log())
+        await s.commit()
+    async with AsyncSessionLocal() as s:
+        assert await DraftSessionLog.fetch(s, "s1") == _log()
+        replaced = {**_log(), "sessionID": "DB2"}
+        await DraftSessionLog.store(s, "s1", replaced)
+        await s.commit()
+    async with AsyncSessionLocal() as s:
+        assert (await DraftSessionLog.fetch(s, "s1"))["sessionID"] == "DB2"
+        assert len((await s.execute(select(DraftSessionLog))).scalars().all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_load_draft_data_is_the_deferred_accessor(test_db):
+    await seed_session("s1")
+    await seed_session("s2")
+    async with AsyncSessionLocal() as s:
+        await DraftSessionLog.store(s, "s1", _log())
+        await s.commit()
+
+    ds = await DraftSession.get_by_session_id("s1")
+    assert not hasattr(ds, "draft_data")
+    assert await ds.load_draft_data() == _log()
+    assert await (await DraftSession.get_by_session_id("s2")).load_draft_data() is None
+
+
+@pytest.mark.asyncio
+async def test_payload_is_compressed(test_db):
+    await seed_session("s1")
+    big = {"users": {f"u{i}": {"picks": [{"booster": ["c1"] * 15}] * 45} for i in range(8)}}
+    async with AsyncSessionLocal() as s:
+        await DraftSessionLog.store(s, "s1", big)
+        await s.commit()
+        row = await s.get(DraftSessionLog, "s1")
+    assert len(row.payload) < len(json.dumps(big)) // 5
+
+
+def test_migration_copies_existing_logs_once():
+    conn = create_engine("sqlite://").connect()
+    conn.execute(text("CREATE TABLE draft_sessions (session_id TEXT, draft_data TEXT)"))
+    conn.execute(text("CREATE TABLE draft_session_logs (session_id TEXT PRIMARY KEY, payload BLOB, stored_at TEXT)"))
+    conn.execute(text("INSERT INTO draft_sessions VALUES ('s1', :d), ('s2', NULL), ('s3', 'null')"),
+                 {"d": json.dumps(_log())})
+
+    assert draftlogblob01.copy_logs_out(conn) == 1
+    assert draftlogblob01.copy_logs_out(conn) == 0   # idempotent
+    payload = conn.execute(text("SELECT payload FROM draft_session_logs WHERE session_id = 's1'")).scalar_one()
+    assert DraftSessionLog.decode(payload) == _log()
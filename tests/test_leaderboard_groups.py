@@ -60,6 +60,7 @@ def _channel(sent_id=999):
     message.delete = AsyncMock()
     channel.send = AsyncMock(return_value=message)
     channel.fetch_message = AsyncMock(return_value=message)
+    channel.get_partial_message = MagicMock(return_value=message)
     return channel, message
 
 
@@ -101,7 +102,7 @@ class TestGroupHeaders:
         import cogs.leaderboard as mod
         monkeypatch.setattr(mod, "db_session", _fake_session)
         channel, message = _channel(sent_id=777)
-        channel.fetch_message = AsyncMock(side_effect=discord.NotFound(MagicMock(), "gone"))
+        message.edit = AsyncMock(side_effect=discord.NotFound(MagicMock(), "gone"))
         group = LEADERBOARD_GROUPS[0]
         record = _record(group_header_message_ids={group["key"]: "42"})
 
@@ -0,0 +1,71 @@
+"""services/leaderboard_refresh: per-guild debounce of leaderboard refreshes
+and the unchanged-embed digest."""
+import asyncio
+from datetime import datetime, timedelta
+
+import discord
+import pytest
+
+from services.leaderboard_refresh import LeaderboardRefreshCoordinator, embed_digest
+
+
+class _Recorder:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, bot, guild_id, session_id=None, streak_extensions=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.calls.append((guild_id, session_id, streak_extensions))
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_triggers_within_window_coalesce_and_merge_extensions():
+    refresh = _Recorder()
+    coordinator = LeaderboardRefreshCoordinator(refresh, window=0.05)
+
+    coordinator.request(None, "g", "s1", {"p1": {"win_streak_increased": True}})
+    g = coordinator.request(None, "g", "s2", {"p1": {"win_streak_increased": False,
+                                                 "perfect_streak_increased": True},
+                                          "p2": {"draft_win_streak_increased": True}})
+    other = coordinator.request(None, "other", "s3")
+    await asyncio.gather(g, other)
+
+    by_guild = {c[0]: c for c in refresh.calls}
+    assert len(refresh.calls) == 2
+    assert by_guild["g"][1] == "s1, s2"
+    assert by_guild["g"][2] == {"p1": {"win_streak_increased": True, "perfect_streak_increased": True},
+                                "p2": {"draft_win_streak_increased": True}}
+    assert by_guild["other"][1:] == ("s3", None)
+
+
+@pytest.mark.asyncio
+async def test_trigger_during_refresh_gets_exactly_one_follow_up():
+    refresh = _Recorder(delay=0.1)
+    coordinator = LeaderboardRefreshCoordinator(refresh, window=0.01)
+
+    worker = coordinator.request(None, "g", "s1")
+    await asyncio.sleep(0.05)                  # first refresh is running
+    assert coordinator.request(None, "g", "s2") is worker
+    coordinator.request(None, "g", "s3")
+    await worker
+
+    assert [c[1] for c in refresh.calls] == ["s1", "s2, s3"]
+    assert refresh.max_running == 1
+    assert "g" not in coordinator._workers
+
+
+def test_embed_digest_ignores_timestamp_only():
+    def board(rows, at):
+        return discord.Embed(title="Draft Record", description=rows, timestamp=at)
+
+    now = datetime.now()
+    same = embed_digest(board("1. a", now), "30d", False)
+    assert embed_digest(board("1. a", now + timedelta(minutes=5)), "30d", False) == same
+    assert embed_digest(board("1. b", now), "30d", False) != same
+    assert embed_digest(board("1. a", now), "lifetime", False) != same
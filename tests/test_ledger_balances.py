@@ -0,0 +1,140 @@
+"""Materialized wallet_balance / debt_pair_balance: kept in step with every ledger
+insert, rewound correctly for the aged-cutoff path, and audited by
+services/ledger_balances.check_consistency."""
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select, text, update, func
+
+from database.db_session import db_session
+from models.debt_ledger import DebtLedger
+from models.ledger_balance import DebtPairBalance, WalletBalance
+from services import debt_service
+from services import wallet_service as ws
+from services.ledger_balances import check_consistency
+
+_spec = importlib.util.spec_from_file_location(
+    "balancetbl01",
+    Path(__file__).parent.parent / "alembic" / "versions" /
+    "balancetbl01_add_materialized_ledger_balances.py")
+balancetbl01 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(balancetbl01)
+
+GUILD = "g1"
+A, B, C = "111", "222", "333"
+
+
+async def _ledger_pair_sum(player, counterparty, created_before=None):
+    """The pre-materialization definition, straight off the ledger."""
+    conditions = [DebtLedger.guild_id == GUILD, DebtLedger.player_id == player,
+                  DebtLedger.counterparty_id == counterparty, debt_service.TIX_ONLY]
+    if created_before is not None:
+        conditions.append(DebtLedger.created_at < created_before)
+    async with db_session() as session:
+        return (await session.execute(
+            select(func.coalesce(func.sum(DebtLedger.amount), 0)).where(*conditions))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_wallet_balance_follows_every_insert(test_db):
+    await ws.credit_done(GUILD, A, 10, job_id="j1")
+    await ws.pay(GUILD, A, B, 4)
+    await ws.adjust(GUILD, B, -1, "fix", "admin")
+    assert await ws.get_balance(GUILD, A) == 6
+    assert await ws.balances_for(GUILD, [A, B, C]) == {A: 6, B: 3, C: 0}
+    assert (await check_consistency())["ok"]
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_insert_leaves_no_balance(test_db):
+    with pytest.raises(RuntimeError):
+        async with db_session() as session:
+            await ws.transfer_in(session, GUILD, A, B, 5, "src")
+            assert await ws.balance_in(session, GUILD, B) == 5   # visible in-transaction
+            raise RuntimeError("abort")
+    assert await ws.get_balance(GUILD, B) == 0
+    assert (await check_consistency())["ok"]
+
+
+@pytest.mark.asyncio
+async def test_pair_balance_is_tix_only(test_db):
+    await debt_service.create_ledger_entries(GUILD, A, B, 30, "draft", "s1")
+    await debt_service.create_card_loan(GUILD, B, A, "Black Lotus", 3)
+    await debt_service.create_settlement(GUILD, A, B, 10, settled_by=A)
+    assert await debt_service.get_balance_with(GUILD, A, B) == -20 == await _ledger_pair_sum(A, B)
+    assert await debt_service.get_balance_with(GUILD, B, A) == 20
+    assert await debt_service.get_balance_with(GUILD, A, B, exclude_session_id="s1") == 10
+    assert (await check_consistency())["ok"]
+
+
+@pytest.mark.asyncio
+async def test_as_of_balances_match_the_ledger(test_db):
+    # A owed B 50 long ago and paid 20 since; A owed C nothing until recently;
+    # C owed A 15 long ago, then A borrowed back 40 (A now owes C 25).
+    await debt_service.create_ledger_entries(GUILD, A, B, 50, "draft", "old1")
+    await debt_service.create_ledger_entries(GUILD, C, A, 15, "draft", "old2")
+    async with db_session() as session:
+        await session.execute(update(DebtLedger).values(
+            created_at=datetime.now() - timedelta(days=10)))
+    await debt_service.create_settlement(GUILD, A, B, 20, settled_by=A)
+    await debt_service.create_ledger_entries(GUILD, A, C, 40, "draft", "new1")
+    cutoff = datetime.now() - timedelta(days=7)
+
+    for created_before in (None, cutoff):
+        rows = await debt_service._negative_pair_balances(GUILD, created_before=created_before)
+        expected = {}
+        for p, c in ((A, B), (B, A), (A, C), (C, A)):
+            owed = await _ledger_pair_sum(p, c, created_before)
+            if owed < 0:
+                expected[(p, c)] = owed
+        assert {(r.player_id, r.counterparty_id): r.balance for r in rows} == expected
+        assert [r.balance for r in rows] == sorted(r.balance for r in rows)
+
+    totals, old = await debt_service.get_owed_maps(GUILD, [A, C], cutoff)
+    assert totals == {A: 55}
+    assert old == {A: 30}   # the A->C debt is all newer than the cutoff
+
+
+@pytest.mark.asyncio
+async def test_consistency_check_reports_and_repairs_drift(test_db):
+    await ws.credit_done(GUILD, A, 10, job_id="j1")
+    await debt_service.create_ledger_entries(GUILD, A, B, 30, "draft", "s1")
+    async with db_session() as session:
+        await session.execute(update(WalletBalance).values(balance=99))
+        await session.execute(DebtPairBalance.__table__.delete().where(
+            DebtPairBalance.player_id == B))
+
+    report = await check_consistency()
+    assert not report["ok"]
+    assert report["wallet_mismatches"] == [((GUILD, A), 10, 99)]
+    assert report["debt_mismatches"] == [((GUILD, B, A), 30, None)]
+
+    assert (await check_consistency(repair=True))["repaired"]
+    assert (await check_consistency())["ok"]
+    assert await ws.get_balance(GUILD, A) == 10
+    assert await debt_service.get_balance_with(GUILD, B, A) == 30
+
+
+def test_migration_backfill_sums_the_ledgers():
+    conn = create_engine("sqlite://").connect()
+    conn.execute(text("CREATE TABLE wallet_tx (guild_id TEXT, player_id TEXT, amount INTEGER)"))
+    conn.execute(text("CREATE TABLE debt_ledger (guild_id TEXT, player_id TEXT, "
+                      "counterparty_id TEXT, amount INTEGER, card_name TEXT)"))
+    conn.execute(text("CREATE TABLE wallet_balance (guild_id TEXT, player_id TEXT, balance INTEGER, "
+                      "PRIMARY KEY (guild_id, player_id))"))
+    conn.execute(text("CREATE TABLE debt_pair_balance (guild_id TEXT, player_id TEXT, "
+                      "counterparty_id TEXT, balance INTEGER, "
+                      "PRIMARY KEY (guild_id, player_id, counterparty_id))"))
+    conn.execute(text("INSERT INTO wallet_tx VALUES ('g', 'a', 5), ('g', 'a', -2), ('g', 'b', 7)"))
+    conn.execute(text("INSERT INTO debt_ledger VALUES ('g', 'a', 'b', -30, NULL), "
+                      "('g', 'b', 'a', 30, NULL), ('g', 'a', 'b', 30, NULL), "
+                      "('g', 'a', 'b', -2, 'Black Lotus')"))
+
+    for _ in range(2):   # re-runnable
+        balancetbl01.backfill_balances(conn)
+    assert sorted(conn.execute(text("SELECT * FROM wallet_balance")).fetchall()) == [
+        ('g', 'a', 3), ('g', 'b', 7)]
+    assert sorted(conn.execute(text("SELECT * FROM debt_pair_balance")).fetchall()) == [
+        ('g', 'a', 'b', 0), ('g', 'b', 'a', 30)]
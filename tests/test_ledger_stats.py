@@ -2,7 +2,7 @@
 (spec 2026-08-06-ledger-stats-unification-design).
 
 test_db and the _seed session seeder come from tests/conftest.py."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import MappingProxyType
 
 import pytest
@@ -474,3 +474,188 @@ async def test_straddling_session_is_all_or_nothing_for_draft_facts(test_db):
     lifetime = await fetch_session_records("g", player_id="1")
     assert draft_totals(lifetime) == 2        # both count with no window
     assert team_record(lifetime)["won"] == 2  # straddler's TRUE outcome: won 5-1
+
+
+# ---- incremental LedgerSnapshot.fetch -----------------------------------------
+
+async def _set_winner(session_id, match_number, winner):
+    from sqlalchemy import update
+    from database.db_session import AsyncSessionLocal
+    from models.match import MatchResult
+    async with AsyncSessionLocal() as s:
+        await s.execute(update(MatchResult)
+                        .where(MatchResult.session_id == session_id,
+                               MatchResult.match_number == match_number)
+                        .values(winner_id=winner))
+        await s.commit()
+
+
+async def _set_stage(session_id, stage):
+    from sqlalchemy import update
+    from database.db_session import AsyncSessionLocal
+    async with AsyncSessionLocal() as s:
+        await s.execute(update(DraftSession)
+                        .where(DraftSession.session_id == session_id)
+                        .values(session_stage=stage))
+        await s.commit()
+
+
+@pytest.mark.asyncio
+async def test_cached_snapshot_advances_with_new_sessions(test_db):
+    from services.ledger_stats import LedgerSnapshot, match_totals
+    await _seed(session_id="s1", matches=[("1", "2", "1", None)])
+    first = await LedgerSnapshot.fetch("g")
+    assert await LedgerSnapshot.fetch("g") is first       # nothing changed: reused
+
+    await _seed(session_id="s2", matches=[("1", "3", "3", None)])
+    second = await LedgerSnapshot.fetch("g")
+    assert second is not first
+    assert match_totals(second.fold("1")) == {"matches_played": 2, "matches_won": 1}
+    # The snapshot handed out earlier is never mutated under its holder.
+    assert match_totals(first.fold("1")) == {"matches_played": 1, "matches_won": 1}
+
+
+@pytest.mark.asyncio
+async def test_report_below_high_water_mark_needs_invalidation(test_db):
+    """A completed session's late report lands on a row created before the
+    mark: only invalidate_session (called by apply_result_report) surfaces it."""
+    from services.ledger_stats import LedgerSnapshot, invalidate_session, match_totals
+    await _seed(session_id="s1", matches=[("1", "2", "1", None), ("1", "3", None, None)])
+    await _seed(session_id="s2", matches=[("4", "5", "4", None)])
+    await LedgerSnapshot.fetch("g")
+
+    await _set_winner("s1", 2, "1")
+    invalidate_session("s1")
+    snapshot = await LedgerSnapshot.fetch("g")
+    assert match_totals(snapshot.fold("1")) == {"matches_played": 2, "matches_won": 2}
+
+
+@pytest.mark.asyncio
+async def test_open_sessions_are_refetched_until_completed(test_db):
+    from services.ledger_stats import LedgerSnapshot, draft_totals
+    await _seed(session_id="s1", stage="pairings", matches=[("1", "2", "1", None)])
+    assert draft_totals((await LedgerSnapshot.fetch("g")).fold("1")) == 0
+
+    await _set_stage("s1", "completed")                   # no invalidation needed
+    assert draft_totals((await LedgerSnapshot.fetch("g")).fold("1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_abandoned_open_session_drops_out(test_db):
+    from services.ledger_stats import LedgerSnapshot
+    await _seed(session_id="s1", stage="pairings", matches=[("1", "2", "1", None)])
+    assert (await LedgerSnapshot.fetch("g")).fold("1")
+    await _set_winner("s1", 1, None)
+    assert (await LedgerSnapshot.fetch("g")).fold("1") == []
+
+
+@pytest.mark.asyncio
+async def test_incremental_matches_fresh_fetch(test_db):
+    from services.ledger_stats import LedgerSnapshot, reset_snapshot_cache
+    await _seed(session_id="s1", teams=(["1", "2"], ["3", "4"]), matches=[
+        ("1", "3", "1", None), ("2", "4", "4", None)])
+    await LedgerSnapshot.fetch("g")
+    await _seed(session_id="s2", stage="pairings", teams=(["1", "3"], ["2", "4"]), matches=[
+        ("1", "2", "2", None), ("3", "4", "3", None)])
+    await LedgerSnapshot.fetch("g")
+    await _seed(session_id="s3", teams=(["1", "4"], ["2", "3"]), matches=[
+        ("1", "2", "1", datetime(2026, 2, 1))])
+    incremental = (await LedgerSnapshot.fetch("g")).fold()
+
+    reset_snapshot_cache()
+    assert (await LedgerSnapshot.fetch("g")).fold() == incremental
+
+
+# ---- columnar engine parity (services/ledger_columns.py) ----------------------
+
+def _record_teammate_matrix(records):
+    """The teammate pass as the record fold defines it (side_eligible, real
+    teammates) -- the reference the columnar matrix must reproduce."""
+    from services.ledger_stats import side_eligible, side_outcome
+    matrix = {}
+    for r in records:
+        if not side_eligible(r):
+            continue
+        for mate in r.teammates:
+            entry = matrix.setdefault(r.player_id, {}).setdefault(mate, {
+                "drafts_played": 0, "drafts_won": 0, "drafts_lost": 0, "drafts_tied": 0})
+            entry["drafts_played"] += 1
+            entry[f"drafts_{side_outcome(r)}"] += 1
+    return matrix
+
+
+def _assert_engines_agree(snapshot, since):
+    from services.ledger_stats import match_totals, draft_totals, team_record, cube_breakdown
+    records = snapshot.fold(since=since)
+    per_player = {}
+    for r in records:
+        per_player.setdefault(r.player_id, []).append(r)
+    window = snapshot.columns().window(since)
+
+    assert sorted(window.player_ids()) == sorted(per_player)
+    totals, drafts, teams = window.match_totals(), window.draft_totals(), window.team_record()
+    for pid, recs in per_player.items():
+        assert totals[pid] == match_totals(recs), pid
+        assert drafts[pid] == draft_totals(recs), pid
+        assert teams[pid] == team_record(recs), pid
+        assert window.cube_breakdown(pid) == cube_breakdown(recs), pid
+    assert window.teammate_matrix() == _record_teammate_matrix(records)
+
+
+async def _seed_random_history(rng, n_sessions):
+    players = [str(p) for p in range(1, 13)]
+    cubes = ["LSVCube", "lsvcube", "Vintage", None]
+    for i in range(n_sessions):
+        roster = rng.sample(players, 6)
+        team_a, team_b = roster[:3], roster[3:]
+        legacy = rng.random() < 0.15
+        if rng.random() < 0.2:                       # a sub the team JSON never listed
+            team_b = team_b[:2]
+        matches = []
+        for _ in range(rng.randint(1, 9)):
+            p1, p2 = rng.choice(roster[:3]), rng.choice(roster[3:])
+            if rng.random() < 0.1:                   # two unlisted players paired
+                p1, p2 = "90", "91"
+            winner = rng.choice([p1, p2, p1, p2, None])
+            when = None if rng.random() < 0.1 else (
+                datetime(2026, 1, 1) + timedelta(days=rng.randint(0, 150), hours=rng.randint(0, 23)))
+            matches.append((p1, p2, winner, when))
+        await _seed(session_id=f"{'legacy-' if legacy else 's'}{i}",
+                    stage=rng.choice(["completed", "pairings", None]),
+                    victory=rng.choice([None, "v"]),
+                    teams=None if legacy else (team_a, team_b),
+                    matches=matches, cube=rng.choice(cubes),
+                    start=datetime(2026, 1, 1) + timedelta(days=rng.randint(0, 150)))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_columnar_engine_matches_record_fold(test_db, seed):
+    import random
+    from services.ledger_stats import LedgerSnapshot
+    await _seed_random_history(random.Random(seed), 40)
+    snapshot = await LedgerSnapshot.fetch("g")
+    for since in (None, datetime(2026, 1, 1), datetime(2026, 3, 10), datetime(2026, 5, 20),
+                  datetime(2030, 1, 1)):
+        _assert_engines_agree(snapshot, since)
+
+
+@pytest.mark.asyncio
+async def test_columnar_engine_on_empty_history(test_db):
+    from services.ledger_stats import LedgerSnapshot
+    window = (await LedgerSnapshot.fetch("g")).columns().window(None)
+    assert window.player_ids() == []
+    assert window.match_totals() == {} and window.teammate_matrix() == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2])
+async def test_fold_windows_matches_one_fold_per_window(test_db, seed):
+    import random
+    from services.ledger_stats import LedgerSnapshot
+    await _seed_random_history(random.Random(seed), 40)
+    snapshot = await LedgerSnapshot.fetch("g")
+    windows = [datetime(2026, 5, 20), datetime(2026, 3, 10), None, datetime(2030, 1, 1)]
+    for player_id in (None, "1", "90"):
+        folded = snapshot.fold_windows(player_id=player_id, windows=windows)
+        assert folded == [snapshot.fold(player_id=player_id, since=since) for since in windows]
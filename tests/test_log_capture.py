@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from models.draft_session_log import DraftSessionLog
 from services.draft_setup_manager import DraftSetupManager
 
 
@@ -33,10 +34,26 @@ def _draft_data():
     }
 
 
+@pytest.fixture(autouse=True)
+def _log_store_on_stand_in():
+    """Route DraftSessionLog reads/writes to the stand-in's `draft_data`
+    attribute, so these tests keep asserting on one object even though the
+    real log lives in its own table."""
+    async def fetch(session, session_id):
+        return session.draft_session.draft_data
+
+    async def store(session, session_id, draft_data):
+        session.draft_session.draft_data = draft_data
+
+    with patch.object(DraftSessionLog, "fetch", fetch), patch.object(DraftSessionLog, "store", store):
+        yield
+
+
 def _mock_db_session(draft_session):
     """Patch target for `db_session()` -> async ctx mgr yielding a session whose
     execute().scalar_one_or_none() returns `draft_session`."""
     session = MagicMock()
+    session.draft_session = draft_session
     result = MagicMock()
     result.scalar_one_or_none.return_value = draft_session
     session.execute = AsyncMock(return_value=result)
@@ -72,6 +89,26 @@ async def test_capture_stores_data_and_stamps_without_publishing():
     session.commit.assert_awaited()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index_error", [None, ValueError("untraceable log")])
+async def test_capture_indexes_quiz_seats_and_survives_failure(index_error):
+    m = _manager()
+    ds = SimpleNamespace(session_id="sid", sign_ups=None, draft_data=None,
+                         pack_first_picks=None, logs_captured_at=None, unlock_at=None,
+                         data_received=False)
+    db_factory, session = _mock_db_session(ds)
+    data = _draft_data()
+    with patch("services.draft_setup_manager.db_session", db_factory), \
+         patch.object(DraftSetupManager, "save_to_digitalocean_spaces", AsyncMock(return_value="team/x.json")), \
+         patch("services.draft_setup_manager.index_quiz_seats",
+               AsyncMock(side_effect=index_error)) as index:
+        ok = await m.capture_draft_log(data)
+
+    assert ok is True
+    index.assert_awaited_once_with(session, ds, data)
+    assert ds.logs_captured_at is not None
+
+
 @pytest.mark.asyncio
 async def test_capture_is_idempotent():
     m = _manager()
@@ -199,6 +199,8 @@ async def test_reconcile_capture_spawns_and_captures_uncaptured_drafts():
     mgr = MagicMock()
     mgr.current_draft_log = {"users": {}}     # log arrived on join
     mgr.capture_draft_log = AsyncMock()
+    mgr.socket_client.connect_with_retry = AsyncMock(return_value=True)
+    mgr.keep_connection_alive = AsyncMock()
 
     with patch("services.log_reconciler.db_session", MagicMock(return_value=ctx)), \
          patch.object(DraftSetupManager, "spawn_for_existing_session", AsyncMock(return_value=mgr)), \
@@ -249,6 +251,8 @@ async def test_reconcile_capture_selects_teams_stage_draft(test_db):
     mgr = MagicMock()
     mgr.current_draft_log = {"users": {}}     # log arrived on join
     mgr.capture_draft_log = AsyncMock()
+    mgr.socket_client.connect_with_retry = AsyncMock(return_value=True)
+    mgr.keep_connection_alive = AsyncMock()
 
     with patch.object(DraftSetupManager, "spawn_for_existing_session", AsyncMock(return_value=mgr)), \
          patch("services.log_reconciler.asyncio.sleep", AsyncMock()):
@@ -0,0 +1,76 @@
+"""services/manager_supervisor: one timer heap for all managers, and the
+event-driven waits that replaced the per-manager polling loops."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services import draft_setup_manager as dsm
+from services.draft_setup_manager import DraftSetupManager, notify_victory
+from services.manager_supervisor import ManagerSupervisor
+
+
+def _manager(session_id="sid"):
+    """A DraftSetupManager without running __init__ (skips socket setup)."""
+    m = DraftSetupManager.__new__(DraftSetupManager)
+    m.session_id = session_id
+    m.draft_id = "ABC123"
+    m.logger = MagicMock()
+    m.cube_imported = True
+    m.settings_updated = True
+    m._is_connecting = False
+    m._loop_wake = asyncio.Event()
+    m._victory_event = asyncio.Event()
+    return m
+
+
+@pytest.mark.asyncio
+async def test_timers_fire_in_deadline_order_and_cancelled_ones_never_do():
+    sup = ManagerSupervisor()
+    fired = []
+
+    async def record(name):
+        fired.append(name)
+
+    sup.call_later(0.03, record, "late")
+    cancelled = sup.call_later(0.01, record, "cancelled")
+    sup.call_later(0.0, fired.append, "now")
+    sup.call_later(0.02, record, "soon")
+    cancelled.cancel()
+    await asyncio.sleep(0.06)
+
+    assert fired == ["now", "soon", "late"]
+    assert sup.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_disconnect_event_wakes_the_idle_loop_immediately():
+    m = _manager()
+    sup = ManagerSupervisor()
+    with patch.object(dsm, "get_supervisor", return_value=sup):
+        waiter = asyncio.create_task(m._wait_for_wake())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert sup.pending == 1          # one idle-refresh deadline, no sleeping task
+        await m._on_disconnect()
+        await asyncio.wait_for(waiter, 0.1)
+    assert sup.pending == 0              # its timer was cancelled on wake
+
+
+@pytest.mark.asyncio
+async def test_victory_disconnect_fires_on_the_victory_write_not_a_poll():
+    m = _manager("victory-sid")
+    m._check_victory_status = AsyncMock(return_value=False)
+    m.disconnect_safely = AsyncMock()
+    dsm.ACTIVE_MANAGERS["victory-sid"] = m
+    try:
+        task = asyncio.create_task(m._handle_victory_aware_disconnect())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        notify_victory("victory-sid")
+        await asyncio.wait_for(task, 0.1)
+    finally:
+        dsm.ACTIVE_MANAGERS.pop("victory-sid", None)
+
+    m._check_victory_status.assert_awaited_once()
+    m.disconnect_safely.assert_awaited_once()
@@ -0,0 +1,75 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from helpers.message_edits import (
+    PRIORITY_BACKGROUND, PRIORITY_INTERACTION, MessageEditScheduler,
+)
+
+
+def _channel(channel_id, calls, delay=0.0, error=None):
+    """A channel whose partial messages record (channel, message, fields)."""
+    channel = MagicMock()
+    channel.id = channel_id
+
+    def partial(message_id):
+        async def edit(**fields):
+            calls.append((channel_id, message_id, fields))
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return f"msg-{message_id}"
+        msg = MagicMock()
+        msg.edit = AsyncMock(side_effect=edit)
+        return msg
+
+    channel.get_partial_message = MagicMock(side_effect=partial)
+    channel.fetch_message = AsyncMock()
+    return channel
+
+
+@pytest.mark.asyncio
+async def test_burst_on_one_message_coalesces_to_latest_payload():
+    calls = []
+    channel = _channel(1, calls, delay=0.05)
+    sched = MessageEditScheduler()
+
+    first = asyncio.create_task(sched.edit(channel, 10, embed="e0"))
+    await asyncio.sleep(0.01)   # e0 is now in flight
+    burst = [asyncio.create_task(sched.edit(channel, 10, embed=f"e{i}", view="v")) for i in (1, 2, 3)]
+    results = await asyncio.gather(first, *burst)
+
+    assert [c[2] for c in calls] == [{"embed": "e0"}, {"embed": "e3", "view": "v"}]
+    assert results == ["msg-10"] * 4
+    channel.fetch_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_channel_budget_defers_and_interaction_edits_go_first():
+    calls = []
+    channel = _channel(1, calls)
+    sched = MessageEditScheduler(channel_budget=(1, 0.1), global_budget=(100, 1.0))
+
+    await sched.edit(channel, 1, content="spends the window")
+    background = asyncio.create_task(sched.edit(channel, 2, priority=PRIORITY_BACKGROUND, content="board"))
+    interaction = asyncio.create_task(sched.edit(channel, 3, priority=PRIORITY_INTERACTION, content="click"))
+    await asyncio.gather(background, interaction)
+
+    assert [c[1] for c in calls] == [1, 3, 2]
+
+
+@pytest.mark.asyncio
+async def test_edit_errors_reach_every_coalesced_caller():
+    calls = []
+    gone = discord.NotFound(MagicMock(status=404), "Unknown Message")
+    channel = _channel(1, calls, error=gone)
+    sched = MessageEditScheduler()
+
+    results = await asyncio.gather(
+        sched.edit(channel, 10, content="a"), sched.edit(channel, 10, content="b"),
+        return_exceptions=True,
+    )
+    assert len(calls) == 1
+    assert all(isinstance(r, discord.NotFound) for r in results)
@@ -49,6 +49,7 @@ class TestSplitContentForEmbedImport:
         channel = MagicMock()
         channel.guild = MagicMock()
         channel.fetch_message = AsyncMock(return_value=message)
+        channel.get_partial_message = MagicMock(return_value=message)
         bot = MagicMock()
         bot.get_channel = MagicMock(return_value=channel)
 
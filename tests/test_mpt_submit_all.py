@@ -0,0 +1,125 @@
+"""MagicProtoolsHelper.submit_all against a local stand-in for /api/draft/add:
+requests overlap up to the concurrency bound, transient failures are retried,
+and the bodies are rendered off the event loop."""
+import asyncio
+import threading
+from urllib.parse import parse_qs
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from helpers import magicprotools_helper
+from helpers.magicprotools_helper import MagicProtoolsHelper
+
+
+def _draft_log(n):
+    users = {
+        f"dm{i}": {"userName": f"Player{i}", "seatNum": i, "picks": [
+            {"packNum": 0, "pickNum": 0, "booster": ["c0", "c1"], "pick": [i % 2]}]}
+        for i in range(n)
+    }
+    return {"sessionID": "s1", "time": 1000, "setRestriction": [], "users": users,
+            "carddata": {"c0": {"name": "Lightning Bolt", "set": "lea"},
+                         "c1": {"name": "Llanowar Elves", "set": "lea"}}}
+
+
+class FakeMPT:
+    """Records how many requests are in flight; optionally fails the first
+    attempt for some drafters with a given status."""
+
+    def __init__(self, delay=0.05, fail_first=(), fail_status=503):
+        self.delay = delay
+        self.fail_first = set(fail_first)
+        self.fail_status = fail_status
+        self.in_flight = 0
+        self.peak = 0
+        self.attempts = {}
+
+    async def handle(self, request):
+        form = parse_qs(await request.text())
+        drafter = next(line[4:] for line in form["draft"][0].splitlines() if line.startswith("--> "))
+        self.attempts[drafter] = self.attempts.get(drafter, 0) + 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if drafter in self.fail_first and self.attempts[drafter] == 1:
+            return web.Response(status=self.fail_status)
+        return web.json_response({"url": f"https://mpt.test/draft/show?id={drafter}"})
+
+
+@pytest_asyncio.fixture
+async def serve(monkeypatch):
+    servers = []
+    monkeypatch.setattr(magicprotools_helper, "MPT_RETRY_BASE_DELAY", 0)
+
+    async def start(fake):
+        app = web.Application()
+        app.router.add_post("/api/draft/add", fake.handle)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        monkeypatch.setattr(magicprotools_helper, "MPT_API_URL", str(server.make_url("/api/draft/add")))
+        return fake
+
+    yield start
+    for server in servers:
+        await server.close()
+
+
+def _helper():
+    h = MagicProtoolsHelper()
+    h.api_key = "k"
+    return h
+
+
+@pytest.mark.asyncio
+async def test_requests_overlap_up_to_the_bound(serve):
+    fake = await serve(FakeMPT())
+    users = [f"dm{i}" for i in range(8)]
+    urls = await _helper().submit_all(users, _draft_log(8), concurrency=4)
+    assert urls == {u: f"https://mpt.test/draft/show?id=Player{u[2:]}" for u in users}
+    assert fake.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_and_4xx_is_not(serve):
+    fake = await serve(FakeMPT(delay=0, fail_first={"Player1"}))
+    urls = await _helper().submit_all(["dm0", "dm1"], _draft_log(2))
+    assert urls["dm1"] == "https://mpt.test/draft/show?id=Player1"
+    assert fake.attempts == {"Player0": 1, "Player1": 2}
+
+    fake = await serve(FakeMPT(delay=0, fail_first={"Player0"}, fail_status=400))
+    urls = await _helper().submit_all(["dm0", "dm1"], _draft_log(2))
+    assert urls["dm0"] is None and urls["dm1"] is not None
+    assert fake.attempts["Player0"] == 1
+
+
+@pytest.mark.asyncio
+async def test_payloads_are_built_off_the_event_loop(serve, monkeypatch):
+    await serve(FakeMPT(delay=0))
+    h = _helper()
+    threads = []
+    build = h._build_payloads
+
+    def spy(*args):
+        threads.append(threading.current_thread())
+        return build(*args)
+
+    monkeypatch.setattr(h, "_build_payloads", spy)
+    urls = await h.submit_all(["dm0", "dm1", "dm2"], _draft_log(3))
+    assert all(urls.values())
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_without_key_nothing_is_sent(serve):
+    fake = await serve(FakeMPT())
+    h = _helper()
+    h.api_key = None
+    assert await h.submit_all(["dm0"], _draft_log(1)) == {"dm0": None}
+    assert fake.attempts == {}
@@ -38,6 +38,12 @@ class FakeDB:
     async def execute(self, *args, **kwargs):
         self.calls.append("db-execute")
 
+    async def get(self, *args, **kwargs):
+        return None
+
+    def add(self, row):
+        self.calls.append("db-add")
+
     async def commit(self):
         self.calls.append("db-commit")
 
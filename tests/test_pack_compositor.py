@@ -20,10 +20,10 @@ async def test_composite_none_when_any_card_unfetchable():
     ids = [f"c{i}" for i in range(15)]
     cd = _carddata(15)
 
-    async def fetch(session, card_id, carddata, **kw):
+    async def fetch(card_id, carddata, size, **kw):
         return None if card_id == "c7" else _img()
 
-    with patch("helpers.pack_compositor.fetch_card_image", new=AsyncMock(side_effect=fetch)):
+    with patch("helpers.pack_compositor.get_card_image", new=AsyncMock(side_effect=fetch)):
         out = await PackCompositor().create_pack_composite(ids, cd)
     assert out is None
 
@@ -32,7 +32,7 @@ async def test_composite_none_when_any_card_unfetchable():
 async def test_composite_none_when_fetch_raises():
     ids = [f"c{i}" for i in range(15)]
     cd = _carddata(15)
-    with patch("helpers.pack_compositor.fetch_card_image",
+    with patch("helpers.pack_compositor.get_card_image",
                new=AsyncMock(side_effect=RuntimeError("boom"))):
         out = await PackCompositor().create_pack_composite(ids, cd)
     assert out is None
@@ -42,7 +42,7 @@ async def test_composite_none_when_fetch_raises():
 async def test_composite_ok_when_all_fetched():
     ids = [f"c{i}" for i in range(15)]
     cd = _carddata(15)
-    with patch("helpers.pack_compositor.fetch_card_image", new=AsyncMock(return_value=_img())):
+    with patch("helpers.pack_compositor.get_card_image", new=AsyncMock(return_value=_img())):
         out = await PackCompositor().create_pack_composite(ids, cd)
     assert isinstance(out, BytesIO)
     assert len(out.getvalue()) > 0
@@ -48,9 +48,9 @@ def test_bucketing_duplicate_card_ids_not_collapsed():
 @pytest.mark.asyncio
 async def test_build_none_when_any_card_unfetchable():
     cd = _cd()
-    async def fetch(session, card_id, carddata, **kw):
+    async def fetch(card_id, carddata, size, **kw):
         return None if card_id == "one" else Image.new("RGB", (244, 340), (1, 2, 3))
-    with patch("helpers.pile_compositor.fetch_card_image", new=AsyncMock(side_effect=fetch)):
+    with patch("helpers.pile_compositor.get_card_image", new=AsyncMock(side_effect=fetch)):
         out = await PileImageBuilder().build(["land", "one"], [], cd)
     assert out is None
 
@@ -58,7 +58,7 @@ async def test_build_none_when_any_card_unfetchable():
 @pytest.mark.asyncio
 async def test_build_none_when_fetch_raises():
     cd = _cd()
-    with patch("helpers.pile_compositor.fetch_card_image",
+    with patch("helpers.pile_compositor.get_card_image",
                new=AsyncMock(side_effect=RuntimeError("boom"))):
         out = await PileImageBuilder().build(["land", "one"], [], cd)
     assert out is None
@@ -67,7 +67,7 @@ async def test_build_none_when_fetch_raises():
 @pytest.mark.asyncio
 async def test_build_returns_jpeg_bytes_on_success():
     cd = _cd()
-    with patch("helpers.pile_compositor.fetch_card_image",
+    with patch("helpers.pile_compositor.get_card_image",
                new=AsyncMock(return_value=Image.new("RGB", (244, 340), (1, 2, 3)))):
         out = await PileImageBuilder().build(["land", "one", "seven"], [], cd)
     assert isinstance(out, BytesIO)
@@ -78,7 +78,7 @@ async def test_build_returns_jpeg_bytes_on_success():
 @pytest.mark.asyncio
 async def test_build_returns_jpeg_bytes_for_duplicate_card_ids():
     cd = _cd()
-    with patch("helpers.pile_compositor.fetch_card_image",
+    with patch("helpers.pile_compositor.get_card_image",
                new=AsyncMock(return_value=Image.new("RGB", (244, 340), (1, 2, 3)))):
         out = await PileImageBuilder().build(["one", "one", "one"], [], cd)
     assert isinstance(out, BytesIO)
@@ -107,7 +107,7 @@ async def test_build_canvas_dimensions_match_geometry_formula():
     expected_w = b + num_cols * (cw + b)
     expected_h = b + (ch + nb * (max_cards_in_col - 1)) + b
 
-    with patch("helpers.pile_compositor.fetch_card_image",
+    with patch("helpers.pile_compositor.get_card_image",
                new=AsyncMock(return_value=Image.new("RGB", (cw, ch)))):
         out = await builder.build(card_ids, [], cd)
 
@@ -120,7 +120,7 @@ async def test_build_canvas_dimensions_match_geometry_formula():
 async def test_build_renders_sideboard_taller_than_main_only():
     cd = _cd()
     solid = Image.new("RGB", (244, 340), (1, 2, 3))
-    with patch("helpers.pile_compositor.fetch_card_image", new=AsyncMock(return_value=solid)):
+    with patch("helpers.pile_compositor.get_card_image", new=AsyncMock(return_value=solid)):
         main_only = await PileImageBuilder().build(["one", "seven"], [], cd)
         with_side = await PileImageBuilder().build(["one", "seven"], ["land", "amv1"], cd)
     h_main = Image.open(BytesIO(main_only.getvalue())).size[1]
@@ -131,9 +131,9 @@ async def test_build_renders_sideboard_taller_than_main_only():
 @pytest.mark.asyncio
 async def test_build_none_when_a_sideboard_card_unfetchable():
     cd = _cd()
-    async def fetch(session, card_id, carddata, **kw):
+    async def fetch(card_id, carddata, size, **kw):
         return None if card_id == "amv1" else Image.new("RGB", (244, 340), (1, 2, 3))
-    with patch("helpers.pile_compositor.fetch_card_image", new=AsyncMock(side_effect=fetch)):
+    with patch("helpers.pile_compositor.get_card_image", new=AsyncMock(side_effect=fetch)):
         out = await PileImageBuilder().build(["one"], ["amv1"], cd)
     assert out is None                # all-or-nothing across main ∪ side
 
@@ -159,7 +159,7 @@ async def test_sideboard_divider_spans_full_width_when_sideboard_wider():
 
     main_block_h = b + (ch + nb * (1 - 1)) + b   # tallest main column has 1 card
 
-    with patch("helpers.pile_compositor.fetch_card_image", new=AsyncMock(return_value=solid)):
+    with patch("helpers.pile_compositor.get_card_image", new=AsyncMock(return_value=solid)):
         out = await builder.build(main_ids, side_ids, cd)
 
     assert isinstance(out, BytesIO)
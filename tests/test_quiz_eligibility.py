@@ -0,0 +1,85 @@
+"""Quiz eligibility index: seats computed from the log at capture time, and
+selection as one anti-join against quiz_sessions (no Spaces downloads)."""
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select, update
+
+from conftest import seed_session
+from database.db_session import AsyncSessionLocal
+from models import DraftSession, QuizSession
+from models.quiz_eligible_seat import QuizEligibleSeat
+from services.quiz_eligibility import index_quiz_seats, pick_unused_seat
+from test_quiz_seats import create_6_player_draft_data
+
+SINCE = datetime(2025, 6, 1)
+
+
+async def _indexed_draft(session_id, guild="g", seats=(0,), start=datetime(2026, 1, 1)):
+    await seed_session(session_id, guild=guild, start=start)
+    async with AsyncSessionLocal() as s:
+        await s.execute(update(DraftSession).where(DraftSession.session_id == session_id)
+                        .values(spaces_object_key=f"team/{session_id}.json"))
+        await QuizEligibleSeat.record(s, session_id, 0, 4, seats)
+        await s.commit()
+
+
+async def _quiz(session_id, seat, guild="g"):
+    async with AsyncSessionLocal() as s:
+        s.add(QuizSession(quiz_id=f"{session_id}-{seat}", display_id=seat + 1, guild_id=guild,
+                          channel_id="c", draft_session_id=session_id, starting_seat=seat,
+                          pack_trace_data={}, correct_answers=[], posted_by="mod"))
+        await s.commit()
+
+
+@pytest.mark.asyncio
+async def test_index_stores_the_valid_seats_and_replaces_on_rerun(test_db):
+    await seed_session("s1")
+    async with AsyncSessionLocal() as s:
+        draft = (await s.execute(
+            select(DraftSession).where(DraftSession.session_id == "s1"))).scalar_one()
+        assert await index_quiz_seats(s, draft, create_6_player_draft_data()) == [0]
+        await QuizEligibleSeat.record(s, "s1", 0, 4, [0, 2])
+        await s.commit()
+        rows = (await s.execute(select(QuizEligibleSeat.starting_seat))).scalars().all()
+    assert sorted(rows) == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_pick_skips_used_seats_without_downloading(test_db):
+    await _indexed_draft("s1", seats=(0, 1))
+    await _quiz("s1", 0)
+
+    with patch("services.draft_data_loader.DigitalOceanHelper") as spaces:
+        picks = {(await pick_unused_seat("g", SINCE))[1] for _ in range(10)}
+    assert picks == {1}
+    spaces.assert_not_called()
+
+    await _quiz("s1", 1)
+    assert await pick_unused_seat("g", SINCE) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_pick_respects_guild_window_and_unset_seat_quizzes(test_db):
+    await _indexed_draft("old", start=datetime(2024, 1, 1))
+    await _indexed_draft("other", guild="g2")
+    await _indexed_draft("s1")
+    # A legacy quiz with no starting_seat doesn't burn any seat.
+    await _quiz("s1", 0)
+    async with AsyncSessionLocal() as s:
+        await s.execute(update(QuizSession).values(starting_seat=None))
+        await s.commit()
+
+    draft, seat = await pick_unused_seat("g", SINCE)
+    assert (draft.session_id, seat) == ("s1", 0)
+
+
+@pytest.mark.asyncio
+async def test_quiz_command_selection_uses_the_index(test_db):
+    from cogs.quiz_commands import QuizCommands
+    await _indexed_draft("s1", seats=(3,), start=datetime.now())
+    with patch("services.draft_analysis.DraftAnalysis.from_session", new=AsyncMock()) as load:
+        draft, seat = await QuizCommands(bot=None)._select_random_draft_and_seat("g")
+    assert (draft.session_id, seat) == ("s1", 3)
+    load.assert_not_awaited()
@@ -0,0 +1,77 @@
+"""Pick-quiz trace record: the traced picks and card names stored on the
+QuizSession, so a rehydrated QuizPublicView never downloads or re-indexes the
+draft (legacy rows are rebuilt once and upgraded)."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select, update
+
+from conftest import seed_session
+from database.db_session import AsyncSessionLocal
+from models import DraftSession, QuizSession
+from quiz_views_module.quiz_views import QuizPublicView
+from services.draft_analysis import DraftAnalysis
+from services.quiz_trace_record import load_trace_record, trace_record
+from test_quiz_seats import create_6_player_draft_data
+
+
+def _traced():
+    analysis = DraftAnalysis(create_6_player_draft_data())
+    return analysis, analysis.trace_pack(pack_num=0, length=4, starting_seat=0)
+
+
+def test_record_round_trips_picks_and_card_names():
+    analysis, pack_trace = _traced()
+    restored, cards = load_trace_record(trace_record(pack_trace, analysis))
+
+    assert restored == pack_trace
+    for pick in pack_trace.picks:
+        for cid in pick.booster_ids:
+            assert cards.get_card(cid) == analysis.get_card(cid)
+
+
+def test_legacy_record_without_names_is_not_loadable():
+    assert load_trace_record({"picks": [{"user_name": "a", "booster_ids": ["x"], "picked_id": "x"}]}) is None
+    assert load_trace_record(None) is None
+
+
+async def _quiz(pack_trace_data):
+    await seed_session("s1")
+    async with AsyncSessionLocal() as s:
+        await s.execute(update(DraftSession).where(DraftSession.session_id == "s1")
+                        .values(spaces_object_key="team/s1.json"))
+        s.add(QuizSession(quiz_id="q1", display_id=1, guild_id="g", channel_id="c",
+                          draft_session_id="s1", starting_seat=0,
+                          pack_trace_data=pack_trace_data, correct_answers=[], posted_by="mod"))
+        await s.commit()
+
+
+@pytest.mark.asyncio
+async def test_view_rehydrates_from_the_record_without_spaces(test_db):
+    analysis, pack_trace = _traced()
+    await _quiz(trace_record(pack_trace, analysis))
+
+    with patch.object(DraftAnalysis, "from_session", AsyncMock()) as from_session:
+        view = QuizPublicView(quiz_id="q1")
+        assert await view._load_quiz_data()
+    from_session.assert_not_called()
+    assert view.pack_trace == pack_trace
+    first = pack_trace.picks[0].picked_id
+    assert view.analysis.get_card(first).name == analysis.get_card(first).name
+
+
+@pytest.mark.asyncio
+async def test_legacy_quiz_rebuilds_once_and_upgrades_its_row(test_db):
+    analysis, pack_trace = _traced()
+    legacy = {"picks": [{"user_name": p.user_name, "booster_ids": p.booster_ids,
+                         "picked_id": p.picked_id} for p in pack_trace.picks]}
+    await _quiz(legacy)
+
+    with patch.object(DraftAnalysis, "from_session", AsyncMock(return_value=analysis)) as from_session:
+        assert await QuizPublicView(quiz_id="q1")._load_quiz_data()
+        assert await QuizPublicView(quiz_id="q1")._load_quiz_data()
+    from_session.assert_awaited_once()
+
+    async with AsyncSessionLocal() as s:
+        stored = (await s.execute(select(QuizSession.pack_trace_data))).scalar_one()
+    assert load_trace_record(stored)[0] == pack_trace
@@ -201,20 +201,22 @@ class TestStripStaleLobbyReadyChecks:
         msg = MagicMock()
         msg.edit = AsyncMock()
         channel = MagicMock()
-        channel.fetch_message = AsyncMock(return_value=msg)
+        channel.get_partial_message = MagicMock(return_value=msg)
         bot = MagicMock()
         bot.get_channel.return_value = channel
         with patch("utils.AsyncSessionLocal", factory):
             await utils.strip_stale_lobby_ready_checks(bot)
 
-        channel.fetch_message.assert_awaited_once_with(555)
+        channel.get_partial_message.assert_called_once_with(555)
         msg.edit.assert_awaited_once_with(view=None)
         assert session.execute.await_count >= 2  # SELECT + UPDATE(clear)
 
     async def test_message_not_found_still_clears_column(self):
         factory, session = self._db([self._stale()])
+        msg = MagicMock()
+        msg.edit = AsyncMock(side_effect=discord.NotFound(MagicMock(), "gone"))
         channel = MagicMock()
-        channel.fetch_message = AsyncMock(side_effect=discord.NotFound(MagicMock(), "gone"))
+        channel.get_partial_message = MagicMock(return_value=msg)
         bot = MagicMock()
         bot.get_channel.return_value = channel
         with patch("utils.AsyncSessionLocal", factory):
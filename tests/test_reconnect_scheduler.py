@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from services.reconnect_scheduler import ReconnectScheduler
+
+
+def _job(log, name, delay=0.02, ok=True):
+    async def connect():
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        return ok
+    return connect
+
+
+@pytest.mark.asyncio
+async def test_reconnects_run_concurrently_up_to_the_cap():
+    sched = ReconnectScheduler(concurrency=3, rate=1000, burst=10)
+    log = []
+    started = time.monotonic()
+    results = await asyncio.gather(*(
+        sched.submit(f"s{i}", None, _job(log, f"s{i}", delay=0.05)) for i in range(6)))
+    elapsed = time.monotonic() - started
+
+    assert all(r.ok for r in results)
+    # 6 jobs, 3 at a time, 0.05s each: two waves, not six.
+    assert elapsed < 0.25
+    in_flight = peak = 0
+    for kind, _ in log:
+        in_flight += 1 if kind == "start" else -1
+        peak = max(peak, in_flight)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_in_progress_drafts_start_before_queues():
+    sched = ReconnectScheduler(concurrency=1, rate=1000, burst=10)
+    log = []
+    first = asyncio.create_task(sched.submit("busy", None, _job(log, "busy")))
+    await asyncio.sleep(0)   # holds the only slot
+    waiting = [
+        asyncio.create_task(sched.submit("queue", None, _job(log, "queue"))),
+        asyncio.create_task(sched.submit("drafting", "teams", _job(log, "drafting"))),
+        asyncio.create_task(sched.submit("paired", "pairings", _job(log, "paired"))),
+    ]
+    await asyncio.gather(first, *waiting)
+
+    assert [name for kind, name in log if kind == "start"] == ["busy", "drafting", "paired", "queue"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_handshakes_and_failures_are_reported():
+    sched = ReconnectScheduler(concurrency=10, rate=20, burst=1)
+
+    async def boom():
+        raise RuntimeError("socket refused")
+
+    log = []
+    results = await asyncio.gather(
+        sched.submit("a", None, _job(log, "a", delay=0)),
+        sched.submit("b", None, boom),
+        sched.submit("c", None, _job(log, "c", delay=0)),
+    )
+
+    assert [r.ok for r in results] == [True, False, True]
+    # One token up front, then one every 50ms.
+    assert results[2].queued_seconds >= 0.08
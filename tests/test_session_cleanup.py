@@ -0,0 +1,127 @@
+"""services/session_cleanup: plan -> discord -> commit, with no transaction
+open while Discord calls are in flight."""
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+from sqlalchemy import select
+
+from database.db_session import AsyncSessionLocal
+from models import Challenge, DraftSession
+from services import session_cleanup
+from services.session_cleanup import run_cleanup_tick
+
+NOW = datetime(2026, 3, 1, 12, 0)
+_open = {"sessions": 0}
+
+
+@asynccontextmanager
+async def _tracked_db_session():
+    """session_cleanup's db_session, counting how many are open."""
+    _open["sessions"] += 1
+    try:
+        async with AsyncSessionLocal() as session:
+            yield session
+            await session.commit()
+    finally:
+        _open["sessions"] -= 1
+
+
+async def _seed():
+    async with AsyncSessionLocal() as s:
+        s.add(DraftSession(session_id="stale", guild_id="g", session_type="random",
+                           session_stage=None, friendly_id="RND-1",
+                           draft_channel_id="100", message_id="1001",
+                           deletion_time=NOW - timedelta(minutes=5)))
+        s.add(DraftSession(session_id="done", guild_id="g", session_type="random",
+                           session_stage="teams", channel_ids=["201", "202"],
+                           draft_channel_id="100", message_id="1002",
+                           deletion_time=NOW - timedelta(hours=1)))
+        s.add(DraftSession(session_id="fresh", guild_id="g", session_type="random",
+                           session_stage="teams", deletion_time=NOW + timedelta(hours=1)))
+        s.add(Challenge(id=7, team_a_id=1, channel_id="100", message_id="1003",
+                        start_time=NOW - timedelta(hours=3)))
+        await s.commit()
+
+
+def _bot(calls):
+    channels = {}
+
+    def get_channel(channel_id):
+        if channel_id not in channels:
+            channel = MagicMock()
+            channel.id = channel_id
+            channel.name = f"chan-{channel_id}"
+
+            async def delete(**kw):
+                calls.append(("channel", channel_id, _open["sessions"]))
+            channel.delete = AsyncMock(side_effect=delete)
+
+            def partial(message_id):
+                msg = MagicMock()
+
+                async def delete_msg():
+                    calls.append(("message", message_id, _open["sessions"]))
+                    if message_id == 1003:
+                        raise discord.NotFound(MagicMock(status=404), "gone")
+                msg.delete = AsyncMock(side_effect=delete_msg)
+                return msg
+            channel.get_partial_message = MagicMock(side_effect=partial)
+            channel.send = AsyncMock()
+            channels[channel_id] = channel
+        return channels[channel_id]
+
+    bot = MagicMock()
+    bot.get_channel = MagicMock(side_effect=get_channel)
+    return bot, channels
+
+
+@pytest.mark.asyncio
+async def test_tick_reaps_discord_state_then_batches_row_deletes(test_db):
+    await _seed()
+    calls = []
+    bot, channels = _bot(calls)
+
+    with patch.object(session_cleanup, "is_cleanup_exempt", return_value=False), \
+         patch.object(session_cleanup, "db_session", _tracked_db_session), \
+         patch("ready_check.ReadyCheckSession.cleanup", new=AsyncMock()) as rc_cleanup:
+        metrics = await run_cleanup_tick(bot, now=NOW)
+
+    assert sorted((kind, target) for kind, target, _ in calls) == [
+        ("channel", 201), ("channel", 202),
+        ("message", 1001), ("message", 1002), ("message", 1003),
+    ]
+    # No DB session (so no transaction) was open during any Discord call.
+    assert all(checked_out == 0 for _, _, checked_out in calls)
+    channels[100].send.assert_awaited_once()
+    rc_cleanup.assert_awaited_once()
+
+    assert (metrics.queues_cancelled, metrics.sessions_expired, metrics.challenges_removed) == (1, 1, 1)
+    assert (metrics.channels_deleted, metrics.messages_deleted, metrics.discord_errors) == (2, 2, 0)
+
+    async with AsyncSessionLocal() as s:
+        remaining = set((await s.execute(select(DraftSession.session_id))).scalars())
+        assert remaining == {"done", "fresh"}
+        assert (await s.execute(select(Challenge))).scalars().first() is None
+
+
+@pytest.mark.asyncio
+async def test_queue_that_started_during_discord_phase_is_kept(test_db):
+    await _seed()
+    bot, _ = _bot([])
+
+    async def started_meanwhile(*a, **kw):
+        async with AsyncSessionLocal() as s:
+            ds = (await s.execute(select(DraftSession).filter_by(session_id="stale"))).scalar_one()
+            ds.session_stage = "teams"
+            await s.commit()
+
+    with patch.object(session_cleanup, "is_cleanup_exempt", return_value=False), \
+         patch("ready_check.ReadyCheckSession.cleanup", new=AsyncMock(side_effect=started_meanwhile)):
+        metrics = await run_cleanup_tick(bot, now=NOW)
+
+    assert metrics.queues_cancelled == 0
+    async with AsyncSessionLocal() as s:
+        assert (await s.execute(select(DraftSession).filter_by(session_id="stale"))).scalar_one()
@@ -1,4 +1,6 @@
 """Unit tests for the shared TrueSkill helpers (helpers/skill.py)."""
+import random
+
 from helpers.skill import (
     PRIOR_MU,
     PRIOR_SIGMA,
@@ -8,6 +10,7 @@ from helpers.skill import (
     new_ratings,
     rating_counts_for,
     rating_update_action,
+    replay_1vs1,
     skill_rating,
 )
 
@@ -98,3 +101,33 @@ def test_new_ratings_moves_winner_up_loser_down_and_shrinks_sigma():
     assert nl_mu < 25.0
     assert nw_sig < 25.0 / 3
     assert nl_sig < 25.0 / 3
+
+
+def _library_1vs1(w_mu, w_sigma, l_mu, l_sigma):
+    w, l = SKILL_ENV.rate_1vs1(SKILL_ENV.create_rating(w_mu, w_sigma),
+                               SKILL_ENV.create_rating(l_mu, l_sigma))
+    return w.mu, w.sigma, l.mu, l.sigma
+
+
+def test_closed_form_update_matches_trueskill_library():
+    rng = random.Random(0)
+    for _ in range(2000):
+        args = (rng.uniform(5, 45), rng.uniform(0.5, 9), rng.uniform(5, 45), rng.uniform(0.5, 9))
+        for ours, theirs in zip(new_ratings(*args), _library_1vs1(*args)):
+            assert abs(ours - theirs) < 1e-9
+
+
+def test_bulk_replay_matches_sequential_library_updates():
+    rng = random.Random(1)
+    n = 12
+    mu, sigma = [PRIOR_MU] * n, [PRIOR_SIGMA] * n
+    expected_mu, expected_sigma = list(mu), list(sigma)
+    matches = [tuple(rng.sample(range(n), 2)) for _ in range(500)]
+    for w, l in matches:
+        expected_mu[w], expected_sigma[w], expected_mu[l], expected_sigma[l] = _library_1vs1(
+            expected_mu[w], expected_sigma[w], expected_mu[l], expected_sigma[l])
+
+    assert replay_1vs1(mu, sigma, matches) == 500
+    for i in range(n):
+        assert abs(mu[i] - expected_mu[i]) < 1e-9
+        assert abs(sigma[i] - expected_sigma[i]) < 1e-9
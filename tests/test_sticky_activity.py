@@ -0,0 +1,74 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from database.db_session import AsyncSessionLocal
+from database.message_management import (
+    Message, flush_sticky_activity, get_sticky_activity, load_sticky_registry,
+    record_sticky_activity, remove_sticky_message,
+)
+
+
+async def _seed(channel_id, count=0, last_activity=0.0):
+    async with AsyncSessionLocal() as session:
+        row = Message(guild_id="1", channel_id=channel_id, message_id=f"m{channel_id}",
+                      content="sticky", view_metadata={"view_type": "draft"},
+                      is_sticky=True, message_count=count, last_activity=last_activity,
+                      last_update_time=0.0)
+        session.add(row)
+        await session.commit()
+        return row.id
+
+
+async def _row(channel_id):
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(
+            select(Message).filter_by(channel_id=channel_id))).scalars().first()
+
+
+@pytest.mark.asyncio
+async def test_activity_is_counted_in_memory_and_flushed_in_one_batch(test_db):
+    await _seed("10", count=3)
+    await _seed("20")
+    assert await load_sticky_registry() == 2
+
+    with patch("database.message_management.AsyncSessionLocal") as no_db:
+        for _ in range(4):
+            assert record_sticky_activity("10", 1000.0)
+        assert record_sticky_activity("20", 2000.0)
+        assert not record_sticky_activity("99", 3000.0)   # not a sticky channel
+    no_db.assert_not_called()
+    assert get_sticky_activity("10").message_count == 7
+    assert (await _row("10")).message_count == 3
+
+    assert await flush_sticky_activity() == 2
+    assert ((await _row("10")).message_count, (await _row("10")).last_activity) == (7, 1000.0)
+    assert ((await _row("20")).message_count, (await _row("20")).last_activity) == (1, 2000.0)
+    assert await flush_sticky_activity() == 0   # nothing new since
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counters_dirty(test_db):
+    await _seed("10")
+    await load_sticky_registry()
+    record_sticky_activity("10", 1000.0)
+
+    broken = MagicMock(side_effect=RuntimeError("locked"))
+    with patch("database.message_management.AsyncSessionLocal", broken):
+        assert await flush_sticky_activity() == 0
+    assert get_sticky_activity("10").dirty
+    assert await flush_sticky_activity() == 1
+    assert (await _row("10")).message_count == 1
+
+
+@pytest.mark.asyncio
+async def test_removing_the_sticky_drops_it_from_the_registry(test_db):
+    await _seed("10")
+    await load_sticky_registry()
+    message = MagicMock(id="m10")
+    message.channel.id = "10"
+    await remove_sticky_message(message)
+    assert get_sticky_activity("10") is None
+    assert not record_sticky_activity("10", time.time())
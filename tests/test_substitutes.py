@@ -1,8 +1,9 @@
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from conftest import seed_session
+from database.db_session import AsyncSessionLocal
 from helpers.substitutes import (
     GrantDecision,
     channel_ids_contains,
@@ -10,6 +11,7 @@ from helpers.substitutes import (
     resolve_sub_grant,
 )
 from models.draft_session import DraftSession
+from models.draft_session_channel import DraftSessionChannel
 
 
 def make_session(team_a=None, team_b=None, sign_ups=None,
@@ -186,45 +188,43 @@ def test_contains_handles_none_and_empty():
 
 # ---- DraftSession.get_by_any_channel_id --------------------------------------
 
-def _mock_db_session(drafts):
-    """Async-context-manager mock for models.draft_session.db_session whose
-    execute() returns the given drafts via .scalars().all()."""
-    result = MagicMock()
-    result.scalars.return_value.all.return_value = drafts
-    session = MagicMock()
-    session.execute = AsyncMock(return_value=result)
-    ctx = MagicMock()
-    ctx.__aenter__ = AsyncMock(return_value=session)
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    db = MagicMock(return_value=ctx)
-    return db
+async def _register(session_id, channel_ids=(), draft_chat_channel=None):
+    async with AsyncSessionLocal() as s:
+        await DraftSessionChannel.register(s, session_id, channel_ids, draft_chat_channel)
+        await s.commit()
 
 
 @pytest.mark.asyncio
-async def test_get_by_any_channel_id_prefers_draft_chat_match():
-    direct_hit = SimpleNamespace(session_id="s1")
-    with patch.object(DraftSession, "get_by_channel_id",
-                      AsyncMock(return_value=direct_hit)) as direct:
-        found = await DraftSession.get_by_any_channel_id(555)
-    assert found is direct_hit
-    direct.assert_awaited_once_with("555")
+async def test_get_by_any_channel_id_finds_draft_chat(test_db):
+    await seed_session("s1")
+    await _register("s1", [555, 111], draft_chat_channel="555")
+    found = await DraftSession.get_by_any_channel_id(555)
+    assert found.session_id == "s1"
 
 
 @pytest.mark.asyncio
-async def test_get_by_any_channel_id_falls_back_to_channel_ids():
-    other = SimpleNamespace(session_id="s0", channel_ids=[333])
-    match = SimpleNamespace(session_id="s1", channel_ids=[111, 222])  # ints, as stored
-    with patch.object(DraftSession, "get_by_channel_id",
-                      AsyncMock(return_value=None)), \
-         patch("models.draft_session.db_session", _mock_db_session([other, match])):
-        found = await DraftSession.get_by_any_channel_id("222")
-    assert found is match
+async def test_get_by_any_channel_id_finds_team_channel(test_db):
+    await seed_session("s0")
+    await seed_session("s1")
+    await _register("s0", [333])
+    await _register("s1", [111, 222], draft_chat_channel="111")  # ints, as stored
+    found = await DraftSession.get_by_any_channel_id("222")
+    assert found.session_id == "s1"
 
 
 @pytest.mark.asyncio
-async def test_get_by_any_channel_id_returns_none_when_no_match():
-    with patch.object(DraftSession, "get_by_channel_id",
-                      AsyncMock(return_value=None)), \
-         patch("models.draft_session.db_session", _mock_db_session([])):
-        found = await DraftSession.get_by_any_channel_id(999)
-    assert found is None
+async def test_get_by_any_channel_id_no_substring_false_positive(test_db):
+    await seed_session("s1")
+    await _register("s1", [51234])
+    assert await DraftSession.get_by_any_channel_id(123) is None
+    assert await DraftSession.get_by_any_channel_id(999) is None
+
+
+@pytest.mark.asyncio
+async def test_reused_channel_belongs_to_latest_registration(test_db):
+    """Test drafts use the queue channel as their chat; the newest session wins."""
+    await seed_session("old")
+    await seed_session("new")
+    await _register("old", draft_chat_channel="777")
+    await _register("new", draft_chat_channel="777")
+    assert (await DraftSession.get_by_any_channel_id("777")).session_id == "new"
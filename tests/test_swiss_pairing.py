@@ -1,8 +1,10 @@
 """Tests for the pure Swiss pairing engine (draft_organization/swiss.py)."""
+import itertools
 import random
 
 import pytest
 
+from draft_organization.matching import max_weight_matching
 from draft_organization.swiss import assign_bye, pair_round
 
 
@@ -81,6 +83,64 @@ def test_no_rematch_across_score_groups_with_backtracking():
     assert len(normalized) == 2
 
 
+def test_unavoidable_rematches_are_kept_to_the_minimum():
+    # Team 1 has played everyone, so one rematch is forced; pairing in
+    # standings order would also replay 3v4 and 5v6.
+    teams = [team(i, 6 - i) for i in range(1, 7)]
+    history = {frozenset({1, t}) for t in range(2, 7)} | {frozenset({3, 4}), frozenset({5, 6})}
+    pairs, _ = pair_round(teams, history, rng())
+    assert sum(frozenset(p) in history for p in pairs) == 1
+
+
+def test_large_field_with_a_cornered_team_pairs_without_rematches():
+    # The bottom team has met everyone but the leader: the old top-down
+    # backtracking enumerated the whole field before finding this.
+    size = 64
+    teams = [team(0, 6)] + [team(t, 3) for t in range(1, size - 1)] + [team(size - 1, 0)]
+    history = {frozenset({size - 1, t}) for t in range(1, size - 1)}
+    pairs, _ = pair_round(teams, history, rng())
+    assert len(pairs) == size // 2
+    assert not any(frozenset(p) in history for p in pairs)
+    assert frozenset({0, size - 1}) in {frozenset(p) for p in pairs}
+
+
+# ---- max_weight_matching --------------------------------------------------------
+
+def _best_by_brute_force(n, weights):
+    best = (0, 0)
+
+    def search(free, cardinality, total):
+        nonlocal best
+        best = max(best, (cardinality, total))
+        if not free:
+            return
+        first, rest = free[0], free[1:]
+        search(rest, cardinality, total)
+        for other in rest:
+            w = weights.get(frozenset({first, other}))
+            if w is not None:
+                search([v for v in rest if v != other], cardinality + 1, total + w)
+
+    search(list(range(n)), 0, 0)
+    return best
+
+
+def test_matching_agrees_with_brute_force_on_small_graphs():
+    r = random.Random(3)
+    for _ in range(300):
+        n = r.randint(2, 8)
+        edges = [(i, j, r.randint(-2, 10)) for i, j in itertools.combinations(range(n), 2)
+                 if r.random() < 0.7]
+        if not edges:
+            continue
+        mate = max_weight_matching(edges, maxcardinality=True)
+        weights = {frozenset({i, j}): w for i, j, w in edges}
+        matched = [(v, m) for v, m in enumerate(mate) if m > v]
+        assert all(mate[m] == v for v, m in matched)
+        got = (len(matched), sum(weights[frozenset(p)] for p in matched))
+        assert got == _best_by_brute_force(n, weights)
+
+
 # ---- assign_bye -----------------------------------------------------------------
 
 def test_bye_goes_to_lowest_points_among_fewest_byes():
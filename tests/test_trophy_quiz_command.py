@@ -14,6 +14,7 @@ import cogs.trophy_quiz_commands as trophy_quiz_commands
 from database.db_session import AsyncSessionLocal
 from database.models_base import Base
 from models import DraftSession, MatchResult, TrophyQuizSession
+from services.trophy_quiz_candidates import index_trophy_candidates
 
 
 @pytest_asyncio.fixture
@@ -84,9 +85,13 @@ async def _seed_draft(session_id, guild_id, n, rounds, **overrides):
     kwargs.update(overrides)
     async with AsyncSessionLocal() as s:
         async with s.begin():
-            s.add(DraftSession(**kwargs))
+            draft = DraftSession(**kwargs)
+            s.add(draft)
             for i, (a, b, w) in enumerate(rounds):
                 s.add(MatchResult(session_id=session_id, match_number=i, player1_id=a, player2_id=b, winner_id=w))
+            await s.flush()
+            # What capture_draft_log does with the log in hand.
+            await index_trophy_candidates(s, draft, draft_data)
     return draft_data
 
 
@@ -104,7 +109,7 @@ async def test_select_eligible_draft_skips_ineligible_draft(test_db):
     async def fake_load(object_key):
         return data_by_key[object_key]
 
-    with patch("cogs.trophy_quiz_commands.load_from_spaces", AsyncMock(side_effect=fake_load)):
+    with patch("services.draft_analysis.load_from_spaces", AsyncMock(side_effect=fake_load)):
         draft, decks, draft_data = await trophy_quiz_commands._select_eligible_draft(guild_id, rng=random.Random(0))
 
     assert draft is not None
@@ -114,6 +119,34 @@ async def test_select_eligible_draft_skips_ineligible_draft(test_db):
     assert draft_data == eligible_data
 
 
+@pytest.mark.asyncio
+async def test_select_eligible_draft_downloads_only_the_chosen_log(test_db):
+    guild_id = "g1"
+    for i in range(8):
+        await _seed_draft(f"d-middle-{i}", guild_id, 4, _NO_EXTREME)
+    # Captured before any result was reported: indexed, but not yet eligible.
+    pending_data = await _seed_draft("d-pending", guild_id, 6, [])
+    eligible_data = await _seed_draft("d-eligible", guild_id, 6, _WITH_EXTREME)
+
+    load = AsyncMock(return_value=eligible_data)
+    with patch("services.draft_analysis.load_from_spaces", load):
+        draft, decks, _ = await trophy_quiz_commands._select_eligible_draft(guild_id, rng=random.Random(0))
+    assert draft.session_id == "d-eligible"
+    load.assert_awaited_once_with("key-d-eligible")
+
+    # Results reported after capture count at selection time.
+    async with AsyncSessionLocal() as s:
+        async with s.begin():
+            for i, (a, b, w) in enumerate(_WITH_EXTREME):
+                s.add(MatchResult(session_id="d-pending", match_number=i, player1_id=a, player2_id=b, winner_id=w))
+    with patch("services.draft_analysis.load_from_spaces", AsyncMock(return_value=pending_data)):
+        draft, decks, _ = await trophy_quiz_commands._select_eligible_draft(
+            guild_id, rng=random.Random(0), exclude_draft_ids={"d-eligible"})
+    assert draft.session_id == "d-pending"
+    wins = sorted(deck["wins"] for deck in decks)
+    assert wins[0] <= 1 and wins[1] >= 2
+
+
 @pytest.mark.asyncio
 async def test_select_eligible_draft_none_when_already_recorded(test_db):
     guild_id = "g1"
@@ -134,7 +167,7 @@ async def test_select_eligible_draft_none_when_already_recorded(test_db):
                 posted_by="mod",
             ))
 
-    with patch("cogs.trophy_quiz_commands.load_from_spaces", AsyncMock()) as mock_load:
+    with patch("services.draft_analysis.load_from_spaces", AsyncMock()) as mock_load:
         draft, decks, draft_data = await trophy_quiz_commands._select_eligible_draft(guild_id, rng=random.Random(0))
 
     assert draft is None
@@ -162,7 +195,7 @@ class _FakeChannel:
 async def _select_eligible_with_data(guild_id, draft_data, rng_seed=0):
     """Seed-and-select helper: patches load_from_spaces to return draft_data
     for any key, then runs the real _select_eligible_draft selection."""
-    with patch("cogs.trophy_quiz_commands.load_from_spaces", AsyncMock(return_value=draft_data)):
+    with patch("services.draft_analysis.load_from_spaces", AsyncMock(return_value=draft_data)):
         return await trophy_quiz_commands._select_eligible_draft(guild_id, rng=random.Random(rng_seed))
 
 
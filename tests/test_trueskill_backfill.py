@@ -1,7 +1,15 @@
 """Backfill recompute logic (helpers.skill.backfill_skill_ratings) on a temp DB."""
+import random
+
 from sqlalchemy import create_engine, text
 
-from helpers.skill import PRIOR_MU, PRIOR_SIGMA, backfill_skill_ratings, new_ratings
+from helpers.skill import (
+    PRIOR_MU,
+    PRIOR_SIGMA,
+    backfill_skill_ratings,
+    new_ratings,
+    replay_guild_skill_ratings,
+)
 
 DDL = [
     """CREATE TABLE player_stats (
@@ -14,6 +22,9 @@ DDL = [
     """CREATE TABLE match_results (
         id INTEGER PRIMARY KEY, session_id TEXT, player1_id TEXT, player2_id TEXT,
         winner_id TEXT, result_submitted_at TEXT)""",
+    """CREATE TABLE skill_checkpoints (
+        guild_id TEXT, position INTEGER, prefix_hash TEXT, state TEXT,
+        created_at TEXT, PRIMARY KEY (guild_id, position))""",
 ]
 
 
@@ -168,3 +179,66 @@ def test_chronology_uses_submitted_then_start_time_and_counts_games():
     assert (w[2], w[3]) == (2, 0)
     assert (l[2], l[3]) == (0, 2)
     assert w[0] > PRIOR_MU and l[0] < PRIOR_MU
+
+
+def _all_ratings(conn):
+    return conn.execute(text(
+        "SELECT guild_id, player_id, true_skill_mu, true_skill_sigma, games_won, games_lost "
+        "FROM player_stats ORDER BY guild_id, player_id")).fetchall()
+
+
+def test_guild_replay_from_checkpoints_equals_full_backfill():
+    """Property: after any sequence of winner corrections, replaying only the
+    corrected guild from its checkpoints leaves player_stats exactly as a
+    from-scratch backfill of every guild would."""
+    for seed in range(5):
+        rng = random.Random(seed)
+        incremental, full = _conn(), _conn()
+        guilds = ["g1", "g2", "g3"]
+        players = [str(i) for i in range(1, 9)]
+        matches = []
+        for conn in (incremental, full):
+            for g in guilds:
+                for p in players:
+                    _add_player(conn, p, guild=g)
+        for mid in range(1, 121):
+            guild = rng.choice(guilds)
+            stype = rng.choice(["random", "staked", "premade", "swiss"])
+            p1, p2 = rng.sample(players, 2)
+            # Shared timestamps exercise the id tiebreak.
+            submitted = f"2026-01-{rng.randint(1, 20):02d}T10:00:00"
+            winner = rng.choice([p1, p2])
+            matches.append((mid, guild, p1, p2))
+            for conn in (incremental, full):
+                _add_session(conn, f"s{mid}", stype, "2026-01-01", guild=guild)
+                _add_match(conn, mid, f"s{mid}", p1, p2, winner, submitted)
+        for g in guilds:
+            replay_guild_skill_ratings(incremental, g, interval=7)
+
+        for _ in range(6):
+            mid, guild, p1, p2 = rng.choice(matches)
+            winner = rng.choice([p1, p2, None])
+            for conn in (incremental, full):
+                conn.execute(text("UPDATE match_results SET winner_id = :w WHERE id = :i"),
+                             {"w": winner, "i": mid})
+            replay_guild_skill_ratings(incremental, guild, interval=7)
+            backfill_skill_ratings(full)
+            assert _all_ratings(incremental) == _all_ratings(full)
+
+
+def test_guild_replay_resumes_from_last_valid_checkpoint():
+    conn = _conn()
+    _add_player(conn, "1"); _add_player(conn, "2")
+    for mid in range(1, 21):
+        _add_session(conn, f"s{mid}", "premade", "2026-01-01")
+        _add_match(conn, mid, f"s{mid}", "1", "2", "1", f"2026-01-01T10:{mid:02d}:00")
+
+    assert replay_guild_skill_ratings(conn, "g1", interval=5) == 20
+    assert replay_guild_skill_ratings(conn, "g1", interval=5) == 0
+    # Correcting the 17th result invalidates nothing before checkpoint 15.
+    conn.execute(text("UPDATE match_results SET winner_id = '2' WHERE id = 17"))
+    assert replay_guild_skill_ratings(conn, "g1", interval=5) == 5
+    # Correcting the 3rd invalidates every checkpoint.
+    conn.execute(text("UPDATE match_results SET winner_id = '2' WHERE id = 3"))
+    assert replay_guild_skill_ratings(conn, "g1", interval=5) == 20
+    assert _rating(conn, "1")[2:] == (18, 2)
@@ -0,0 +1,107 @@
+"""cogs/unified_scheduler_cog: next-fire computation, the schedule heap, and
+startup catch-up of slots missed while the bot was down."""
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from cogs.unified_scheduler_cog import (
+    ScheduledPost,
+    ScheduleQueue,
+    UnifiedSchedulerCog,
+    missed_slot,
+    next_fire,
+)
+from database.db_session import AsyncSessionLocal
+from database.models_base import Base
+from models.draft_logs import LogChannel, PostSchedule
+from models.quiz_scheduling import QuizChannel, QuizSchedule
+
+UTC = timezone.utc
+
+
+@pytest_asyncio.fixture
+async def test_db():
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.db'); tmp.close()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp.name}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    AsyncSessionLocal.configure(bind=engine)
+    yield engine
+    await engine.dispose(); os.unlink(tmp.name)
+
+
+def test_next_fire_uses_channel_time_zone_and_rolls_to_tomorrow():
+    after = datetime(2026, 1, 15, 13, 0, tzinfo=UTC)          # 08:00 in New York
+    assert next_fire("09:00", "US/Eastern", after) == datetime(2026, 1, 15, 14, 0, tzinfo=UTC)
+    assert next_fire("07:00", "US/Eastern", after) == datetime(2026, 1, 16, 12, 0, tzinfo=UTC)
+    # Exactly on the slot: the next one is tomorrow.
+    assert next_fire("13:00", "UTC", after) == datetime(2026, 1, 16, 13, 0, tzinfo=UTC)
+
+
+def test_next_fire_follows_dst_changes():
+    # 2026-03-08 US spring-forward: 09:00 EDT is 13:00 UTC, the day before 14:00 UTC.
+    before = datetime(2026, 3, 7, 15, 0, tzinfo=UTC)
+    assert next_fire("09:00", "US/Eastern", before) == datetime(2026, 3, 8, 13, 0, tzinfo=UTC)
+    # 02:30 does not exist that day; it posts once, just past the gap.
+    gap = next_fire("02:30", "US/Eastern", datetime(2026, 3, 8, 5, 0, tzinfo=UTC))
+    assert gap.date() == datetime(2026, 3, 8).date()
+
+
+def test_slow_post_delays_but_never_skips_the_next_slot():
+    queue = ScheduleQueue()
+    start = datetime(2026, 1, 15, 9, 0, tzinfo=UTC)
+    a = ScheduledPost("quiz", "c1", "09:00", "UTC", "pick")
+    b = ScheduledPost("draft_log", "c2", "09:01", "UTC")
+    queue.push(start, a)
+    queue.push(start + timedelta(minutes=1), b)
+
+    assert queue.pop_due(start) == [a]
+    # The 09:00 post took three minutes; 09:01 is still due when it returns.
+    assert queue.pop_due(start + timedelta(minutes=3)) == [b]
+    assert queue.next_due() == start + timedelta(days=1)
+    assert len(queue) == 2
+
+
+def test_missed_slot_respects_last_post_and_grace():
+    post = ScheduledPost("quiz", "c1", "09:00", "UTC", "pick")
+    now = datetime(2026, 1, 15, 10, 0, tzinfo=UTC)
+    slot = datetime(2026, 1, 15, 9, 0, tzinfo=UTC)
+    yesterday = (slot - timedelta(days=1)).astimezone().replace(tzinfo=None)
+    posted_at_slot = slot.astimezone().replace(tzinfo=None)
+
+    assert missed_slot(post, yesterday, now) == slot
+    assert missed_slot(post, posted_at_slot, now) is None
+    assert missed_slot(post, None, now) is None
+    assert missed_slot(post, yesterday, now + timedelta(hours=3)) is None
+
+
+@pytest.mark.asyncio
+async def test_load_catches_up_once_per_channel_and_skips_disabled(test_db):
+    now = datetime.now(UTC)
+    hour_ago = (now - timedelta(hours=1)).strftime("%H:%M")
+    half_hour_ago = (now - timedelta(minutes=30)).strftime("%H:%M")
+    stale = datetime.now() - timedelta(days=1)
+    async with AsyncSessionLocal() as s:
+        async with s.begin():
+            s.add(QuizChannel(channel_id="q1", guild_id="g", time_zone="UTC", last_post=stale))
+            s.add(QuizSchedule(channel_id="q1", post_time=hour_ago, quiz_type="pick"))
+            await s.flush()                      # one row per INSERT (nullable autoincrement id)
+            s.add(QuizSchedule(channel_id="q1", post_time=half_hour_ago, quiz_type="trophy"))
+            s.add(LogChannel(channel_id="l1", guild_id="g", time_zone="UTC", last_post=stale,
+                             enabled=False))
+            s.add(PostSchedule(channel_id="l1", post_time=hour_ago))
+
+    cog = UnifiedSchedulerCog.__new__(UnifiedSchedulerCog)
+    cog.queue = ScheduleQueue()
+    await cog.load_schedules(catch_up=True)
+
+    assert len(cog.queue) == 2                   # disabled log channel not queued
+    due = cog.queue.pop_due(datetime.now(UTC))
+    assert [p.channel_id for p in due] == ["q1"]
+
+    await cog.load_schedules(catch_up=False)     # after a schedule command
+    assert cog.queue.pop_due(datetime.now(UTC)) == []
@@ -0,0 +1,86 @@
+"""helpers/view_restore: register unchanged layouts without touching Discord,
+edit only messages whose layout changed, and keep the signature table tidy."""
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from sqlalchemy import select
+
+from database.db_session import AsyncSessionLocal
+from helpers.view_restore import ViewRestorer, layout_signature
+from models import RegisteredViewLayout
+
+
+def _view(custom_id="btn:1", label="Go"):
+    view = discord.ui.View(timeout=None)
+    view.add_item(discord.ui.Button(label=label, custom_id=custom_id))
+    return view
+
+
+def _channel(error=None):
+    channel = MagicMock()
+    channel.id = 100
+    message = MagicMock()
+    message.edit = AsyncMock(side_effect=error)
+    channel.get_partial_message = MagicMock(return_value=message)
+    return channel, message
+
+
+async def _stored():
+    async with AsyncSessionLocal() as s:
+        rows = (await s.execute(select(RegisteredViewLayout))).scalars().all()
+        return {row.message_id: row.signature for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_layout_is_registered_without_edit(test_db):
+    view = _view()
+    async with AsyncSessionLocal() as s:
+        s.add(RegisteredViewLayout(message_id="555", signature=layout_signature(view)))
+        s.add(RegisteredViewLayout(message_id="999", signature="old"))
+        await s.commit()
+    bot = MagicMock()
+    channel, message = _channel()
+
+    restorer = await ViewRestorer.load(bot)
+    restorer.restore(channel, 555, view, "queue")
+    await restorer.finish()
+
+    bot.add_view.assert_called_once_with(view, message_id=555)
+    message.edit.assert_not_called()
+    # 999 was not restored this time, so its signature is dropped.
+    assert await _stored() == {"555": layout_signature(view)}
+
+
+@pytest.mark.asyncio
+async def test_changed_layout_is_edited_once_and_recorded(test_db):
+    async with AsyncSessionLocal() as s:
+        s.add(RegisteredViewLayout(message_id="555", signature=layout_signature(_view(label="Old"))))
+        await s.commit()
+    bot = MagicMock()
+    channel, message = _channel()
+    view = _view(label="New")
+
+    restorer = await ViewRestorer.load(bot)
+    restorer.restore(channel, 555, view, "queue")
+    await restorer.finish()
+
+    bot.add_view.assert_not_called()
+    message.edit.assert_awaited_once_with(view=view)
+    assert (restorer.registered, restorer.edited) == (0, 1)
+    assert await _stored() == {"555": layout_signature(view)}
+
+
+@pytest.mark.asyncio
+async def test_missing_message_drops_its_signature(test_db):
+    async with AsyncSessionLocal() as s:
+        s.add(RegisteredViewLayout(message_id="555", signature="old"))
+        await s.commit()
+    channel, _ = _channel(error=discord.NotFound(MagicMock(status=404), "Unknown Message"))
+
+    restorer = await ViewRestorer.load(MagicMock())
+    restorer.restore(channel, 555, _view(), "queue")
+    await restorer.finish()
+
+    assert restorer.missing == 1
+    assert await _stored() == {}
@@ -15,6 +15,7 @@ from models import QuizSession, TrophyQuizSession
 from quiz_views_module.quiz_views import QuizPublicView
 from quiz_views_module.trophy_quiz_views import TrophyQuizView
 from helpers.draft_footer import apply_draft_footer_from_session
+from helpers.message_edits import edit_message, PRIORITY_BACKGROUND
 from services.draft_analysis import DraftAnalysis
 from cogs.leaderboard import create_leaderboard_embed, TimeframeView
 from draft_organization.tournament import Tournament
@@ -32,6 +33,12 @@ from config import is_cleanup_exempt, is_test_mode
 from helpers.money_gate import add_wallet_howto
 from leaderboard_config import AUTO_UPDATE_CATEGORIES, effective_timeframe, pinned_timeframe
 from services.crown_roles import update_crown_roles_for_guild
+from services.leaderboard_refresh import (
+    LeaderboardRefreshCoordinator,
+    embed_digest,
+    is_already_posted,
+    remember_posted,
+)
 
 # Module-level dict to track match streak extensions for ring bearer checks
 # {session_id: {player_id: {win_streak_increased: bool, perfect_streak_increased: bool}}}
@@ -44,10 +51,12 @@ from helpers.skill import (
     backfill_skill_ratings,
     new_ratings,
     rating_counts_for,
+    replay_guild_skill_ratings,
     rating_update_action,
     winner_probability_from_stats,
 )
 from services.ring_bearer_service import update_ring_bearer_for_guild
+from services.ledger_stats import invalidate_session as invalidate_ledger_session
 
 # Configuration constants
 QUIZ_REREGISTER_DAYS = 7  # Re-register quiz views from last 7 days
@@ -769,12 +778,11 @@ async def update_draft_summary_message(bot, draft_session_id):
         channel = guild.get_channel(int(draft_session.draft_chat_channel))
 
         try:
-            summary_message = await channel.fetch_message(int(draft_session.draft_summary_message_id))
             # Update with both embeds
             embeds = [main_embed]
             if bet_embed:
                 embeds.append(bet_embed)
-            await summary_message.edit(embeds=embeds)
+            await edit_message(channel, draft_session.draft_summary_message_id, embeds=embeds)
         except Exception as e:
             print(f"Failed to update draft summary message: {e}")
 
@@ -1110,13 +1118,14 @@ async def check_and_post_victory_or_draw(bot, draft_session_id):
                     logger.debug(f"[RING BEARER] Combined streak extensions for session {draft_session_id}: {all_streak_extensions}")
 
                     # Update leaderboards in background, passing streak extension info
-                    # (leaderboard updates can take 20+ seconds due to rate limiting)
-                    asyncio.create_task(update_leaderboards_for_guild(
+                    # (leaderboard updates can take 20+ seconds due to rate limiting).
+                    # Pods finishing close together share one debounced refresh.
+                    request_leaderboard_refresh(
                         bot,
                         draft_session.guild_id,
                         session_id=draft_session_id,
                         streak_extensions=all_streak_extensions
-                    ))
+                    )
 
                     # Update debt summary in background (if one exists for this guild)
                     fire_debt_summary_refresh(bot, draft_session.guild_id, "StakeDebts")
@@ -1200,14 +1209,22 @@ async def update_leaderboards_for_guild(bot, guild_id: str, session_id=None, str
                     if hasattr(leaderboard_message, msg_id_field) and getattr(leaderboard_message, msg_id_field):
                         try:
                             message_id = getattr(leaderboard_message, msg_id_field)
-                            message = await channel.fetch_message(int(message_id))
+
+                            # Skip the edit when this board is exactly what was last posted.
+                            pinned = bool(pinned_timeframe(category, guild_id))
+                            digest = embed_digest(embed, timeframes[category], pinned)
+                            if is_already_posted(message_id, digest):
+                                logger.debug(f"{category} leaderboard unchanged for guild {guild_id}, skipping edit")
+                                continue
 
                             # A board that fixes its own window gets no selector;
                             # passing view=None is also what strips one already there.
                             view = None
-                            if not pinned_timeframe(category, guild_id):
+                            if not pinned:
                                 view = TimeframeView(bot, guild_id, category, current_timeframe=timeframes[category])
-                            await message.edit(embed=embed, view=view)
+                            await edit_message(channel, message_id, priority=PRIORITY_BACKGROUND,
+                                               embed=embed, view=view)
+                            remember_posted(message_id, digest)
 
                             logger.info(f"Updated {category} leaderboard for guild {guild_id}")
                         except discord.NotFound:
@@ -1240,6 +1257,17 @@ async def update_leaderboards_for_guild(bot, guild_id: str, session_id=None, str
         logger.error(f"Error updating leaderboards for guild {guild_id}: {e}")
 
 
+_LEADERBOARD_REFRESHES = LeaderboardRefreshCoordinator(update_leaderboards_for_guild)
+
+
+def request_leaderboard_refresh(bot, guild_id: str, session_id=None, streak_extensions=None):
+    """Debounced update_leaderboards_for_guild: triggers for the same guild
+    within LEADERBOARD_REFRESH_WINDOW share one refresh, and a guild never
+    has two refreshes running (see services.leaderboard_refresh)."""
+    return _LEADERBOARD_REFRESHES.request(bot, guild_id, session_id=session_id,
+                                          streak_extensions=streak_extensions)
+
+
 def fire_debt_summary_refresh(client, guild_id: str, context: str):
     """Fire-and-forget panel refresh after any ledger mutation (tix
     settlement, transfer, card loan, card return). One helper so no
@@ -1389,7 +1417,11 @@ async def post_or_update_victory_message(bot, session, channel, embeds, draft_se
             message = await channel.send(embeds=embeds)
         setattr(draft_session, victory_message_attr, str(message.id))
         session.add(draft_session)
-    
+
+    # Wake the draft's manager if it is waiting to disconnect on victory
+    from services.draft_setup_manager import notify_victory
+    notify_victory(draft_session.session_id)
+
     # Schedule the removal of the live draft summary after 15 minutes (900 seconds)
     from livedrafts import remove_live_draft_summary_after_delay
     asyncio.create_task(remove_live_draft_summary_after_delay(bot, draft_session.session_id, 900))
@@ -1587,110 +1619,14 @@ async def calculate_three_zero_drafters(session, draft_session_id, guild):
 
 
 async def cleanup_sessions_task(bot):
+    """Every 10 minutes: reap expired sessions, stale queues and old challenges
+    (see services/session_cleanup.py for the plan -> discord -> commit phases)."""
+    from services.session_cleanup import run_cleanup_tick
     while True:
-        current_time = datetime.now()
-        window_time = current_time - timedelta(hours=24)
-        challenge_time = current_time - timedelta(hours=2)
-        async with AsyncSessionLocal() as db_session:  
-            async with db_session.begin():
-                # Fetch sessions that are past their deletion time and in the deletion window
-                stmt = select(DraftSession).where(DraftSession.deletion_time.between(window_time, current_time))
-                results = await db_session.execute(stmt)
-                sessions_to_cleanup = results.scalars().all()
-                
-                challenge_stmt = select(Challenge).where(Challenge.start_time < challenge_time)
-                challenge_results = await db_session.execute(challenge_stmt)
-                challenges_to_cleanup = challenge_results.scalars().all()
-
-                # Check for inactive initial queues (no activity for 90 minutes)
-                inactive_stmt = select(DraftSession).where(
-                    DraftSession.session_stage.is_(None),  # Only initial queue stage
-                    DraftSession.deletion_time < current_time  # Past the deletion time
-                )
-                inactive_results = await db_session.execute(inactive_stmt)
-                inactive_sessions = inactive_results.scalars().all()
-
-                # Process inactive sessions for cancellation due to inactivity
-                for session in inactive_sessions:
-                    # Skip queue cleanup for guilds marked as cleanup_exempt
-                    if is_cleanup_exempt(session.guild_id):
-                        continue
-                    
-                    # Cancel the queue due to inactivity
-                    if session.draft_channel_id and session.message_id:
-                        draft_channel = bot.get_channel(int(session.draft_channel_id))
-                        if draft_channel:
-                            try:
-                                # Delete the original message
-                                msg = await draft_channel.fetch_message(int(session.message_id))
-                                if msg:
-                                    # Send cancellation notification
-                                    await draft_channel.send(f"Queue for `{session.friendly_id}` has been cancelled due to inactivity (no new signups for 180 minutes).")
-                                    await msg.delete()
-                                    logger.info(f"Cancelled inactive queue for session {session.session_id} ({session.friendly_id})")
-                            except discord.NotFound:
-                                pass
-                            except discord.HTTPException as e:
-                                logger.error(f"Failed to delete message ID {session.message_id} in draft channel. Reason: {e}")
-                            from ready_check import ReadyCheckSession
-                            await ReadyCheckSession.cleanup(session.session_id, draft_channel)
-                    
-                    # Delete the session from the database
-                    await db_session.delete(session)
-
-                # Original cleanup code for regular sessions
-                for session in sessions_to_cleanup:
-                    # Never reap a draft whose tournament match is still unfinished —
-                    # extend its lifespan instead so the pairing buttons stay alive.
-                    from services.tournament_service import extend_deletion_if_unfinished
-                    if await extend_deletion_if_unfinished(db_session, session, current_time):
-                        logger.info(
-                            f"Skipped cleanup for session {session.session_id}: tournament "
-                            f"match {session.tournament_match_id} unfinished; deletion_time extended"
-                        )
-                        continue
-                    # Check if channel_ids is not None and is iterable before attempting to iterate
-                    if session.channel_ids:
-                        for channel_id in session.channel_ids:
-                            channel = bot.get_channel(int(channel_id))
-                            if channel:  # Check if channel was found
-                                try:
-                                    await channel.delete(reason="Session expired.")
-                                except discord.NotFound:
-                                    # If the message is not found, silently continue
-                                    continue
-                                except discord.HTTPException as e:
-                                    print(f"Failed to delete channel: {channel.name}. Reason: {e}")
-
-                    if session.draft_channel_id and session.message_id:
-                        if session.session_type == "winston":
-                            if not session.sign_ups or len(session.sign_ups) < 2:
-                                continue
-                        draft_channel = bot.get_channel(int(session.draft_channel_id))
-                        if draft_channel:
-                            try:
-                                msg = await draft_channel.fetch_message(int(session.message_id))
-                                await msg.delete()
-                            except discord.NotFound:
-                                # If the message is not found, silently continue
-                                continue
-                            except discord.HTTPException as e:
-                                print(f"Failed to delete message ID {session.message_id} in draft channel. Reason: {e}")
-
-                for challenge in challenges_to_cleanup:
-                    if challenge.channel_id and challenge.message_id:
-                        channel = bot.get_channel(int(challenge.channel_id))
-                        if channel:
-                            try:
-                                msg = await channel.fetch_message(int(challenge.message_id))
-                                await msg.delete()
-                            except Exception as e:
-                                print(f"Failed to delete challenge message {challenge.message_id}: {e}")
-
-                    await db_session.delete(challenge)
-                    # Commit deletion of challenge
-
-                    print(f"{challenge.id} has been removed.")
+        try:
+            await run_cleanup_tick(bot)
+        except Exception as e:
+            logger.error(f"Session cleanup tick failed: {e}")
         # Sleep for a certain amount of time before running again
         await asyncio.sleep(600)  # Sleep for 10 minutes
 
@@ -2018,17 +1954,20 @@ def _new_player_stats_row(player_id, guild_id):
     )
 
 
-async def recompute_skill_ratings():
-    """Heal player_stats by replaying the full match_results ledger.
+async def recompute_skill_ratings(guild_id=None):
+    """Heal player_stats by replaying the match_results ledger.
 
     Used when a reported winner is corrected: the wrong incremental update is
     already baked into mu/sigma and TrueSkill updates are order-dependent, so
-    the only exact repair is a from-scratch replay. Streaks and
+    the only exact repair is a replay. Ratings never cross guilds, so with a
+    guild_id only that guild is replayed, from its newest still-valid
+    skill_checkpoints row (helpers.skill.replay_guild_skill_ratings); without
+    one, every guild is replayed from scratch. Streaks and
     drafts_participated are left untouched (same contract as the backfill).
 
-    The replay is tens of thousands of pure-CPU TrueSkill updates, so it runs
-    in a worker thread on its own short-lived sync connection (to the same
-    database AsyncSessionLocal is bound to) instead of stalling the event loop.
+    The replay is pure-CPU TrueSkill updates, so it runs in a worker thread on
+    its own short-lived sync connection (to the same database
+    AsyncSessionLocal is bound to) instead of stalling the event loop.
     """
     url = AsyncSessionLocal.kw["bind"].url.render_as_string(
         hide_password=False).replace("+aiosqlite", "")
@@ -2037,7 +1976,11 @@ async def recompute_skill_ratings():
         engine = create_engine(url)
         try:
             with engine.begin() as conn:
-                backfill_skill_ratings(conn)
+                if guild_id is None:
+                    backfill_skill_ratings(conn)
+                else:
+                    replayed = replay_guild_skill_ratings(conn, str(guild_id))
+                    logger.info(f"Skill replay for guild {guild_id}: {replayed} results re-rated")
         finally:
             engine.dispose()
 
@@ -2052,18 +1995,24 @@ async def apply_result_report(match_result, previous_winner_id):
     indistinguishable from a duplicate. Only the first report of a winner
     applies an incremental update; re-selecting a result (score corrections,
     a teammate reporting the same match) must not double-count; a winner
-    change heals by replaying the ledger.
+    change heals by replaying the ledger of the match's guild.
 
     Returns (action, streak_extensions): the rating_update_action taken, and
     streak extensions when an incremental update ran (else None). Callers
     should gate first-report-only side effects (streak storage, ring-bearer
     transfer) on action == "apply".
     """
+    # The row was just rewritten (winner, score or submission time), possibly
+    # below the cached ledger snapshots' high-water mark: have them refetch it.
+    invalidate_ledger_session(match_result.session_id)
     action = rating_update_action(previous_winner_id, match_result.winner_id)
     if action == "apply":
         return action, await update_player_stats_and_elo(match_result)
     if action == "recompute":
-        await recompute_skill_ratings()
+        async with AsyncSessionLocal() as session:
+            guild_id = await session.scalar(
+                select(DraftSession.guild_id).where(DraftSession.session_id == match_result.session_id))
+        await recompute_skill_ratings(guild_id)
     return action, None
 
 
@@ -2313,8 +2262,16 @@ async def balance_teams(player_ids, guild):
     return team_a, team_b
 
 async def re_register_views(bot):
+    """Re-attach every live persistent view after a restart, from DB state
+    alone: views whose message already carries the same layout are only
+    registered (bot.add_view); the rest are edited once under the shared
+    edit budget (see helpers/view_restore.py)."""
+    from views import PersistentView, MatchResultButton, pairing_button_style
+    from helpers.view_restore import ViewRestorer
+
     current_time = datetime.now()
-    
+    restorer = await ViewRestorer.load(bot)
+
     async with AsyncSessionLocal() as db_session:
         async with db_session.begin():
             # Query for all active draft sessions that have a deletion_time in the future
@@ -2322,109 +2279,64 @@ async def re_register_views(bot):
                 .where(DraftSession.deletion_time > current_time)\
                 .order_by(desc(DraftSession.id))
             result = await db_session.execute(stmt)
-            draft_sessions = result.scalars().unique()
+            draft_sessions = result.scalars().unique().all()
 
         for draft_session in draft_sessions:
             if not draft_session.session_stage and draft_session.draft_channel_id:
-                channel_id = int(draft_session.draft_channel_id)
-                channel = bot.get_channel(channel_id)
-                if channel:
-                    try:
-                        message = await channel.fetch_message(int(draft_session.message_id))
-                        from views import PersistentView
-                        if draft_session.session_type == "winston":
-                            view = PersistentView(
-                                                bot=bot,
-                                                draft_session_id=draft_session.session_id,
-                                                session_type=draft_session.session_type
-                                                )
-                        else:
-                            view = PersistentView(bot=bot,
-                                                draft_session_id=draft_session.session_id,
-                                                session_type=draft_session.session_type,
-                                                team_a_name=draft_session.team_a_name,
-                                                team_b_name=draft_session.team_b_name,
-                                                session_stage=None)
-                            
-                        await message.edit(view=view)  # Reattach the view
-                        print(f"Re-registered view for session: {draft_session.session_id}")
-                    except discord.NotFound:
-                        # Handle cases where the message or channel might have been deleted
-                        print(f"Message or channel not found for session: {draft_session.session_id}")
-                    except Exception as e:
-                        # Log or handle any other exceptions
-                        print(f"Failed to re-register view for session: {draft_session.session_id}, error: {e}")
+                if draft_session.session_type == "winston":
+                    view = PersistentView(
+                                        bot=bot,
+                                        draft_session_id=draft_session.session_id,
+                                        session_type=draft_session.session_type
+                                        )
+                else:
+                    view = PersistentView(bot=bot,
+                                        draft_session_id=draft_session.session_id,
+                                        session_type=draft_session.session_type,
+                                        team_a_name=draft_session.team_a_name,
+                                        team_b_name=draft_session.team_b_name,
+                                        session_stage=None)
+                restorer.restore(bot.get_channel(int(draft_session.draft_channel_id)),
+                                 draft_session.message_id, view, f"queue {draft_session.session_id}")
             elif draft_session.session_stage == "teams":
-                channel_id = int(draft_session.draft_channel_id)
-                channel = bot.get_channel(channel_id)
-                if channel:
-                    try:
-                        message = await channel.fetch_message(int(draft_session.message_id))
-                        from views import PersistentView
-                        view = PersistentView(bot=bot,
-                                            draft_session_id=draft_session.session_id,
-                                            session_type=draft_session.session_type,
-                                            team_a_name=draft_session.team_a_name,
-                                            team_b_name=draft_session.team_b_name,
-                                            session_stage="teams")
-                        await message.edit(view=view)  # Reattach the view
-                        print(f"Re-registered team view for session: {draft_session.session_id}")
-                    except discord.NotFound:
-                        # Handle cases where the message or channel might have been deleted
-                        print(f"Message or channel not found for session: {draft_session.session_id}")
-                    except Exception as e:
-                        # Log or handle any other exceptions
-                        print(f"Failed to re-register view for session: {draft_session.session_id}, error: {e}")
+                view = PersistentView(bot=bot,
+                                    draft_session_id=draft_session.session_id,
+                                    session_type=draft_session.session_type,
+                                    team_a_name=draft_session.team_a_name,
+                                    team_b_name=draft_session.team_b_name,
+                                    session_stage="teams")
+                restorer.restore(bot.get_channel(int(draft_session.draft_channel_id)),
+                                 draft_session.message_id, view, f"teams {draft_session.session_id}")
             elif draft_session.session_stage == "pairings":
+                if not draft_session.draft_chat_channel:
+                    continue
+                channel = bot.get_channel(int(draft_session.draft_chat_channel))
                 # Group match results by pairing_message_id
                 matches_by_pairing_msg = {}
                 for match_result in draft_session.match_results:
-                    pairing_msg_id = match_result.pairing_message_id
-                    if pairing_msg_id not in matches_by_pairing_msg:
-                        matches_by_pairing_msg[pairing_msg_id] = []
-                    matches_by_pairing_msg[pairing_msg_id].append(match_result)
-                
-                # Iterate over each group of match results by their pairing message
-                for pairing_message_id, match_results in matches_by_pairing_msg.items():
-                    if draft_session.draft_chat_channel:
-                        channel_id = int(draft_session.draft_chat_channel)
-                        channel = bot.get_channel(channel_id)
-                        if channel:
-                            try:
-                                message = await channel.fetch_message(int(pairing_message_id))
-                                view = View(timeout=None)  # Initialize a new view for this set of match results
-                                
-                                # Add a button for each match result in this group
-                                for match_result in match_results:
-                                    from views import MatchResultButton
-                                    
-                                    from views import pairing_button_style
-                                    button_style = pairing_button_style(
-                                        match_result, draft_session.team_a, draft_session.team_b
-                                    )
-                                    
-                                    button = MatchResultButton(
-                                        bot=bot,
-                                        session_id=draft_session.session_id,
-                                        match_id=match_result.id,
-                                        match_number=match_result.match_number,
-                                        label=f"Match {match_result.match_number} Results",
-                                        style=button_style
-                                        # row parameter is optional
-                                    )
-                                    if draft_session.session_type != "test":
-                                        view.add_item(button)
-                                
-                                # Now, view contains all buttons for the matches associated with this pairing message
-                                await message.edit(view=view)
-                                print(f"Re-registered pairing view for message ID: {pairing_message_id}")
-                            except discord.NotFound:
-                                print(f"Pairing message or channel not found for pairing message ID: {pairing_message_id}")
-                            except Exception as e:
-                                print(f"Failed to re-register view for pairing message ID: {pairing_message_id}, error: {e}")
+                    matches_by_pairing_msg.setdefault(match_result.pairing_message_id, []).append(match_result)
 
-        # Re-register quiz views for all recent quizzes
-        # Get all quiz sessions from the last N days
+                for pairing_message_id, match_results in matches_by_pairing_msg.items():
+                    if not pairing_message_id:
+                        continue
+                    view = View(timeout=None)  # Initialize a new view for this set of match results
+                    if draft_session.session_type != "test":
+                        for match_result in match_results:
+                            view.add_item(MatchResultButton(
+                                bot=bot,
+                                session_id=draft_session.session_id,
+                                match_id=match_result.id,
+                                match_number=match_result.match_number,
+                                label=f"Match {match_result.match_number} Results",
+                                style=pairing_button_style(
+                                    match_result, draft_session.team_a, draft_session.team_b
+                                ),
+                            ))
+                    restorer.restore(channel, pairing_message_id, view,
+                                     f"pairings {draft_session.session_id}")
+
+        # Re-register quiz views for all recent quizzes. The quiz's analysis is
+        # not loaded here: the view lazy-loads it on the first click.
         cutoff_date = current_time - timedelta(days=QUIZ_REREGISTER_DAYS)
         async with db_session.begin():
             stmt = select(QuizSession).where(
@@ -2438,25 +2350,8 @@ async def re_register_views(bot):
         for quiz_session in quiz_sessions:
             if not quiz_session.message_id or not quiz_session.channel_id:
                 continue
-
-            channel = bot.get_channel(int(quiz_session.channel_id))
-            if not channel:
-                continue
-
-            try:
-                message = await channel.fetch_message(int(quiz_session.message_id))
-
-                # Use from_metadata to recreate view (reuses existing logic)
-                metadata = {"quiz_id": quiz_session.quiz_id, "view_type": "quiz"}
-                view = await QuizPublicView.from_metadata(bot, metadata)
-
-                await message.edit(view=view)
-                logger.info(f"Re-registered quiz view for quiz: {quiz_session.quiz_id}")
-
-            except discord.NotFound:
-                logger.warning(f"Quiz message or channel not found for quiz: {quiz_session.quiz_id}")
-            except Exception as e:
-                logger.error(f"Failed to re-register quiz view: {quiz_session.quiz_id}, error: {e}", exc_info=True)
+            restorer.restore(bot.get_channel(int(quiz_session.channel_id)), quiz_session.message_id,
+                             QuizPublicView(quiz_id=quiz_session.quiz_id), f"quiz {quiz_session.quiz_id}")
 
         # Re-register trophy quiz views for all recent trophy quizzes so their
         # persistent dropdowns/buttons keep working after a restart (mirrors the
@@ -2473,53 +2368,9 @@ async def re_register_views(bot):
         for trophy_quiz in trophy_quiz_sessions:
             if not trophy_quiz.message_id or not trophy_quiz.channel_id:
                 continue
-
-            channel = bot.get_channel(int(trophy_quiz.channel_id))
-            if not channel:
-                continue
-
-            try:
-                message = await channel.fetch_message(int(trophy_quiz.message_id))
-                view = TrophyQuizView(trophy_quiz.quiz_id, trophy_quiz.decks)
-                await message.edit(view=view)
-                logger.info(f"Re-registered trophy quiz view for quiz: {trophy_quiz.quiz_id}")
-            except discord.NotFound:
-                logger.warning(f"Trophy quiz message or channel not found for quiz: {trophy_quiz.quiz_id}")
-            except Exception as e:
-                logger.error(f"Failed to re-register trophy quiz view: {trophy_quiz.quiz_id}, error: {e}", exc_info=True)
-
-        # Cleanup: Unpin quiz messages older than the rejoin cutoff
-        logger.info("Cleaning up old quiz messages (unpinning messages older than rejoin cutoff)")
-        old_quiz_cutoff = current_time - timedelta(days=QUIZ_REREGISTER_DAYS)
-
-        async with db_session.begin():
-            # Find quiz messages older than the cutoff
-            stmt = select(QuizSession).where(
-                QuizSession.posted_at < old_quiz_cutoff
-            )
-            result = await db_session.execute(stmt)
-            old_quiz_sessions = result.scalars().all()
-
-        logger.info(f"Found {len(old_quiz_sessions)} old quiz sessions to potentially unpin")
-
-        for old_quiz in old_quiz_sessions:
-            if not old_quiz.message_id or not old_quiz.channel_id:
-                continue
-
-            channel = bot.get_channel(int(old_quiz.channel_id))
-            if not channel:
-                continue
-
-            try:
-                message = await channel.fetch_message(int(old_quiz.message_id))
-                if message.pinned:
-                    await safe_unpin(message)
-            except discord.NotFound:
-                logger.debug(f"Old quiz message {old_quiz.message_id} not found (already deleted)")
-            except discord.Forbidden:
-                logger.warning(f"Bot lacks permission to unpin message {old_quiz.message_id}")
-            except Exception as e:
-                logger.error(f"Error unpinning old quiz message {old_quiz.message_id}: {e}")
+            restorer.restore(bot.get_channel(int(trophy_quiz.channel_id)), trophy_quiz.message_id,
+                             TrophyQuizView(trophy_quiz.quiz_id, trophy_quiz.decks),
+                             f"trophy quiz {trophy_quiz.quiz_id}")
 
         # Re-register SettleDebtsView for completed staked drafts (last 7 days)
         settle_cutoff = current_time - timedelta(days=7)
@@ -2537,45 +2388,69 @@ async def re_register_views(bot):
         for staked_session in staked_sessions:
             # Re-register view in draft chat channel
             if staked_session.draft_chat_channel and staked_session.victory_message_id_draft_chat:
-                channel = bot.get_channel(int(staked_session.draft_chat_channel))
-                if channel:
-                    try:
-                        message = await channel.fetch_message(int(staked_session.victory_message_id_draft_chat))
-                        view = SettleDebtsView(
-                            session_id=staked_session.session_id,
-                            guild_id=staked_session.guild_id
-                        )
-                        await message.edit(view=view)
-                        logger.debug(f"Re-registered settle view for draft chat: {staked_session.session_id}")
-                    except discord.NotFound:
-                        logger.debug(f"Victory message not found for session: {staked_session.session_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to re-register settle view for session {staked_session.session_id}: {e}")
+                restorer.restore(
+                    bot.get_channel(int(staked_session.draft_chat_channel)),
+                    staked_session.victory_message_id_draft_chat,
+                    SettleDebtsView(session_id=staked_session.session_id, guild_id=staked_session.guild_id),
+                    f"settle {staked_session.session_id}",
+                )
 
             # Re-register view in results channel (if different message)
             if staked_session.victory_message_id_results_channel:
-                results_channel_name = "team-draft-results"
                 guild = bot.get_guild(int(staked_session.guild_id))
-                if guild:
-                    results_channel = discord.utils.get(guild.text_channels, name=results_channel_name)
-                    if results_channel:
-                        try:
-                            message = await results_channel.fetch_message(int(staked_session.victory_message_id_results_channel))
-                            view = SettleDebtsView(
-                                session_id=staked_session.session_id,
-                                guild_id=staked_session.guild_id
-                            )
-                            await message.edit(view=view)
-                            logger.debug(f"Re-registered settle view for results channel: {staked_session.session_id}")
-                        except discord.NotFound:
-                            logger.debug(f"Results message not found for session: {staked_session.session_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to re-register settle view for results channel {staked_session.session_id}: {e}")
+                results_channel = (discord.utils.get(guild.text_channels, name="team-draft-results")
+                                   if guild else None)
+                restorer.restore(
+                    results_channel,
+                    staked_session.victory_message_id_results_channel,
+                    SettleDebtsView(session_id=staked_session.session_id, guild_id=staked_session.guild_id),
+                    f"settle results {staked_session.session_id}",
+                )
+
+    await restorer.finish()
+
+    # Cleanup: Unpin quiz messages older than the rejoin cutoff
+    await unpin_old_quiz_messages(bot, current_time - timedelta(days=QUIZ_REREGISTER_DAYS))
 
     # Strip stale lobby ready-check buttons left over from a restart mid-check.
     await strip_stale_lobby_ready_checks(bot)
 
 
+async def unpin_old_quiz_messages(bot, old_quiz_cutoff):
+    """Unpin quiz messages posted before the rejoin cutoff. Reads each quiz
+    channel's pin list once instead of fetching every old quiz message."""
+    async with AsyncSessionLocal() as db_session:
+        stmt = select(QuizSession.channel_id, QuizSession.message_id).where(
+            QuizSession.posted_at < old_quiz_cutoff,
+            QuizSession.message_id.isnot(None),
+            QuizSession.channel_id.isnot(None),
+        )
+        rows = (await db_session.execute(stmt)).all()
+
+    old_by_channel = {}
+    for channel_id, message_id in rows:
+        old_by_channel.setdefault(str(channel_id), set()).add(str(message_id))
+    logger.info(f"Checking pins in {len(old_by_channel)} quiz channels for {len(rows)} old quiz messages")
+
+    async def _unpin_channel(channel_id, message_ids):
+        channel = bot.get_channel(int(channel_id))
+        if not channel:
+            return
+        try:
+            pins = await channel.pins()
+        except discord.Forbidden:
+            logger.warning(f"Bot lacks permission to read pins in {channel_id}")
+            return
+        except Exception as e:
+            logger.error(f"Error reading pins in quiz channel {channel_id}: {e}")
+            return
+        for message in pins:
+            if str(message.id) in message_ids:
+                await safe_unpin(message)
+
+    await asyncio.gather(*(_unpin_channel(cid, mids) for cid, mids in old_by_channel.items()))
+
+
 async def strip_stale_lobby_ready_checks(bot):
     """Remove Ready/Not-Ready buttons from lobby ready-check messages left in-flight
     by a restart, and clear the persisted message id.
@@ -2593,21 +2468,24 @@ async def strip_stale_lobby_ready_checks(bot):
             result = await db_session.execute(stmt)
             stale_rc_sessions = result.scalars().all()
 
-        for stale_session in stale_rc_sessions:
+        async def _strip(stale_session):
             if not stale_session.draft_channel_id:
-                continue
+                return
             channel = bot.get_channel(int(stale_session.draft_channel_id))
             if not channel:
-                continue
+                return
             try:
-                message = await channel.fetch_message(int(stale_session.lobby_ready_check_message_id))
-                await message.edit(view=None)  # Strip Ready/Not-Ready buttons; keep the embed.
+                # Strip Ready/Not-Ready buttons; keep the embed.
+                await edit_message(channel, stale_session.lobby_ready_check_message_id,
+                                   priority=PRIORITY_BACKGROUND, view=None)
                 logger.info(f"Stripped stale lobby ready-check buttons for session: {stale_session.session_id}")
             except discord.NotFound:
                 logger.debug(f"Stale lobby ready-check message not found for session: {stale_session.session_id}")
             except Exception as e:
                 logger.error(f"Failed to strip lobby ready-check buttons for {stale_session.session_id}: {e}")
 
+        await asyncio.gather(*(_strip(stale_session) for stale_session in stale_rc_sessions))
+
         # Clear every persisted id in one statement — the cleanup is self-healing,
         # so clearing all rows at once (rather than one UPDATE per session) is correct.
         async with db_session.begin():
@@ -11,7 +11,7 @@ from ready_check import ReadyCheckView, ReadyCheckSession
 from draft_organization.stake_calculator import calculate_stakes_with_strategy
 from services.draft_setup_manager import DraftSetupManager, ACTIVE_MANAGERS
 from session import StakeInfo, AsyncSessionLocal, get_draft_session, DraftSession, MatchResult
-from models import SignUpHistory
+from models import SignUpHistory, DraftSessionChannel
 from sqlalchemy import update, select, and_
 from sqlalchemy.orm import selectinload
 from helpers.utils import get_cube_thumbnail_url
@@ -19,6 +19,7 @@ from helpers.money_gate import wallet_howto
 from helpers.display_names import get_display_name, get_display_name_by_id
 from helpers.debt_warning import format_staked_sign_ups, DEBT_WARNING_AGE_DAYS
 from helpers.draft_footer import apply_draft_footer_from_session
+from helpers.message_edits import edit_message, PRIORITY_INTERACTION
 from helpers.opponent_threads import spawn_opponent_threads
 from helpers.permissions import bot_manager_button
 from utils import (
@@ -1250,7 +1251,7 @@ class PersistentView(discord.ui.View):
             embed.set_field_at(team_b_index, name=f"{session.team_b_name} ({len(session.team_b or [])}):", value="\n".join(team_b_names) if team_b_names else "No players yet.", inline=True)
 
         # Edit the original message with the updated embed
-        await message.edit(embed=embed)
+        await edit_message(channel, session.message_id, priority=PRIORITY_INTERACTION, embed=embed)
     
 
     async def remove_user_button_callback(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -1403,6 +1404,9 @@ class PersistentView(discord.ui.View):
                 await db_session.execute(update(DraftSession)
                                         .where(DraftSession.session_id == self.draft_session_id)
                                         .values(**update_values))
+                await DraftSessionChannel.register(
+                    db_session, self.draft_session_id, self.channel_ids, self.draft_chat_channel
+                )
                 await db_session.commit()
 
         # One scouting thread per opposing player, so each team has a dedicated
@@ -1527,6 +1531,9 @@ class PersistentView(discord.ui.View):
                     else:
                         draft_chat_channel = guild.get_channel(int(session.draft_channel_id))
                         session.draft_chat_channel = session.draft_channel_id
+                        await DraftSessionChannel.register(
+                            db_session, session.session_id, draft_chat_channel=session.draft_chat_channel
+                        )
                         logger.debug("Using test channel {}", session.draft_channel_id)
 
                     # Generate and send summary
@@ -1737,6 +1744,9 @@ async def create_pairings_view(bot, guild, session_id, match_results, team_a=Non
 
 class MatchResultButton(Button):
     def __init__(self, bot, session_id, match_id, match_number, label, *args, **kwargs):
+        # Stable id, so a restart can re-register the pairing view with
+        # bot.add_view instead of re-editing every pairing message.
+        kwargs.setdefault("custom_id", f"match_result:{session_id}:{match_id}")
         super().__init__(label=label, *args, **kwargs)
         self.bot = bot
         self.session_id = session_id
@@ -1974,7 +1984,8 @@ class MatchResultSelect(Select):
 
             try:
                 # Edit the message with the updated embed and view
-                await message.edit(embed=embed, view=new_view)
+                await edit_message(message.channel, message.id, priority=PRIORITY_INTERACTION,
+                                   embed=embed, view=new_view)
             except Exception as e:
                 print(f"Error updating message: {e}")
                 
@@ -2345,7 +2356,9 @@ async def update_draft_message(bot, session_id):
         # when Update Cube changes the session's cube (#383).
         apply_draft_footer_from_session(embed, draft_session)
 
-        await message.edit(embed=embed)
+        # The embed above is read-modify-write off the live message, so the
+        # fetch stays; the edit itself coalesces with any burst of updates.
+        await edit_message(channel, message_id, embed=embed)
         logger.info(f"Successfully updated message for session ID: {session_id}")
 
     except Exception as e: